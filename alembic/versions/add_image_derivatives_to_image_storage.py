@@ -0,0 +1,27 @@
+"""Add image size and derivative flag to IMAGE_STORAGE
+
+Revision ID: add_image_derivatives
+Revises: add_conversation_tables_simple
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'add_image_derivatives'
+down_revision = 'add_conversation_tables_simple'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('IMAGE_STORAGE', sa.Column('image_width', sa.Integer(), nullable=True, comment='이미지 너비(px)'))
+    op.add_column('IMAGE_STORAGE', sa.Column('image_height', sa.Integer(), nullable=True, comment='이미지 높이(px)'))
+    op.add_column('IMAGE_STORAGE', sa.Column('has_derivatives', sa.Boolean(), nullable=False, server_default=sa.text('0'), comment='썸네일/중간 크기 WebP 파생본 존재 여부'))
+
+
+def downgrade() -> None:
+    op.drop_column('IMAGE_STORAGE', 'has_derivatives')
+    op.drop_column('IMAGE_STORAGE', 'image_height')
+    op.drop_column('IMAGE_STORAGE', 'image_width')
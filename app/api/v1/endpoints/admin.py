@@ -20,6 +20,7 @@ from app.schemas.hf_token import (
     HFTokenTestResponse,
 )
 from app.services.hf_token_service import get_hf_token_service
+from app.services.hf_token_resolver import get_hf_token_resolver
 from app.core.encryption import decrypt_sensitive_data
 
 router = APIRouter()
@@ -224,8 +225,12 @@ async def admin_assign_token_to_team(
             )
 
         # 토큰을 팀에 할당
+        previous_team_id = token.group_id
         token.group_id = team_id
         db.commit()
+        get_hf_token_resolver().invalidate_token(
+            token_id, group_ids=[previous_team_id, team_id]
+        )
 
         return {
             "message": f"토큰 '{token.hf_token_nickname}'이 팀 '{team.group_name}'에 할당되었습니다",
@@ -276,6 +281,7 @@ async def admin_unassign_token(
         # 토큰 할당 해제
         token.group_id = None
         db.commit()
+        get_hf_token_resolver().invalidate_token(token_id, group_ids=[old_team_id])
 
         return {
             "message": f"토큰 '{token.hf_token_nickname}'의 할당이 해제되었습니다",
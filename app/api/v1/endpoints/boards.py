@@ -9,17 +9,16 @@ from fastapi import (
     Body,
     Form,
 )
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List
 import uuid
-from sqlalchemy import update, text
-import json
+from sqlalchemy import select, update, text
 import logging
 from datetime import datetime
 
-from app.database import get_db
+from app.database import get_db, get_async_db
 from app.models.board import Board
-from app.models.user import User, HFTokenManage
 from app.schemas.board import (
     BoardCreate,
     BoardUpdate,
@@ -29,6 +28,7 @@ from app.schemas.board import (
 )
 from app.services.content_enhancement_service import ContentEnhancementService
 from app.core.security import get_current_user
+from app.core.permissions import get_user_group_ids_async
 from app.services.content_generation_service import (
     get_content_generation_workflow,
     generate_content_for_board,
@@ -39,10 +39,12 @@ from app.services.content_generation_service import (
 
 from app.services.scheduler_service import scheduler_service
 from app.models.influencer import AIInfluencer
-from app.services.instagram_posting_service import InstagramPostingService
+from app.services.instagram_stats_cache import (
+    InstagramStatsRequest,
+    get_instagram_stats_cache,
+)
 from transformers import AutoModelForCausalLM, AutoTokenizer
 import torch
-import re
 from pydantic import BaseModel
 from app.utils.timezone_utils import get_current_kst, convert_to_kst
 
@@ -55,7 +57,7 @@ async def get_boards(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     influencer_id: str = Query(None, description="특정 인플루언서 ID로 필터링"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(get_current_user),
 ):
     """로그인된 사용자가 소속된 그룹이 사용한 인플루언서가 작성한 게시글만 조회 (최적화된 목록용)"""
@@ -67,15 +69,12 @@ async def get_boards(
                 detail="User authentication required",
             )
 
-        # 1. 사용자 존재 확인
-        user = db.query(User).filter(User.user_id == user_id).first()
-        if not user:
-            logger.warning(f"User not found: {user_id}")
-            return []
-
-        # 2. 사용자 팀 정보 안전하게 조회
+        # 1~2. 사용자 존재 확인 및 팀 정보 조회 (한 번의 쿼리)
         try:
-            group_ids = [team.group_id for team in user.teams] if user.teams else []
+            group_ids = await get_user_group_ids_async(db, user_id)
+            if group_ids is None:
+                logger.warning(f"User not found: {user_id}")
+                return []
             if not group_ids:
                 logger.info(f"User {user_id} has no teams")
                 return []
@@ -86,10 +85,10 @@ async def get_boards(
         # 3. 해당 그룹의 인플루언서 조회
         try:
             influencers = (
-                db.query(AIInfluencer)
-                .filter(AIInfluencer.group_id.in_(group_ids))
-                .all()
-            )
+                await db.execute(
+                    select(AIInfluencer).where(AIInfluencer.group_id.in_(group_ids))
+                )
+            ).scalars().all()
             influencer_ids = [inf.influencer_id for inf in influencers]
 
             if not influencer_ids:
@@ -104,7 +103,7 @@ async def get_boards(
             # JOIN을 사용하여 인플루언서 정보를 한번에 가져오기
             # 필요한 컬럼만 선택하여 메모리 사용량 최적화
             query = (
-                db.query(
+                select(
                     Board.board_id,
                     Board.influencer_id,
                     Board.board_topic,
@@ -126,22 +125,55 @@ async def get_boards(
                     AIInfluencer.instagram_access_token
                 )
                 .join(AIInfluencer, Board.influencer_id == AIInfluencer.influencer_id)
-                .filter(Board.influencer_id.in_(influencer_ids))
+                .where(Board.influencer_id.in_(influencer_ids))
             )
 
             # influencer_id 필터링 적용
             if influencer_id is not None:
-                query = query.filter(Board.influencer_id == influencer_id)
+                query = query.where(Board.influencer_id == influencer_id)
 
             # 인덱스를 활용한 정렬 (created_at 기준)
             results = (
-                query.order_by(Board.created_at.desc()).offset(skip).limit(limit).all()
-            )
+                await db.execute(
+                    query.order_by(Board.created_at.desc()).offset(skip).limit(limit)
+                )
+            ).all()
         except Exception as e:
             logger.error(f"Failed to get boards: {str(e)}")
             return []
 
-        # 5. 목록용 간소화된 데이터 구성
+        # 5. 발행된 인스타그램 게시글의 통계를 한 번에 조회 (캐시 + 계정별 병렬 조회)
+        influencer_map = {inf.influencer_id: inf for inf in influencers}
+        stats_requests = []
+        for result in results:
+            influencer = influencer_map.get(result.influencer_id)
+            if (
+                result.board_platform == 0
+                and result.board_status == 3
+                and result.platform_post_id
+                and influencer
+                and influencer.instagram_is_active
+                and influencer.instagram_access_token
+                and influencer.instagram_id
+            ):
+                stats_requests.append(
+                    InstagramStatsRequest(
+                        platform_post_id=str(result.platform_post_id),
+                        access_token=str(influencer.instagram_access_token),
+                        instagram_id=str(influencer.instagram_id),
+                    )
+                )
+
+        stats_by_post_id = {}
+        if stats_requests:
+            try:
+                stats_by_post_id = await get_instagram_stats_cache().get_many(
+                    stats_requests
+                )
+            except Exception as e:
+                logger.error(f"Failed to fetch Instagram stats: {str(e)}")
+
+        # 6. 목록용 간소화된 데이터 구성
         board_list = []
         for result in results:
             # 튜플 형태의 결과를 언패킹
@@ -153,41 +185,8 @@ async def get_boards(
             
             # 목록용 최소한의 통계 정보만 포함
             instagram_stats = {"like_count": 0, "comments_count": 0}
-            
-            # 발행된 인스타그램 게시글의 경우 기본 통계만 가져오기
-            if (
-                board_platform == 0
-                and board_status == 3
-                and platform_post_id
-            ):
-                try:
-                    # 인플루언서 정보 확인
-                    influencer = next((inf for inf in influencers if inf.influencer_id == influencer_id), None)
-                    
-                    if (
-                        influencer
-                        and influencer.instagram_is_active
-                        and influencer.instagram_access_token
-                        and influencer.instagram_id
-                    ):
-                        # 인스타그램 게시글 정보 가져오기 (목록에서는 기본 통계만)
-                        instagram_service = InstagramPostingService()
-                        post_info = await instagram_service.get_instagram_post_info(
-                            platform_post_id,
-                            str(influencer.instagram_access_token),
-                            str(influencer.instagram_id),
-                        )
-
-                        if post_info:
-                            instagram_stats.update({
-                                "like_count": post_info.get("like_count", 0),
-                                "comments_count": post_info.get("comments_count", 0),
-                            })
-
-                except Exception as e:
-                    logger.error(
-                        f"Failed to fetch Instagram stats for board {board_id}: {str(e)}"
-                    )
+            if platform_post_id and str(platform_post_id) in stats_by_post_id:
+                instagram_stats.update(stats_by_post_id[str(platform_post_id)])
 
             board_dict = {
                 "board_id": board_id,
@@ -198,6 +197,8 @@ async def get_boards(
                 "board_hash_tag": board_hash_tag,
                 "board_status": board_status,
                 # image_url 필드 제거 - 목록에서는 이미지 사용하지 않음
+                # (thumbnail_url도 제공하지 않음: 게시글 이미지는 upload_image로 바로 올라가 파생본이 만들어지지 않음,
+                #  목록에 이미지를 보여주게 되면 업로드 시 이미지 파이프라인으로 파생본을 만든 뒤 추가)
                 "reservation_at": reservation_at,
                 "published_at": published_at,
                 "platform_post_id": platform_post_id,
@@ -232,7 +233,7 @@ async def get_boards(
 @router.get("/{board_id}", response_model=BoardWithInfluencer)
 async def get_board(
     board_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(get_current_user),
 ):
     """특정 게시글 조회 (상세 정보 포함)"""
@@ -244,48 +245,32 @@ async def get_board(
                 detail="User authentication required",
             )
 
-        # 1. 사용자 존재 확인
-        user = db.query(User).filter(User.user_id == user_id).first()
-        if not user:
+        # 1~2. 사용자 존재 확인 및 팀 정보 조회 (한 번의 쿼리)
+        group_ids = await get_user_group_ids_async(db, user_id)
+        if group_ids is None:
             logger.warning(f"User not found: {user_id}")
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
             )
 
-        # 2. 사용자 팀 정보 안전하게 조회
-        try:
-            group_ids = [team.group_id for team in user.teams] if user.teams else []
-        except Exception as e:
-            logger.error(f"Failed to get user teams: {str(e)}")
-            group_ids = []
-
-        # 3. 해당 그룹의 인플루언서 조회
-        try:
-            influencers = (
-                db.query(AIInfluencer)
-                .filter(AIInfluencer.group_id.in_(group_ids))
-                .all()
-            )
-            influencer_ids = [inf.influencer_id for inf in influencers]
-        except Exception as e:
-            logger.error(f"Failed to get influencers: {str(e)}")
-            influencer_ids = []
-
-        # 4. 게시글 조회 (권한 체크 포함)
-        query = db.query(Board).filter(Board.board_id == board_id)
+        # 3~4. 게시글 조회 (권한 체크 포함)
+        query = select(Board).where(Board.board_id == board_id)
         
         # 권한 체크: 사용자가 직접 생성한 게시글이거나 사용자가 속한 그룹의 인플루언서가 작성한 게시글
         if group_ids:
-            query = query.filter(
-                (Board.user_id == user_id) | (Board.influencer_id.in_(influencer_ids))
+            group_influencer_ids = select(AIInfluencer.influencer_id).where(
+                AIInfluencer.group_id.in_(group_ids)
             )
-            logger.info(f"게시글 조회 - 사용자: {user_id}, 그룹: {group_ids}, 인플루언서: {influencer_ids}")
+            query = query.where(
+                (Board.user_id == user_id) | (Board.influencer_id.in_(group_influencer_ids))
+            )
+            logger.info(f"게시글 조회 - 사용자: {user_id}, 그룹: {group_ids}")
         else:
             # 그룹이 없는 경우 사용자가 직접 생성한 게시글만
-            query = query.filter(Board.user_id == user_id)
+            query = query.where(Board.user_id == user_id)
             logger.info(f"게시글 조회 - 사용자: {user_id}, 그룹 없음")
 
-        board = query.first()
+        board = (await db.execute(query)).scalars().first()
 
         if board is None:
             logger.warning(f"게시글을 찾을 수 없음 - board_id: {board_id}, user_id: {user_id}")
@@ -296,11 +281,7 @@ async def get_board(
         logger.info(f"게시글 조회 성공 - board_id: {board_id}, influencer_id: {board.influencer_id}")
 
         # 인플루언서 정보 조회
-        influencer = (
-            db.query(AIInfluencer)
-            .filter(AIInfluencer.influencer_id == board.influencer_id)
-            .first()
-        )
+        influencer = await db.get(AIInfluencer, board.influencer_id)
 
         # 인플루언서 프로필 이미지 URL 처리
         influencer_image_url = None
@@ -331,36 +312,36 @@ async def get_board(
         image_url = board.image_url
         if image_url:
             # 쉼표로 구분된 다중 이미지 처리
-            image_urls = image_url.split(",") if "," in image_url else [image_url]
-            processed_image_urls = []
+            image_urls = [url.strip() for url in image_url.split(",")]
+            s3_keys = [url for url in image_urls if not url.startswith("http")]
 
+            # S3 키들은 presigned URL을 한 번에 생성 (상세보기용 전체 이미지, 1시간 유효)
+            presigned_urls = {}
+            if s3_keys:
+                try:
+                    from app.services.s3_image_service import get_s3_image_service
+
+                    s3_service = get_s3_image_service()
+                    if s3_service.is_available():
+                        presigned_urls = s3_service.generate_presigned_urls(
+                            s3_keys, expiration=3600
+                        )
+                    else:
+                        logger.warning("S3 service unavailable, using direct URL")
+                except Exception as e:
+                    logger.error(f"Failed to generate presigned URL: {e}")
+
+            processed_image_urls = []
             for single_image_url in image_urls:
-                single_image_url = single_image_url.strip()
-                if not single_image_url.startswith("http"):
-                    # S3 키인 경우 presigned URL 생성
-                    try:
-                        from app.services.s3_image_service import get_s3_image_service
-
-                        s3_service = get_s3_image_service()
-                        if s3_service.is_available():
-                            # 상세보기에서는 전체 이미지용 presigned URL 생성 (1시간 유효)
-                            processed_url = s3_service.generate_presigned_url(
-                                single_image_url, expiration=3600
-                            )
-                            logger.info(f"Generated presigned URL for image: {processed_url}")
-                        else:
-                            # S3 서비스가 사용 불가능한 경우 직접 URL 생성
-                            processed_url = f"https://aimex-influencers.s3.ap-northeast-2.amazonaws.com/{single_image_url}"
-                            logger.warning("S3 service unavailable, using direct URL")
-                    except Exception as e:
-                        logger.error(f"Failed to generate presigned URL: {e}")
-                        # 실패 시 직접 URL 생성
-                        processed_url = f"https://aimex-influencers.s3.ap-northeast-2.amazonaws.com/{single_image_url}"
-                else:
+                if single_image_url.startswith("http"):
                     # 이미 HTTP URL인 경우 그대로 사용
                     processed_url = single_image_url
-                    logger.info(f"Using existing HTTP URL: {processed_url}")
-
+                else:
+                    # 실패 시 직접 URL 생성
+                    processed_url = (
+                        presigned_urls.get(single_image_url)
+                        or f"https://aimex-influencers.s3.ap-northeast-2.amazonaws.com/{single_image_url}"
+                    )
                 processed_image_urls.append(processed_url)
 
             # 상세보기에서는 모든 이미지를 쉼표로 구분하여 반환
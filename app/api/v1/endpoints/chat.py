@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from typing import List
 from datetime import datetime
@@ -8,17 +9,17 @@ import logging
 import json
 import uuid
 from pydantic import BaseModel
-from app.database import get_db
+from app.database import get_db, new_async_session
 from app.models.influencer import (
     AIInfluencer,
     InfluencerAPI,
-    APICallAggregation,
 )
 from app.models.chat_message import ChatMessage
 from app.models.user import User
 from app.core.security import get_current_user
 from app.utils.timezone_utils import get_current_kst
 from app.core.security import get_current_user, get_current_user_by_api_key
+from app.services.api_usage_counter import get_api_usage_counter
 
 logger = logging.getLogger(__name__)
 
@@ -87,7 +88,7 @@ async def chatbot_chat(
     """
     try:
         # API 사용량 추적
-        await track_api_usage(db, str(influencer.influencer_id))
+        await track_api_usage(str(influencer.influencer_id))
 
         # RunPod 서비스 호출
         try:
@@ -385,7 +386,7 @@ async def chatbot_chat_stream(
     """
     try:
         # API 사용량 추적
-        await track_api_usage(db, str(influencer.influencer_id))
+        await track_api_usage(str(influencer.influencer_id))
 
         async def generate_stream():
             try:
@@ -536,61 +537,28 @@ async def chatbot_chat_stream(
         )
 
 
-async def track_api_usage(db: Session, influencer_id: str):
-    """API 사용량 추적"""
+async def track_api_usage(influencer_id: str):
+    """API 사용량 추적 (메모리 집계 후 주기적으로 저장, 요청 경로에서는 쓰기 없음)"""
     try:
-        logger.info(f"📊 API 사용량 추적 시작 - influencer_id: {influencer_id}")
-        
-        # API 키 조회
-        api_key = (
-            db.query(InfluencerAPI)
-            .filter(InfluencerAPI.influencer_id == influencer_id)
-            .first()
-        )
-        
-        if not api_key:
+        # API 키 조회 (비동기 엔진 사용)
+        async with new_async_session() as db:
+            api_id = (
+                await db.execute(
+                    select(InfluencerAPI.api_id)
+                    .where(InfluencerAPI.influencer_id == influencer_id)
+                    .limit(1)
+                )
+            ).scalar_one_or_none()
+
+        if not api_id:
             logger.warning(f"⚠️ API 키를 찾을 수 없음 - influencer_id: {influencer_id}")
             return
-        
-        logger.info(f"🔑 API 키 조회 성공 - api_id: {api_key.api_id}")
-        
-        today = datetime.now().date()
-
-        # 오늘 날짜의 API 호출 집계 조회
-        aggregation = (
-            db.query(APICallAggregation)
-            .filter(
-                APICallAggregation.api_id == api_key.api_id,
-                APICallAggregation.created_at >= today,
-            )
-            .first()
-        )
-
-        if aggregation:
-            # 기존 집계 업데이트
-            old_count = aggregation.daily_call_count
-            aggregation.daily_call_count += 1
-            aggregation.updated_at = datetime.now()
-            logger.info(f"✅ 기존 집계 업데이트 - api_id: {api_key.api_id}, 이전: {old_count}, 현재: {aggregation.daily_call_count}")
-        else:
-            # 새로운 집계 생성
-            aggregation = APICallAggregation(
-                api_id=api_key.api_id,
-                influencer_id=influencer_id,
-                daily_call_count=1,
-                created_at=datetime.now(),
-                updated_at=datetime.now(),
-            )
-            db.add(aggregation)
-            logger.info(f"🆕 새로운 집계 생성 - api_id: {api_key.api_id}, influencer_id: {influencer_id}")
 
-        db.commit()
-        logger.info(f"💾 API 사용량 추적 완료 - influencer_id: {influencer_id}, api_id: {api_key.api_id}")
+        get_api_usage_counter().increment(str(api_id), influencer_id)
 
     except Exception as e:
         # API 사용량 추적 실패는 로그만 남기고 계속 진행
         logger.error(f"❌ API usage tracking failed: {e}")
-        db.rollback()
 
 
 # 기존 사용자 인증 기반 엔드포인트들 (관리용)
@@ -9,10 +9,8 @@ from fastapi import (
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 from app.database import get_db
-from app.models.user import HFTokenManage
 from app.services.runpod_manager import get_vllm_manager, get_tts_manager
 from app.services.s3_service import S3Service
-from app.core.encryption import decrypt_sensitive_data
 from app.services.hf_token_resolver import get_token_by_group
 from app.services.chat_message_service import ChatMessageService
 import json
@@ -23,110 +21,210 @@ from datetime import datetime
 from typing import List, Dict, Optional
 from app.core.config import settings
 import os
-import httpx
+from app.core.http_clients import pooled_client
 from app.services.s3_image_service import get_s3_image_service
+from app.services.chat_conversation_state import ChatConversationState
+from app.services.tts_cache import TTSAudio, get_tts_cache, tts_cache_key
+from app.services.voice_asset_cache import get_voice_asset_cache
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
-async def _process_tts_async(websocket: WebSocket, text: str, influencer_id: str):
-    """비동기로 TTS 처리하고 완료되면 base64 오디오 데이터 전송"""
-    from app.models.influencer import AIInfluencer
-    from sqlalchemy.orm import Session
-    from app.database import get_db
-    import asyncio
-    
+async def _process_tts_async(
+    websocket: WebSocket,
+    text: str,
+    influencer_id: str,
+    binary_audio: bool = False,
+    send_lock: Optional[asyncio.Lock] = None,
+):
+    """비동기로 TTS 처리하고 완료되면 오디오 전송
+
+    결과는 TTS 캐시에 저장되어 같은 음성/문장은 RunPod 합성 없이 재사용.
+    binary_audio이면 작은 JSON 헤더(audio_header) 뒤에 바이너리 프레임으로 전송하고,
+    아니면 기존처럼 base64 JSON 메시지로 전송
+    """
     try:
-        # DB에서 influencer의 voice_base 정보 가져오기
-        db: Session = next(get_db())
-        try:
-            influencer = db.query(AIInfluencer).filter(
-                AIInfluencer.influencer_id == influencer_id
-            ).first()
-            
-            base_voice_id = None
+        # influencer의 voice_base 정보 (참조 음성 캐시의 비동기 조회, 이벤트 루프를 막지 않음)
+        voice = await get_voice_asset_cache().resolve_voice(influencer_id)
+        base_voice_id = voice.voice_id if voice else None
+        if voice:
+            logger.info(f"[WS] 인플루언서 {influencer_id}의 base_voice_id 찾음: {base_voice_id} ({voice.version})")
+        else:
+            logger.warning(f"[WS] 인플루언서 {influencer_id}의 base_voice를 찾을 수 없음")
+
+        output_format = "wav"  # 기본값 wav
+        emotion_name = "neutral"  # 기본 감정 설정
+        # 음성 버전(S3 키 + 수정 시각)을 키에 포함하여 같은 행에 음성을 다시 올리면 이전 결과를 쓰지 않음
+        # base voice가 없으면 워커가 influencer_id 기준으로 음성을 고르므로 인플루언서별로 구분
+        voice_key = f"{base_voice_id}:{voice.version}" if voice else f"influencer:{influencer_id}"
+        cache_key = tts_cache_key(text, voice_key, emotion_name, output_format)
+
+        async def synthesize() -> Optional[TTSAudio]:
             presigned_url = None
+            if voice:
+                # S3 presigned URL 생성
+                presigned_url = S3Service().generate_presigned_url(voice.s3_key)
+                logger.info(f"[WS] Base voice presigned URL 생성됨")
+
+            # TTS 매니저 가져오기
+            tts_manager = get_tts_manager()
             
-            if influencer and influencer.voice_base:
-                base_voice_id = str(influencer.voice_base.id)
-                logger.info(f"[WS] 인플루언서 {influencer_id}의 base_voice_id 찾음: {base_voice_id}")
-                logger.info(f"[WS] Base voice 정보 - ID: {base_voice_id}, URL: {influencer.voice_base.s3_url}")
+            # TTS 생성 요청 (동기) - 새로운 메서드 사용
+            logger.info(f"[WS] TTS 생성 요청: {text[:50]}...")
+            job_input = {
+                "text": text,
+                "influencer_id": influencer_id,
+                "base_voice_id": base_voice_id,  # voice_id로 influencer_id 사용
+                "output_format": output_format,
+                "emotion_name": emotion_name
+            }
+            
+            # base_voice_id와 presigned_url이 있으면 추가
+            if base_voice_id and presigned_url:
+                job_input["base_voice_id"] = base_voice_id
+                job_input["voice_data_base64"] = None  # presigned_url은 worker에서 처리
+                logger.info(f"[WS] Voice cloning 모드로 TTS 생성 - base_voice_id: {base_voice_id}")
+            
+            # runsync 메서드 사용 (동기 요청)
+            tts_result = await tts_manager.runsync(job_input)
+            
+            # task_id 확인
+            if not tts_result or not tts_result.get("id"):
+                logger.error("[WS] TTS task_id를 받지 못함")
+                return None
                 
-                # S3 presigned URL 생성
-                s3_service = S3Service()
-                if influencer.voice_base.s3_url:
-                    # S3 URL에서 키 추출 (s3://bucket-name/key 형식)
-                    s3_key = influencer.voice_base.s3_url.replace(f"s3://{s3_service.bucket_name}/", "")
-                    presigned_url = s3_service.generate_presigned_url(s3_key)
-                    logger.info(f"[WS] Base voice presigned URL 생성됨")
-            else:
-                logger.warning(f"[WS] 인플루언서 {influencer_id}의 base_voice를 찾을 수 없음")
-        finally:
-            db.close()
-        
-        # TTS 매니저 가져오기
-        tts_manager = get_tts_manager()
-        
-        # TTS 생성 요청 (동기) - 새로운 메서드 사용
-        logger.info(f"[WS] TTS 생성 요청: {text[:50]}...")
-        job_input = {
-            "text": text,
-            "influencer_id": influencer_id,
-            "base_voice_id": base_voice_id,  # voice_id로 influencer_id 사용
-            "output_format": "wav",  # 기본값 wav
-            "emotion_name": "neutral"  # 기본 감정 설정
-        }
-        
-        # base_voice_id와 presigned_url이 있으면 추가
-        if base_voice_id and presigned_url:
-            job_input["base_voice_id"] = base_voice_id
-            job_input["voice_data_base64"] = None  # presigned_url은 worker에서 처리
-            logger.info(f"[WS] Voice cloning 모드로 TTS 생성 - base_voice_id: {base_voice_id}")
-        
-        # runsync 메서드 사용 (동기 요청)
-        tts_result = await tts_manager.runsync(job_input)
-        
-        # task_id 확인
-        if not tts_result or not tts_result.get("id"):
-            logger.error("[WS] TTS task_id를 받지 못함")
-            return
+            task_id = tts_result.get("id")
+            logger.info(f"[WS] TTS 작업 생성됨: task_id={task_id}")
             
-        task_id = tts_result.get("id")
-        logger.info(f"[WS] TTS 작업 생성됨: task_id={task_id}")
-        
-        if tts_result.get("status") == "COMPLETED":
+            if tts_result.get("status") != "COMPLETED":
+                return None
+
             output = tts_result.get("output", {})
             logger.info(f"[WS] TTS output 구조: {list(output.keys()) if output else 'None'}")
             
             # audio_base64, audio_data, 또는 다른 필드 확인
             audio_base64 = output.get("audio_base64") or output.get("audio_data") or output.get("audio")
-            
-            if audio_base64:
-                # WebSocket 연결 상태 확인
-                try:
-                    # WebSocket으로 base64 오디오 데이터 전송
+            if not audio_base64:
+                logger.warning(f"[WS] TTS output에서 오디오 데이터를 찾을 수 없음. 가능한 키: {list(output.keys())}")
+                return None
+
+            return TTSAudio(
+                audio=base64.b64decode(audio_base64),
+                format=output.get("format", output_format),
+                duration=output.get("duration"),
+            )
+
+        audio, cached = await get_tts_cache().get_or_synthesize(cache_key, synthesize)
+        if audio is None:
+            return
+        if cached:
+            logger.info(f"[WS] TTS 캐시 적중: {text[:50]}...")
+
+        # WebSocket 연결 상태 확인
+        try:
+            if binary_audio:
+                # 헤더와 바이너리 프레임 사이에 다른 TTS 오디오가 끼어들지 않도록 잠금
+                async with send_lock or asyncio.Lock():
                     await websocket.send_text(
                         json.dumps({
-                            "type": "audio",
-                            "audio_base64": audio_base64,
-                            "duration": output.get("duration"),
-                            "format": output.get("format", "wav"),
+                            "type": "audio_header",
+                            "size": len(audio.audio),
+                            "duration": audio.duration,
+                            "format": audio.format,
+                            "cached": cached,
                             "message": "음성이 생성되었습니다."
                         })
                     )
-                    logger.info(f"[WS] TTS base64 오디오 전송 완료 (크기: {len(audio_base64)} bytes)")
-                except Exception as send_error:
-                    logger.error(f"[WS] TTS 오디오 전송 실패 (WebSocket 연결 끊김?): {send_error}")
+                    await websocket.send_bytes(audio.audio)
+                logger.info(f"[WS] TTS 바이너리 오디오 전송 완료 (크기: {len(audio.audio)} bytes)")
             else:
-                logger.warning(f"[WS] TTS output에서 오디오 데이터를 찾을 수 없음. 가능한 키: {list(output.keys())}")
-
+                # WebSocket으로 base64 오디오 데이터 전송
+                audio_base64 = base64.b64encode(audio.audio).decode("ascii")
+                await websocket.send_text(
+                    json.dumps({
+                        "type": "audio",
+                        "audio_base64": audio_base64,
+                        "duration": audio.duration,
+                        "format": audio.format,
+                        "cached": cached,
+                        "message": "음성이 생성되었습니다."
+                    })
+                )
+                logger.info(f"[WS] TTS base64 오디오 전송 완료 (크기: {len(audio_base64)} bytes)")
+        except Exception as send_error:
+            logger.error(f"[WS] TTS 오디오 전송 실패 (WebSocket 연결 끊김?): {send_error}")
             
     except Exception as e:
         logger.error(f"[WS] TTS 처리 중 오류: {e}")
         # TTS 오류는 무시하고 채팅은 계속 진행
 
 
+# 스트리밍 프레임 병합 설정: 작은 토큰은 모아서 한 프레임으로 전송
+STREAM_FLUSH_INTERVAL = 0.05  # 초
+STREAM_MIN_FRAME_CHARS = 8
+
+
+async def _relay_vllm_stream(websocket: WebSocket, vllm_manager, payload: Dict) -> str:
+    """vLLM 스트리밍 토큰을 WebSocket으로 중계하고 전체 응답 반환
+
+    생성(producer)과 전송(sender)을 분리하여, 전송이 느리면 대기 중인 토큰을
+    하나의 프레임으로 합쳐 보냄 (프레임 큐가 무한히 쌓이지 않음)
+    """
+    pending: List[str] = []
+    parts: List[str] = []
+    new_data = asyncio.Event()
+    finished = False
+
+    async def produce():
+        nonlocal finished
+        try:
+            async for text in vllm_manager.stream_text(payload):
+                pending.append(text)
+                parts.append(text)
+                new_data.set()
+        finally:
+            finished = True
+            new_data.set()
+
+    producer = asyncio.create_task(produce())
+    typing_sent = False
+    try:
+        while True:
+            await new_data.wait()
+            new_data.clear()
+
+            if not finished and sum(len(p) for p in pending) < STREAM_MIN_FRAME_CHARS:
+                await asyncio.sleep(STREAM_FLUSH_INTERVAL)
+
+            if pending:
+                chunk = "".join(pending)
+                pending.clear()
+                if not typing_sent:
+                    # 첫 토큰 도착 시 타이핑 시작 상태 전송
+                    await websocket.send_text(
+                        json.dumps({"type": "typing", "message": "답변 입력중..."}, ensure_ascii=False)
+                    )
+                    typing_sent = True
+                await websocket.send_text(
+                    json.dumps({"type": "token", "content": chunk}, ensure_ascii=False)
+                )
+
+            if finished and not pending:
+                break
+    finally:
+        if not producer.done():
+            producer.cancel()
+
+    # 생성 중 발생한 오류 전파
+    await producer
+
+    await websocket.send_text(
+        json.dumps({"type": "complete", "content": ""}, ensure_ascii=False)
+    )
+    return "".join(parts)
+
+
 # 메모리 히스토리 클래스 제거 - 데이터베이스만 사용
 
 
@@ -183,6 +281,8 @@ async def chatbot(
         group_id = query_params.get("group_id", [None])[0]
         influencer_id = query_params.get("influencer_id", [None])[0]
         token = query_params.get("token", [None])[0]
+        # TTS 오디오 전송 방식 (binary: 헤더 + 바이너리 프레임, 기본: base64 JSON)
+        binary_audio = query_params.get("audio_transport", ["base64"])[0] == "binary"
         
         logger.info(f"[WS] 요청 파라미터: lora_repo={lora_repo}, group_id={group_id}, influencer_id={influencer_id}")
         
@@ -246,6 +346,9 @@ async def chatbot(
         import traceback
         logger.error(f"[WS] Traceback: {traceback.format_exc()}")
         return
+
+    # 바이너리 TTS 오디오의 헤더/프레임 쌍 전송 순서 보장용
+    audio_send_lock = asyncio.Lock()
     
     # JWT 토큰 검증 (연결 후)
     try:
@@ -404,8 +507,14 @@ async def chatbot(
             f"[WS] RunPod WebSocket 연결 시작: lora_repo={lora_repo_decoded}, group_id={group_id}, session_id={session_id}"
         )
 
-        # HF 토큰 가져오기 (필요시)
-        hf_token = await _get_hf_token_by_group(group_id, db)
+        # 연결별 대화 상태 (MCP 서버 목록/HF 토큰은 여기서 한 번 로드하고 변경 시에만 갱신)
+        conversation = ChatConversationState(
+            influencer_id or "default", group_id, summarizer=summarize_chat_history
+        )
+        await asyncio.to_thread(conversation.load_resources, db)
+        # 첫 TTS 요청 전에 참조 음성을 미리 받아 둠
+        get_voice_asset_cache().warm(influencer_id)
+        hf_token = conversation.hf_token
 
         # 인플루언서 정보 가져오기
         influencer = None
@@ -452,48 +561,11 @@ async def chatbot(
                     
                     # 히스토리 관련 명령 처리
                     if message_type == "get_history":
-                        # 현재 세션의 히스토리 조회
-                        if current_session_id:
-                            session_messages = (
-                                chat_message_service.get_session_messages(
-                                    current_session_id
-                                )
-                            )
-
-                            # 사용자/AI 메시지를 쌍으로 구성하여 히스토리 생성 (message_type 기반)
-                            history_data = []
-                            current_user_msg = None
-                            current_timestamp = None
-
-                            for msg in session_messages:
-                                if msg.message_type == "user":
-                                    current_user_msg = msg.message_content
-                                    current_timestamp = (
-                                        msg.created_at.isoformat()
-                                        if msg.created_at
-                                        else None
-                                    )
-                                elif msg.message_type == "ai" and current_user_msg:
-                                    ai_response = msg.message_content
-                                    history_data.append(
-                                        {
-                                            "query": current_user_msg,
-                                            "response": ai_response,
-                                            "timestamp": current_timestamp,
-                                            "source": "session",
-                                            "session_id": msg.session_id,
-                                        }
-                                    )
-                                    current_user_msg = None
-                                    current_timestamp = None
-
-                            await websocket.send_text(
-                                json.dumps({"type": "history", "data": history_data})
-                            )
-                        else:
-                            await websocket.send_text(
-                                json.dumps({"type": "history", "data": []})
-                            )
+                        # 현재 세션의 히스토리 (연결 상태에서 바로 반환)
+                        history_data = conversation.history if current_session_id else []
+                        await websocket.send_text(
+                            json.dumps({"type": "history", "data": history_data})
+                        )
                         continue
                     elif message_type == "clear_history":
                         # 현재 세션 종료 (새 세션 시작)
@@ -507,6 +579,7 @@ async def chatbot(
                         current_session_id = chat_message_service.create_session(
                             influencer_id or "default"
                         )
+                        conversation.reset(current_session_id)
                         logger.info(
                             f"[WS] 새 세션 생성 (히스토리 초기화): session_id={current_session_id}"
                         )
@@ -535,67 +608,46 @@ async def chatbot(
                         current_session_id = chat_message_service.create_session(
                             influencer_id or "default"
                         )
-                    logger.info(f"[WS] 새 세션 생성: session_id={current_session_id}")
+                        conversation.reset(current_session_id)
+                        logger.info(f"[WS] 새 세션 생성: session_id={current_session_id}")
 
                 # 의도 기반 히스토리 컨텍스트 추가
                 enhanced_message = user_message
 
-                # 현재 세션의 이전 메시지들 조회
-                session_messages = chat_message_service.get_session_messages(
-                    current_session_id
-                )
+                # 연결 상태에 누적된 대화쌍 사용 (요약 + 최근 대화, DB 재조회 없음)
+                conversation_pairs = conversation.conversation_pairs()
 
-                if session_messages:
-                    # 빈 메시지 제외하고 유효한 메시지만 필터링
-                    valid_messages = [
-                        msg for msg in session_messages if msg.message_content.strip()
-                    ]
+                if conversation_pairs:
+                    try:
+                        # 의도 분석을 통한 히스토리 프롬프트 생성
+                        intent_based_context = await analyze_user_intent(
+                            user_message, conversation_pairs
+                        )
 
-                    if len(valid_messages) >= 2:  # 최소 1턴(사용자+AI) 이상
-                        try:
-                            # 사용자/AI 메시지를 쌍으로 구성 (message_type 기반)
-                            conversation_pairs = []
-                            current_user_msg = None
-
-                            for msg in valid_messages:
-                                if msg.message_type == "user":
-                                    current_user_msg = msg.message_content
-                                elif msg.message_type == "ai" and current_user_msg:
-                                    ai_response = msg.message_content
-                                    conversation_pairs.append(
-                                        {
-                                            "query": current_user_msg,
-                                            "response": ai_response,
-                                        }
-                                    )
-                                    current_user_msg = None  # 다음 쌍을 위해 초기화
-
-                            if conversation_pairs:
-                                # 의도 분석을 통한 히스토리 프롬프트 생성
-                                intent_based_context = await analyze_user_intent(
-                                    user_message, conversation_pairs
-                                )
-
-                                if (
-                                    intent_based_context
-                                    and len(intent_based_context) > 10
-                                ):
-                                    enhanced_message = f"{intent_based_context}\n\n현재 질문: {user_message}"
-                                    logger.info(
-                                        f"[WS] 의도 기반 히스토리 사용 (세션: {current_session_id}, 대화쌍: {len(conversation_pairs)}개)"
-                                    )
-                                else:
-                                    # 의도 분석 실패 시 최근 대화만 사용
-                                    latest_pair = conversation_pairs[-1]
-                                    enhanced_message = f"이전 질문: {latest_pair['query'][:50]}...\n\n현재 질문: {user_message}"
-                                    logger.info(
-                                        f"[WS] 최근 대화 사용 (세션: {current_session_id})"
-                                    )
-                        except Exception as e:
-                            logger.warning(
-                                f"[WS] 히스토리 처리 실패, 요약 없이 진행: {e}"
+                        if (
+                            intent_based_context
+                            and len(intent_based_context) > 10
+                        ):
+                            enhanced_message = f"{intent_based_context}\n\n현재 질문: {user_message}"
+                            logger.info(
+                                f"[WS] 의도 기반 히스토리 사용 (세션: {current_session_id}, 대화쌍: {len(conversation_pairs)}개)"
                             )
-                            enhanced_message = user_message
+                        else:
+                            # 의도 분석 실패 시 최근 대화만 사용
+                            latest_pair = conversation_pairs[-1]
+                            enhanced_message = f"이전 질문: {latest_pair['query'][:50]}...\n\n현재 질문: {user_message}"
+                            logger.info(
+                                f"[WS] 최근 대화 사용 (세션: {current_session_id})"
+                            )
+                    except Exception as e:
+                        logger.warning(
+                            f"[WS] 히스토리 처리 실패, 요약 없이 진행: {e}"
+                        )
+                        enhanced_message = user_message
+
+                # MCP 서버 할당/HF 토큰 변경 여부는 주기적으로만 확인
+                await asyncio.to_thread(conversation.refresh_resources_if_stale, db)
+                hf_token = conversation.hf_token
 
                 # MCP 처리 로직 추가
                 mcp_result = None
@@ -603,14 +655,11 @@ async def chatbot(
                 try:
                     # MCP 처리를 위한 API 엔드포인트 모듈 가져오기
                     from app.api.v1.endpoints.mcp import process_with_mcp_tools
-                    from app.services.mcp_server_service import MCPServerService
                     
                     logger.info(f"[WS] MCP 처리 시작: {user_message[:50]}...")
                     
-                    # 인플루언서에게 할당된 MCP 서버 목록 가져오기
-                    mcp_service = MCPServerService(db)
-                    assigned_servers = mcp_service.get_influencer_mcp_servers(influencer_id or "")
-                    selected_servers = [server.mcp_name for server in assigned_servers]
+                    # 인플루언서에게 할당된 MCP 서버 목록 (연결 상태에 캐시됨)
+                    selected_servers = conversation.mcp_servers
                     
                     if selected_servers:
                         logger.info(f"[WS] 할당된 MCP 서버: {selected_servers}")
@@ -650,56 +699,21 @@ async def chatbot(
                         }
                     }
                     
-                    # runsync로 전체 응답 받기
-                    result = await vllm_manager.runsync(payload)
-                    
-                    # 응답 처리
-                    full_response = result
-                    
-                    # 타이핑 시작 상태 전송 
-                    await websocket.send_text(
-                        json.dumps({"type": "typing", "message": "답변 입력중..."}, ensure_ascii=False)
-                    )
-                    
-                    # 받은 응답을 단어 단위로 분할해서 스트리밍
-                    words = full_response.split(' ')
-                    chunk_size = 2  # 2단어씩 전송
-                    token_count = 0
-                    
-                    for i in range(0, len(words), chunk_size):
-                        chunk_words = words[i:i + chunk_size]
-                        chunk_text = ' '.join(chunk_words)
-                        
-                        # 마지막 청크가 아니면 공백 추가
-                        if i + chunk_size < len(words):
-                            chunk_text += ' '
-                        
-                        # 클라이언트에 청크 전송
-                        await websocket.send_text(
-                            json.dumps({"type": "token", "content": chunk_text}, ensure_ascii=False)
-                        )
-                        token_count += 1
-                        
-                        # 스트리밍 효과를 위한 딜레이
-                        await asyncio.sleep(0.1)
-
-                    # 스트리밍 완료 신호
-                    await websocket.send_text(
-                        json.dumps({"type": "complete", "content": ""}, ensure_ascii=False)
-                    )
+                    # 생성되는 토큰을 그대로 중계
+                    full_response = await _relay_vllm_stream(websocket, vllm_manager, payload)
                     
                     # 사용자 메시지와 AI 응답 저장
                     if current_session_id:
                         try:
                             # 사용자 메시지 저장
-                            chat_message_service.add_message_to_session(
+                            await chat_message_service.queue_message(
                                 session_id=current_session_id,
                                 influencer_id=influencer_id or "default",
                                 message_content=user_message,
                                 message_type="user",
                             )
                             # AI 응답 저장  
-                            chat_message_service.add_message_to_session(
+                            await chat_message_service.queue_message(
                                 session_id=current_session_id,
                                 influencer_id=influencer_id or "default",
                                 message_content=full_response,
@@ -710,6 +724,7 @@ async def chatbot(
                             )
                         except Exception as e:
                             logger.error(f"[WS] MCP 응답 세션 저장 실패: {e}")
+                        conversation.append_turn(user_message, full_response)
                     
                     # TTS 생성 (MCP 응답에 대해서도)
                     if full_response.strip():
@@ -717,7 +732,9 @@ async def chatbot(
                             _process_tts_async(
                                 websocket, 
                                 full_response, 
-                                influencer_id if influencer_id else "default"
+                                influencer_id if influencer_id else "default",
+                                binary_audio,
+                                audio_send_lock,
                             )
                         )
                     
@@ -755,7 +772,7 @@ async def chatbot(
                     json.dumps({"type": "thinking", "message": "생각중..."}, ensure_ascii=False)
                 )
                 
-                # runsync로 응답 생성 후 클라이언트에 스트리밍으로 전달
+                # 워커 스트림을 클라이언트에 실시간 중계
                 payload = {
                     "input": {
                         "hf_token": hf_token,
@@ -767,44 +784,7 @@ async def chatbot(
                     }
                 }
                 
-                # runsync로 전체 응답 받기
-                result = await vllm_manager.runsync(payload)
-                
-                # 응답 처리
-                full_response = result
-                
-                
-                # 타이핑 시작 상태 전송 
-                await websocket.send_text(
-                    json.dumps({"type": "typing", "message": "답변 입력중..."}, ensure_ascii=False)
-                )
-                
-                # 받은 응답을 단어 단위로 분할해서 스트리밍
-                words = full_response.split(' ')
-                chunk_size = 2  # 2단어씩 전송
-                token_count = 0
-                
-                for i in range(0, len(words), chunk_size):
-                    chunk_words = words[i:i + chunk_size]
-                    chunk_text = ' '.join(chunk_words)
-                    
-                    # 마지막 청크가 아니면 공백 추가
-                    if i + chunk_size < len(words):
-                        chunk_text += ' '
-                    
-                    # 클라이언트에 청크 전송
-                    await websocket.send_text(
-                        json.dumps({"type": "token", "content": chunk_text}, ensure_ascii=False)
-                    )
-                    token_count += 1
-                    
-                    # 스트리밍 효과를 위한 딜레이
-                    await asyncio.sleep(0.1)
-
-                # 스트리밍 완료 신호
-                await websocket.send_text(
-                    json.dumps({"type": "complete", "content": ""}, ensure_ascii=False)
-                )
+                full_response = await _relay_vllm_stream(websocket, vllm_manager, payload)
 
                 # TTS 생성 시작 (비동기로 처리)
                 if full_response.strip():
@@ -813,7 +793,9 @@ async def chatbot(
                         _process_tts_async(
                             websocket, 
                             full_response, 
-                            influencer_id if influencer_id else "default"
+                            influencer_id if influencer_id else "default",
+                            binary_audio,
+                            audio_send_lock,
                         )
                     )
 
@@ -821,7 +803,7 @@ async def chatbot(
                     if full_response.strip():
                         try:
                             # 사용자 메시지 저장
-                            chat_message_service.add_message_to_session(
+                            await chat_message_service.queue_message(
                                 session_id=current_session_id,
                                 influencer_id=influencer_id or "default",
                                 message_content=user_message,
@@ -829,7 +811,7 @@ async def chatbot(
                             )
 
                             # AI 응답 저장
-                            chat_message_service.add_message_to_session(
+                            await chat_message_service.queue_message(
                                 session_id=current_session_id,
                                 influencer_id=influencer_id or "default",
                                 message_content=full_response,
@@ -840,9 +822,10 @@ async def chatbot(
                             )
                         except Exception as e:
                             logger.error(f"[WS] 세션 저장 실패: {e}")
+                        conversation.append_turn(user_message, full_response)
                         
                     logger.info(
-                        f"[WS] RunPod 스트리밍 응답 전송 완료 (토큰 수: {token_count})"
+                        f"[WS] RunPod 스트리밍 응답 전송 완료 (응답 길이: {len(full_response)}자)"
                     )
 
             except WebSocketDisconnect:
@@ -889,37 +872,26 @@ async def chatbot(
 
 
 async def _get_hf_token_by_group(group_id: int, db: Session) -> str | None:
-    """그룹 ID로 HF 토큰 가져오기"""
+    """그룹 ID로 HF 토큰 가져오기 (복호화된 토큰은 리졸버 캐시에서 재사용)"""
     try:
-        hf_token_manage = (
-            db.query(HFTokenManage)
-            .filter(HFTokenManage.group_id == group_id)
-            .order_by(HFTokenManage.created_at.desc())
-            .first()
-        )
-
-        if hf_token_manage:
-            return decrypt_sensitive_data(str(hf_token_manage.hf_token_value))
-        else:
-            logger.warning(f"그룹 {group_id}에 등록된 HF 토큰이 없습니다.")
-            return None
+        hf_token, _ = await get_token_by_group(group_id, db, prefer_default=False)
+        return hf_token
 
     except Exception as e:
         logger.error(f"HF 토큰 조회 실패: {e}")
         return None
 
 
-# OpenAI API 클라이언트 추가
-async def get_openai_client():
-    """OpenAI API 클라이언트 생성"""
-    return httpx.AsyncClient(
-        base_url="https://api.openai.com/v1",
-        headers={
-            "Authorization": f"Bearer {os.getenv('OPENAI_API_KEY')}",
-            "Content-Type": "application/json",
-        },
-        timeout=30.0,
-    )
+# OpenAI API 호출 (공유 커넥션 풀 사용)
+OPENAI_CHAT_COMPLETIONS_URL = "https://api.openai.com/v1/chat/completions"
+
+
+def _openai_headers() -> Dict[str, str]:
+    """OpenAI API 요청 헤더"""
+    return {
+        "Authorization": f"Bearer {os.getenv('OPENAI_API_KEY')}",
+        "Content-Type": "application/json",
+    }
 
 
 async def analyze_user_intent(user_message: str, history: List[Dict]) -> str:
@@ -939,8 +911,6 @@ async def analyze_user_intent(user_message: str, history: List[Dict]) -> str:
             )
 
         # OpenAI API 호출 (의도 분석용 시스템 프롬프트)
-        client = await get_openai_client()
-
         system_prompt = """당신은 사용자의 질문 의도를 분석하는 전문가입니다.
 
 주어진 이전 대화 히스토리와 현재 질문을 바탕으로, 현재 질문과 관련된 이전 대화만을 선별하여 컨텍스트를 제공하세요.
@@ -961,26 +931,29 @@ async def analyze_user_intent(user_message: str, history: List[Dict]) -> str:
 
 분석 결과:"""
 
-        response = await client.post(
-            "/chat/completions",
-            json={
-                "model": "gpt-3.5-turbo",
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": system_prompt.format(
-                            user_message=user_message, history_text=history_text
-                        ),
-                    },
-                    {
-                        "role": "user",
-                        "content": f"현재 질문: {user_message}\n\n이전 대화:\n{history_text}",
-                    },
-                ],
-                "max_tokens": 150,
-                "temperature": 0.3,
-            },
-        )
+        async with pooled_client("openai") as client:
+            response = await client.post(
+                OPENAI_CHAT_COMPLETIONS_URL,
+                headers=_openai_headers(),
+                timeout=30.0,
+                json={
+                    "model": "gpt-3.5-turbo",
+                    "messages": [
+                        {
+                            "role": "system",
+                            "content": system_prompt.format(
+                                user_message=user_message, history_text=history_text
+                            ),
+                        },
+                        {
+                            "role": "user",
+                            "content": f"현재 질문: {user_message}\n\n이전 대화:\n{history_text}",
+                        },
+                    ],
+                    "max_tokens": 150,
+                    "temperature": 0.3,
+                },
+            )
 
         if response.status_code == 200:
             result = response.json()
@@ -1008,26 +981,28 @@ async def summarize_chat_history(history: List[Dict], max_tokens: int = 80) -> s
             history_text += f"Q{i}: {chat['query']}\nA{i}: {chat['response']}\n\n"
 
         # OpenAI API 호출 (개선된 시스템 프롬프트)
-        openai_client = await get_openai_client()
-        response = await openai_client.post(
-            "/chat/completions",
-            json={
-                "model": "gpt-3.5-turbo",
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "다음 대화를 80토큰 이하로 완전히 요약하세요. 핵심 정보만 포함하고, 문장을 중간에 끊지 마세요. 반드시 완전한 문장으로 마무리하세요.",
-                    },
-                    {
-                        "role": "user",
-                        "content": f"다음 대화를 요약해주세요:\n\n{history_text}",
-                    },
-                ],
-                "max_tokens": max_tokens,
-                "temperature": 0.1,  # 더 일관된 요약을 위해 낮춤
-                "stop": None,  # 중간에 끊기지 않도록 stop 토큰 제거
-            },
-        )
+        async with pooled_client("openai") as openai_client:
+            response = await openai_client.post(
+                OPENAI_CHAT_COMPLETIONS_URL,
+                headers=_openai_headers(),
+                timeout=30.0,
+                json={
+                    "model": "gpt-3.5-turbo",
+                    "messages": [
+                        {
+                            "role": "system",
+                            "content": "다음 대화를 80토큰 이하로 완전히 요약하세요. 핵심 정보만 포함하고, 문장을 중간에 끊지 마세요. 반드시 완전한 문장으로 마무리하세요.",
+                        },
+                        {
+                            "role": "user",
+                            "content": f"다음 대화를 요약해주세요:\n\n{history_text}",
+                        },
+                    ],
+                    "max_tokens": max_tokens,
+                    "temperature": 0.1,  # 더 일관된 요약을 위해 낮춤
+                    "stop": None,  # 중간에 끊기지 않도록 stop 토큰 제거
+                },
+            )
 
         if response.status_code == 200:
             result = response.json()
@@ -16,8 +16,7 @@ from app.schemas.content_enhancement import (
 from app.services.runpod_manager import get_vllm_manager
 from app.services.content_enhancement_service import ContentEnhancementService
 from app.models.influencer import AIInfluencer
-from app.models.user import HFTokenManage
-from app.core.encryption import decrypt_sensitive_data
+from app.services.hf_token_resolver import get_hf_token_resolver
 from app.core.security import get_current_user
 from app.services.runpod_manager import get_vllm_manager
 import logging
@@ -207,19 +206,13 @@ async def transform_with_influencer_tone(
             raise HTTPException(
                 status_code=400, detail="허깅페이스 토큰이 설정되지 않았습니다."
             )
-        hf_token = (
-            db.query(HFTokenManage)
-            .filter(HFTokenManage.hf_manage_id == ai_influencer.hf_manage_id)
-            .first()
+        decrypted_token, _ = get_hf_token_resolver().get_token_for_influencer(
+            ai_influencer, db
         )
-        if not hf_token:
+        if not decrypted_token:
             raise HTTPException(
                 status_code=404, detail="허깅페이스 토큰을 찾을 수 없습니다."
             )
-        encrypted_token_value = getattr(hf_token, "hf_token_value", None)
-        if not encrypted_token_value:
-            raise HTTPException(status_code=400, detail="토큰 값이 없습니다.")
-        decrypted_token = decrypt_sensitive_data(encrypted_token_value)
 
         # 인플루언서 성격과 톤 정보 가져오기
         personality = getattr(ai_influencer, "influencer_personality", None)
@@ -3,7 +3,7 @@ DOCUMENTS 테이블 API 엔드포인트
 """
 
 from typing import List, Optional, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, Query, File, UploadFile, Form
+from fastapi import APIRouter, Depends, HTTPException, Query, File, UploadFile, Form, Request
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 from sqlalchemy import select
@@ -265,8 +265,13 @@ async def get_vectorized_documents(
 
 
 @router.get("/{documents_id}/download")
-async def download_document(documents_id: str, db: Session = Depends(get_db)):
-    """문서 다운로드 (Presigned URL 반환)"""
+async def download_document(
+    documents_id: str,
+    request: Request,
+    stream: bool = Query(False, description="파일을 직접 스트리밍 (기본: Presigned URL 반환)"),
+    db: Session = Depends(get_db),
+):
+    """문서 다운로드 (Presigned URL 반환, stream=true면 파일 스트리밍)"""
     try:
         rag_document_service = get_rag_document_service()
         document = await rag_document_service.get_document_by_id(
@@ -276,6 +281,28 @@ async def download_document(documents_id: str, db: Session = Depends(get_db)):
         if not document:
             raise HTTPException(status_code=404, detail="문서를 찾을 수 없습니다.")
 
+        if stream:
+            from app.services.s3_service import get_s3_service
+            from app.services.download_proxy import stream_s3_object
+
+            s3_service = get_s3_service()
+            if not s3_service.is_available():
+                raise HTTPException(
+                    status_code=500, detail="S3 서비스를 사용할 수 없습니다."
+                )
+
+            s3_url = document["s3_url"]
+            s3_key = s3_url.split(".com/")[-1] if ".com/" in s3_url else s3_url
+
+            # S3 객체를 메모리에 올리지 않고 청크 단위로 전달 (Range/ETag 지원)
+            return await stream_s3_object(
+                s3_service.storage,
+                s3_key,
+                request,
+                filename=document["documents_name"],
+                cache_control="private, max-age=3600",
+            )
+
         # S3에서 presigned URL 생성
         try:
             from app.services.s3_service import get_s3_service
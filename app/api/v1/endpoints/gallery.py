@@ -31,7 +31,11 @@ async def get_gallery_images(
                     "storage_id": "uuid",
                     "group_id": 1,
                     "created_at": "2024-01-01T00:00:00",
-                    "s3_url": "https://presigned-url..."
+                    "s3_url": "https://presigned-url...",
+                    "thumbnail_url": "https://presigned-url... (그리드용 WebP, 없으면 원본)",
+                    "medium_url": "https://presigned-url... (상세 미리보기용 WebP, 없으면 원본)",
+                    "width": 1024,
+                    "height": 1024
                 }
             ],
             "pagination": {
@@ -6,7 +6,7 @@ WebSocket을 통한 실시간 세션 상태 모니터링 및 이미지 생성
 
 """
 
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, WebSocket, WebSocketDisconnect, status, Query
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Request, WebSocket, WebSocketDisconnect, status, Query
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
@@ -14,18 +14,26 @@ from typing import Optional, Dict, Any, List
 import logging
 import asyncio
 import json
-import io
 import time
 from datetime import datetime
 from app.database import get_async_db
 
 
 from app.core.security import get_current_user
+from app.core.config import settings
 from app.services.user_session_service import get_user_session_service
+from app.services.session_state_bus import get_session_state_bus, refresh_remaining_seconds
 from app.services.image_storage_service import get_image_storage_service
 from app.services.comfyui_flux_service import get_comfyui_flux_service
 from app.services.prompt_optimization_service import get_prompt_optimization_service
 from app.services.s3_service import get_s3_service
+from app.services.download_proxy import (
+    own_s3_urls,
+    parse_own_s3_key,
+    stream_s3_object,
+    stream_url,
+    verify_presigned_s3_url,
+)
 from app.models.user import User
 
 logger = logging.getLogger(__name__)
@@ -281,7 +289,8 @@ async def generate_image(
             await image_storage_service.save_generated_image_url(
                 s3_url=s3_url,
                 group_id=group_id,
-                db=db
+                db=db,
+                image_data=image_data
             )
             
         except Exception as e:
@@ -554,6 +563,27 @@ from app.websocket import get_ws_manager
 manager = get_ws_manager()
 
 
+def _drain_queue(queue: asyncio.Queue):
+    """이미 전송한 상태와 같은 대기 중 이벤트 제거"""
+    while not queue.empty():
+        queue.get_nowait()
+
+
+def _needs_status_recheck(session_status: Optional[dict]) -> bool:
+    """하트비트 시 DB/RunPod 재조회가 필요한 상태인지 확인 (failed Pod 또는 만료 시각 경과)"""
+    if not session_status:
+        return False
+    if session_status.get("pod_status") == "failed":
+        return True
+    return any(
+        remaining is not None and remaining <= 0
+        for remaining in (
+            session_status.get("session_remaining_seconds"),
+            session_status.get("processing_remaining_seconds"),
+        )
+    )
+
+
 @router.websocket("/ws")
 async def websocket_endpoint(
     websocket: WebSocket,
@@ -593,22 +623,36 @@ async def websocket_endpoint(
         # WebSocket 연결
         await manager.connect(websocket, user_id)
         
-        # 초기 세션 상태 전송
+        # 세션 상태 변경 구독 (상태 전이 시에만 전송, 연결 수만큼 주기 조회하지 않음)
         user_session_service = get_user_session_service()
+        state_bus = get_session_state_bus()
+        state_queue = state_bus.subscribe(user_id)
+        
+        # 초기 세션 상태 전송
         session_status = await user_session_service.get_session_status(user_id, db)
+        state_bus.prime(user_id, session_status)
+        _drain_queue(state_queue)
         
         await manager.send_message(user_id, {
             "type": "session_status",
             "data": session_status or {"pod_status": "none"}
         })
         
-        # 주기적인 세션 상태 업데이트를 위한 태스크
+        # 세션 상태 변경 push + 느린 하트비트
         async def send_session_updates():
+            heartbeat = settings.SESSION_STATUS_HEARTBEAT_SECONDS or None
             while True:
                 try:
-                    await asyncio.sleep(5)  # 5초마다 상태 업데이트
+                    try:
+                        session_status = await asyncio.wait_for(state_queue.get(), timeout=heartbeat)
+                    except asyncio.TimeoutError:
+                        # 하트비트: 마지막 상태의 남은 시간만 갱신 (DB 조회 없음)
+                        session_status = refresh_remaining_seconds(state_bus.get_state(user_id))
+                        if _needs_status_recheck(session_status):
+                            # failed Pod 재확인 또는 만료 처리가 필요한 경우에만 조회
+                            session_status = await user_session_service.get_session_status(user_id, db)
+                            _drain_queue(state_queue)
                     
-                    session_status = await user_session_service.get_session_status(user_id, db)
                     await manager.send_message(user_id, {
                         "type": "session_status",
                         "data": session_status or {"pod_status": "none"}
@@ -874,8 +918,9 @@ async def websocket_endpoint(
                 "data": {"message": str(e)}
             })
         finally:
-            # 백그라운드 태스크 종료
+            # 백그라운드 태스크 종료 및 구독 해제
             update_task.cancel()
+            state_bus.unsubscribe(user_id, state_queue)
             
     except Exception as e:
         logger.error(f"WebSocket connection error: {e}")
@@ -1040,7 +1085,8 @@ async def handle_websocket_image_generation(
         storage_id = await image_storage_service.save_generated_image_url(
             s3_url=s3_url,
             group_id=group_id,
-            db=db
+            db=db,
+            image_data=image_data
         )
         
         # 11. 완료
@@ -1113,8 +1159,46 @@ async def _get_user_with_groups(user_id: str, db: AsyncSession) -> Optional[User
         return None
 
 
+async def _can_read_own_image(
+    url: str, s3_key: str, current_user: Dict, s3_service, db: AsyncSession
+) -> bool:
+    """자체 버킷 객체 직접 스트리밍 허용 여부
+
+    유효한(만료 전) presigned URL이거나, 사용자 그룹의 IMAGE_STORAGE 이미지인 경우만 허용
+    """
+    if verify_presigned_s3_url(
+        url, s3_service.bucket_name, s3_service.aws_access_key_id, s3_service.aws_secret_access_key
+    ):
+        return True
+
+    user_id = current_user.get("sub")
+    user = await _get_user_with_groups(user_id, db) if user_id else None
+    if not user or not user.teams:
+        return False
+
+    from sqlalchemy import or_, select
+    from app.models.image_storage import ImageStorage
+
+    candidates = own_s3_urls(s3_key, s3_service.bucket_name, s3_service.aws_region)
+    candidates.add(url.split("?", 1)[0])
+    result = await db.execute(
+        select(ImageStorage.storage_id)
+        .where(
+            ImageStorage.group_id.in_([team.group_id for team in user.teams]),
+            or_(
+                ImageStorage.s3_url.in_(candidates),
+                # presigned URL 형태로 저장된 레코드
+                *(ImageStorage.s3_url.startswith(f"{candidate}?", autoescape=True) for candidate in candidates),
+            ),
+        )
+        .limit(1)
+    )
+    return result.first() is not None
+
+
 @router.get("/proxy-download")
 async def proxy_download_image(
+    request: Request,
     url: str = Query(..., description="다운로드할 이미지 URL"),
     current_user: Dict = Depends(get_current_user),
     db: AsyncSession = Depends(get_async_db)
@@ -1122,11 +1206,9 @@ async def proxy_download_image(
     """
     S3 이미지 다운로드 프록시 엔드포인트
     CORS 문제를 해결하기 위해 백엔드를 통해 이미지를 다운로드
+    (받은 청크를 바로 전달, Range/조건부 요청 지원)
     """
     try:
-        import httpx
-        from fastapi.responses import StreamingResponse
-        
         # URL 디코딩
         decoded_url = url
         
@@ -1136,25 +1218,28 @@ async def proxy_download_image(
         if not decoded_url.startswith(('https://', 'http://')):
             raise HTTPException(status_code=400, detail="유효하지 않은 URL입니다")
         
-        # 이미지 다운로드
-        async with httpx.AsyncClient() as client:
-            response = await client.get(decoded_url, follow_redirects=True)
-            
-            if response.status_code != 200:
-                raise HTTPException(status_code=response.status_code, detail="이미지 다운로드 실패")
-            
-            # Content-Type 확인
-            content_type = response.headers.get('content-type', 'image/png')
-            
-            # StreamingResponse로 반환
-            return StreamingResponse(
-                io.BytesIO(response.content),
-                media_type=content_type,
-                headers={
-                    "Content-Disposition": f"attachment; filename=image.png",
-                    "Cache-Control": "public, max-age=3600"
-                }
-            )
+        # 자체 버킷 이미지는 접근 권한이 확인된 경우에만 S3에서 직접 스트리밍
+        s3_service = get_s3_service()
+        s3_key = None
+        if s3_service.is_available():
+            s3_key = parse_own_s3_key(decoded_url, s3_service.bucket_name, s3_service.aws_region)
+            if s3_key and await _can_read_own_image(decoded_url, s3_key, current_user, s3_service, db):
+                return await stream_s3_object(
+                    s3_service.storage,
+                    s3_key,
+                    request,
+                    filename="image.png",
+                    cache_control="private, max-age=3600",
+                )
+        
+        # 그 외 URL은 공유 커넥션 풀로 스트리밍 (자체 버킷 URL이면 S3가 서명/공개 여부로 접근 판단)
+        return await stream_url(
+            decoded_url,
+            request,
+            filename="image.png",
+            cache_control="private, max-age=3600" if s3_key else "public, max-age=3600",
+            default_media_type="image/png",
+        )
             
     except HTTPException:
         raise
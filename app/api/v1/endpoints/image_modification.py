@@ -10,10 +10,7 @@ from typing import Optional, Dict, Any
 from fastapi import APIRouter, UploadFile, File, Form, Depends, HTTPException, status, WebSocket, WebSocketDisconnect, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-import httpx
 import io
-from PIL import Image
-from pathlib import Path
 import base64
 
 from app.database import get_async_db, get_db
@@ -23,8 +20,12 @@ from app.services.image_storage_service import get_image_storage_service
 from app.services.prompt_optimization_service import get_prompt_optimization_service
 from app.services.image_analysis_service import get_image_analysis_service
 from app.core.config import settings
+from app.core.http_clients import pooled_client
 from app.websocket.manager import WebSocketManager
 from app.services.comfyui_synthesis_service import get_comfyui_synthesis_service
+from app.services.comfyui_event_listener import get_comfyui_event_hub
+from app.services.workflow_templates import IMAGE_MODIFY, get_workflow_template_registry
+from app.services.image_pipeline import ImageProcessingError, get_image_pipeline
 
 logger = logging.getLogger(__name__)
 
@@ -34,23 +35,8 @@ class ImageModificationService:
     """이미지 수정 서비스"""
     
     def __init__(self):
-        self.workflow_path = Path(__file__).parent.parent.parent.parent.parent / "workflows" / "image_modify_text_simple.json"
-        self.base_workflow = None
-        self._load_workflow()
-    
-    def _load_workflow(self):
-        """이미지 수정 워크플로우 로드"""
-        try:
-            if self.workflow_path.exists():
-                with open(self.workflow_path, 'r', encoding='utf-8') as f:
-                    self.base_workflow = json.load(f)
-                logger.info(f"✅ 이미지 수정 워크플로우 로드 완료: {self.workflow_path}")
-            else:
-                logger.error(f"❌ 워크플로우 파일을 찾을 수 없음: {self.workflow_path}")
-                raise Exception(f"필수 워크플로우 파일이 없습니다: {self.workflow_path}")
-        except Exception as e:
-            logger.error(f"❌ 워크플로우 로드 실패: {e}")
-            raise Exception(f"이미지 수정 워크플로우 초기화 실패: {e}")
+        # 워크플로우는 레지스트리에서 한 번만 로드/검증 (변경 시 자동 갱신)
+        self.templates = get_workflow_template_registry()
     
     async def upload_image_to_comfyui(
         self, 
@@ -73,7 +59,7 @@ class ImageModificationService:
             # ComfyUI 업로드 엔드포인트
             upload_url = f"{comfyui_endpoint.rstrip('/')}/upload/image"
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client("runpod_pod") as client:
                 response = await client.post(upload_url, files=files, data=data)
                 
                 if response.status_code == 200:
@@ -90,47 +76,40 @@ class ImageModificationService:
     
     def inject_modification_params(
         self, 
-        workflow: Dict[str, Any], 
         uploaded_filename: str,
         edit_instruction: str,
         lora_settings: Optional[Dict[str, Any]] = None,
         image_width: Optional[int] = None,
         image_height: Optional[int] = None
     ) -> Dict[str, Any]:
-        """워크플로우에 수정 파라미터 주입"""
+        """수정 파라미터를 주입한 실행용 워크플로우 생성"""
         try:
+            import random
             
-            if "1" in workflow:
-                workflow["1"]["inputs"]["image"] = uploaded_filename
-                logger.info(f"✅ DiptychCreate 노드에 이미지 설정: {uploaded_filename} (이미지 분할 처리)")
-            
-            # InContextEditInstruction 노드 (ID: 9)에 수정 지시사항 설정
-            if "9" in workflow:
-                workflow["9"]["inputs"]["editText"] = edit_instruction
-                logger.info(f"✅ 수정 지시사항 설정: {edit_instruction}")
-            
-            
-            if "6" in workflow:
-                import random
-                workflow["6"]["inputs"]["seed"] = random.randint(0, 2**32 - 1)
-                logger.info(f"✅ 랜덤 시드 설정: {workflow['6']['inputs']['seed']}")
+            params: Dict[str, Any] = {
+                # DiptychCreate 노드 (ID: 1) - 이미지 분할 처리
+                "image": uploaded_filename,
+                # InContextEditInstruction 노드 (ID: 9) - 수정 지시사항
+                "edit_text": edit_instruction,
+                # KSampler 노드 (ID: 6) - 랜덤 시드
+                "seed": random.randint(0, 2**32 - 1),
+            }
+            logger.info(f"✅ 수정 파라미터 설정: 이미지={uploaded_filename}, 지시사항={edit_instruction}, 시드={params['seed']}")
             
             # Power Lora Loader 노드 (ID: 22)에 동적 LoRA 설정 적용
-            if lora_settings and "22" in workflow:
-                lora_node = workflow["22"]["inputs"]
-                
+            if lora_settings:
                 # LoRA 1 (동양인) 설정
                 if "lora_1_enabled" in lora_settings:
-                    lora_node["lora_1"]["on"] = lora_settings["lora_1_enabled"]
+                    params["lora_1_on"] = lora_settings["lora_1_enabled"]
                     if lora_settings["lora_1_enabled"] and "lora_1_strength" in lora_settings:
-                        lora_node["lora_1"]["strength"] = lora_settings["lora_1_strength"]
+                        params["lora_1_strength"] = lora_settings["lora_1_strength"]
                         logger.info(f"✅ LoRA 1 (동양인) 설정: 활성화={lora_settings['lora_1_enabled']}, 강도={lora_settings['lora_1_strength']}")
                 
                 # LoRA 2 (서양인) 설정
                 if "lora_2_enabled" in lora_settings:
-                    lora_node["lora_2"]["on"] = lora_settings["lora_2_enabled"]
+                    params["lora_2_on"] = lora_settings["lora_2_enabled"]
                     if lora_settings["lora_2_enabled"] and "lora_2_strength" in lora_settings:
-                        lora_node["lora_2"]["strength"] = lora_settings["lora_2_strength"]
+                        params["lora_2_strength"] = lora_settings["lora_2_strength"]
                         logger.info(f"✅ LoRA 2 (서양인) 설정: 활성화={lora_settings['lora_2_enabled']}, 강도={lora_settings['lora_2_strength']}")
                 
                 # LoRA 3 (필수 Power LoRA)은 항상 유지
@@ -140,22 +119,18 @@ class ImageModificationService:
                 if "analysis" in lora_settings:
                     logger.info(f"📊 이미지 분석 결과: {lora_settings['analysis']}")
             
-            # ImageCrop 노드 설정 - 수정된 이미지(오른쪽 절반)만 추출
-            if "19" in workflow and image_width and image_height:
+            # ImageCrop 노드 (ID: 19) 설정 - 수정된 이미지(오른쪽 절반)만 추출
+            if image_width and image_height:
                 # VAEDecode 출력은 원본과 수정본이 가로로 붙은 이미지
                 # 따라서 전체 너비는 image_width * 2
-                crop_node = workflow["19"]["inputs"]
-                crop_node["width"] = image_width  # 원본 이미지 너비
-                crop_node["height"] = image_height  # 원본 이미지 높이
-                crop_node["x"] = image_width  # 오른쪽 절반 시작 위치
-                crop_node["y"] = 0
+                params["crop_width"] = image_width  # 원본 이미지 너비
+                params["crop_height"] = image_height  # 원본 이미지 높이
+                params["crop_x"] = image_width  # 오른쪽 절반 시작 위치
+                params["crop_y"] = 0
                 logger.info(f"✅ ImageCrop 노드 설정: 수정된 이미지만 추출 (x={image_width}, 크기={image_width}x{image_height})")
-            
-            # 이미지 크기 정보 로깅
-            if image_width and image_height:
                 logger.info(f"📐 입력 이미지 크기: {image_width}x{image_height}")
             
-            return workflow
+            return self.templates.build(IMAGE_MODIFY, **params)
             
         except Exception as e:
             logger.error(f"❌ 워크플로우 파라미터 주입 실패: {e}")
@@ -170,14 +145,16 @@ class ImageModificationService:
         """수정 워크플로우 실행"""
         try:
             # API 형식으로 변환
+            # 실행 이벤트가 리스너 소켓으로 전달되도록 리스너의 client_id 사용
+            listener = get_comfyui_event_hub().get_listener(comfyui_endpoint)
             api_request = {
                 "prompt": workflow,
-                "client_id": str(uuid.uuid4())
+                "client_id": listener.client_id
             }
             
             prompt_url = f"{comfyui_endpoint.rstrip('/')}/prompt"
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client("runpod_pod") as client:
                 response = await client.post(prompt_url, json=api_request)
                 
                 if response.status_code == 200:
@@ -209,59 +186,40 @@ class ImageModificationService:
         max_wait_time: int = 300,
         progress_callback: Optional[callable] = None
     ) -> Optional[Dict[str, Any]]:
-        """워크플로우 실행 결과 대기"""
-        import asyncio
+        """워크플로우 실행 결과 대기 (ComfyUI WebSocket 완료/진행률 이벤트)"""
         
-        history_url = f"{comfyui_endpoint.rstrip('/')}/history/{prompt_id}"
+        async def on_progress(value: int, maximum: int):
+            if progress_callback and maximum:
+                # 샘플링 단계 진행률을 50% ~ 80% 구간으로 변환
+                progress = 50 + int(30 * min(value, maximum) / maximum)
+                await progress_callback("modifying", progress, f"이미지 수정 중... ({value}/{maximum}단계)")
         
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            for attempt in range(max_wait_time // 5):
-                await asyncio.sleep(5)
-                
-                try:
-                    response = await client.get(history_url)
-                    
-                    if response.status_code == 200:
-                        history = response.json()
-                        
-                        if prompt_id in history:
-                            execution = history[prompt_id]
-                            
-                            # 실행 상태 확인
-                            status = execution.get("status", {})
-                            
-                            # 진행률 계산 및 콜백
-                            if progress_callback:
-                                # 대략적인 진행률 계산 (50% ~ 80%)
-                                progress = 50 + min(30, (attempt + 1) * 3)
-                                await progress_callback("modifying", progress, f"이미지 수정 중... ({attempt + 1}단계)")
-                            
-                            if status.get("status_str") == "success" and status.get("completed", False):
-                                logger.info(f"✅ 워크플로우 실행 완료: {prompt_id}")
-                                logger.info(f"📊 실행 결과 구조: {list(execution.keys())}")
-                                
-                                # status 정보 상세 로깅
-                                logger.info(f"📊 Status 정보: {json.dumps(status, indent=2, default=str)}")
-                                
-                                # meta 정보 확인
-                                if "meta" in execution:
-                                    logger.info(f"📊 Meta 정보: {json.dumps(execution['meta'], indent=2, default=str)[:300]}...")
-                                
-                                if "outputs" in execution:
-                                    return self._extract_result_image(execution)
-                                else:
-                                    logger.warning(f"⚠️ outputs가 없지만 완료됨. 전체 실행 구조: {json.dumps(execution, indent=2, default=str)[:500]}...")
-                            elif status.get("status_str") == "error":
-                                logger.error(f"❌ 워크플로우 실행 오류: {status}")
-                                if "error" in execution:
-                                    logger.error(f"❌ 오류 상세: {json.dumps(execution['error'], indent=2, default=str)}")
-                                return None
-                                
-                except Exception as e:
-                    logger.warning(f"⚠️ 결과 확인 중 오류: {e}")
-                    continue
-        
-        logger.error(f"❌ 워크플로우 실행 타임아웃: {prompt_id}")
+        listener = get_comfyui_event_hub().get_listener(comfyui_endpoint)
+        execution = await listener.wait_for_execution(prompt_id, max_wait_time, on_progress=on_progress)
+        if execution is None:
+            return None
+        
+        status = execution.get("status", {})
+        if status.get("status_str") == "error":
+            logger.error(f"❌ 워크플로우 실행 오류: {status}")
+            if "error" in execution:
+                logger.error(f"❌ 오류 상세: {json.dumps(execution['error'], indent=2, default=str)}")
+            return None
+        
+        logger.info(f"✅ 워크플로우 실행 완료: {prompt_id}")
+        logger.info(f"📊 실행 결과 구조: {list(execution.keys())}")
+        
+        # status 정보 상세 로깅
+        logger.info(f"📊 Status 정보: {json.dumps(status, indent=2, default=str)}")
+        
+        # meta 정보 확인
+        if "meta" in execution:
+            logger.info(f"📊 Meta 정보: {json.dumps(execution['meta'], indent=2, default=str)[:300]}...")
+        
+        if "outputs" in execution:
+            return self._extract_result_image(execution)
+        
+        logger.warning(f"⚠️ outputs가 없지만 완료됨. 전체 실행 구조: {json.dumps(execution, indent=2, default=str)[:500]}...")
         return None
     
     def _extract_result_image(self, execution: Dict[str, Any]) -> Dict[str, Any]:
@@ -330,7 +288,7 @@ class ImageModificationService:
                 "subfolder": subfolder
             }
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client("runpod_pod") as client:
                 response = await client.get(view_url, params=params)
                 
                 if response.status_code == 200:
@@ -383,11 +341,10 @@ async def modify_image_simple(
         # 이미지 파일 읽기
         image_data = await image.read()
         
-        # 이미지 검증
+        # 이미지 검증 (메타데이터는 이후 크기 확인에 재사용)
         try:
-            img = Image.open(io.BytesIO(image_data))
-            img.verify()
-        except Exception as e:
+            image_metadata = await get_image_pipeline().inspect(image_data)
+        except ImageProcessingError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="유효하지 않은 이미지 파일입니다"
@@ -474,15 +431,10 @@ async def modify_image_simple(
             }
         
         # 3. 워크플로우에 파라미터 주입 (최적화된 프롬프트와 LoRA 설정 사용)
-        import copy
-        workflow = copy.deepcopy(image_modification_service.base_workflow)
-        
-        # 이미지 크기 재확인
-        img = Image.open(io.BytesIO(image_data))
-        image_width, image_height = img.size
+        # 검증 시 확인한 이미지 크기 사용 (EXIF 방향 적용, ComfyUI LoadImage와 동일)
+        image_width, image_height = image_metadata.width, image_metadata.height
         
         workflow = image_modification_service.inject_modification_params(
-            workflow=workflow,
             uploaded_filename=upload_filename,
             edit_instruction=optimized_instruction,
             lora_settings=lora_settings,
@@ -557,7 +509,8 @@ async def modify_image_simple(
         await image_storage_service.save_generated_image_url(
             s3_url=s3_url,
             group_id=team_id,
-            db=db
+            db=db,
+            image_data=result_image_data
         )
         
         # 세션 완료 처리 (10분 연장)
@@ -572,10 +525,10 @@ async def modify_image_simple(
         
         # 수정된 이미지의 실제 크기 확인
         try:
-            modified_img = Image.open(io.BytesIO(result_image_data))
-            actual_width, actual_height = modified_img.size
+            result_metadata = await get_image_pipeline().inspect(result_image_data)
+            actual_width, actual_height = result_metadata.width, result_metadata.height
             logger.info(f"✅ 수정된 이미지 크기: {actual_width}x{actual_height}")
-        except:
+        except ImageProcessingError:
             # 크기 확인 실패 시 원본 크기 사용
             actual_width, actual_height = image_width, image_height
         
@@ -648,14 +601,11 @@ async def handle_websocket_image_modification(
         except Exception as e:
             raise Exception(f"이미지 디코딩 실패: {str(e)}")
         
-        # 이미지 검증
+        # 이미지 검증 및 크기 정보
         try:
-            img = Image.open(io.BytesIO(image_data))
-            img.verify()
-            # 이미지 크기 정보
-            img = Image.open(io.BytesIO(image_data))
-            width, height = img.size
-        except Exception as e:
+            image_metadata = await get_image_pipeline().inspect(image_data)
+            width, height = image_metadata.width, image_metadata.height
+        except ImageProcessingError:
             raise Exception("유효하지 않은 이미지 파일입니다")
         
         # 2. 사용자 팀 정보 확인
@@ -760,10 +710,7 @@ async def handle_websocket_image_modification(
         # 8. 워크플로우 준비
         await send_progress("preparing_workflow", 40, "수정 워크플로우 준비 중...")
         
-        import copy
-        workflow = copy.deepcopy(image_modification_service.base_workflow)
         workflow = image_modification_service.inject_modification_params(
-            workflow=workflow,
             uploaded_filename=upload_filename,
             edit_instruction=optimized_instruction,
             lora_settings=lora_settings,
@@ -816,7 +763,8 @@ async def handle_websocket_image_modification(
         await image_storage_service.save_generated_image_url(
             s3_url=s3_url,
             group_id=team_id,
-            db=db
+            db=db,
+            image_data=result_image_data
         )
         
         # 세션 완료 처리
@@ -834,10 +782,10 @@ async def handle_websocket_image_modification(
         
         # 수정된 이미지의 실제 크기 확인
         try:
-            modified_img = Image.open(io.BytesIO(result_image_data))
-            actual_width, actual_height = modified_img.size
+            result_metadata = await get_image_pipeline().inspect(result_image_data)
+            actual_width, actual_height = result_metadata.width, result_metadata.height
             logger.info(f"✅ 수정된 이미지 크기: {actual_width}x{actual_height}")
-        except:
+        except ImageProcessingError:
             # 크기 확인 실패 시 원본 크기 사용
             actual_width, actual_height = width, height
         
@@ -1077,7 +1025,8 @@ async def synthesize_images(
         await image_storage_service.save_generated_image_url(
             s3_url=s3_url,
             group_id=team_id,
-            db=db
+            db=db,
+            image_data=result_image_data
         )
         
         # 10. Presigned URL 생성
@@ -8,9 +8,11 @@ from fastapi import (
     File,
     Form,
     Header,
+    Request,
 )
 from fastapi.responses import StreamingResponse
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
 import os
@@ -19,7 +21,7 @@ import json
 import uuid
 import asyncio
 import time
-from app.database import get_db
+from app.database import get_db, get_async_db
 from app.schemas.influencer import (
     AIInfluencer as AIInfluencerSchema,
     AIInfluencerWithDetails,
@@ -42,16 +44,25 @@ from app.core.security import get_current_user
 from app.models.user import User
 from app.core.permissions import check_team_resource_permission
 from app.services.influencers.crud import (
-    get_influencers_list,
+    get_influencers_list_async,
     get_influencer_by_id,
+    get_influencer_by_id_async,
     create_influencer,
     update_influencer,
     delete_influencer,
 )
 from app.services.influencers.style_presets import (
     get_style_presets,
+    get_style_presets_with_mbti,
     create_style_preset,
 )
+from app.services.catalog_cache import (
+    INFLUENCERS,
+    MBTI,
+    PRIVATE_CACHE_CONTROL,
+    STYLE_PRESETS,
+    get_catalog_cache,
+)
 from app.services.influencers.mbti import get_mbti_list
 from app.services.influencers.instagram import (
     InstagramConnectRequest,
@@ -64,7 +75,7 @@ from app.services.background_tasks import (
     get_background_task_manager,
     BackgroundTaskManager,
 )
-from fastapi import Request, status
+from fastapi import status
 from app.services.influencers.qa_generator import QAGenerationStatus
 from app.services.finetuning_service import (
     get_finetuning_service,
@@ -81,7 +92,11 @@ import os
 import json
 from pydantic import BaseModel
 from app.models.influencer import APICallAggregation
+from app.services.api_key_cache import APIKeyContext, get_api_key_cache, load_api_key_context
+from app.services.hf_token_resolver import get_hf_token_resolver
+from app.services.api_usage_counter import get_api_usage_counter
 from app.services.qa_generation_service import get_qa_generation_service
+from app.services.voice_asset_cache import get_voice_asset_cache
 from app.schemas.influencer_qa import (
     ToneGenerationResponse,
     QAGenerationRequest,
@@ -101,8 +116,8 @@ async def verify_api_key(
     x_api_key: Optional[str] = Header(None, alias="X-API-Key"),
     authorization: Optional[str] = Header(None),
     db: Session = Depends(get_db),
-) -> AIInfluencer:
-    """API 키를 검증하고 해당 인플루언서를 반환합니다."""
+) -> APIKeyContext:
+    """API 키를 검증하고 해당 인플루언서 컨텍스트를 반환합니다. (캐시 적중 시 DB 조회 없음)"""
 
     # API 키 추출 (헤더에서)
     api_key = None
@@ -121,13 +136,16 @@ async def verify_api_key(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    api_key_cache = get_api_key_cache()
+    context = api_key_cache.get(api_key)
+    if context is not None:
+        return context
+
     try:
-        # API 키로 인플루언서 조회
-        influencer_api = (
-            db.query(InfluencerAPI).filter(InfluencerAPI.api_value == api_key).first()
-        )
+        # API 키로 인플루언서 조회 (캐시 미스 시에만)
+        context = load_api_key_context(api_key, db)
 
-        if not influencer_api:
+        if not context:
             logger.warning(f"❌ 잘못된 API 키 시도: {api_key[:10]}...")
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -135,37 +153,28 @@ async def verify_api_key(
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        # 인플루언서 정보 조회
-        influencer = (
-            db.query(AIInfluencer)
-            .filter(AIInfluencer.influencer_id == influencer_api.influencer_id)
-            .first()
-        )
-
-        if not influencer:
-            logger.error(
-                f"❌ API 키는 유효하지만 인플루언서를 찾을 수 없음: {influencer_api.influencer_id}"
-            )
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Influencer not found",
-            )
-
         # 인플루언서가 사용 가능한 상태인지 확인 (학습 상태와 관계없이 접근 허용)
-        if influencer.learning_status is None:
+        if context.learning_status is None:
             logger.warning(
-                f"⚠️ 학습 상태가 설정되지 않은 인플루언서 접근: {influencer.influencer_name}"
+                f"⚠️ 학습 상태가 설정되지 않은 인플루언서 접근: {context.influencer_name}"
             )
-        elif influencer.learning_status != 1:
+        elif context.learning_status != 1:
             logger.info(
-                f"ℹ️ 학습 중인 인플루언서 접근: {influencer.influencer_name} (status: {influencer.learning_status})"
+                f"ℹ️ 학습 중인 인플루언서 접근: {context.influencer_name} (status: {context.learning_status})"
             )
 
-        logger.info(f"✅ API 키 인증 성공: {influencer.influencer_name}")
-        return influencer
+        api_key_cache.put(api_key, context)
+        logger.info(f"✅ API 키 인증 성공: {context.influencer_name}")
+        return context
 
     except HTTPException:
         raise
+    except LookupError as e:
+        logger.error(f"❌ API 키는 유효하지만 인플루언서를 찾을 수 없음: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Influencer not found",
+        )
     except Exception as e:
         logger.error(f"❌ API 키 인증 중 오류: {str(e)}")
         raise HTTPException(
@@ -177,74 +186,24 @@ async def verify_api_key(
 # 스타일 프리셋 관련 API (구체적인 경로를 먼저 정의)
 @router.get("/style-presets", response_model=List[StylePresetWithMBTI])
 async def get_style_presets_list(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
-    """스타일 프리셋 목록 조회 (MBTI 정보 포함)"""
+    """스타일 프리셋 목록 조회 (MBTI 정보 포함, 응답 캐시 + ETag)"""
     logger.info(f"🎯 스타일 프리셋 목록 조회 API 호출됨 - skip: {skip}, limit: {limit}")
     try:
-        # StylePreset과 ModelMBTI를 조인하여 조회
-        from app.models.influencer import StylePreset, ModelMBTI, AIInfluencer
-
-        # 프리셋과 MBTI 정보를 함께 조회
-        presets_with_mbti = []
-        presets = db.query(StylePreset).offset(skip).limit(limit).all()
-
-        for preset in presets:
-            # 해당 프리셋을 사용하는 인플루언서들의 MBTI 정보 수집
-            # 가장 많이 사용되는 MBTI를 찾기 위해 서브쿼리 사용
-            from sqlalchemy import func
-
-            mbti_counts = (
-                db.query(
-                    ModelMBTI.mbti_id,
-                    ModelMBTI.mbti_name,
-                    ModelMBTI.mbti_traits,
-                    ModelMBTI.mbti_speech,
-                    func.count(AIInfluencer.influencer_id).label("count"),
-                )
-                .join(AIInfluencer, ModelMBTI.mbti_id == AIInfluencer.mbti_id)
-                .filter(
-                    AIInfluencer.style_preset_id == preset.style_preset_id,
-                    AIInfluencer.mbti_id.isnot(None),
-                )
-                .group_by(
-                    ModelMBTI.mbti_id,
-                    ModelMBTI.mbti_name,
-                    ModelMBTI.mbti_traits,
-                    ModelMBTI.mbti_speech,
-                )
-                .order_by(func.count(AIInfluencer.influencer_id).desc())
-                .first()
-            )
-
-            # MBTI 정보가 있으면 가장 많이 사용되는 것을 사용, 없으면 None
-            mbti_info = mbti_counts if mbti_counts else None
-
-            # 프리셋 데이터를 딕셔너리로 변환
-            preset_dict = {
-                "style_preset_id": preset.style_preset_id,
-                "style_preset_name": preset.style_preset_name,
-                "influencer_type": preset.influencer_type,
-                "influencer_gender": preset.influencer_gender,
-                "influencer_age_group": preset.influencer_age_group,
-                "influencer_hairstyle": preset.influencer_hairstyle,
-                "influencer_style": preset.influencer_style,
-                "influencer_personality": preset.influencer_personality,
-                "influencer_speech": preset.influencer_speech,
-                "created_at": preset.created_at,
-                "updated_at": preset.updated_at,
-                "mbti_name": mbti_info.mbti_name if mbti_info else None,
-                "mbti_traits": mbti_info.mbti_traits if mbti_info else None,
-                "mbti_speech": mbti_info.mbti_speech if mbti_info else None,
-            }
-
-            presets_with_mbti.append(StylePresetWithMBTI(**preset_dict))
-
-        logger.info(f"✅ 프리셋 조회 성공 - 개수: {len(presets_with_mbti)}")
-        return presets_with_mbti
+        # 프리셋별 가장 많이 사용되는 MBTI는 캐시 미스 시 한 번의 집계 쿼리로 조회
+        return get_catalog_cache().respond(
+            request,
+            key=f"style_presets_with_mbti:{skip}:{limit}",
+            namespaces=(STYLE_PRESETS, INFLUENCERS, MBTI),
+            build=lambda: get_style_presets_with_mbti(db, skip, limit),
+            response_type=List[StylePresetWithMBTI],
+            cache_control=PRIVATE_CACHE_CONTROL,
+        )
     except Exception as e:
         logger.error(f"❌ 프리셋 조회 실패: {str(e)}")
         raise HTTPException(
@@ -282,10 +241,19 @@ async def get_style_preset_by_id(
 # MBTI 관련 API
 @router.get("/mbti", response_model=List[ModelMBTISchema])
 async def get_mbti_options(
-    db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
 ):
     """MBTI 목록 조회"""
-    return get_mbti_list(db)
+    return get_catalog_cache().respond(
+        request,
+        key="mbti",
+        namespaces=(MBTI,),
+        build=lambda: get_mbti_list(db),
+        response_type=List[ModelMBTISchema],
+        cache_control=PRIVATE_CACHE_CONTROL,
+    )
 
 
 @router.post("/upload-image")
@@ -390,7 +358,7 @@ async def upload_influencer_image(
 async def get_influencers(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(get_current_user),
 ):
     """사용자별 AI 인플루언서 목록 조회"""
@@ -398,7 +366,7 @@ async def get_influencers(
     if not user_id:
         raise HTTPException(status_code=401, detail="User ID not found")
 
-    influencers = await get_influencers_list(db, user_id, skip, limit)
+    influencers = await get_influencers_list_async(db, user_id, skip, limit)
 
     # 목록에서는 이미지 URL 처리를 제거하여 성능 최적화
     # 프로필 이미지가 필요한 경우 별도 API를 통해 조회
@@ -414,7 +382,7 @@ async def get_influencers(
 @router.get("/{influencer_id}", response_model=AIInfluencerWithDetails)
 async def get_influencer(
     influencer_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(get_current_user),
 ):
     """특정 AI 인플루언서 조회"""
@@ -422,7 +390,7 @@ async def get_influencer(
     if not user_id:
         raise HTTPException(status_code=401, detail="User ID not found")
 
-    influencer = await get_influencer_by_id(db, user_id, influencer_id)
+    influencer = await get_influencer_by_id_async(db, user_id, influencer_id)
 
     # 이미지 URL을 S3 presigned URL로 변환
     if influencer.image_url:
@@ -740,8 +708,10 @@ async def get_qa_generation_status(
         openai_batch_status = None
         if batch_key_entry.openai_batch_id:
             try:
-                openai_batch_status = task_manager.qa_generator.check_batch_status(
-                    str(batch_key_entry.openai_batch_id)
+                openai_batch_status = (
+                    await task_manager.qa_generator.check_batch_status_async(
+                        str(batch_key_entry.openai_batch_id)
+                    )
                 )
 
             except Exception as e:
@@ -1062,21 +1032,16 @@ async def handle_openai_batch_webhook(
 
             # 백그라운드에서 결과 처리 및 S3 업로드 실행
             import asyncio
-            from app.database import get_db
             from app.services.influencers.qa_generator import InfluencerQAGenerator
 
             async def process_webhook_result():
-                """웹훅 결과 처리를 위한 별도 DB 세션 사용"""
-                webhook_db = next(get_db())
-                try:
-                    qa_generator_instance = (
-                        InfluencerQAGenerator()
-                    )  # 새로운 인스턴스 생성
-                    await qa_generator_instance.complete_qa_generation(
-                        batch_key_entry.task_id, webhook_db
-                    )
-                finally:
-                    webhook_db.close()
+                """웹훅 결과 처리 (결과 처리 워커 풀에서 별도 DB 세션 사용)"""
+                qa_generator_instance = (
+                    InfluencerQAGenerator()
+                )  # 새로운 인스턴스 생성
+                await qa_generator_instance.complete_qa_generation_async(
+                    batch_key_entry.task_id
+                )
 
             asyncio.create_task(process_webhook_result())
 
@@ -1562,6 +1527,7 @@ async def save_system_prompt(
         query.update({"system_prompt": request.data.strip()})
 
         db.commit()
+        get_api_key_cache().invalidate_influencer(influencer_id)
 
         logger.info(
             f"✅ 시스템 프롬프트 저장 완료: influencer_id={influencer_id}, type={request.type}"
@@ -1668,6 +1634,8 @@ async def generate_api_key(
             existing_api.api_value = new_api_key
             existing_api.updated_at = datetime.utcnow()
             db.commit()
+            # 이전 키로 캐시된 인증 정보 제거
+            get_api_key_cache().invalidate_influencer(influencer_id)
             logger.info(f"✅ API 키 업데이트 완료 - influencer_id: {influencer_id}")
         else:
             # 새로운 API 키 생성
@@ -1829,13 +1797,14 @@ async def get_api_key_usage(
 
     today = date.today()
 
+    # 날짜별 집계 행 도입 이전에 생성된 행이 함께 있을 수 있으므로 합산
     usage = (
         db.query(APICallAggregation)
         .filter(
             APICallAggregation.api_id == api_key.api_id,
             APICallAggregation.created_at >= today,
         )
-        .first()
+        .all()
     )
 
     # 전체 사용량 조회
@@ -1850,7 +1819,7 @@ async def get_api_key_usage(
     return {
         "influencer_id": influencer_id,
         "influencer_name": influencer.influencer_name,
-        "today_calls": usage.daily_call_count if usage else 0,
+        "today_calls": sum(u.daily_call_count for u in usage),
         "total_calls": total_calls,
         "api_key_created_at": api_key.created_at,
         "api_key_updated_at": api_key.updated_at,
@@ -1865,13 +1834,13 @@ async def get_api_key_usage(
 @router.post("/chat")
 async def chat_with_influencer(
     request: ChatRequest,
-    api_key: AIInfluencer = Depends(verify_api_key),
+    api_key: APIKeyContext = Depends(verify_api_key),
     db: Session = Depends(get_db),
 ):
     """API 키로 인증된 인플루언서와 대화"""
     try:
-        # API 사용량 추적
-        await track_api_usage(db, str(api_key.influencer_id))
+        # API 사용량 추적 (메모리 집계 후 주기적으로 저장)
+        track_api_usage(api_key)
 
         # RunPod 서비스 호출
         try:
@@ -1879,7 +1848,9 @@ async def chat_with_influencer(
 
             # vLLM 매니저 가져오기 및 서버 상태 확인
             vllm_manager = get_vllm_manager()
-            if not await vllm_manager.health_check():
+            # health check 결과는 짧게 캐시하여 요청마다 RunPod API를 호출하지 않음
+            health = await vllm_manager.cached_health_check()
+            if not health.endpoint_id:
                 logger.warning("vLLM 서버에 연결할 수 없어 기본 응답을 사용합니다.")
                 response_text = f"안녕하세요! 저는 {api_key.influencer_name}입니다. '{request.message}'에 대한 답변을 드리겠습니다."
             else:
@@ -1894,24 +1865,13 @@ async def chat_with_influencer(
                 if api_key.influencer_model_repo:
                     model_id = str(api_key.influencer_model_repo)
 
-                    # HF 토큰 가져오기
-                    from app.models.user import HFTokenManage
-                    from app.core.encryption import decrypt_sensitive_data
-
+                    # HF 토큰 (복호화된 값은 리졸버 캐시에서 재사용)
                     hf_token = None
-                    if hasattr(api_key, "group_id") and api_key.group_id:
-                        hf_token_manage = (
-                            db.query(HFTokenManage)
-                            .filter(HFTokenManage.group_id == api_key.group_id)
-                            .order_by(HFTokenManage.created_at.desc())
-                            .first()
+                    if api_key.group_id:
+                        hf_token, _ = get_hf_token_resolver().get_token_by_group(
+                            api_key.group_id, db, prefer_default=False
                         )
 
-                        if hf_token_manage:
-                            hf_token = decrypt_sensitive_data(
-                                str(hf_token_manage.hf_token_value)
-                            )
-
                     # 메시지 구성
                     messages = []
                     if system_message:
@@ -1975,69 +1935,9 @@ async def chat_with_influencer(
         raise HTTPException(status_code=500, detail="챗봇 대화 중 오류가 발생했습니다.")
 
 
-async def track_api_usage(db: Session, influencer_id: str):
-    """API 사용량을 추적하여 APICallAggregation 테이블에 기록"""
-    try:
-        logger.info(f"📊 API 사용량 추적 시작 - influencer_id: {influencer_id}")
-        
-        from datetime import date
-
-        # 해당 인플루언서의 API 키 조회
-        api_key = (
-            db.query(InfluencerAPI)
-            .filter(InfluencerAPI.influencer_id == influencer_id)
-            .first()
-        )
-
-        if not api_key:
-            logger.warning(f"⚠️ API 키를 찾을 수 없음 - influencer_id: {influencer_id}")
-            return
-
-        logger.info(f"🔑 API 키 조회 성공 - api_id: {api_key.api_id}")
-
-        today = date.today()
-
-        # 오늘 날짜의 기존 집계 데이터 조회
-        existing_aggregation = (
-            db.query(APICallAggregation)
-            .filter(
-                APICallAggregation.api_id == api_key.api_id,
-                APICallAggregation.created_at >= today,
-            )
-            .first()
-        )
-
-        if existing_aggregation:
-            # 기존 데이터가 있으면 호출 횟수 증가
-            old_count = existing_aggregation.daily_call_count
-            existing_aggregation.daily_call_count += 1
-            existing_aggregation.updated_at = datetime.utcnow()
-            logger.info(
-                f"✅ 기존 집계 업데이트 - api_id: {api_key.api_id}, influencer_id: {influencer_id}, 이전: {old_count}, 현재: {existing_aggregation.daily_call_count}"
-            )
-
-        else:
-            # 새로운 집계 데이터 생성
-            new_aggregation = APICallAggregation(
-                api_id=api_key.api_id,
-                influencer_id=influencer_id,
-                daily_call_count=1,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
-            )
-            db.add(new_aggregation)
-            logger.info(
-                f"🆕 새로운 집계 생성 - api_id: {api_key.api_id}, influencer_id: {influencer_id}, daily_calls: 1"
-            )
-
-        db.commit()
-        logger.info(f"💾 API 사용량 추적 완료 - influencer_id: {influencer_id}, api_id: {api_key.api_id}")
-
-    except Exception as e:
-        logger.error(
-            f"❌ API 사용량 추적 실패 - influencer_id: {influencer_id}, error: {str(e)}"
-        )
-        db.rollback()
+def track_api_usage(api_key: APIKeyContext):
+    """API 사용량을 메모리에 집계 (APICallAggregation 저장은 백그라운드에서 일괄 처리)"""
+    get_api_usage_counter().increment(api_key.api_id, api_key.influencer_id)
 
 
 # Base64 음성 업로드 요청 모델
@@ -2122,6 +2022,7 @@ async def upload_base_voice(
             .first()
         )
 
+        previous_s3_key = existing_voice.s3_key if existing_voice else None
         if existing_voice:
             # 기존 음성 업데이트
             existing_voice.file_name = wav_filename
@@ -2144,6 +2045,13 @@ async def upload_base_voice(
 
         db.commit()
 
+        # 같은 S3 키에 덮어쓰므로 참조 음성 캐시와 인플루언서 → 음성 조회 결과 제거
+        # (다음 TTS는 새 수정 시각으로 음성 버전이 바뀌어 이전 TTS 결과 캐시를 사용하지 않음)
+        voice_cache = get_voice_asset_cache()
+        voice_cache.invalidate(s3_key, influencer_id=influencer.influencer_id)
+        if previous_s3_key and previous_s3_key != s3_key:
+            voice_cache.invalidate(previous_s3_key)
+
         return {
             "message": "베이스 음성이 성공적으로 업로드되었습니다 (WAV로 변환됨)",
             "s3_url": s3_url,
@@ -2651,6 +2559,8 @@ async def receive_finetuning_result(
             )
 
         db.commit()
+        # 사용 가능 인플루언서 목록이 바뀌었을 수 있으므로 카탈로그 캐시 무효화
+        get_catalog_cache().invalidate(INFLUENCERS)
         
         return FineTuningResultResponse(
             success=True,
@@ -5,8 +5,7 @@ import os
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models.influencer import AIInfluencer
-from app.models.user import HFTokenManage
-from app.core.encryption import decrypt_sensitive_data
+from app.services.hf_token_resolver import get_hf_token_resolver
 from app.core.security import get_current_user
 import re
 from fastapi import HTTPException
@@ -147,6 +146,7 @@ async def multi_chat(request: MultiChatRequest, db: Session = Depends(get_db), c
     
     # 병렬 처리를 위한 태스크 리스트
     tasks = []
+    hf_token_resolver = get_hf_token_resolver()
     
     for influencer_info in request.influencers:
         logger.info(f"Processing influencer: {influencer_info.influencer_id}, repo: {influencer_info.influencer_model_repo}")
@@ -188,14 +188,10 @@ async def multi_chat(request: MultiChatRequest, db: Session = Depends(get_db), c
             tasks.append(asyncio.create_task(return_no_hf_token()))
             continue
 
-        # 허깅페이스 토큰 조회
-        hf_token = (
-            db.query(HFTokenManage)
-            .filter(HFTokenManage.hf_manage_id == ai_influencer.hf_manage_id)
-            .first()
-        )
+        # 허깅페이스 토큰 조회 (복호화된 토큰은 리졸버 캐시에서 재사용)
+        decrypted_token, _ = hf_token_resolver.get_token_for_influencer(ai_influencer, db)
 
-        if not hf_token:
+        if not decrypted_token:
             async def return_hf_not_found():
                 return InfluencerResponse(
                     influencer_id=influencer_info.influencer_id,
@@ -204,19 +200,6 @@ async def multi_chat(request: MultiChatRequest, db: Session = Depends(get_db), c
             tasks.append(asyncio.create_task(return_hf_not_found()))
             continue
 
-        # 허깅페이스 토큰 복호화
-        encrypted_token_value = getattr(hf_token, "hf_token_value", None)
-        if not encrypted_token_value:
-            async def return_no_token_value():
-                return InfluencerResponse(
-                    influencer_id=influencer_info.influencer_id,
-                    response="토큰 값이 없습니다."
-                )
-            tasks.append(asyncio.create_task(return_no_token_value()))
-            continue
-        
-        decrypted_token = decrypt_sensitive_data(encrypted_token_value)
-
         # 비동기 태스크 생성
         task = asyncio.create_task(
             process_single_influencer(
@@ -1,11 +1,12 @@
 """
 공개 MBTI API 엔드포인트
 인증 없이 접근 가능한 MBTI 및 스타일 프리셋 데이터 제공
+목록/단건 응답은 카탈로그 캐시에서 반환하며 ETag로 재검증 (If-None-Match → 304)
 
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from sqlalchemy.orm import Session, joinedload
 from typing import List
 import logging
 
@@ -16,6 +17,7 @@ from app.schemas.influencer import (
     StylePreset as StylePresetSchema,
     AIInfluencer as AIInfluencerSchema,
 )
+from app.services.catalog_cache import INFLUENCERS, MBTI, STYLE_PRESETS, get_catalog_cache
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -27,38 +29,29 @@ router = APIRouter()
 @router.get("/mbti", response_model=List[ModelMBTISchema])
 @router.get("/mbti/", response_model=List[ModelMBTISchema])
 async def get_mbti_list(
+    request: Request,
     db: Session = Depends(get_db)
 ):
     """
     MBTI 목록 조회 (공개 API - 인증 불필요)
     SRP: MBTI 데이터 조회만 담당
     """
-    try:
-        logger.info("공개 MBTI 목록 조회 시작")
-        
-        # 데이터베이스 연결 확인
-        if not db:
-            logger.error("데이터베이스 연결 실패")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="데이터베이스 연결에 실패했습니다"
-            )
-        
-        # MBTI 데이터 조회
+    def load_mbti_list():
         mbti_list = db.query(ModelMBTI).all()
         logger.info(f"MBTI 데이터 조회 완료: {len(mbti_list)}개")
-        
-        # 데이터가 없는 경우
         if not mbti_list:
-            logger.warning("MBTI 데이터가 비어있습니다")
             # 빈 배열 반환 (404가 아닌 정상 응답)
-            return []
-        
-        # 각 MBTI 데이터 로깅 (처음 3개만)
-        for i, mbti in enumerate(mbti_list[:3]):
-            logger.info(f"MBTI {i+1}: ID={mbti.mbti_id}, NAME={mbti.mbti_name}")
-        
+            logger.warning("MBTI 데이터가 비어있습니다")
         return mbti_list
+
+    try:
+        return get_catalog_cache().respond(
+            request,
+            key="mbti",
+            namespaces=(MBTI,),
+            build=load_mbti_list,
+            response_type=List[ModelMBTISchema],
+        )
         
     except HTTPException:
         # 이미 처리된 HTTP 예외는 다시 발생
@@ -74,12 +67,11 @@ async def get_mbti_list(
 @router.get("/mbti/{mbti_id}", response_model=ModelMBTISchema)
 async def get_mbti_by_id(
     mbti_id: int,
+    request: Request,
     db: Session = Depends(get_db)
 ):
     """특정 MBTI 정보 조회 (공개 API)"""
-    try:
-        logger.info(f"MBTI ID {mbti_id} 조회 시작")
-        
+    def load_mbti():
         mbti = db.query(ModelMBTI).filter(ModelMBTI.mbti_id == mbti_id).first()
         
         if not mbti:
@@ -88,9 +80,16 @@ async def get_mbti_by_id(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"MBTI ID {mbti_id}를 찾을 수 없습니다"
             )
-        
-        logger.info(f"MBTI 조회 완료: {mbti.mbti_name}")
         return mbti
+
+    try:
+        return get_catalog_cache().respond(
+            request,
+            key=f"mbti:{mbti_id}",
+            namespaces=(MBTI,),
+            build=load_mbti,
+            response_type=ModelMBTISchema,
+        )
         
     except HTTPException:
         raise
@@ -105,6 +104,7 @@ async def get_mbti_by_id(
 @router.get("/style-presets", response_model=List[StylePresetSchema])
 @router.get("/style-presets/", response_model=List[StylePresetSchema])
 async def get_style_presets(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     db: Session = Depends(get_db),
@@ -114,12 +114,13 @@ async def get_style_presets(
     SRP: 스타일 프리셋 데이터 조회만 담당
     """
     try:
-        logger.info("공개 스타일 프리셋 목록 조회 시작")
-        
-        presets = db.query(StylePreset).offset(skip).limit(limit).all()
-        logger.info(f"스타일 프리셋 조회 완료: {len(presets)}개")
-        
-        return presets
+        return get_catalog_cache().respond(
+            request,
+            key=f"style_presets:{skip}:{limit}",
+            namespaces=(STYLE_PRESETS,),
+            build=lambda: db.query(StylePreset).offset(skip).limit(limit).all(),
+            response_type=List[StylePresetSchema],
+        )
         
     except Exception as e:
         logger.error(f"스타일 프리셋 조회 중 오류: {str(e)}", exc_info=True)
@@ -174,6 +175,7 @@ async def check_public_api_health(db: Session = Depends(get_db)):
 @router.get("/influencers", response_model=List[AIInfluencerSchema])
 @router.get("/influencers/", response_model=List[AIInfluencerSchema])
 async def get_public_influencers(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
     db: Session = Depends(get_db)
@@ -182,21 +184,28 @@ async def get_public_influencers(
     AI 인플루언서 목록 조회 (공개 API - 인증 불필요)
     테스트 및 개발용으로 사용 가능한 인플루언서 목록만 반환
     """
-    try:
-        logger.info("공개 AI 인플루언서 목록 조회 시작")
-        
+    def load_influencers():
         # 사용 가능한 인플루언서만 조회 (learning_status=1)
+        # 응답에 포함되는 프리셋/MBTI는 함께 로드하여 항목별 추가 쿼리 방지
         influencers = (
             db.query(AIInfluencer)
+            .options(joinedload(AIInfluencer.style_preset), joinedload(AIInfluencer.mbti))
             .filter(AIInfluencer.learning_status == 1)  # 사용 가능 상태만
             .offset(skip)
             .limit(limit)
             .all()
         )
-        
         logger.info(f"공개 AI 인플루언서 조회 완료: {len(influencers)}개")
-        
         return influencers
+
+    try:
+        return get_catalog_cache().respond(
+            request,
+            key=f"influencers:{skip}:{limit}",
+            namespaces=(INFLUENCERS, STYLE_PRESETS, MBTI),
+            build=load_influencers,
+            response_type=List[AIInfluencerSchema],
+        )
         
     except Exception as e:
         logger.error(f"공개 AI 인플루언서 조회 중 오류: {str(e)}", exc_info=True)
@@ -209,14 +218,14 @@ async def get_public_influencers(
 @router.get("/influencers/{influencer_id}", response_model=AIInfluencerSchema)
 async def get_public_influencer_by_id(
     influencer_id: str,
+    request: Request,
     db: Session = Depends(get_db)
 ):
     """특정 AI 인플루언서 정보 조회 (공개 API)"""
-    try:
-        logger.info(f"공개 AI 인플루언서 ID {influencer_id} 조회 시작")
-        
+    def load_influencer():
         influencer = (
             db.query(AIInfluencer)
+            .options(joinedload(AIInfluencer.style_preset), joinedload(AIInfluencer.mbti))
             .filter(
                 AIInfluencer.influencer_id == influencer_id,
                 AIInfluencer.learning_status == 1  # 사용 가능 상태만
@@ -230,9 +239,16 @@ async def get_public_influencer_by_id(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"AI 인플루언서 ID {influencer_id}를 찾을 수 없거나 사용할 수 없습니다"
             )
-        
-        logger.info(f"공개 AI 인플루언서 조회 완료: {influencer.influencer_name}")
         return influencer
+
+    try:
+        return get_catalog_cache().respond(
+            request,
+            key=f"influencer:{influencer_id}",
+            namespaces=(INFLUENCERS, STYLE_PRESETS, MBTI),
+            build=load_influencer,
+            response_type=AIInfluencerSchema,
+        )
         
     except HTTPException:
         raise
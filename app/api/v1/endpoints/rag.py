@@ -13,6 +13,7 @@ import logging
 from datetime import datetime
 
 from app.core.config import settings
+from app.core.http_clients import pooled_client
 from app.database import get_db
 from app.services.rag_service import get_rag_service
 from app.services.rag_processor import process_with_rag
@@ -75,14 +76,12 @@ class VectorStatsResponse(BaseModel):
 
 async def _check_vllm_server_with_retry(max_retries: int = 3) -> bool:
     """VLLM 서버 상태 확인 (재시도 포함)"""
-    import httpx
-
     vllm_url = settings.VLLM_BASE_URL or "http://localhost:8001"
 
     for attempt in range(max_retries):
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{vllm_url}/health")
+            async with pooled_client("vllm") as client:
+                response = await client.get(f"{vllm_url}/health", timeout=5.0)
                 if response.status_code == 200:
                     logger.info("✅ VLLM 서버 연결 확인됨")
                     return True
@@ -154,8 +153,6 @@ async def upload_document_gpu(
             source_file = file.filename
             logger.info("💾 vLLM 서버 벡터DB 저장 시작")
 
-            import httpx
-
             # QA 쌍을 DocumentChunk 형식으로 변환
             documents = []
             for i, qa in enumerate(qa_pairs):
@@ -176,7 +173,7 @@ async def upload_document_gpu(
             vllm_url = settings.VLLM_BASE_URL or "http://localhost:8001"
             logger.info(f"🔗 vLLM 서버 URL: {vllm_url}")
 
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with pooled_client("vllm") as client:
                 # 1. 벡터DB 초기화
                 logger.info("🗑️ 벡터DB 초기화 시작")
                 clear_response = await client.delete(f"{vllm_url}/vector-db/clear")
@@ -532,13 +529,11 @@ async def embed_and_search(
 async def get_vector_stats():
     """vLLM 서버의 Milvus 벡터DB 통계 및 상태 확인"""
     try:
-        import httpx
-
         # vLLM 서버의 벡터DB 통계 API 호출
         vllm_url = settings.VLLM_BASE_URL or "http://localhost:8001"
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(f"{vllm_url}/vector-db/stats")
+        async with pooled_client("vllm") as client:
+            response = await client.get(f"{vllm_url}/vector-db/stats", timeout=30.0)
 
             if response.status_code == 200:
                 vllm_stats = response.json()
@@ -578,13 +573,11 @@ async def get_vector_stats():
 async def clear_vector_store():
     """vLLM 서버의 Milvus 벡터DB 초기화"""
     try:
-        import httpx
-
         # vLLM 서버의 벡터DB 초기화 API 호출
         vllm_url = settings.VLLM_BASE_URL or "http://localhost:8001"
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.delete(f"{vllm_url}/vector-db/clear")
+        async with pooled_client("vllm") as client:
+            response = await client.delete(f"{vllm_url}/vector-db/clear", timeout=30.0)
 
             if response.status_code == 200:
                 result = response.json()
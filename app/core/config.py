@@ -32,6 +32,8 @@ class Settings(BaseSettings):
     )
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 10080  # 7 days
+    # 검증된 JWT 캐시 최대 항목 수
+    JWT_VERIFY_CACHE_SIZE: int = int(os.getenv("JWT_VERIFY_CACHE_SIZE", "10000"))
 
     # CORS 설정
     BACKEND_CORS_ORIGINS: List[str] = [
@@ -61,6 +63,29 @@ class Settings(BaseSettings):
     AWS_REGION: str = "ap-northeast-2"
     S3_BUCKET_NAME: Optional[str] = None
     S3_ENABLED: bool = True
+    # S3 호환 서버(MinIO, moto 등) 사용 시 엔드포인트 URL
+    S3_ENDPOINT_URL: Optional[str] = os.getenv("S3_ENDPOINT_URL") or None
+    # boto3 호출 전용 스레드 풀 크기
+    S3_MAX_WORKERS: int = int(os.getenv("S3_MAX_WORKERS", "16"))
+    # 이 크기 이상이면 멀티파트 업로드
+    S3_MULTIPART_THRESHOLD: int = int(
+        os.getenv("S3_MULTIPART_THRESHOLD", str(8 * 1024 * 1024))
+    )
+    S3_MULTIPART_CHUNKSIZE: int = int(
+        os.getenv("S3_MULTIPART_CHUNKSIZE", str(8 * 1024 * 1024))
+    )
+    S3_MULTIPART_CONCURRENCY: int = int(os.getenv("S3_MULTIPART_CONCURRENCY", "4"))
+    # 다운로드 프록시 동시 스트리밍 수 및 청크 크기
+    PROXY_DOWNLOAD_CONCURRENCY: int = int(os.getenv("PROXY_DOWNLOAD_CONCURRENCY", "32"))
+    PROXY_DOWNLOAD_CHUNK_SIZE: int = int(os.getenv("PROXY_DOWNLOAD_CHUNK_SIZE", str(64 * 1024)))
+    # presigned URL 캐시 최대 항목 수
+    PRESIGNED_URL_CACHE_SIZE: int = int(os.getenv("PRESIGNED_URL_CACHE_SIZE", "10000"))
+    # 이미지 파생본(WebP 썸네일/중간 크기) 생성 프로세스 수 (0이면 스레드에서 처리)
+    IMAGE_PIPELINE_WORKERS: int = int(os.getenv("IMAGE_PIPELINE_WORKERS", "2"))
+    # 파생본 긴 변 최대 길이(px)와 WebP 품질
+    IMAGE_THUMBNAIL_SIZE: int = int(os.getenv("IMAGE_THUMBNAIL_SIZE", "320"))
+    IMAGE_MEDIUM_SIZE: int = int(os.getenv("IMAGE_MEDIUM_SIZE", "1024"))
+    IMAGE_WEBP_QUALITY: int = int(os.getenv("IMAGE_WEBP_QUALITY", "80"))
 
     # 소셜 로그인 설정
     GOOGLE_CLIENT_ID: Optional[str] = None
@@ -71,6 +96,24 @@ class Settings(BaseSettings):
     INSTAGRAM_APP_SECRET: Optional[str] = os.getenv("INSTAGRAM_APP_SECRET")
     WEBHOOK_VERIFY_TOKEN: Optional[str] = os.getenv("WEBHOOK_VERIFY_TOKEN")
 
+    # 공개 챗봇 API 키 캐시 (최대 항목 수 / 유효 시간(초)) 및 호출 수 저장 주기 (초)
+    API_KEY_CACHE_SIZE: int = int(os.getenv("API_KEY_CACHE_SIZE", "5000"))
+    API_KEY_CACHE_TTL: int = int(os.getenv("API_KEY_CACHE_TTL", "300"))
+    API_USAGE_FLUSH_INTERVAL: float = float(os.getenv("API_USAGE_FLUSH_INTERVAL", "10"))
+
+    # 복호화된 HF 토큰 캐시 (인플루언서/그룹 → 토큰, 토큰 변경 시 무효화)
+    HF_TOKEN_CACHE_SIZE: int = int(os.getenv("HF_TOKEN_CACHE_SIZE", "1000"))
+    HF_TOKEN_CACHE_TTL: int = int(os.getenv("HF_TOKEN_CACHE_TTL", "1800"))
+
+    # 게시글 목록의 Instagram 좋아요/댓글 수 캐시 (초)
+    INSTAGRAM_STATS_CACHE_TTL: int = int(os.getenv("INSTAGRAM_STATS_CACHE_TTL", "60"))
+    # TTL 경과 후 이 시간까지는 이전 값을 반환하고 백그라운드에서 갱신
+    INSTAGRAM_STATS_STALE_TTL: int = int(os.getenv("INSTAGRAM_STATS_STALE_TTL", "600"))
+
+    # MBTI / 스타일 프리셋 / 공개 인플루언서 목록 응답 캐시 (유효 시간(초) / 최대 항목 수)
+    CATALOG_CACHE_TTL: int = int(os.getenv("CATALOG_CACHE_TTL", "300"))
+    CATALOG_CACHE_SIZE: int = int(os.getenv("CATALOG_CACHE_SIZE", "500"))
+
     # 허깅페이스 설정
     HUGGINGFACE_API_URL: str = "https://api.huggingface.co"
     HUGGINGFACE_TIMEOUT: int = int(os.getenv("HUGGINGFACE_TIMEOUT", "30"))
@@ -84,6 +127,14 @@ class Settings(BaseSettings):
     COMFYUI_SERVER_URL: str = os.getenv("COMFYUI_SERVER_URL", "http://127.0.0.1:8188")
     COMFYUI_API_KEY: str = os.getenv("COMFYUI_API_KEY", "")
     COMFYUI_TIMEOUT: int = int(os.getenv("COMFYUI_TIMEOUT", "300"))
+    # 이미지 생성 WebSocket 세션 상태 하트비트 간격 (초, 0이면 변경 시에만 전송)
+    SESSION_STATUS_HEARTBEAT_SECONDS: int = int(os.getenv("SESSION_STATUS_HEARTBEAT_SECONDS", "60"))
+    # ComfyUI 완료 이벤트 WebSocket (소켓이 끊겼을 때만 /history 폴링, 대기 없는 연결 유지 시간(초))
+    COMFYUI_WS_FALLBACK_POLL_INTERVAL: float = float(os.getenv("COMFYUI_WS_FALLBACK_POLL_INTERVAL", "5"))
+    COMFYUI_WS_RECONNECT_DELAY: float = float(os.getenv("COMFYUI_WS_RECONNECT_DELAY", "2"))
+    COMFYUI_WS_IDLE_TIMEOUT: int = int(os.getenv("COMFYUI_WS_IDLE_TIMEOUT", "600"))
+    # workflows 디렉토리 변경 감지 간격 (초, 0이면 시작 시 한 번만 로드)
+    WORKFLOW_RELOAD_INTERVAL: float = float(os.getenv("WORKFLOW_RELOAD_INTERVAL", "5"))
 
     # RunPod 설정
     RUNPOD_API_KEY: str = os.getenv("RUNPOD_API_KEY", "")
@@ -94,6 +145,55 @@ class Settings(BaseSettings):
     RUNPOD_GPU_TYPE: str = os.getenv("RUNPOD_GPU_TYPE", "NVIDIA RTX 5090")
     RUNPOD_MAX_WORKERS: int = int(os.getenv("RUNPOD_MAX_WORKERS", "1"))
     RUNPOD_IDLE_TIMEOUT: int = int(os.getenv("RUNPOD_IDLE_TIMEOUT", "300"))  # 5분
+    RUNPOD_ENDPOINT_CACHE_TTL: int = int(
+        os.getenv("RUNPOD_ENDPOINT_CACHE_TTL", "300")
+    )  # serverless 엔드포인트 목록 캐시 (초)
+    RUNPOD_ENDPOINT_FAILURE_BACKOFF: int = int(
+        os.getenv("RUNPOD_ENDPOINT_FAILURE_BACKOFF", "15")
+    )  # 엔드포인트 목록 조회 실패 후 재조회까지 대기 (초)
+    RUNPOD_HEALTH_CACHE_TTL: int = int(
+        os.getenv("RUNPOD_HEALTH_CACHE_TTL", "30")
+    )  # 공개 챗봇 API의 serverless health check 결과 캐시 (초)
+
+    # ComfyUI 웜 Pod 풀 (준비된 유휴 Pod을 세션에 즉시 할당, 최대 크기 0이면 비활성화)
+    RUNPOD_POOL_MAX_SIZE: int = int(os.getenv("RUNPOD_POOL_MAX_SIZE", "0"))
+    RUNPOD_POOL_MIN_IDLE: int = int(os.getenv("RUNPOD_POOL_MIN_IDLE", "1"))
+    # 시간대별 유휴 Pod 수 (서버 시각 기준 "9-18:2,18-24:3", 비우면 사용 안 함)
+    RUNPOD_POOL_PROFILE: str = os.getenv("RUNPOD_POOL_PROFILE", "")
+    # 최근 세션 유입률 계산 구간 (초) - 유입률 × Pod 준비 시간만큼 미리 확보
+    RUNPOD_POOL_RATE_WINDOW: int = int(os.getenv("RUNPOD_POOL_RATE_WINDOW", "900"))
+    RUNPOD_POOL_MAX_REUSE: int = int(os.getenv("RUNPOD_POOL_MAX_REUSE", "20"))
+    RUNPOD_POOL_MAX_POD_AGE: int = int(os.getenv("RUNPOD_POOL_MAX_POD_AGE", "21600"))  # 6시간
+    # 목표보다 많은 유휴 Pod, 사용자 전용으로 반환된 Pod을 종료하기까지 유지 시간 (초)
+    RUNPOD_POOL_IDLE_TTL: int = int(os.getenv("RUNPOD_POOL_IDLE_TTL", "1200"))
+    RUNPOD_POOL_CHECK_INTERVAL: int = int(os.getenv("RUNPOD_POOL_CHECK_INTERVAL", "30"))
+    RUNPOD_POOL_MAX_CONCURRENT_BOOTS: int = int(os.getenv("RUNPOD_POOL_MAX_CONCURRENT_BOOTS", "2"))
+    # 남은 크레딧이 이 값보다 적으면 보충 중단 및 유휴 Pod 종료
+    RUNPOD_POOL_MIN_CREDITS: float = float(os.getenv("RUNPOD_POOL_MIN_CREDITS", "10"))
+    RUNPOD_POOL_CREDITS_CHECK_INTERVAL: int = int(os.getenv("RUNPOD_POOL_CREDITS_CHECK_INTERVAL", "300"))
+
+    # TTS 결과 캐시 (정규화 텍스트 + 음성 + 감정 + 모델 버전 해시, 메모리 LRU → 로컬 디스크)
+    TTS_CACHE_MAX_BYTES: int = int(os.getenv("TTS_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+    # 디스크 캐시 경로 (비우면 메모리 캐시만 사용)
+    TTS_CACHE_DIR: str = os.getenv("TTS_CACHE_DIR", "/tmp/aimex_tts_cache")
+    TTS_CACHE_DISK_MAX_BYTES: int = int(os.getenv("TTS_CACHE_DISK_MAX_BYTES", str(1024 * 1024 * 1024)))
+    # TTS 워커/모델 교체 시 변경하면 기존 캐시 항목이 모두 무효화됨
+    TTS_CACHE_MODEL_VERSION: str = os.getenv("TTS_CACHE_MODEL_VERSION", "zonos-tts")
+    # TTS 참조 음성 캐시 (S3 키 + ETag, 재검증 주기 이후 조건부 HEAD로 변경 확인)
+    VOICE_CACHE_MAX_BYTES: int = int(os.getenv("VOICE_CACHE_MAX_BYTES", str(128 * 1024 * 1024)))
+    VOICE_CACHE_REVALIDATE_SECONDS: float = float(os.getenv("VOICE_CACHE_REVALIDATE_SECONDS", "60"))
+
+    # vLLM 요청 디스패처 (같은 어댑터의 동시 요청을 모아 /run 제출 + 공유 /status 폴링)
+    VLLM_DISPATCH_ENABLED: bool = os.getenv("VLLM_DISPATCH_ENABLED", "true").lower() == "true"
+    VLLM_DISPATCH_WINDOW_MS: int = int(os.getenv("VLLM_DISPATCH_WINDOW_MS", "20"))
+    VLLM_DISPATCH_MAX_BATCH: int = int(os.getenv("VLLM_DISPATCH_MAX_BATCH", "16"))
+    VLLM_DISPATCH_POLL_INTERVAL: float = float(os.getenv("VLLM_DISPATCH_POLL_INTERVAL", "0.5"))
+    VLLM_DISPATCH_MAX_POLL_INTERVAL: float = float(os.getenv("VLLM_DISPATCH_MAX_POLL_INTERVAL", "2.0"))
+    VLLM_DISPATCH_JOB_TIMEOUT: int = int(os.getenv("VLLM_DISPATCH_JOB_TIMEOUT", "300"))
+    VLLM_DISPATCH_STATUS_CONCURRENCY: int = int(os.getenv("VLLM_DISPATCH_STATUS_CONCURRENCY", "20"))
+    # vLLM 스트리밍 /stream 폴링 간격 (새 토큰이 없으면 최대값까지 두 배씩 증가, 초)
+    VLLM_STREAM_POLL_INTERVAL: float = float(os.getenv("VLLM_STREAM_POLL_INTERVAL", "0.25"))
+    VLLM_STREAM_MAX_POLL_INTERVAL: float = float(os.getenv("VLLM_STREAM_MAX_POLL_INTERVAL", "2.0"))
 
     # 기존 실행 중인 RunPod 인스턴스 정보
     RUNPOD_EXISTING_ENDPOINT: str = os.getenv("RUNPOD_EXISTING_ENDPOINT", "")
@@ -124,6 +224,10 @@ class Settings(BaseSettings):
         "LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
 
+    # /metrics 지표 수집 (라우트 지연 히스토그램 샘플링 비율 0~1, 이벤트 루프 지연 측정 간격(초))
+    METRICS_ROUTE_SAMPLE_RATE: float = float(os.getenv("METRICS_ROUTE_SAMPLE_RATE", "0.1"))
+    EVENT_LOOP_LAG_INTERVAL: float = float(os.getenv("EVENT_LOOP_LAG_INTERVAL", "0.5"))
+
     # API 제한 설정
     RATE_LIMIT_PER_MINUTE: int = int(os.getenv("RATE_LIMIT_PER_MINUTE", "60"))
     RATE_LIMIT_PER_HOUR: int = int(os.getenv("RATE_LIMIT_PER_HOUR", "1000"))
@@ -140,6 +244,15 @@ class Settings(BaseSettings):
     # 캐시 설정
     CACHE_TTL: int = int(os.getenv("CACHE_TTL", "300"))  # 5 minutes
 
+    # 채팅 메시지 write-behind 저장 설정
+    CHAT_MESSAGE_BATCH_SIZE: int = int(os.getenv("CHAT_MESSAGE_BATCH_SIZE", "100"))
+    CHAT_MESSAGE_FLUSH_INTERVAL: float = float(
+        os.getenv("CHAT_MESSAGE_FLUSH_INTERVAL", "1.0")
+    )  # 초
+    CHAT_MESSAGE_QUEUE_MAXSIZE: int = int(
+        os.getenv("CHAT_MESSAGE_QUEUE_MAXSIZE", "10000")
+    )
+
     # QA 생성 설정
     QA_GENERATION_COUNT: int = int(
         os.getenv("QA_GENERATION_COUNT", "2000")
@@ -157,6 +270,12 @@ class Settings(BaseSettings):
     OPENAI_POLLING_INTERVAL_MINUTES: int = int(
         os.getenv("OPENAI_POLLING_INTERVAL_MINUTES", "7")
     )  # 폴링 간격 (분)
+    OPENAI_BATCH_STATUS_CONCURRENCY: int = int(
+        os.getenv("OPENAI_BATCH_STATUS_CONCURRENCY", "5")
+    )  # 배치 상태 동시 조회 수
+    OPENAI_BATCH_RESULT_WORKERS: int = int(
+        os.getenv("OPENAI_BATCH_RESULT_WORKERS", "2")
+    )  # 결과 다운로드/처리 워커 수
     OPENAI_WEBHOOK_URL: str = os.getenv(
         "OPENAI_WEBHOOK_URL",
         "http://localhost:8000/api/v1/influencers/webhooks/openai/batch-complete",
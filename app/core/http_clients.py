@@ -0,0 +1,270 @@
+"""
+애플리케이션 범위 HTTP 클라이언트 레지스트리
+외부 서비스(upstream)별로 커넥션 풀을 공유하여 요청마다 발생하던 TCP/TLS 핸드셰이크를 제거
+- upstream별 커넥션 수 제한, keep-alive, 타임아웃, 재시도 정책
+- h2 패키지가 설치된 경우 HTTP/2 사용
+- lifespan에서 초기화하고 종료 시 닫음
+- upstream별 호출 지연은 /metrics 히스토그램으로 기록
+"""
+
+import asyncio
+import importlib.util
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+import aiohttp
+import httpx
+
+from app.core.metrics import InstrumentedTransport, build_aiohttp_trace_config
+
+logger = logging.getLogger(__name__)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+
+@dataclass(frozen=True)
+class UpstreamPolicy:
+    """upstream별 커넥션/타임아웃/재시도 정책"""
+
+    timeout: float = 30.0
+    connect_timeout: float = 10.0
+    max_connections: int = 50
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    http2: bool = True
+    # 연결 실패 시 transport 레벨 재시도 횟수
+    connect_retries: int = 1
+    # 아래 상태 코드 응답 시 멱등 요청 재시도 횟수
+    status_retries: int = 0
+    retry_statuses: Tuple[int, ...] = (429, 502, 503, 504)
+    backoff_seconds: float = 0.5
+    verify_ssl: bool = True
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+UPSTREAM_POLICIES: Dict[str, UpstreamPolicy] = {
+    # api.runpod.io GraphQL (엔드포인트/파드 관리)
+    "runpod_graphql": UpstreamPolicy(timeout=30.0, max_connections=20, connect_retries=2, status_retries=2),
+    # api.runpod.ai/v2 serverless 작업 API (runsync는 최대 300초 대기)
+    "runpod_api": UpstreamPolicy(timeout=300.0, max_connections=100, max_keepalive_connections=50, status_retries=1),
+    # RunPod 파드 프록시 (ComfyUI/JupyterLab) - 프록시 인증서 문제로 검증 생략
+    "runpod_pod": UpstreamPolicy(timeout=30.0, max_connections=50, http2=False, verify_ssl=False),
+    "instagram": UpstreamPolicy(timeout=30.0, max_connections=20, status_retries=2),
+    # 소셜 로그인 OAuth (Google/Naver 토큰 교환, 사용자 정보)
+    "oauth": UpstreamPolicy(timeout=10.0, max_connections=20),
+    "openai": UpstreamPolicy(timeout=120.0, max_connections=50, connect_retries=2),
+    # RAG/임베딩용 vLLM 서버
+    "vllm": UpstreamPolicy(timeout=60.0, max_connections=20, http2=False),
+    # 로컬 MCP 서버
+    "mcp": UpstreamPolicy(timeout=30.0, max_connections=20, http2=False),
+    # presigned URL 다운로드 등 S3 HTTP 접근
+    "s3": UpstreamPolicy(timeout=60.0, max_connections=50),
+    "default": UpstreamPolicy(),
+}
+
+
+def get_policy(upstream: str) -> UpstreamPolicy:
+    """upstream 정책 반환 (없으면 default)"""
+    return UPSTREAM_POLICIES.get(upstream, UPSTREAM_POLICIES["default"])
+
+
+def build_http_client(upstream: str = "default", **overrides: Any) -> httpx.AsyncClient:
+    """정책이 적용된 새 httpx.AsyncClient 생성 (호출자가 수명 관리)"""
+    policy = get_policy(upstream)
+    limits = httpx.Limits(
+        max_connections=policy.max_connections,
+        max_keepalive_connections=policy.max_keepalive_connections,
+        keepalive_expiry=policy.keepalive_expiry,
+    )
+    http2 = policy.http2 and HTTP2_AVAILABLE
+    transport = httpx.AsyncHTTPTransport(
+        retries=policy.connect_retries,
+        limits=limits,
+        http2=http2,
+        verify=policy.verify_ssl,
+    )
+    options: Dict[str, Any] = {
+        "timeout": httpx.Timeout(policy.timeout, connect=policy.connect_timeout),
+        "transport": InstrumentedTransport(transport, upstream),
+        "headers": policy.headers,
+    }
+    options.update(overrides)
+    return httpx.AsyncClient(**options)
+
+
+def build_aiohttp_session(upstream: str = "default") -> aiohttp.ClientSession:
+    """정책이 적용된 새 aiohttp.ClientSession 생성 (호출자가 수명 관리)"""
+    policy = get_policy(upstream)
+    connector = aiohttp.TCPConnector(
+        limit=policy.max_connections,
+        limit_per_host=policy.max_connections,
+        keepalive_timeout=policy.keepalive_expiry,
+        ssl=None if policy.verify_ssl else False,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=policy.timeout, connect=policy.connect_timeout),
+        headers=policy.headers,
+        trace_configs=[build_aiohttp_trace_config(upstream)],
+    )
+
+
+class HTTPClientRegistry:
+    """upstream별 공유 클라이언트 보관소"""
+
+    def __init__(self):
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._sessions: Dict[str, aiohttp.ClientSession] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def bind(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """공유 클라이언트를 사용할 이벤트 루프 지정"""
+        loop = loop or asyncio.get_running_loop()
+        if self._loop is not None and loop is not self._loop:
+            self._clients.clear()
+            self._sessions.clear()
+        self._loop = loop
+
+    def owns_current_loop(self) -> bool:
+        """현재 실행 중인 루프가 공유 클라이언트의 루프인지 확인"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        if self._loop is None:
+            self._loop = loop
+        elif self._loop.is_closed():
+            # 이전 루프에 묶인 커넥션은 재사용할 수 없으므로 버림
+            self._clients.clear()
+            self._sessions.clear()
+            self._loop = loop
+        return loop is self._loop
+
+    def get_client(self, upstream: str = "default") -> httpx.AsyncClient:
+        """공유 httpx 클라이언트 반환 (최초 호출 시 생성)"""
+        client = self._clients.get(upstream)
+        if client is None or client.is_closed:
+            client = build_http_client(upstream)
+            self._clients[upstream] = client
+            logger.debug(f"HTTP 클라이언트 생성: {upstream}")
+        return client
+
+    def get_session(self, upstream: str = "default") -> aiohttp.ClientSession:
+        """공유 aiohttp 세션 반환 (최초 호출 시 생성)"""
+        session = self._sessions.get(upstream)
+        if session is None or session.closed:
+            session = build_aiohttp_session(upstream)
+            self._sessions[upstream] = session
+            logger.debug(f"aiohttp 세션 생성: {upstream}")
+        return session
+
+    async def aclose(self) -> None:
+        """모든 공유 클라이언트 종료"""
+        for upstream, client in list(self._clients.items()):
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"⚠️ HTTP 클라이언트 종료 실패 ({upstream}): {e}")
+        for upstream, session in list(self._sessions.items()):
+            try:
+                await session.close()
+            except Exception as e:
+                logger.warning(f"⚠️ aiohttp 세션 종료 실패 ({upstream}): {e}")
+        self._clients.clear()
+        self._sessions.clear()
+        self._loop = None
+
+
+# 싱글톤 인스턴스
+_registry = HTTPClientRegistry()
+
+
+def get_http_client_registry() -> HTTPClientRegistry:
+    """HTTP 클라이언트 레지스트리 싱글톤 인스턴스 반환"""
+    return _registry
+
+
+def init_http_clients() -> None:
+    """lifespan 시작 시 현재 루프에 레지스트리 바인딩"""
+    _registry.bind()
+    logger.info(f"🌐 공유 HTTP 클라이언트 레지스트리 초기화 (HTTP/2: {HTTP2_AVAILABLE})")
+
+
+async def close_http_clients() -> None:
+    """lifespan 종료 시 모든 공유 클라이언트 종료"""
+    await _registry.aclose()
+    logger.info("🌐 공유 HTTP 클라이언트 종료 완료")
+
+
+def get_http_client(upstream: str = "default") -> httpx.AsyncClient:
+    """공유 httpx 클라이언트 반환 (앱 이벤트 루프 안에서만 사용)"""
+    return _registry.get_client(upstream)
+
+
+@asynccontextmanager
+async def pooled_client(upstream: str = "default") -> AsyncIterator[httpx.AsyncClient]:
+    """공유 httpx 클라이언트를 닫지 않고 빌려줌
+
+    앱 루프가 아닌 별도 루프(스레드 등)에서 호출되면 임시 클라이언트를 만들어 사용 후 닫음
+    """
+    if _registry.owns_current_loop():
+        yield _registry.get_client(upstream)
+        return
+
+    client = build_http_client(upstream)
+    try:
+        yield client
+    finally:
+        await client.aclose()
+
+
+@asynccontextmanager
+async def pooled_aiohttp_session(upstream: str = "default") -> AsyncIterator[aiohttp.ClientSession]:
+    """공유 aiohttp 세션을 닫지 않고 빌려줌 (별도 루프에서는 임시 세션 사용)"""
+    if _registry.owns_current_loop():
+        yield _registry.get_session(upstream)
+        return
+
+    session = build_aiohttp_session(upstream)
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
+async def request_with_retry(
+    upstream: str,
+    method: str,
+    url: str,
+    idempotent: Optional[bool] = None,
+    **kwargs: Any,
+) -> httpx.Response:
+    """upstream 재시도 정책을 적용한 요청
+
+    Args:
+        upstream: upstream 이름
+        method: HTTP 메서드
+        url: 요청 URL
+        idempotent: 재시도 가능 여부 (미지정 시 메서드로 판단, GraphQL 조회 POST는 True 지정)
+    """
+    policy = get_policy(upstream)
+    if idempotent is None:
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+    attempts = policy.status_retries + 1 if idempotent else 1
+
+    async with pooled_client(upstream) as client:
+        for attempt in range(attempts):
+            response = await client.request(method, url, **kwargs)
+            if response.status_code not in policy.retry_statuses or attempt == attempts - 1:
+                return response
+            logger.warning(
+                f"⚠️ {upstream} 응답 {response.status_code}, 재시도 {attempt + 1}/{attempts - 1}: {url}"
+            )
+            await response.aclose()
+            await asyncio.sleep(policy.backoff_seconds * (2 ** attempt))
+
+    return response
@@ -1,9 +1,10 @@
-import httpx
 import os
 from typing import Dict, Optional, List
 from fastapi import HTTPException, status
 from dotenv import load_dotenv
 
+from app.core.http_clients import pooled_client
+
 load_dotenv()
 
 class InstagramService:
@@ -23,7 +24,7 @@ class InstagramService:
         logger.info(f"   - redirect_uri: {redirect_uri}")
         logger.info(f"   - code: {code[:20] if code else None}...")
         
-        async with httpx.AsyncClient() as client:
+        async with pooled_client("instagram") as client:
             token_data = {
                 "client_id": self.instagram_app_id,
                 "client_secret": self.instagram_app_secret,
@@ -66,7 +67,7 @@ class InstagramService:
         import logging
         logger = logging.getLogger(__name__)
         
-        async with httpx.AsyncClient() as client:
+        async with pooled_client("instagram") as client:
             user_response = await client.get(
                 f"https://graph.instagram.com/{user_id}",
                 params={
@@ -175,7 +176,7 @@ class InstagramService:
     async def verify_instagram_token(self, access_token: str, instagram_id: str) -> bool:
         """Instagram access token 유효성 검사"""
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("instagram") as client:
                 response = await client.get(
                     f"https://graph.instagram.com/{instagram_id}",
                     params={
@@ -193,7 +194,7 @@ class InstagramService:
             import logging
             logger = logging.getLogger(__name__)
             
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("instagram") as client:
                 # Instagram Graph API를 사용하여 DM 전송
                 # 주의: 실제 운영에서는 Instagram 비즈니스 계정의 메시지 전송 API를 사용해야 함
                 
@@ -235,7 +236,7 @@ class InstagramService:
 
     async def get_user_media(self, user_id: str, access_token: str, limit: int = 20) -> List[Dict]:
         """사용자의 미디어 목록을 가져옵니다."""
-        async with httpx.AsyncClient() as client:
+        async with pooled_client("instagram") as client:
             response = await client.get(
                 f"https://graph.instagram.com/{user_id}/media",
                 params={"fields": "id,caption,media_type,media_url,permalink,thumbnail_url,timestamp,like_count,comments_count", "access_token": access_token, "limit": limit}
@@ -245,7 +246,7 @@ class InstagramService:
 
     async def get_media_insights(self, media_id: str, access_token: str) -> Dict:
         """미디어에 대한 인사이트를 가져옵니다."""
-        async with httpx.AsyncClient() as client:
+        async with pooled_client("instagram") as client:
             response = await client.get(
                 f"https://graph.facebook.com/v18.0/{media_id}/insights",
                 params={"metric": "engagement,impressions,reach", "access_token": access_token}
@@ -0,0 +1,512 @@
+"""
+애플리케이션 지표 수집 및 Prometheus 텍스트 형식 노출 (/metrics)
+- 외부 의존성(MySQL, RunPod, vLLM, OpenAI, S3, MCP 등) 호출별 지연 히스토그램
+  httpx transport / aiohttp trace / botocore 이벤트 / SQLAlchemy 엔진 이벤트에서 측정
+- 이벤트 루프 지연(lag) 게이지, 엔드포인트별 WebSocket 연결 수 (ASGI 미들웨어)
+- 라우트별 요청 수와 지연 히스토그램 (지연은 샘플링하여 기록)
+- prometheus_client 의존성 없이 필요한 최소 기능만 구현
+"""
+
+import time
+import random
+import asyncio
+import logging
+import threading
+from collections import deque
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import aiohttp
+import httpx
+from sqlalchemy import event
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 외부 호출 / 라우트 지연용 버킷 (초)
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0,
+)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """라벨별 값을 보관하는 지표 기본 클래스 (스레드 안전)"""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} 라벨 불일치: {sorted(labels)} != {sorted(self.labelnames)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Gauge(_Metric):
+    """증감 가능한 현재 값"""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Histogram(_Metric):
+    """버킷별 누적 분포 + 합계/개수"""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 → [버킷별 개수..., 합계, 전체 개수]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [0.0] * (len(self.buckets) + 2)
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[index] += 1
+                    break
+            state[-2] += value
+            state[-1] += 1
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = [(key, list(state)) for key, state in self._values.items()]
+
+        bucket_labels = self.labelnames + ("le",)
+        lines = []
+        for key, state in items:
+            cumulative = 0.0
+            for index, bound in enumerate(self.buckets):
+                cumulative += state[index]
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(bucket_labels, key + (_format_value(bound),))} "
+                    f"{_format_value(cumulative)}"
+                )
+            lines.append(
+                f"{self.name}_bucket{_format_labels(bucket_labels, key + ('+Inf',))} {_format_value(state[-1])}"
+            )
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(state[-2])}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {_format_value(state[-1])}")
+        return lines
+
+
+class MetricsRegistry:
+    """등록된 지표 모음"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"이미 등록된 지표: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식으로 전체 지표 출력"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+# 싱글톤 인스턴스
+_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """지표 레지스트리 싱글톤 인스턴스 반환"""
+    return _registry
+
+
+DEPENDENCY_LATENCY = _registry.register(Histogram(
+    "aimex_dependency_request_duration_seconds",
+    "외부 의존성 호출 지연 (HTTP는 응답 헤더 수신까지)",
+    ("dependency", "operation", "outcome"),
+))
+EVENT_LOOP_LAG = _registry.register(Gauge(
+    "aimex_event_loop_lag_seconds",
+    "가장 최근 측정된 이벤트 루프 지연",
+))
+EVENT_LOOP_LAG_MAX = _registry.register(Gauge(
+    "aimex_event_loop_lag_max_seconds",
+    "최근 1분간 측정된 이벤트 루프 최대 지연",
+))
+WEBSOCKET_CONNECTIONS = _registry.register(Gauge(
+    "aimex_websocket_connections",
+    "현재 열려 있는 WebSocket 연결 수",
+    ("endpoint",),
+))
+HTTP_REQUESTS = _registry.register(Counter(
+    "aimex_http_requests_total",
+    "라우트별 처리한 요청 수",
+    ("method", "route", "status"),
+))
+HTTP_REQUEST_LATENCY = _registry.register(Histogram(
+    "aimex_http_request_duration_seconds",
+    "라우트별 요청 처리 지연 (METRICS_ROUTE_SAMPLE_RATE 비율로 샘플링)",
+    ("method", "route", "status"),
+))
+HTTP_REQUEST_SAMPLE_RATE = _registry.register(Gauge(
+    "aimex_http_request_latency_sample_rate",
+    "라우트 지연 히스토그램 샘플링 비율",
+))
+HTTP_REQUEST_SAMPLE_RATE.set(settings.METRICS_ROUTE_SAMPLE_RATE)
+VOICE_ASSET_CACHE_REQUESTS = _registry.register(Counter(
+    "aimex_voice_asset_cache_requests_total",
+    "TTS 참조 음성 캐시 조회 결과 (hit/miss/stale/error)",
+    ("result",),
+))
+
+
+def observe_dependency(dependency: str, operation: str, seconds: float, outcome: str = "ok") -> None:
+    """외부 의존성 호출 지연 기록"""
+    DEPENDENCY_LATENCY.observe(seconds, dependency=dependency, operation=operation, outcome=outcome)
+
+
+@contextmanager
+def track_dependency(dependency: str, operation: str) -> Iterator[None]:
+    """블록 실행 시간을 외부 의존성 호출로 기록 (예외 발생 시 outcome=error)"""
+    start = time.perf_counter()
+    outcome = "ok"
+    try:
+        yield
+    except BaseException:
+        outcome = "error"
+        raise
+    finally:
+        observe_dependency(dependency, operation, time.perf_counter() - start, outcome)
+
+
+def route_label(scope) -> str:
+    """라우팅된 경로 템플릿 반환 (경로 파라미터별로 라벨이 늘어나지 않도록)"""
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+def should_sample_route() -> bool:
+    """이번 요청의 지연을 히스토그램에 기록할지 결정"""
+    rate = settings.METRICS_ROUTE_SAMPLE_RATE
+    return rate >= 1.0 or (rate > 0.0 and random.random() < rate)
+
+
+def observe_route(method: str, route: str, status: int, seconds: Optional[float]) -> None:
+    """라우트 요청 수 기록, 샘플링된 요청이면 지연도 기록"""
+    labels = {"method": method, "route": route, "status": str(status)}
+    HTTP_REQUESTS.inc(**labels)
+    if seconds is not None:
+        HTTP_REQUEST_LATENCY.observe(seconds, **labels)
+
+
+def _outcome_for_status(status_code: int) -> str:
+    return "error" if status_code >= 500 else "ok"
+
+
+class WebSocketMetricsMiddleware:
+    """수락된 WebSocket 연결 수를 라우트 경로 템플릿별로 기록하는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "websocket":
+            await self.app(scope, receive, send)
+            return
+
+        endpoint: Optional[str] = None
+
+        async def send_wrapper(message):
+            nonlocal endpoint
+            # accept 시점에는 라우터가 scope에 route를 채워 둔 상태
+            if message["type"] == "websocket.accept" and endpoint is None:
+                endpoint = route_label(scope)
+                WEBSOCKET_CONNECTIONS.inc(endpoint=endpoint)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if endpoint is not None:
+                WEBSOCKET_CONNECTIONS.dec(endpoint=endpoint)
+
+
+# ---------------------------------------------------------------------------
+# 외부 호출 계측
+# ---------------------------------------------------------------------------
+
+
+class InstrumentedTransport(httpx.AsyncBaseTransport):
+    """httpx transport를 감싸 요청별 지연 기록 (응답 헤더 수신 시점까지)"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, dependency: str):
+        self._transport = transport
+        self.dependency = dependency
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        start = time.perf_counter()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            observe_dependency(self.dependency, request.method, time.perf_counter() - start, "error")
+            raise
+        observe_dependency(
+            self.dependency,
+            request.method,
+            time.perf_counter() - start,
+            _outcome_for_status(response.status_code),
+        )
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def build_aiohttp_trace_config(dependency: str) -> aiohttp.TraceConfig:
+    """aiohttp 세션 요청 지연을 기록하는 TraceConfig 생성"""
+    trace_config = aiohttp.TraceConfig(trace_config_ctx_factory=SimpleNamespace)
+
+    async def on_request_start(session, ctx, params):
+        ctx.start = time.perf_counter()
+
+    async def on_request_end(session, ctx, params):
+        observe_dependency(
+            dependency,
+            params.method,
+            time.perf_counter() - ctx.start,
+            _outcome_for_status(params.response.status),
+        )
+
+    async def on_request_exception(session, ctx, params):
+        observe_dependency(dependency, params.method, time.perf_counter() - ctx.start, "error")
+
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_request_end.append(on_request_end)
+    trace_config.on_request_exception.append(on_request_exception)
+    return trace_config
+
+
+def instrument_boto3_client(client, dependency: str = "s3"):
+    """botocore 이벤트로 boto3 클라이언트 API 호출 지연 기록 (재시도 포함)"""
+    service = client.meta.service_model.service_name
+
+    def before_call(model, context, **kwargs):
+        context["_metrics_start"] = time.perf_counter()
+
+    def after_call(model, context, http_response=None, **kwargs):
+        start = context.pop("_metrics_start", None)
+        if start is not None:
+            status = getattr(http_response, "status_code", 200) or 200
+            observe_dependency(dependency, model.name, time.perf_counter() - start, _outcome_for_status(status))
+
+    def after_call_error(context, **kwargs):
+        start = context.pop("_metrics_start", None)
+        model = kwargs.get("model")
+        if start is not None:
+            observe_dependency(
+                dependency, getattr(model, "name", "unknown"), time.perf_counter() - start, "error"
+            )
+
+    client.meta.events.register(f"before-call.{service}", before_call)
+    client.meta.events.register(f"after-call.{service}", after_call)
+    client.meta.events.register(f"after-call-error.{service}", after_call_error)
+    return client
+
+
+_SQL_OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE", "REPLACE", "WITH", "SHOW"}
+
+
+def _sql_operation(statement: str) -> str:
+    verb = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    return verb if verb in _SQL_OPERATIONS else "OTHER"
+
+
+def instrument_engine(engine, dependency: str = "mysql") -> None:
+    """SQLAlchemy (동기) 엔진의 커서 실행 지연 기록, 비동기 엔진은 sync_engine 전달"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("_metrics_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("_metrics_start")
+        if starts:
+            observe_dependency(dependency, _sql_operation(statement), time.perf_counter() - starts.pop())
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(exception_context):
+        conn = exception_context.connection
+        starts = conn.info.get("_metrics_start") if conn is not None else None
+        if starts:
+            observe_dependency(
+                dependency,
+                _sql_operation(exception_context.statement or ""),
+                time.perf_counter() - starts.pop(),
+                "error",
+            )
+
+
+# ---------------------------------------------------------------------------
+# 이벤트 루프 지연 측정
+# ---------------------------------------------------------------------------
+
+
+class EventLoopLagMonitor:
+    """일정 간격으로 sleep 후 실제로 깨어난 시각과의 차이를 이벤트 루프 지연으로 기록"""
+
+    def __init__(self, interval: Optional[float] = None, window: float = 60.0):
+        self.interval = interval or settings.EVENT_LOOP_LAG_INTERVAL
+        self.window = window
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"⏱️ 이벤트 루프 지연 측정 시작 (간격: {self.interval}초)")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        samples: "deque[Tuple[float, float]]" = deque()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            now = loop.time()
+            lag = max(0.0, now - expected)
+
+            samples.append((now, lag))
+            while samples and samples[0][0] < now - self.window:
+                samples.popleft()
+
+            EVENT_LOOP_LAG.set(lag)
+            EVENT_LOOP_LAG_MAX.set(max(sample for _, sample in samples))
+
+
+# 싱글톤 인스턴스
+_event_loop_monitor: Optional[EventLoopLagMonitor] = None
+
+
+def get_event_loop_monitor() -> EventLoopLagMonitor:
+    """이벤트 루프 지연 측정기 싱글톤 인스턴스 반환"""
+    global _event_loop_monitor
+    if _event_loop_monitor is None:
+        _event_loop_monitor = EventLoopLagMonitor()
+    return _event_loop_monitor
+
+
+# 애플리케이션 시작/종료 시 호출
+async def start_event_loop_monitor():
+    """애플리케이션 시작시 호출"""
+    await get_event_loop_monitor().start()
+
+
+async def stop_event_loop_monitor():
+    """애플리케이션 종료시 호출"""
+    await get_event_loop_monitor().stop()
@@ -5,10 +5,12 @@ Admin 권한 체크, 그룹 권한 체크 등 권한 관련 로직 통합
 
 import logging
 from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
-from typing import Union, Dict, Any
+from typing import Union, Dict, Any, Optional
 
-from app.models.user import User
+from app.models.user import User, user_group
 
 logger = logging.getLogger(__name__)
 
@@ -274,6 +276,27 @@ def get_user_accessible_group_ids(user: Union[User, Dict[str, Any]], db: Session
         return []
 
 
+async def get_user_group_ids_async(db: AsyncSession, user_id: str) -> Optional[list[int]]:
+    """
+    사용자 존재 여부와 소속 그룹 ID 목록을 한 번의 쿼리로 조회 (비동기 세션용)
+    Args:
+        db: 비동기 데이터베이스 세션
+        user_id: 사용자 ID
+    Returns:
+        Optional[list[int]]: 소속 그룹 ID 목록, 사용자가 없으면 None
+    """
+    rows = (
+        await db.execute(
+            select(User.user_id, user_group.c.group_id)
+            .outerjoin(user_group, user_group.c.user_id == User.user_id)
+            .where(User.user_id == user_id)
+        )
+    ).all()
+    if not rows:
+        return None
+    return [row.group_id for row in rows if row.group_id is not None]
+
+
 def is_admin(user: Union[User, Dict[str, Any]], db: Session = None) -> bool:
     """
     사용자가 Admin인지 간단히 확인하는 함수 (예외 발생 안함)
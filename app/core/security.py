@@ -1,10 +1,14 @@
 from datetime import datetime, timedelta
-from typing import Optional, Any, Union
+from typing import Optional, Any, Tuple, Union
+from collections import OrderedDict
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import HTTPException, status, Request, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+import time
+import hashlib
 import logging
+import threading
 from typing import Dict
 from app.core.config import settings
 from app.models.influencer import InfluencerAPI, AIInfluencer
@@ -87,104 +91,132 @@ def create_access_token(
         "iat": datetime.utcnow()
     })
     
-    # 디버그: SECRET_KEY 확인
-    logger.info(f"🔑 Creating token with SECRET_KEY: {settings.SECRET_KEY[:20]}... (algorithm: {settings.ALGORITHM})")
-    
     encoded_jwt = jwt.encode(
         to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
     )
     return encoded_jwt
 
 
+def _copy_claims(value: Any) -> Any:
+    """JWT 클레임 깊은 복사 (JSON 값은 dict/list/스칼라뿐이므로 copy.deepcopy보다 가볍게 처리)"""
+    if isinstance(value, dict):
+        return {k: _copy_claims(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_claims(v) for v in value]
+    return value
+
+
+class VerifiedTokenCache:
+    """검증된 JWT 페이로드 LRU 캐시 (스레드 안전)
+
+    토큰 원문 대신 SHA-256 해시를 키로 보관하며, 토큰의 exp까지만 유효
+    저장/반환 시 깊은 복사(_copy_claims)를 하므로 호출 측에서 groups 등 중첩 값을 수정해도 캐시가 오염되지 않음
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = max_entries or settings.JWT_VERIFY_CACHE_SIZE
+        self._entries: "OrderedDict[bytes, Tuple[dict, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @staticmethod
+    def token_key(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, key: bytes) -> Optional[dict]:
+        """캐시된 페이로드 반환 (없거나 만료되었으면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            payload, expires_at = entry
+            if time.time() >= expires_at:
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return _copy_claims(payload)
+
+    def put(self, key: bytes, payload: dict, expires_at: float) -> None:
+        """페이로드 저장 (용량 초과 시 가장 오래 사용하지 않은 항목 제거)"""
+        payload = _copy_claims(payload)
+        with self._lock:
+            self._entries[key] = (payload, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict:
+        """캐시 지표 반환"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "cache_size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / lookups, 3) if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
+
+
+# 검증된 토큰 캐시 (get_current_user / WebSocket 인증 공용)
+verified_token_cache = VerifiedTokenCache()
+
+
 def verify_token(token: str) -> Optional[dict]:
-    """토큰 검증"""
-    try:
-        # 토큰 기본 검증
-        if not token:
-            logger.error(f"❌ JWT verification failed: 토큰이 비어있음")
-            return None
-        
-        if not isinstance(token, str):
-            logger.error(f"❌ JWT verification failed: 토큰이 문자열이 아님 (type: {type(token)})")
-            return None
-        
-        # 토큰 구조 확인 (JWT는 3개 부분으로 구성)
-        token_parts = token.split('.')
-        if len(token_parts) != 3:
-            logger.error(f"❌ JWT verification failed: 토큰 구조가 잘못됨 (parts: {len(token_parts)})")
-            return None
-        
-        # 디버그: SECRET_KEY 확인
-        logger.info(f"🔐 JWT 토큰 검증 시작:")
-        logger.info(f"🔐 - SECRET_KEY: {settings.SECRET_KEY[:20]}... (length: {len(settings.SECRET_KEY)})")
-        logger.info(f"🔐 - Algorithm: {settings.ALGORITHM}")
-        logger.info(f"🔐 - Token length: {len(token)}")
-        logger.info(f"🔐 - Token parts: {len(token_parts)} (header.payload.signature)")
-        
-        # 서명 없이 페이로드 먼저 확인
-        try:
-            unverified = jwt.decode(token, key=settings.SECRET_KEY, options={"verify_signature": False})
-            logger.info(f"🔐 토큰 페이로드 (서명 미검증): {unverified}")
-            
-            # 만료 시간 확인
-            exp = unverified.get('exp')
-            iat = unverified.get('iat')
-            current_time = datetime.utcnow().timestamp()
-            
-            if exp:
-                exp_datetime = datetime.fromtimestamp(exp)
-                logger.info(f"🔐 토큰 만료 시간: {exp_datetime} (현재: {datetime.fromtimestamp(current_time)})")
-                if exp < current_time:
-                    logger.error(f"❌ JWT verification failed: 토큰이 만료됨 (exp: {exp_datetime})")
-                    return None
-            
-            if iat:
-                iat_datetime = datetime.fromtimestamp(iat)
-                logger.info(f"🔐 토큰 발행 시간: {iat_datetime}")
-                
-        except Exception as decode_error:
-            logger.error(f"❌ 토큰 페이로드 디코딩 실패: {decode_error}")
-            return None
-        
-        # 실제 서명 검증
-        logger.info(f"🔐 서명 검증 시작...")
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
-        
-        logger.info(f"✅ JWT 토큰 검증 성공!")
-        logger.info(f"✅ 사용자 ID: {payload.get('sub')}")
-        logger.info(f"✅ 이메일: {payload.get('email')}")
-        logger.info(f"✅ 그룹: {payload.get('groups', [])}")
-        
+    """토큰 검증
+
+    서명/만료 검증은 한 번의 decode로 처리하고, 검증된 토큰은 exp까지 캐시에서 반환
+    """
+    if not token or not isinstance(token, str):
+        logger.debug(f"JWT 검증 실패: reason=empty_or_invalid_type, type={type(token).__name__}")
+        return None
+
+    if token.count(".") != 2:
+        logger.debug(f"JWT 검증 실패: reason=malformed, token={mask_token_for_logging(token)}")
+        return None
+
+    key = verified_token_cache.token_key(token)
+    payload = verified_token_cache.get(key)
+    if payload is not None:
+        # 캐시가 깊은 복사본을 반환하므로 그대로 사용
         return payload
-        
+
+    try:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
     except JWTError as e:
-        logger.error(f"❌ JWT verification failed: {type(e).__name__}: {str(e)}")
-        logger.error(f"❌ 토큰 정보:")
-        logger.error(f"   - Token prefix: {token[:20]}..." if len(token) > 20 else f"   - Token: {token}")
-        logger.error(f"   - SECRET_KEY configured: {'Yes' if settings.SECRET_KEY else 'No'}")
-        logger.error(f"   - SECRET_KEY prefix: {settings.SECRET_KEY[:20]}..." if settings.SECRET_KEY else "None")
-        logger.error(f"   - Algorithm: {settings.ALGORITHM}")
-        
-        # 구체적인 오류 타입별 메시지
-        if "ExpiredSignatureError" in str(type(e)):
-            logger.error(f"❌ 토큰 만료 오류")
-        elif "InvalidSignatureError" in str(type(e)):
-            logger.error(f"❌ 서명 불일치 오류 - SECRET_KEY 확인 필요")
-        elif "DecodeError" in str(type(e)):
-            logger.error(f"❌ 토큰 디코딩 오류 - 토큰 형식 문제")
-        elif "InvalidTokenError" in str(type(e)):
-            logger.error(f"❌ 유효하지 않은 토큰")
-        
+        logger.debug(
+            f"JWT 검증 실패: reason={type(e).__name__}, token={mask_token_for_logging(token)}, detail={e}"
+        )
         return None
-        
     except Exception as e:
         logger.error(f"❌ JWT verification 예상치 못한 오류: {type(e).__name__}: {str(e)}")
-        import traceback
-        logger.error(f"❌ 스택 트레이스: {traceback.format_exc()}")
         return None
 
+    # exp가 없는 토큰은 만료 시점을 알 수 없으므로 캐시하지 않음
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        verified_token_cache.put(key, payload, float(exp))
+
+    logger.debug(f"JWT 검증 성공: sub={payload.get('sub')}, provider={payload.get('provider')}, exp={exp}")
+    return payload
+
 
 # 현재 사용자 가져오기 (Enhanced with full payload support)
 async def get_current_user(
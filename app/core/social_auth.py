@@ -1,9 +1,10 @@
-import httpx
 import os
 from typing import Dict, Optional
 from fastapi import HTTPException, status
 from dotenv import load_dotenv
 
+from app.core.http_clients import pooled_client
+
 load_dotenv()
 
 class SocialAuthService:
@@ -17,7 +18,7 @@ class SocialAuthService:
     
     async def exchange_google_code(self, code: str, redirect_uri: str) -> Dict:
         """Google OAuth2 authorization code를 사용자 정보로 교환"""
-        async with httpx.AsyncClient() as client:
+        async with pooled_client("oauth") as client:
             token_data = {
                 "client_id": self.google_client_id,
                 "client_secret": self.google_client_secret,
@@ -62,7 +63,7 @@ class SocialAuthService:
     
     async def exchange_naver_code(self, code: str, redirect_uri: str) -> Dict:
         """Naver OAuth2 authorization code를 사용자 정보로 교환"""
-        async with httpx.AsyncClient() as client:
+        async with pooled_client("oauth") as client:
             token_data = {
                 "client_id": self.naver_client_id,
                 "client_secret": self.naver_client_secret,
@@ -111,7 +112,7 @@ class SocialAuthService:
         import logging
         logger = logging.getLogger(__name__)
         
-        async with httpx.AsyncClient() as client:
+        async with pooled_client("instagram") as client:
             logger.info(f"🔑 Instagram API with Instagram Login 토큰 교환 시작")
             logger.info(f"   - client_id: {self.instagram_app_id}")
             logger.info(f"   - redirect_uri: {redirect_uri}")
@@ -282,7 +283,7 @@ class SocialAuthService:
         import logging
         logger = logging.getLogger(__name__)
         
-        async with httpx.AsyncClient() as client:
+        async with pooled_client("instagram") as client:
             try:
                 logger.info(f"📱 Instagram Business 정보 조회:")
                 logger.info(f"   - Instagram ID: {instagram_id}")
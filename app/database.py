@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sess
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
 from app.core.config import settings
+from app.core.metrics import instrument_engine
 import logging
 from typing import Generator, AsyncGenerator
 import time
@@ -19,10 +20,12 @@ engine = create_engine(
     echo=False,  # SQL 로그 비활성화
 )
 
+instrument_engine(engine)
+
 # 세션 팩토리 생성 (동기)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-# 비동기 데이터베이스 엔진 (선택적 설치)
+# 비동기 데이터베이스 엔진 (이벤트 루프를 막지 않아야 하는 주요 경로용)
 async_engine = None
 AsyncSessionLocal = None
 
@@ -39,6 +42,7 @@ try:
         pool_timeout=settings.DATABASE_POOL_TIMEOUT,
         echo=False,  # SQL 로그 비활성화
     )
+    instrument_engine(async_engine.sync_engine)
     
     # 비동기 세션 팩토리 생성
     AsyncSessionLocal = async_sessionmaker(
@@ -49,10 +53,9 @@ try:
     logger.info("✅ Async database engine initialized with aiomysql")
     
 except ImportError:
-    logger.warning("⚠️ aiomysql not found, using sync database only. Install with: pip install aiomysql")
+    logger.error("❌ aiomysql not found, async database endpoints will fail. Install with: pip install aiomysql")
 except Exception as e:
     logger.error(f"❌ Failed to initialize async database engine: {e}")
-    logger.info("🔄 Falling back to sync database only")
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -64,18 +67,19 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
-async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
-    """비동기 데이터베이스 세션 의존성 - Windows 호환성을 위해 동기 세션 사용"""
+def new_async_session() -> AsyncSession:
+    """비동기 세션 생성 (백그라운드 작업용, `async with`로 사용)"""
     if AsyncSessionLocal is None:
-        # Windows 환경에서 aiomysql 설치 문제 시 동기 세션으로 폴백
-        logger.warning("AsyncSessionLocal not available, falling back to sync session")
-        # 동기 세션을 AsyncSession 처럼 사용 (임시 해결책)
-        with SessionLocal() as session:
-            # 동기 세션을 비동기 인터페이스로 래핑
-            yield session  # type: ignore
-        return
-    
-    async with AsyncSessionLocal() as session:
+        # 동기 세션을 AsyncSession처럼 넘기면 이벤트 루프에서 블로킹 쿼리가 실행되므로 폴백하지 않음
+        raise RuntimeError(
+            "비동기 데이터베이스 엔진이 초기화되지 않았습니다. aiomysql 설치 및 DATABASE_URL을 확인하세요."
+        )
+    return AsyncSessionLocal()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """비동기 데이터베이스 세션 의존성 (aiomysql 엔진)"""
+    async with new_async_session() as session:
         try:
             yield session
         except Exception:
@@ -84,6 +88,7 @@ async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
         finally:
             await session.close()
 
+
 def init_database():
     """데이터베이스 초기화"""
     try:
@@ -1,7 +1,7 @@
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 from fastapi.staticfiles import StaticFiles
 from starlette.exceptions import HTTPException as StarletteHTTPException
@@ -12,11 +12,55 @@ from contextlib import asynccontextmanager
 from pathlib import Path
 
 from app.core.config import settings
+from app.core.http_clients import init_http_clients, close_http_clients
+from app.core.metrics import (
+    PROMETHEUS_CONTENT_TYPE,
+    WebSocketMetricsMiddleware,
+    get_metrics_registry,
+    observe_route,
+    route_label,
+    should_sample_route,
+    start_event_loop_monitor,
+    stop_event_loop_monitor,
+)
+from app.core.security import verified_token_cache
 from app.database import init_database, test_database_connection
 from app.api.v1.api import api_router
 from app.services.startup_service import run_startup_tasks
 from app.services.batch_monitor import start_batch_monitoring, stop_batch_monitoring
 from app.services.scheduler_service import scheduler_service
+from app.services.chat_message_writer import (
+    start_chat_message_writer,
+    stop_chat_message_writer,
+    get_chat_message_writer,
+)
+from app.services.session_state_bus import get_session_state_bus
+from app.services.api_key_cache import get_api_key_cache
+from app.services.hf_token_resolver import get_hf_token_resolver
+from app.services.catalog_cache import get_catalog_cache
+from app.services.vllm_dispatcher import get_vllm_dispatcher
+from app.services.comfyui_event_listener import (
+    get_comfyui_event_hub,
+    stop_comfyui_event_listeners,
+)
+from app.services.workflow_templates import (
+    start_workflow_templates,
+    stop_workflow_templates,
+    get_workflow_template_registry,
+)
+from app.services.image_pipeline import get_image_pipeline, stop_image_pipeline
+from app.services.tts_cache import get_tts_cache
+from app.services.voice_asset_cache import get_voice_asset_cache
+from app.services.warm_pod_pool import (
+    start_warm_pod_pool,
+    stop_warm_pod_pool,
+    get_warm_pod_pool,
+)
+from app.services.api_usage_counter import (
+    start_api_usage_counter,
+    stop_api_usage_counter,
+    get_api_usage_counter,
+)
 
 # 세션 정리 서비스 - 비동기로 수정 완료
 from app.services.session_cleanup_service import (
@@ -63,6 +107,15 @@ async def lifespan(app: FastAPI):
     logger.info(f"🔑 JWT ALGORITHM: {settings.ALGORITHM}")
     logger.info(f"🔑 ACCESS_TOKEN_EXPIRE_MINUTES: {settings.ACCESS_TOKEN_EXPIRE_MINUTES}")
 
+    # 공유 HTTP 클라이언트 레지스트리 초기화 (외부 호출 커넥션 풀)
+    init_http_clients()
+
+    # 이벤트 루프 지연 측정 시작 (/metrics)
+    await start_event_loop_monitor()
+
+    # ComfyUI 워크플로우 템플릿 로드/검증 (바인딩 노드가 없으면 시작 중단) 및 변경 감지 시작
+    await start_workflow_templates()
+
     # RunPod 서버 초기화
     try:
         from app.services.runpod_manager import initialize_runpod
@@ -100,6 +153,20 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"⚠️ Startup tasks failed, but continuing: {e}")
 
+    # 채팅 메시지 write-behind 저장 워커 시작
+    try:
+        await start_chat_message_writer()
+        logger.info("💬 채팅 메시지 배치 저장 워커 시작 완료")
+    except Exception as e:
+        logger.warning(f"⚠️ Chat message writer failed to start, messages will be saved synchronously: {e}")
+
+    # 공개 API 호출 수 주기적 저장 작업 시작
+    try:
+        await start_api_usage_counter()
+        logger.info("📊 API 사용량 집계 저장 작업 시작 완료")
+    except Exception as e:
+        logger.warning(f"⚠️ API usage counter failed to start: {e}")
+
     # 배치 모니터링 시작 (폴링 모드인 경우)
     try:
         await start_batch_monitoring()
@@ -127,6 +194,11 @@ async def lifespan(app: FastAPI):
         import traceback
         logger.error(f"   오류 상세: {traceback.format_exc()}")
 
+    # ComfyUI 웜 Pod 풀 시작 (RUNPOD_POOL_MAX_SIZE > 0 인 경우)
+    try:
+        await start_warm_pod_pool()
+    except Exception as e:
+        logger.warning(f"⚠️ Warm pod pool failed to start, but continuing: {e}")
 
     logger.info("✅ AIMEX API Server ready")
 
@@ -166,6 +238,47 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"❌ 세션 정리 서비스 중지 중 오류: {e}")
 
+    # 채팅 메시지 저장 워커 중지 (큐에 남은 메시지 모두 저장)
+    try:
+        await stop_chat_message_writer()
+        logger.info("✅ 채팅 메시지 저장 워커가 정상적으로 중지되었습니다")
+    except Exception as e:
+        logger.error(f"❌ 채팅 메시지 저장 워커 중지 중 오류: {e}")
+
+    # API 사용량 집계 저장 작업 중지 (남은 카운트 저장)
+    try:
+        await stop_api_usage_counter()
+        logger.info("✅ API 사용량 집계 저장 작업이 정상적으로 중지되었습니다")
+    except Exception as e:
+        logger.error(f"❌ API 사용량 집계 저장 작업 중지 중 오류: {e}")
+
+    # 웜 Pod 풀 중지 (유휴/준비 중 Pod 종료)
+    try:
+        await stop_warm_pod_pool()
+    except Exception as e:
+        logger.error(f"❌ 웜 Pod 풀 중지 중 오류: {e}")
+
+    # 워크플로우 변경 감지 중지
+    await stop_workflow_templates()
+
+    # 이미지 파생본 처리 프로세스 풀 종료
+    stop_image_pipeline()
+
+    # ComfyUI 완료 이벤트 소켓 종료
+    try:
+        await stop_comfyui_event_listeners()
+    except Exception as e:
+        logger.error(f"❌ ComfyUI 이벤트 리스너 종료 중 오류: {e}")
+
+    # 이벤트 루프 지연 측정 중지
+    await stop_event_loop_monitor()
+
+    # 공유 HTTP 클라이언트 종료 (다른 서비스 중지 후 마지막에 정리)
+    try:
+        await close_http_clients()
+    except Exception as e:
+        logger.error(f"❌ HTTP 클라이언트 종료 중 오류: {e}")
+
 
 # FastAPI 애플리케이션 생성
 app = FastAPI(
@@ -191,6 +304,9 @@ app.add_middleware(
 # 신뢰할 수 있는 호스트 미들웨어 (보안 강화)
 app.add_middleware(TrustedHostMiddleware, allowed_hosts=["*"])
 
+# WebSocket 연결 수 지표 미들웨어 (엔드포인트별)
+app.add_middleware(WebSocketMetricsMiddleware)
+
 
 # 파일 업로드 크기 제한 미들웨어
 class FileSizeMiddleware(BaseHTTPMiddleware):
@@ -224,8 +340,8 @@ async def log_requests(request: Request, call_next):
     """요청/응답 로깅 (보안 강화 - 토큰 마스킹)"""
     start_time = time.time()
 
-    # 헬스체크 및 상태조회는 로그 생략
-    skip_paths = ["/health", "/api/v1/user-sessions/status"]
+    # 헬스체크, 지표 수집 및 상태조회는 로그 생략
+    skip_paths = ["/health", "/metrics", "/api/v1/user-sessions/status"]
     if request.url.path not in skip_paths:
         client_host = request.client.host if request.client else "unknown"
         
@@ -236,10 +352,18 @@ async def log_requests(request: Request, call_next):
             logger.info(f"📥 {request.method} {request.url.path} - {client_host}")
 
     response = await call_next(request)
+    process_time = time.time() - start_time
+
+    # 라우트별 요청 수 / 지연 기록 (지연은 샘플링된 요청만)
+    observe_route(
+        request.method,
+        route_label(request.scope),
+        response.status_code,
+        process_time if should_sample_route() else None,
+    )
 
     # 응답 로깅 (중요한 요청만)
     if request.url.path not in skip_paths:
-        process_time = time.time() - start_time
         if request.url.path == "/api/v1/user-sessions/status":
             logger.debug(f"📤 {response.status_code} ({process_time:.3f}s)")
         else:
@@ -305,6 +429,20 @@ async def health_check():
             "database": "connected" if db_healthy else "disconnected",
             "timestamp": time.time(),
             "version": settings.VERSION,
+            "chat_message_writer": get_chat_message_writer().get_stats(),
+            "session_state_bus": get_session_state_bus().get_stats(),
+            "jwt_verify_cache": verified_token_cache.get_stats(),
+            "api_key_cache": get_api_key_cache().get_stats(),
+            "hf_token_cache": get_hf_token_resolver().get_cache_stats(),
+            "catalog_cache": get_catalog_cache().get_stats(),
+            "api_usage_counter": get_api_usage_counter().get_stats(),
+            "vllm_dispatcher": get_vllm_dispatcher().get_stats(),
+            "comfyui_events": get_comfyui_event_hub().get_stats(),
+            "warm_pod_pool": get_warm_pod_pool().get_stats(),
+            "workflow_templates": get_workflow_template_registry().get_stats(),
+            "image_pipeline": get_image_pipeline().get_stats(),
+            "tts_cache": get_tts_cache().get_stats(),
+            "voice_asset_cache": get_voice_asset_cache().get_stats(),
         }
     except Exception as e:
         logger.error(f"Health check failed: {e}")
@@ -314,6 +452,13 @@ async def health_check():
         )
 
 
+# Prometheus 지표 엔드포인트
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """의존성별 지연, 이벤트 루프 지연, WebSocket 연결 수, 라우트 지연 지표"""
+    return Response(content=get_metrics_registry().render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
 # 루트 엔드포인트
 @app.get("")
 async def root():
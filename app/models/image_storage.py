@@ -2,7 +2,9 @@ from sqlalchemy import (
     Column,
     String,
     Integer,
+    Boolean,
     ForeignKey,
+    text,
 )
 from sqlalchemy.orm import relationship
 from app.models.base import Base, TimestampMixin
@@ -31,6 +33,15 @@ class ImageStorage(Base, TimestampMixin):
         nullable=False,
         comment="그룹 ID",
     )
+    image_width = Column(Integer, nullable=True, comment="이미지 너비(px)")
+    image_height = Column(Integer, nullable=True, comment="이미지 높이(px)")
+    has_derivatives = Column(
+        Boolean,
+        nullable=False,
+        default=False,
+        server_default=text("0"),
+        comment="썸네일/중간 크기 WebP 파생본 존재 여부",
+    )
 
     # 관계 - 임시 비활성화 (세션 기능 우선 구현)
     # group = relationship("Team", back_populates="image_storages")
\ No newline at end of file
@@ -0,0 +1,173 @@
+"""
+공개 챗봇 API용 API 키 캐시
+외부 파트너가 호출하는 /influencers/chat 경로에서 매 요청마다 수행하던
+InfluencerAPI / AIInfluencer 조회를 캐시 (HF 토큰은 hf_token_resolver가 캐시)
+- API 키 해시 → 인플루언서 컨텍스트 (TTL + 크기 제한 LRU)
+- API 키 재발급/인플루언서 삭제/시스템 프롬프트 변경 시 인플루언서 단위로 무효화
+"""
+
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.influencer import AIInfluencer, InfluencerAPI
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class APIKeyContext:
+    """API 키로 인증된 인플루언서 정보 (챗봇 호출에 필요한 필드만)"""
+
+    api_id: str
+    influencer_id: str
+    influencer_name: str
+    system_prompt: Optional[str]
+    influencer_model_repo: Optional[str]
+    group_id: Optional[int]
+    learning_status: Optional[int]
+
+
+class APIKeyCache:
+    """API 키 → 인플루언서 컨텍스트 LRU 캐시 (스레드 안전)"""
+
+    def __init__(self, max_entries: Optional[int] = None, ttl: Optional[int] = None):
+        self.max_entries = max_entries or settings.API_KEY_CACHE_SIZE
+        self.ttl = ttl or settings.API_KEY_CACHE_TTL
+        self._entries: "OrderedDict[bytes, Tuple[APIKeyContext, float]]" = OrderedDict()
+        # 인플루언서 단위 무효화를 위한 역색인
+        self._by_influencer: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @staticmethod
+    def _key(api_key: str) -> bytes:
+        return hashlib.sha256(api_key.encode("utf-8")).digest()
+
+    def get(self, api_key: str) -> Optional[APIKeyContext]:
+        """캐시된 컨텍스트 반환 (없거나 만료되었으면 None)"""
+        key = self._key(api_key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            context, expires_at = entry
+            if time.monotonic() >= expires_at:
+                self._remove(key)
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return context
+
+    def put(self, api_key: str, context: APIKeyContext) -> None:
+        """컨텍스트 저장 (용량 초과 시 가장 오래 사용하지 않은 항목 제거)"""
+        key = self._key(api_key)
+        with self._lock:
+            # 같은 인플루언서의 이전 키 항목은 제거
+            previous = self._by_influencer.get(context.influencer_id)
+            if previous is not None and previous != key:
+                self._remove(previous)
+
+            self._entries[key] = (context, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            self._by_influencer[context.influencer_id] = key
+            while len(self._entries) > self.max_entries:
+                oldest, _ = next(iter(self._entries.items()))
+                self._remove(oldest)
+                self._evictions += 1
+
+    def invalidate_influencer(self, influencer_id: str) -> None:
+        """인플루언서의 캐시 항목 제거 (API 키 재발급/삭제/설정 변경 시)"""
+        with self._lock:
+            key = self._by_influencer.get(str(influencer_id))
+            if key is not None:
+                self._remove(key)
+                self._invalidations += 1
+
+    def _remove(self, key: bytes) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            influencer_id = entry[0].influencer_id
+            if self._by_influencer.get(influencer_id) == key:
+                del self._by_influencer[influencer_id]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_influencer.clear()
+
+    def get_stats(self) -> Dict:
+        """캐시 지표 반환"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "cache_size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / lookups, 3) if lookups else 0.0,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+            }
+
+
+def load_api_key_context(api_key: str, db: Session) -> Optional[APIKeyContext]:
+    """DB에서 API 키 컨텍스트 조회 (캐시 미스 시에만 호출)
+
+    Returns:
+        Optional[APIKeyContext]: 키가 없으면 None
+
+    Raises:
+        LookupError: 키는 유효하지만 인플루언서가 없는 경우
+    """
+    influencer_api = (
+        db.query(InfluencerAPI).filter(InfluencerAPI.api_value == api_key).first()
+    )
+    if not influencer_api:
+        return None
+
+    influencer = (
+        db.query(AIInfluencer)
+        .filter(AIInfluencer.influencer_id == influencer_api.influencer_id)
+        .first()
+    )
+    if not influencer:
+        raise LookupError(str(influencer_api.influencer_id))
+
+    return APIKeyContext(
+        api_id=str(influencer_api.api_id),
+        influencer_id=str(influencer.influencer_id),
+        influencer_name=influencer.influencer_name,
+        system_prompt=influencer.system_prompt,
+        influencer_model_repo=influencer.influencer_model_repo,
+        group_id=influencer.group_id,
+        learning_status=influencer.learning_status,
+    )
+
+
+# 싱글톤 인스턴스
+_api_key_cache: Optional[APIKeyCache] = None
+
+
+def get_api_key_cache() -> APIKeyCache:
+    """API 키 캐시 싱글톤 인스턴스 반환"""
+    global _api_key_cache
+    if _api_key_cache is None:
+        _api_key_cache = APIKeyCache()
+    return _api_key_cache
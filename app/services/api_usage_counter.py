@@ -0,0 +1,194 @@
+"""
+공개 API 호출 수 집계 서비스
+
+요청 경로에서는 메모리 카운터만 증가시키고, 백그라운드 작업이 주기적으로
+API_CALL_AGGREGATION에 INSERT ... ON DUPLICATE KEY UPDATE로 합산
+- 집계 행 ID는 (api_id, 날짜)에서 결정적으로 생성하여 하루 한 행으로 누적
+- 저장 실패 시 카운트를 되돌려 다음 주기에 재시도
+- 애플리케이션 종료 시 남은 카운트 모두 저장
+"""
+
+import time
+import uuid
+import asyncio
+import logging
+from datetime import date, datetime
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy.dialects.mysql import insert
+
+from app.core.config import settings
+from app.database import new_async_session
+from app.models.influencer import APICallAggregation
+
+logger = logging.getLogger(__name__)
+
+# 집계 행 ID 생성용 네임스페이스
+_AGGREGATION_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "api-call-aggregation")
+
+CounterKey = Tuple[str, str, date]
+
+
+def aggregation_id(api_id: str, day: date) -> str:
+    """(api_id, 날짜)별 집계 행 ID"""
+    return str(uuid.uuid5(_AGGREGATION_NAMESPACE, f"{api_id}:{day.isoformat()}"))
+
+
+class APIUsageCounter:
+    """API 호출 수 메모리 집계 및 주기적 저장"""
+
+    def __init__(self, flush_interval: Optional[float] = None):
+        self.flush_interval = flush_interval or settings.API_USAGE_FLUSH_INTERVAL
+
+        self.is_running = False
+        self._pending: Dict[CounterKey, int] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+
+        # 지표
+        self._counted_total = 0
+        self._flushed_total = 0
+        self._flushes_total = 0
+        self._failed_flushes = 0
+        self._last_flush_ms = 0.0
+        self._last_flush_at: Optional[float] = None
+
+    def increment(self, api_id: str, influencer_id: str, count: int = 1):
+        """호출 수 증가 (DB 접근 없음)"""
+        key = (api_id, influencer_id, date.today())
+        self._pending[key] = self._pending.get(key, 0) + count
+        self._counted_total += count
+
+    async def start(self):
+        """주기적 저장 작업 시작"""
+        if self.is_running:
+            logger.warning("API usage counter is already running")
+            return
+
+        self._flush_lock = asyncio.Lock()
+        self.is_running = True
+        self._flush_task = asyncio.create_task(self._flush_loop())
+        logger.info(f"API usage counter started (interval={self.flush_interval}s)")
+
+    async def stop(self):
+        """저장 작업 종료 후 남은 카운트 저장"""
+        if not self.is_running:
+            logger.info("API usage counter is not running")
+            await self.flush()
+            return
+
+        self.is_running = False
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+
+        await self.flush()
+        logger.info(f"API usage counter stopped - 상태: {self.get_stats()}")
+
+    async def _flush_loop(self):
+        while self.is_running:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"❌ API 사용량 저장 루프 오류: {e}")
+
+    async def flush(self):
+        """누적된 카운트를 DB에 합산"""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+
+        async with self._flush_lock:
+            if not self._pending:
+                return
+
+            # 이벤트 루프에서 교체하므로 저장 중 증가분은 다음 주기로 넘어감
+            pending, self._pending = self._pending, {}
+            started = time.perf_counter()
+            try:
+                await self._write_counts(pending)
+            except Exception as e:
+                self._failed_flushes += 1
+                for key, count in pending.items():
+                    self._pending[key] = self._pending.get(key, 0) + count
+                logger.error(f"❌ API 사용량 저장 실패 ({len(pending)}개 항목, 다음 주기에 재시도): {e}")
+                return
+
+            flushed = sum(pending.values())
+            self._flushed_total += flushed
+            self._flushes_total += 1
+            self._last_flush_ms = (time.perf_counter() - started) * 1000
+            self._last_flush_at = time.time()
+            logger.debug(
+                f"API 사용량 저장: {len(pending)}개 항목, {flushed}회 ({self._last_flush_ms:.1f}ms)"
+            )
+
+    @staticmethod
+    async def _write_counts(pending: Dict[CounterKey, int]):
+        """INSERT ... ON DUPLICATE KEY UPDATE (비동기 엔진 사용)"""
+        now = datetime.now()
+        rows = [
+            {
+                "api_call_id": aggregation_id(api_id, day),
+                "api_id": api_id,
+                "influencer_id": influencer_id,
+                "daily_call_count": count,
+                "created_at": datetime.combine(day, datetime.min.time()),
+                "updated_at": now,
+            }
+            for (api_id, influencer_id, day), count in pending.items()
+        ]
+
+        stmt = insert(APICallAggregation).values(rows)
+        stmt = stmt.on_duplicate_key_update(
+            daily_call_count=APICallAggregation.daily_call_count + stmt.inserted.daily_call_count,
+            updated_at=stmt.inserted.updated_at,
+        )
+
+        async with new_async_session() as db:
+            try:
+                await db.execute(stmt)
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+
+    def get_stats(self) -> dict:
+        """집계 지표 반환"""
+        return {
+            "is_running": self.is_running,
+            "pending_keys": len(self._pending),
+            "pending_calls": sum(self._pending.values()),
+            "counted_total": self._counted_total,
+            "flushed_total": self._flushed_total,
+            "flushes_total": self._flushes_total,
+            "failed_flushes": self._failed_flushes,
+            "last_flush_ms": round(self._last_flush_ms, 1),
+            "last_flush_at": self._last_flush_at,
+        }
+
+
+# 싱글톤 인스턴스
+_api_usage_counter: Optional[APIUsageCounter] = None
+
+
+def get_api_usage_counter() -> APIUsageCounter:
+    """API 사용량 집계기 싱글톤 인스턴스 반환"""
+    global _api_usage_counter
+    if _api_usage_counter is None:
+        _api_usage_counter = APIUsageCounter()
+    return _api_usage_counter
+
+
+# 애플리케이션 시작/종료 시 호출
+async def start_api_usage_counter():
+    """애플리케이션 시작시 호출"""
+    await get_api_usage_counter().start()
+
+
+async def stop_api_usage_counter():
+    """애플리케이션 종료시 호출 (남은 카운트 저장)"""
+    await get_api_usage_counter().stop()
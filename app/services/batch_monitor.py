@@ -4,6 +4,7 @@ OpenAI 배치 작업 모니터링 서비스
 폴링 모드에서 주기적으로 배치 상태를 확인하고 완료된 작업을 처리합니다.
 """
 
+import time
 import asyncio
 import logging
 from typing import List, Dict, Optional
@@ -22,11 +23,32 @@ logger = logging.getLogger(__name__)
 class BatchMonitor:
     """OpenAI 배치 작업 모니터링 클래스"""
     
-    def __init__(self):
-        self.qa_generator = InfluencerQAGenerator()
+    # 배치 상태별 다음 확인까지 대기 시간 (초, 나머지는 기본 폴링 간격)
+    STATE_INTERVALS = {"validating": 60, "finalizing": 30}
+    # 요청의 90% 이상 처리된 배치는 자주 확인
+    NEAR_COMPLETION_RATIO = 0.9
+    NEAR_COMPLETION_INTERVAL = 60
+    # 루프 최소 대기 시간 및 조회 오류 시 최대 backoff (초)
+    MIN_SLEEP_SECONDS = 15
+    MAX_ERROR_BACKOFF_SECONDS = 1800
+    
+    def __init__(self, qa_generator: Optional[InfluencerQAGenerator] = None):
+        # 오프라인 테스트 시 OpenAI 배치 API를 흉내내는 생성기를 주입할 수 있음
+        self.qa_generator = qa_generator or InfluencerQAGenerator()
         self.finetuning_service = get_finetuning_service()
         self.is_running = False
         self.monitor_task: Optional[asyncio.Task] = None
+        
+        # batch_key_id별 다음 확인 시각 (monotonic) 및 연속 조회 실패 횟수
+        self._next_check_at: Dict[int, float] = {}
+        self._error_counts: Dict[int, int] = {}
+        # 결과 처리 중인 배치 (중복 처리 방지)
+        self._completion_tasks: Dict[int, asyncio.Task] = {}
+    
+    @property
+    def base_interval(self) -> float:
+        """기본 폴링 간격 (초)"""
+        return settings.OPENAI_POLLING_INTERVAL_MINUTES * 60
     
     async def start_monitoring(self):
         """모니터링 시작"""
@@ -39,7 +61,7 @@ class BatchMonitor:
             return
         
         self.is_running = True
-        logger.info(f"🔄 배치 모니터링 시작 - 간격: {settings.OPENAI_POLLING_INTERVAL_MINUTES}분")
+        logger.info(f"🔄 배치 모니터링 시작 - 간격: {settings.OPENAI_POLLING_INTERVAL_MINUTES}분 (상태별 조정)")
         
         self.monitor_task = asyncio.create_task(self._monitor_loop())
     
@@ -50,12 +72,16 @@ class BatchMonitor:
         
         self.is_running = False
         
-        if self.monitor_task:
-            self.monitor_task.cancel()
-            try:
-                await self.monitor_task
-            except asyncio.CancelledError:
-                pass
+        tasks = [self.monitor_task, *self._completion_tasks.values()]
+        for task in tasks:
+            if task:
+                task.cancel()
+        for task in tasks:
+            if task:
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
         
         logger.info("⏹️ 배치 모니터링이 중지되었습니다")
     
@@ -63,11 +89,10 @@ class BatchMonitor:
         """모니터링 루프"""
         while self.is_running:
             try:
-                await self._check_batch_status()
+                sleep_seconds = await self._check_batch_status()
                 
-                # 다음 체크까지 대기
-                interval_seconds = settings.OPENAI_POLLING_INTERVAL_MINUTES * 60
-                await asyncio.sleep(interval_seconds)
+                # 가장 먼저 확인이 필요한 배치 시점까지 대기
+                await asyncio.sleep(sleep_seconds)
                 
             except asyncio.CancelledError:
                 break
@@ -76,6 +101,24 @@ class BatchMonitor:
                 # 오류 발생 시 30초 후 재시도
                 await asyncio.sleep(30)
     
+    def _next_interval(self, batch_status: Dict) -> float:
+        """배치 상태에 따른 다음 확인 간격 (초)"""
+        current_status = batch_status.get('status')
+        if current_status in self.STATE_INTERVALS:
+            return self.STATE_INTERVALS[current_status]
+        
+        if current_status == 'in_progress':
+            counts = batch_status.get('request_counts') or {}
+            total = counts.get('total') or 0
+            done = (counts.get('completed') or 0) + (counts.get('failed') or 0)
+            if total and done / total >= self.NEAR_COMPLETION_RATIO:
+                return self.NEAR_COMPLETION_INTERVAL
+        
+        return self.base_interval
+    
+    def _schedule(self, batch_key_id: int, delay: float):
+        self._next_check_at[batch_key_id] = time.monotonic() + delay
+    
     async def check_and_update_single_job(self, batch_key: BatchKey, db: Session):
         """개별 배치 작업의 현재 상태를 확인하고 DB를 업데이트"""
         try:
@@ -83,27 +126,41 @@ class BatchMonitor:
                 logger.warning(f"⚠️ OpenAI 배치 ID가 없음: {batch_key.batch_key_id}")
                 return
 
-            # OpenAI 배치 상태 확인
-            batch_status = self.qa_generator.check_batch_status(batch_key.openai_batch_id)
-            current_status = batch_status.get('status')
-            logger.debug(f"📋 배치 {batch_key.batch_key_id} 현재 상태: {current_status}")
-
-            # 상태에 따른 처리
-            if current_status == 'completed':
-                await self._handle_completed_batch(batch_key, db, batch_status)
-            elif current_status == 'failed':
-                await self._handle_failed_batch(batch_key, batch_status, db)
-            elif current_status in ['validating', 'in_progress']:
-                await self._handle_processing_batch(batch_key, db)
-            else:
-                logger.debug(f"📌 배치 {batch_key.batch_key_id}는 여전히 {current_status} 상태입니다")
+            # OpenAI 배치 상태 확인 (비동기 클라이언트)
+            batch_status = await self.qa_generator.check_batch_status_async(batch_key.openai_batch_id)
+            await self._apply_status(batch_key, batch_status, db, background_completion=False)
 
         except Exception as e:
             logger.error(f"❌ 배치 {batch_key.batch_key_id} 처리 중 오류: {e}", exc_info=True)
             db.rollback() # 오류 발생 시 롤백
 
-    async def _check_batch_status(self):
-        """모든 진행 중인 배치 작업 상태 확인"""
+    async def _apply_status(
+        self, batch_key: BatchKey, batch_status: Dict, db: Session, background_completion: bool = True
+    ):
+        """조회한 배치 상태에 따라 DB 업데이트 및 후속 처리"""
+        current_status = batch_status.get('status')
+        logger.debug(f"📋 배치 {batch_key.batch_key_id} 현재 상태: {current_status}")
+
+        # 상태에 따른 처리
+        if current_status == 'completed':
+            if background_completion:
+                # 결과 다운로드/처리는 오래 걸리므로 다른 배치 폴링을 막지 않도록 분리
+                self._start_completion(batch_key.batch_key_id, batch_status)
+            else:
+                await self._handle_completed_batch(batch_key, db, batch_status)
+        elif current_status == 'failed':
+            await self._handle_failed_batch(batch_key, batch_status, db)
+        elif current_status in ['validating', 'in_progress']:
+            await self._handle_processing_batch(batch_key, db)
+        else:
+            logger.debug(f"📌 배치 {batch_key.batch_key_id}는 여전히 {current_status} 상태입니다")
+
+    async def _check_batch_status(self) -> float:
+        """확인 시점이 된 진행 중인 배치 작업 상태를 동시에 확인
+
+        Returns:
+            float: 다음 확인까지 대기할 시간 (초)
+        """
         logger.debug("🔍 배치 상태 확인 시작")
         
         db: Session = next(get_db())
@@ -113,30 +170,105 @@ class BatchMonitor:
                 BatchKey.status.in_(['pending', 'processing', 'batch_submitted', 'batch_processing', 'in_progress'])
             ).all()
             
+            # 더 이상 진행 중이 아닌 배치의 스케줄 정리
+            pending_ids = {batch_key.batch_key_id for batch_key in pending_batches}
+            for batch_key_id in list(self._next_check_at):
+                if batch_key_id not in pending_ids:
+                    self._next_check_at.pop(batch_key_id, None)
+                    self._error_counts.pop(batch_key_id, None)
+            
             if not pending_batches:
                 logger.debug("📭 진행 중인 배치 작업이 없습니다")
-                return
+                return self.base_interval
             
-            logger.info(f"📊 {len(pending_batches)}개의 진행 중인 배치 작업 확인 중")
+            now = time.monotonic()
+            due_batches = [
+                batch_key for batch_key in pending_batches
+                if batch_key.openai_batch_id
+                and batch_key.batch_key_id not in self._completion_tasks
+                and self._next_check_at.get(batch_key.batch_key_id, 0.0) <= now
+            ]
             
-            for batch_key in pending_batches:
-                await self.check_and_update_single_job(batch_key, db)
+            if due_batches:
+                logger.info(f"📊 진행 중인 배치 {len(pending_batches)}개 중 {len(due_batches)}개 상태 확인")
+                
+                # OpenAI 상태 조회는 동시에 (동시 요청 수 제한), DB 반영은 순서대로
+                semaphore = asyncio.Semaphore(settings.OPENAI_BATCH_STATUS_CONCURRENCY)
+                
+                async def fetch(batch_key: BatchKey):
+                    async with semaphore:
+                        return await self.qa_generator.check_batch_status_async(batch_key.openai_batch_id)
+                
+                results = await asyncio.gather(
+                    *(fetch(batch_key) for batch_key in due_batches), return_exceptions=True
+                )
+                
+                for batch_key, result in zip(due_batches, results):
+                    batch_key_id = batch_key.batch_key_id
+                    if isinstance(result, BaseException):
+                        errors = self._error_counts.get(batch_key_id, 0) + 1
+                        self._error_counts[batch_key_id] = errors
+                        backoff = min(self.base_interval * (2 ** (errors - 1)), self.MAX_ERROR_BACKOFF_SECONDS)
+                        self._schedule(batch_key_id, backoff)
+                        logger.error(f"❌ 배치 {batch_key_id} 상태 조회 실패 ({errors}회), {backoff:.0f}초 후 재시도: {result}")
+                        continue
+                    
+                    self._error_counts.pop(batch_key_id, None)
+                    self._schedule(batch_key_id, self._next_interval(result))
+                    try:
+                        await self._apply_status(batch_key, result, db)
+                    except Exception as e:
+                        logger.error(f"❌ 배치 {batch_key_id} 처리 중 오류: {e}", exc_info=True)
+                        db.rollback() # 오류 발생 시 롤백
+            
+            # OpenAI 배치 ID가 없거나 결과 처리 중인 배치는 폴링 대상이 아니므로 기본 간격 기준
+            next_due = min(
+                (
+                    self._next_check_at.get(batch_key.batch_key_id, now + self.base_interval)
+                    for batch_key in pending_batches
+                    if batch_key.openai_batch_id
+                    and batch_key.batch_key_id not in self._completion_tasks
+                ),
+                default=now + self.base_interval,
+            )
+            return min(max(next_due - time.monotonic(), self.MIN_SLEEP_SECONDS), self.base_interval)
                 
         except Exception as e:
             logger.error(f"❌ _check_batch_status 처리 중 오류: {e}", exc_info=True)
             db.rollback() # 오류 발생 시 롤백
+            return self.base_interval
         finally:
             db.close()
     
+    def _start_completion(self, batch_key_id: int, batch_status: Dict):
+        """완료된 배치의 결과 처리를 별도 작업으로 시작"""
+        if batch_key_id in self._completion_tasks:
+            return
+        
+        async def complete():
+            db: Session = next(get_db())
+            try:
+                batch_key = db.query(BatchKey).filter(BatchKey.batch_key_id == batch_key_id).first()
+                if batch_key:
+                    await self._handle_completed_batch(batch_key, db, batch_status)
+            finally:
+                db.close()
+                self._completion_tasks.pop(batch_key_id, None)
+        
+        self._completion_tasks[batch_key_id] = asyncio.create_task(complete())
+    
     async def _handle_completed_batch(self, batch_key: BatchKey, db: Session, batch_status: Dict):
         """완료된 배치 처리"""
         logger.info(f"✅ 배치 완료 감지: {batch_key.batch_key_id}")
         logger.info(f"📊 배치 상세 정보: task_id={batch_key.task_id}, influencer_id={batch_key.influencer_id}, openai_batch_id={batch_key.openai_batch_id}")
         
         try:
-            # QA 생성 완료 처리
+            # QA 생성 완료 처리 (다운로드/파싱/S3 업로드는 결과 처리 워커 풀에서 실행)
             logger.info(f"🔄 QA 생성 완료 처리 시작: task_id={batch_key.task_id}")
-            success = self.qa_generator.complete_qa_generation(batch_key.task_id, db)
+            success = await self.qa_generator.complete_qa_generation_async(batch_key.task_id)
+            
+            # 워커에서 별도 세션으로 변경된 내용 반영
+            db.refresh(batch_key)
             
             if success:
                 # 배치 상태 업데이트
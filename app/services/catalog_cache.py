@@ -0,0 +1,180 @@
+"""
+읽기 위주 카탈로그 응답 캐시
+MBTI / 스타일 프리셋 / 공개 인플루언서 목록처럼 거의 바뀌지 않는 데이터를
+직렬화된 JSON 응답 단위로 캐시
+- 키별 TTL + 크기 제한 LRU, 데이터 종류(namespace) 단위 명시적 무효화
+- 응답 본문 해시를 ETag로 사용하여 If-None-Match 일치 시 본문 없이 304 반환
+"""
+
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 무효화 단위
+MBTI = "mbti"
+STYLE_PRESETS = "style_presets"
+INFLUENCERS = "influencers"
+
+PUBLIC_CACHE_CONTROL = "public, no-cache"
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+
+@dataclass(frozen=True)
+class _CachedResponse:
+    body: bytes
+    etag: str
+    namespaces: Tuple[str, ...]
+    expires_at: float
+
+
+@lru_cache(maxsize=None)
+def _adapter(response_type: Any) -> TypeAdapter:
+    return TypeAdapter(response_type)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == "*" or candidate == etag:
+            return True
+    return False
+
+
+class CatalogResponseCache:
+    """캐시 키 → 직렬화된 응답 본문/ETag (스레드 안전)"""
+
+    def __init__(self, ttl: Optional[int] = None, max_entries: Optional[int] = None):
+        self.ttl = ttl or settings.CATALOG_CACHE_TTL
+        self.max_entries = max_entries or settings.CATALOG_CACHE_SIZE
+        self._entries: "OrderedDict[str, _CachedResponse]" = OrderedDict()
+        # 조회 도중 무효화된 결과를 저장하지 않기 위한 namespace별 세대 번호
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._not_modified = 0
+        self._invalidations = 0
+
+    def _get(self, key: str) -> Optional[_CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            if time.monotonic() >= entry.expires_at:
+                del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry
+
+    def _generation(self, namespaces: Iterable[str]) -> Tuple[int, ...]:
+        with self._lock:
+            return tuple(self._generations.get(namespace, 0) for namespace in namespaces)
+
+    def _put(
+        self, key: str, namespaces: Tuple[str, ...], body: bytes, generation: Tuple[int, ...]
+    ) -> _CachedResponse:
+        entry = _CachedResponse(
+            body=body,
+            etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+            namespaces=namespaces,
+            expires_at=time.monotonic() + self.ttl,
+        )
+        with self._lock:
+            if generation != tuple(self._generations.get(namespace, 0) for namespace in namespaces):
+                # 조회 중에 데이터가 바뀌었으면 이번 응답만 내보내고 캐시하지 않음
+                return entry
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def invalidate(self, *namespaces: str) -> None:
+        """해당 데이터 종류에 의존하는 응답 모두 제거 (생성/수정/삭제 후 호출)"""
+        with self._lock:
+            for namespace in namespaces:
+                self._generations[namespace] = self._generations.get(namespace, 0) + 1
+            stale = [
+                key for key, entry in self._entries.items()
+                if any(namespace in entry.namespaces for namespace in namespaces)
+            ]
+            for key in stale:
+                del self._entries[key]
+            self._invalidations += len(stale)
+        if stale:
+            logger.debug(f"🗑️ 카탈로그 캐시 무효화: {namespaces} ({len(stale)}개)")
+
+    def respond(
+        self,
+        request: Request,
+        key: str,
+        namespaces: Tuple[str, ...],
+        build: Callable[[], Any],
+        response_type: Any,
+        cache_control: str = PUBLIC_CACHE_CONTROL,
+    ) -> Response:
+        """캐시된 응답 반환, 없으면 build()로 조회 후 response_type으로 직렬화하여 저장
+
+        클라이언트의 If-None-Match가 현재 ETag와 같으면 304 반환
+        """
+        entry = self._get(key)
+        if entry is None:
+            generation = self._generation(namespaces)
+            adapter = _adapter(response_type)
+            # response_model 직렬화와 동일하게 ORM 객체 속성에서 검증
+            body = adapter.dump_json(adapter.validate_python(build(), from_attributes=True))
+            entry = self._put(key, namespaces, body, generation)
+
+        headers = {"ETag": entry.etag, "Cache-Control": cache_control}
+        if _etag_matches(request.headers.get("if-none-match"), entry.etag):
+            with self._lock:
+                self._not_modified += 1
+            return Response(status_code=304, headers=headers)
+        return Response(content=entry.body, media_type="application/json", headers=headers)
+
+    def get_stats(self) -> Dict:
+        """캐시 지표 반환"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "cache_size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / lookups, 3) if lookups else 0.0,
+                "not_modified": self._not_modified,
+                "invalidations": self._invalidations,
+            }
+
+
+# 싱글톤 인스턴스
+_catalog_cache: Optional[CatalogResponseCache] = None
+
+
+def get_catalog_cache() -> CatalogResponseCache:
+    """카탈로그 응답 캐시 싱글톤 인스턴스 반환"""
+    global _catalog_cache
+    if _catalog_cache is None:
+        _catalog_cache = CatalogResponseCache()
+    return _catalog_cache
@@ -0,0 +1,175 @@
+"""
+채팅 WebSocket 연결별 대화 상태
+연결 시 한 번 로드하고 메시지가 추가될 때마다 증분 갱신하여
+턴마다 세션 전체 메시지/MCP 서버/HF 토큰을 다시 조회하지 않도록 함
+"""
+
+import time
+import asyncio
+import logging
+from collections import deque
+from datetime import datetime
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.mcp_server import MCPServer, ai_influencer_mcp_server
+from app.services.hf_token_resolver import get_hf_token_resolver
+
+logger = logging.getLogger(__name__)
+
+Summarizer = Callable[[List[Dict]], Awaitable[str]]
+
+
+class ChatConversationState:
+    """WebSocket 연결 하나의 대화 컨텍스트 캐시"""
+
+    # 의도 분석에 그대로 넘기는 최근 대화쌍 수
+    RECENT_PAIR_WINDOW = 6
+    # 창 밖으로 밀려난 대화쌍이 이만큼 모이면 요약 갱신
+    SUMMARY_BATCH_SIZE = 3
+    # MCP 서버/HF 토큰 변경 여부 확인 주기 (초)
+    RESOURCE_REFRESH_INTERVAL = 60.0
+
+    def __init__(
+        self,
+        influencer_id: str,
+        group_id: int,
+        summarizer: Optional[Summarizer] = None,
+    ):
+        self.influencer_id = influencer_id
+        self.group_id = group_id
+        self.summarizer = summarizer
+
+        self.session_id: Optional[str] = None
+        self.history: List[Dict] = []
+        self.recent_pairs: Deque[Dict] = deque()
+        self.summary: str = ""
+        self._unsummarized: List[Dict] = []
+        self._summary_task: Optional[asyncio.Task] = None
+
+        self.mcp_servers: List[str] = []
+        self.hf_token: Optional[str] = None
+        self._mcp_fingerprint: Optional[Tuple[int, ...]] = None
+        self._resources_checked_at: float = 0.0
+
+    # ---- 세션 / 대화 기록 ----
+
+    def reset(self, session_id: str) -> None:
+        """새 세션으로 대화 기록 초기화"""
+        self.session_id = session_id
+        self.history = []
+        self.recent_pairs.clear()
+        self.summary = ""
+        self._unsummarized = []
+        if self._summary_task and not self._summary_task.done():
+            self._summary_task.cancel()
+        self._summary_task = None
+
+    def append_turn(self, query: str, response: str) -> None:
+        """사용자/AI 한 턴 추가 (증분 갱신)"""
+        if not query.strip() or not response.strip():
+            return
+
+        pair = {
+            "query": query,
+            "response": response,
+            "timestamp": datetime.now().isoformat(),
+            "source": "session",
+            "session_id": self.session_id,
+        }
+        self.history.append(pair)
+        self.recent_pairs.append(pair)
+
+        while len(self.recent_pairs) > self.RECENT_PAIR_WINDOW:
+            self._unsummarized.append(self.recent_pairs.popleft())
+
+        if len(self._unsummarized) >= self.SUMMARY_BATCH_SIZE:
+            self._schedule_summary()
+
+    def conversation_pairs(self) -> List[Dict]:
+        """의도 분석용 대화쌍 (요약 + 최근 대화)"""
+        pairs = list(self.recent_pairs)
+        if self.summary:
+            pairs.insert(0, {"query": "이전 대화 요약", "response": self.summary})
+        return pairs
+
+    def _schedule_summary(self) -> None:
+        """밀려난 대화쌍을 기존 요약에 합쳐 백그라운드에서 요약 갱신"""
+        if not self.summarizer or (self._summary_task and not self._summary_task.done()):
+            return
+
+        batch = self._unsummarized
+        self._unsummarized = []
+        previous = self.summary
+        session_id = self.session_id
+
+        async def summarize():
+            history = list(batch)
+            if previous:
+                history.insert(0, {"query": "이전 대화 요약", "response": previous})
+            try:
+                summary = await self.summarizer(history)
+            except Exception as e:
+                logger.warning(f"[WS] 대화 요약 갱신 실패: {e}")
+                summary = ""
+            # 요약 중 세션이 바뀌었으면 버림
+            if self.session_id != session_id:
+                return
+            if summary:
+                self.summary = summary
+            else:
+                # 요약 실패 시 다음 배치에서 다시 시도
+                self._unsummarized = batch + self._unsummarized
+
+        self._summary_task = asyncio.create_task(summarize())
+
+    # ---- MCP 서버 / HF 토큰 ----
+
+    def load_resources(self, db: Session) -> None:
+        """MCP 서버 목록과 HF 토큰 최초 로드"""
+        self._refresh_mcp_servers(db)
+        self._refresh_hf_token(db)
+        self._resources_checked_at = time.monotonic()
+
+    def refresh_resources_if_stale(self, db: Session) -> bool:
+        """확인 주기가 지났으면 변경 여부만 가볍게 조회하고 바뀐 항목만 다시 로드
+
+        Returns:
+            bool: 변경 여부 확인 쿼리를 실행했는지 여부
+        """
+        if time.monotonic() - self._resources_checked_at < self.RESOURCE_REFRESH_INTERVAL:
+            return False
+        self.load_resources(db)
+        return True
+
+    def _refresh_mcp_servers(self, db: Session) -> None:
+        rows = (
+            db.query(ai_influencer_mcp_server.c.mcp_id)
+            .filter(ai_influencer_mcp_server.c.influencer_id == self.influencer_id)
+            .all()
+        )
+        fingerprint = tuple(sorted(row[0] for row in rows))
+        if fingerprint == self._mcp_fingerprint:
+            return
+
+        if fingerprint:
+            names = (
+                db.query(MCPServer.mcp_name)
+                .filter(MCPServer.mcp_id.in_(fingerprint))
+                .all()
+            )
+            self.mcp_servers = [row[0] for row in names]
+        else:
+            self.mcp_servers = []
+        self._mcp_fingerprint = fingerprint
+        logger.info(f"[WS] MCP 서버 목록 갱신: {self.mcp_servers}")
+
+    def _refresh_hf_token(self, db: Session) -> None:
+        # 복호화된 토큰은 리졸버가 캐시하며 토큰 변경 시 무효화됨
+        hf_token, _ = get_hf_token_resolver().get_token_by_group(
+            self.group_id, db, prefer_default=False
+        )
+        if hf_token != self.hf_token:
+            logger.info(f"[WS] HF 토큰 갱신: group_id={self.group_id}")
+        self.hf_token = hf_token
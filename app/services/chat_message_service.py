@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
 from app.models.chat_message import ChatMessage
+from app.services.chat_message_writer import get_chat_message_writer
 from datetime import datetime
 from typing import List, Dict, Optional
 import logging
@@ -52,6 +53,17 @@ class ChatMessageService:
             self.db.rollback()
             return False
     
+    async def queue_message(self, session_id: str, influencer_id: str, message_content: str, message_type: str = "user") -> str:
+        """세션에 새 메시지 추가 (write-behind 큐를 통해 배치 저장)"""
+        chat_message_id = await get_chat_message_writer().enqueue(
+            session_id=session_id,
+            influencer_id=influencer_id,
+            message_content=message_content,
+            message_type=message_type,
+        )
+        logger.debug(f"세션 메시지 저장 예약: session_id={session_id}, type={message_type}, chat_message_id={chat_message_id}")
+        return chat_message_id
+    
     def end_session(self, session_id: str) -> bool:
         """세션 종료 (세션 종료 시간 기록)"""
         try:
@@ -0,0 +1,265 @@
+"""
+채팅 메시지 write-behind 저장 서비스
+
+WebSocket 핸들러는 메시지를 큐에 넣기만 하고, 백그라운드 워커가 모아서 bulk INSERT
+- 배치 크기 도달 또는 flush 간격 경과 시 저장
+- 실패한 배치는 backoff 후 재시도
+- 애플리케이션 종료 시 큐에 남은 메시지를 모두 저장
+"""
+
+import time
+import uuid
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import insert
+
+from app.core.config import settings
+from app.database import new_async_session
+from app.models.chat_message import ChatMessage
+
+logger = logging.getLogger(__name__)
+
+# 워커 종료 신호
+_STOP = object()
+
+
+class ChatMessageWriter:
+    """ChatMessage 비동기 배치 저장기"""
+
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        max_queue_size: Optional[int] = None,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+    ):
+        self.batch_size = batch_size or settings.CHAT_MESSAGE_BATCH_SIZE
+        self.flush_interval = flush_interval or settings.CHAT_MESSAGE_FLUSH_INTERVAL
+        self.max_queue_size = max_queue_size or settings.CHAT_MESSAGE_QUEUE_MAXSIZE
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+
+        self.is_running = False
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_task: Optional[asyncio.Task] = None
+        self._in_flight = 0
+
+        # 지표
+        self._enqueued_total = 0
+        self._flushed_total = 0
+        self._failed_total = 0
+        self._fallback_total = 0
+        self._batches_total = 0
+        self._max_depth = 0
+        self._last_batch_size = 0
+        self._last_flush_ms = 0.0
+        self._last_flush_at: Optional[float] = None
+
+    async def start(self):
+        """백그라운드 저장 워커 시작"""
+        if self.is_running:
+            logger.warning("Chat message writer is already running")
+            return
+
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self.is_running = True
+        self._worker_task = asyncio.create_task(self._worker_loop())
+        logger.info(
+            f"Chat message writer started (batch={self.batch_size}, interval={self.flush_interval}s)"
+        )
+
+    async def stop(self, timeout: float = 30.0):
+        """큐에 남은 메시지를 모두 저장한 뒤 워커 종료"""
+        if not self.is_running:
+            logger.info("Chat message writer is not running")
+            return
+
+        self.is_running = False
+        await self._queue.put(_STOP)
+        try:
+            await asyncio.wait_for(self._worker_task, timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.error(
+                f"❌ 채팅 메시지 저장 워커 종료 시간 초과, 미저장 메시지: {self._queue.qsize()}개"
+            )
+            self._worker_task.cancel()
+
+        logger.info(f"Chat message writer stopped - 상태: {self.get_stats()}")
+
+    async def enqueue(
+        self,
+        session_id: str,
+        influencer_id: str,
+        message_content: str,
+        message_type: str = "user",
+    ) -> str:
+        """저장할 메시지를 큐에 추가하고 chat_message_id 반환
+
+        워커가 실행 중이 아니면 (시작 전/종료 후) 즉시 저장
+        """
+        row = {
+            "chat_message_id": str(uuid.uuid4()),
+            "session_id": session_id,
+            "influencer_id": influencer_id,
+            "message_content": message_content,
+            "message_type": message_type,
+            # 큐에 들어온 시각으로 기록해야 대화 순서가 유지됨
+            "created_at": datetime.now(),
+            "end_at": None,
+        }
+
+        if not self.is_running:
+            self._fallback_total += 1
+            await self._write_rows([row])
+            self._flushed_total += 1
+            return row["chat_message_id"]
+
+        # 큐가 가득 차면 여유가 생길 때까지 대기 (backpressure)
+        await self._queue.put(row)
+        self._enqueued_total += 1
+        self._max_depth = max(self._max_depth, self._queue.qsize())
+        return row["chat_message_id"]
+
+    async def _worker_loop(self):
+        """큐에서 메시지를 모아 배치 단위로 저장"""
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            item = await self._queue.get()
+            if item is _STOP:
+                break
+
+            batch = [item]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            await self._flush(batch)
+
+        # 종료 시 남은 메시지 모두 저장
+        remaining_rows: List[Dict[str, Any]] = []
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not _STOP:
+                remaining_rows.append(item)
+        for start in range(0, len(remaining_rows), self.batch_size):
+            await self._flush(remaining_rows[start:start + self.batch_size])
+
+    async def _flush(self, batch: List[Dict[str, Any]]):
+        """배치 저장 (실패 시 backoff 재시도, 마지막 실패 후에는 한 건씩 저장)"""
+        self._in_flight = len(batch)
+        started = time.perf_counter()
+        try:
+            saved = len(batch)
+            for attempt in range(self.max_retries):
+                try:
+                    await self._write_rows(batch)
+                    break
+                except Exception as e:
+                    if attempt == self.max_retries - 1:
+                        logger.error(
+                            f"❌ 채팅 메시지 배치 저장 실패 ({len(batch)}개), 한 건씩 저장 시도: {e}"
+                        )
+                        # 잘못된 행 하나 때문에 다른 세션의 메시지까지 잃지 않도록 실패한 행만 버림
+                        saved = await self._write_rows_individually(batch)
+                        break
+                    logger.warning(
+                        f"⚠️ 채팅 메시지 배치 저장 실패, 재시도 {attempt + 1}/{self.max_retries - 1}: {e}"
+                    )
+                    await asyncio.sleep(self.retry_backoff * (2 ** attempt))
+
+            if not saved:
+                return
+            self._flushed_total += saved
+            self._batches_total += 1
+            self._last_batch_size = len(batch)
+            self._last_flush_ms = (time.perf_counter() - started) * 1000
+            self._last_flush_at = time.time()
+            logger.debug(
+                f"채팅 메시지 배치 저장: {saved}개 ({self._last_flush_ms:.1f}ms)"
+            )
+        finally:
+            self._in_flight = 0
+
+    async def _write_rows_individually(self, rows: List[Dict[str, Any]]) -> int:
+        """행 단위 INSERT (저장된 행 수 반환, 실패한 행만 유실 처리)"""
+        saved = 0
+        for row in rows:
+            try:
+                await self._write_rows([row])
+                saved += 1
+            except Exception as e:
+                self._failed_total += 1
+                logger.error(
+                    f"❌ 채팅 메시지 저장 실패로 유실: chat_message_id={row.get('chat_message_id')}, "
+                    f"session_id={row.get('session_id')}: {e}"
+                )
+        return saved
+
+    @staticmethod
+    async def _write_rows(rows: List[Dict[str, Any]]):
+        """bulk INSERT (비동기 엔진 사용, 이벤트 루프를 막지 않음)"""
+        async with new_async_session() as db:
+            try:
+                await db.execute(insert(ChatMessage), rows)
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+
+    def get_stats(self) -> dict:
+        """큐 깊이 및 저장 지표 반환"""
+        queue_depth = self._queue.qsize() if self._queue else 0
+        return {
+            "is_running": self.is_running,
+            "queue_depth": queue_depth,
+            "in_flight": self._in_flight,
+            "max_queue_depth": self._max_depth,
+            "queue_capacity": self.max_queue_size,
+            "enqueued_total": self._enqueued_total,
+            "flushed_total": self._flushed_total,
+            "failed_total": self._failed_total,
+            "fallback_total": self._fallback_total,
+            "batches_total": self._batches_total,
+            "last_batch_size": self._last_batch_size,
+            "last_flush_ms": round(self._last_flush_ms, 1),
+            "last_flush_at": self._last_flush_at,
+        }
+
+
+# 싱글톤 인스턴스
+_chat_message_writer: Optional[ChatMessageWriter] = None
+
+
+def get_chat_message_writer() -> ChatMessageWriter:
+    """채팅 메시지 저장기 싱글톤 인스턴스 반환"""
+    global _chat_message_writer
+    if _chat_message_writer is None:
+        _chat_message_writer = ChatMessageWriter()
+    return _chat_message_writer
+
+
+# 애플리케이션 시작/종료 시 호출
+async def start_chat_message_writer():
+    """애플리케이션 시작시 호출"""
+    await get_chat_message_writer().start()
+
+
+async def stop_chat_message_writer():
+    """애플리케이션 종료시 호출 (남은 메시지 저장)"""
+    await get_chat_message_writer().stop()
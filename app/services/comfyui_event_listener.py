@@ -0,0 +1,391 @@
+"""
+ComfyUI 실행 완료 이벤트 리스너
+워크플로우마다 /history/{prompt_id}를 5초 간격으로 폴링하던 방식을 대체
+- ComfyUI 엔드포인트(파드)별로 /ws?clientId=... 연결 하나를 유지하고
+  executing/progress/executed/execution_* 메시지를 prompt_id별 대기자에게 전달
+- 완료 통지를 받으면 /history를 한 번만 조회하여 기존과 같은 실행 결과 반환
+- 소켓이 끊겨 있는 동안(및 재연결 직후)에만 /history 폴링으로 대체
+- /prompt 요청 시 리스너의 client_id를 넣어야 실행 이벤트가 이 소켓으로 전달됨
+- 대기 작업 없이 COMFYUI_WS_IDLE_TIMEOUT이 지나면 소켓을 닫고 보관소에서도 제거 (종료된 파드의 리스너가 쌓이지 않음)
+"""
+
+import uuid
+import asyncio
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import aiohttp
+
+from app.core.config import settings
+from app.core.http_clients import get_policy, pooled_client
+
+logger = logging.getLogger(__name__)
+
+# 진행률 콜백 (현재 단계, 전체 단계)
+ProgressCallback = Callable[[int, int], Awaitable[None]]
+
+# 대기자 등록 전에 끝난 프롬프트를 기억해 둘 개수
+RECENT_FINISHED_SIZE = 256
+
+# 메시지가 없을 때 유휴 여부를 확인하는 최대 간격 (초)
+RECEIVE_TIMEOUT = 60
+
+# 리스너 지표 중 누적 값 (보관소에서 제거된 리스너 몫도 합계에 유지)
+COUNTER_STATS = ("push_completions", "fallback_polls", "reconnects", "timeouts")
+
+
+@dataclass
+class _PromptState:
+    """prompt_id별 실행 상태 (대기자가 있는 동안만 유지)"""
+
+    changed: asyncio.Event = field(default_factory=asyncio.Event)
+    finished: bool = False
+    error: Optional[Dict[str, Any]] = None
+    progress: Optional[Tuple[int, int]] = None
+    current_node: Optional[str] = None
+
+
+class ComfyUIEventListener:
+    """ComfyUI 엔드포인트 하나에 대한 WebSocket 이벤트 수신기"""
+
+    def __init__(
+        self,
+        endpoint: str,
+        poll_interval: Optional[float] = None,
+        reconnect_delay: Optional[float] = None,
+        idle_timeout: Optional[float] = None,
+        on_idle: Optional[Callable[["ComfyUIEventListener"], None]] = None,
+    ):
+        self.endpoint = endpoint.rstrip("/")
+        self.client_id = uuid.uuid4().hex
+        self.poll_interval = poll_interval or settings.COMFYUI_WS_FALLBACK_POLL_INTERVAL
+        self.reconnect_delay = reconnect_delay or settings.COMFYUI_WS_RECONNECT_DELAY
+        self.idle_timeout = idle_timeout or settings.COMFYUI_WS_IDLE_TIMEOUT
+        # 유휴 상태로 수신 작업이 끝날 때 호출 (보관소에서 제거)
+        self.on_idle = on_idle
+
+        self._states: Dict[str, _PromptState] = {}
+        self._recent_finished: "OrderedDict[str, Optional[Dict[str, Any]]]" = OrderedDict()
+        self._task: Optional[asyncio.Task] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._connected = False
+        # 연결될 때마다 증가 (끊긴 사이에 놓친 이벤트가 있는지 판단)
+        self._epoch = 0
+        self._last_active = 0.0
+
+        # 지표
+        self._push_completions = 0
+        self._fallback_polls = 0
+        self._reconnects = 0
+        self._timeouts = 0
+
+    @property
+    def ws_url(self) -> str:
+        if self.endpoint.startswith("https://"):
+            base = "wss://" + self.endpoint[len("https://"):]
+        elif self.endpoint.startswith("http://"):
+            base = "ws://" + self.endpoint[len("http://"):]
+        else:
+            base = self.endpoint
+        return f"{base}/ws?clientId={self.client_id}"
+
+    @property
+    def connected(self) -> bool:
+        return self._connected
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def ensure_started(self):
+        """수신 작업이 없으면 시작 (/prompt 요청 전에 호출)"""
+        self._last_active = asyncio.get_running_loop().time()
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        self._set_connected(False)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            policy = get_policy("runpod_pod")
+            # 연결을 계속 유지하므로 전체 타임아웃 없이 연결 타임아웃만 적용
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(ssl=None if policy.verify_ssl else False),
+                timeout=aiohttp.ClientTimeout(total=None, connect=policy.connect_timeout),
+            )
+        return self._session
+
+    def _is_idle(self) -> bool:
+        loop = asyncio.get_running_loop()
+        return not self._states and loop.time() - self._last_active > self.idle_timeout
+
+    async def _run(self):
+        while True:
+            try:
+                async with self._get_session().ws_connect(self.ws_url, heartbeat=30) as ws:
+                    self._epoch += 1
+                    if self._epoch > 1:
+                        self._reconnects += 1
+                    self._set_connected(True)
+                    logger.debug(f"🔌 ComfyUI 이벤트 소켓 연결: {self.endpoint}")
+
+                    while True:
+                        try:
+                            message = await ws.receive(timeout=min(RECEIVE_TIMEOUT, self.idle_timeout))
+                        except asyncio.TimeoutError:
+                            if self._is_idle():
+                                break
+                            continue
+                        if message.type == aiohttp.WSMsgType.TEXT:
+                            try:
+                                payload = message.json()
+                            except ValueError:
+                                continue
+                            self._dispatch(payload)
+                        elif message.type in (
+                            aiohttp.WSMsgType.CLOSE,
+                            aiohttp.WSMsgType.CLOSED,
+                            aiohttp.WSMsgType.ERROR,
+                        ):
+                            break
+                        # BINARY는 미리보기 이미지 → 사용하지 않음
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"⚠️ ComfyUI 이벤트 소켓 연결 실패 ({self.endpoint}): {e}")
+            finally:
+                self._set_connected(False)
+
+            if self._is_idle():
+                logger.debug(f"🔌 ComfyUI 이벤트 소켓 종료 (대기 작업 없음): {self.endpoint}")
+                if self.on_idle is not None:
+                    self.on_idle(self)
+                if self._session is not None:
+                    await self._session.close()
+                    self._session = None
+                return
+            await asyncio.sleep(self.reconnect_delay)
+
+    def _set_connected(self, connected: bool):
+        if self._connected == connected:
+            return
+        self._connected = connected
+        # 연결 상태가 바뀌면 대기자가 폴링 여부를 다시 판단하도록 깨움
+        for state in self._states.values():
+            state.changed.set()
+
+    def _dispatch(self, message: Dict[str, Any]):
+        """ComfyUI 메시지를 prompt_id별 상태에 반영"""
+        message_type = message.get("type")
+        data = message.get("data") or {}
+        prompt_id = data.get("prompt_id")
+        if not prompt_id:
+            # status 등 전체 공지 메시지
+            return
+
+        state = self._states.get(prompt_id)
+        finished = False
+        error = None
+
+        if message_type == "executing":
+            # node가 None이면 해당 프롬프트 실행 종료 (history 저장 이후 전송됨)
+            if data.get("node") is None:
+                finished = True
+            elif state is not None:
+                state.current_node = str(data.get("node"))
+        elif message_type == "progress":
+            if state is not None:
+                state.progress = (int(data.get("value", 0)), int(data.get("max", 0)))
+        elif message_type == "executed":
+            if state is not None:
+                state.current_node = str(data.get("node"))
+        elif message_type in ("execution_error", "execution_interrupted"):
+            finished = True
+            error = data
+        else:
+            return
+
+        if finished:
+            if state is None:
+                # 대기자 등록 전에 끝난 경우 (빠른 워크플로우)
+                self._recent_finished[prompt_id] = error
+                while len(self._recent_finished) > RECENT_FINISHED_SIZE:
+                    self._recent_finished.popitem(last=False)
+                return
+            state.finished = True
+            state.error = state.error or error
+        if state is not None:
+            state.changed.set()
+
+    async def _fetch_history(self, prompt_id: str) -> Optional[Dict[str, Any]]:
+        """/history/{prompt_id} 조회, 아직 끝나지 않았으면 None"""
+        url = f"{self.endpoint}/history/{prompt_id}"
+        try:
+            async with pooled_client("runpod_pod") as client:
+                response = await client.get(url, timeout=10.0)
+            if response.status_code != 200:
+                logger.warning(f"⚠️ 히스토리 조회 실패: {response.status_code}")
+                return None
+            return response.json().get(prompt_id)
+        except Exception as e:
+            logger.warning(f"⚠️ 히스토리 조회 중 오류: {e}")
+            return None
+
+    async def wait_for_execution(
+        self,
+        prompt_id: str,
+        max_wait_time: float = 300,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """프롬프트 실행이 끝날 때까지 대기 후 /history 실행 결과 반환 (타임아웃 시 None)"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max_wait_time
+        self.ensure_started()
+
+        state = self._states.setdefault(prompt_id, _PromptState())
+        if prompt_id in self._recent_finished:
+            state.finished = True
+            state.error = self._recent_finished.pop(prompt_id)
+
+        seen_epoch = self._epoch
+        # 완료 통지를 받았는데 history가 아직 비어 있으면 폴링으로 마무리
+        poll = False
+        last_progress = None
+        try:
+            while True:
+                state.changed.clear()
+                self._last_active = loop.time()
+
+                if state.finished and not poll:
+                    if state.error:
+                        logger.error(f"❌ 워크플로우 {prompt_id} 실행 오류: {state.error}")
+                    execution = await self._fetch_history(prompt_id)
+                    if execution is not None:
+                        self._push_completions += 1
+                        logger.info(f"✅ 워크플로우 {prompt_id} 실행 완료")
+                        return execution
+                    poll = True
+                elif poll or not self._connected or self._epoch != seen_epoch:
+                    # 소켓이 없거나 끊긴 사이에 완료되었을 수 있으므로 직접 확인
+                    seen_epoch = self._epoch
+                    self._fallback_polls += 1
+                    execution = await self._fetch_history(prompt_id)
+                    if execution is not None:
+                        logger.info(f"✅ 워크플로우 {prompt_id} 실행 완료 (히스토리 조회)")
+                        return execution
+
+                if on_progress is not None and state.progress and state.progress != last_progress:
+                    last_progress = state.progress
+                    try:
+                        await on_progress(*state.progress)
+                    except Exception as e:
+                        logger.warning(f"⚠️ 진행률 콜백 오류: {e}")
+
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    logger.error(f"❌ 워크플로우 {prompt_id} 실행 타임아웃 ({max_wait_time}초)")
+                    return None
+                if state.changed.is_set():
+                    continue
+                try:
+                    await asyncio.wait_for(state.changed.wait(), timeout=min(remaining, self.poll_interval))
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._states.pop(prompt_id, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "connected": self._connected,
+            "waiting_prompts": len(self._states),
+            "push_completions": self._push_completions,
+            "fallback_polls": self._fallback_polls,
+            "reconnects": self._reconnects,
+            "timeouts": self._timeouts,
+        }
+
+
+class ComfyUIEventHub:
+    """ComfyUI 엔드포인트(파드)별 이벤트 리스너 보관소"""
+
+    def __init__(self, **listener_options: Any):
+        self._listeners: Dict[str, ComfyUIEventListener] = {}
+        # 새 리스너 생성 옵션 (poll_interval, reconnect_delay, idle_timeout)
+        self._listener_options = listener_options
+        # 제거된 리스너의 누적 지표
+        self._retired = dict.fromkeys(COUNTER_STATS, 0)
+        self._removed = 0
+
+    def get_listener(self, comfyui_endpoint: str) -> ComfyUIEventListener:
+        """엔드포인트의 리스너 반환 (없으면 생성), 수신 작업 시작"""
+        key = comfyui_endpoint.rstrip("/")
+        listener = self._listeners.get(key)
+        if listener is None:
+            listener = ComfyUIEventListener(key, on_idle=self._remove_listener, **self._listener_options)
+            self._listeners[key] = listener
+        listener.ensure_started()
+        return listener
+
+    def _remove_listener(self, listener: ComfyUIEventListener):
+        """유휴 상태로 종료되는 리스너를 보관소에서 제거 (이후 요청은 새 리스너 생성)"""
+        if self._listeners.get(listener.endpoint) is not listener:
+            return
+        del self._listeners[listener.endpoint]
+        self._removed += 1
+        stats = listener.get_stats()
+        for name in COUNTER_STATS:
+            self._retired[name] += stats[name]
+
+    async def close(self):
+        """모든 리스너 종료"""
+        for listener in list(self._listeners.values()):
+            try:
+                await listener.stop()
+            except Exception as e:
+                logger.warning(f"⚠️ ComfyUI 이벤트 리스너 종료 실패 ({listener.endpoint}): {e}")
+        self._listeners.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """리스너 지표 합계"""
+        stats = [listener.get_stats() for listener in self._listeners.values()]
+        result = {
+            "listeners": len(stats),
+            "removed_listeners": self._removed,
+            "connected": sum(1 for item in stats if item["connected"]),
+            "waiting_prompts": sum(item["waiting_prompts"] for item in stats),
+        }
+        for name in COUNTER_STATS:
+            result[name] = self._retired[name] + sum(item[name] for item in stats)
+        return result
+
+
+# 싱글톤 인스턴스
+_comfyui_event_hub: Optional[ComfyUIEventHub] = None
+
+
+def get_comfyui_event_hub() -> ComfyUIEventHub:
+    """ComfyUI 이벤트 리스너 보관소 싱글톤 인스턴스 반환"""
+    global _comfyui_event_hub
+    if _comfyui_event_hub is None:
+        _comfyui_event_hub = ComfyUIEventHub()
+    return _comfyui_event_hub
+
+
+async def stop_comfyui_event_listeners():
+    """애플리케이션 종료시 호출"""
+    if _comfyui_event_hub is not None:
+        await _comfyui_event_hub.close()
@@ -4,14 +4,15 @@ ComfyUI Flux 워크플로우 이미지 생성 서비스
 사용자 프롬프트를 Flux 워크플로우에 인젝션하여 이미지를 생성하는 서비스
 """
 
-import json
 import logging
 import asyncio
 import httpx
 from typing import Optional, Dict, Any
-from pathlib import Path
 
 from app.core.config import settings
+from app.core.http_clients import pooled_client
+from app.services.comfyui_event_listener import get_comfyui_event_hub
+from app.services.workflow_templates import FLUX_T2I, get_workflow_template_registry
 
 logger = logging.getLogger(__name__)
 
@@ -20,29 +21,8 @@ class ComfyUIFluxService:
     """ComfyUI Flux 워크플로우 이미지 생성 서비스"""
     
     def __init__(self):
-        self.workflow_path = Path("workflows/t2i_generate_ComfyUI_Flux_Nunchaku_flux.1-dev.json")
-        self.base_workflow = None
-        self._load_workflow()
-    
-    def _load_workflow(self):
-        """기본 워크플로우 JSON 로드"""
-        try:
-            # 백엔드 workflows 디렉토리에서 워크플로우 로드
-            workflow_file = Path(__file__).parent.parent.parent / "workflows" / "t2i_generate_ComfyUI_Flux_Nunchaku_flux.1-dev.json"
-            
-            if workflow_file.exists():
-                with open(workflow_file, 'r', encoding='utf-8') as f:
-                    self.base_workflow = json.load(f)
-                logger.info(f"✅ Flux 워크플로우 로드 완료: {workflow_file}")
-                logger.info(f"🔍 워크플로우 노드 수: {len(self.base_workflow.get('nodes', []))}")
-            else:
-                logger.error(f"❌ 워크플로우 파일을 찾을 수 없음: {workflow_file}")
-                logger.error(f"❌ 현재 작업 디렉토리: {Path.cwd()}")
-                raise Exception(f"필수 워크플로우 파일이 없습니다: {workflow_file}")
-                
-        except Exception as e:
-            logger.error(f"❌ 워크플로우 로드 실패: {e}")
-            raise Exception(f"Flux 워크플로우 초기화 실패: {e}")
+        # 워크플로우는 레지스트리에서 한 번만 로드/검증 (변경 시 자동 갱신)
+        self.templates = get_workflow_template_registry()
     
     def _get_default_workflow(self) -> Dict[str, Any]:
         """기본 워크플로우 구조 반환 (런팟에서 직접 로드 실패 시 백업)"""
@@ -82,11 +62,7 @@ class ComfyUIFluxService:
             생성 결과 정보
         """
         try:
-            if not self.base_workflow:
-                logger.error("❌ 워크플로우가 로드되지 않음")
-                return None
-            
-            # 워크플로우 복사 및 프롬프트 인젝션
+            # 워크플로우 템플릿에 프롬프트 인젝션
             workflow = self._inject_prompt_to_workflow(
                 prompt, width, height, guidance, steps, lora_settings
             )
@@ -116,59 +92,33 @@ class ComfyUIFluxService:
     ) -> Dict[str, Any]:
         """워크플로우에 프롬프트 및 파라미터 인젝션"""
         
-        workflow = json.loads(json.dumps(self.base_workflow))  # 깊은 복사
-        
-        # 노드별 파라미터 업데이트 (workflow는 노드 ID를 키로 하는 객체)
-        # CLIP Text Encode 노드에 프롬프트 인젝션
-        if "6" in workflow and workflow["6"].get("class_type") == "CLIPTextEncode":
-            workflow["6"]["inputs"]["text"] = prompt
-            logger.info(f"✅ 프롬프트 인젝션 완료: {prompt[:50]}...")
-        
-        # EmptySD3LatentImage 노드에 해상도 설정
-        if "27" in workflow and workflow["27"].get("class_type") == "EmptySD3LatentImage":
-            workflow["27"]["inputs"]["width"] = width
-            workflow["27"]["inputs"]["height"] = height
-            logger.info(f"✅ 해상도 설정 완료 (EmptySD3LatentImage): {width}x{height}")
-        
-        # ModelSamplingFlux 노드에 해상도 설정
-        if "30" in workflow and workflow["30"].get("class_type") == "ModelSamplingFlux":
-            workflow["30"]["inputs"]["width"] = width
-            workflow["30"]["inputs"]["height"] = height
-            logger.info(f"✅ 해상도 설정 완료 (ModelSamplingFlux): {width}x{height}")
+        params: Dict[str, Any] = {"prompt": prompt, "width": width, "height": height}
+        logger.info(f"✅ 프롬프트 인젝션: {prompt[:50]}... ({width}x{height})")
         
         # LoRA 설정 적용 (선택된 스타일에 따라)
+        # 첫 번째 LoRA 노드 (46) - FLUX.1-Turbo-Alpha는 항상 기본값 유지
+        # 두 번째 LoRA 노드 (47) - 인종 특성 LoRA 동적 변경
         if lora_settings:
-            # 첫 번째 LoRA 노드 (46) - FLUX.1-Turbo-Alpha (기본 스타일)
-            if "46" in workflow and workflow["46"].get("class_type") == "NunchakuFluxLoraLoader":
-                # 기본값 유지 (Turbo Alpha는 항상 활성화)
-                logger.info(f"✅ 기본 LoRA 유지: FLUX.1-Turbo-Alpha (strength: 1.0)")
+            style_type = lora_settings.get("style_type", "default")
             
-            # 두 번째 LoRA 노드 (47) - 인종 특성 LoRA 동적 변경
-            if "47" in workflow and workflow["47"].get("class_type") == "NunchakuFluxLoraLoader":
-                # 선택된 스타일에 따라 LoRA 변경
-                style_type = lora_settings.get("style_type", "default")
-                
-                if style_type == "asian":
-                    # 동양인 스타일 LoRA
-                    workflow["47"]["inputs"]["lora_name"] = "FLUX/LoRAhnb-North Shore - Korean Exquisite Sweet and Spicy Girl Face Model - Yoon Zhi_v1.safetensors"
-                    workflow["47"]["inputs"]["lora_strength"] = lora_settings.get("lora_strength", 0.6)
-                    logger.info(f"✅ 동양인 스타일 LoRA 적용 (strength: {workflow['47']['inputs']['lora_strength']})")
-                elif style_type == "western":
-                    # 서양인 스타일 LoRA (기존 NSFW_master 대신 적절한 서양인 LoRA로 변경 필요)
-                    workflow["47"]["inputs"]["lora_name"] = "FLUX/aidmarealisticskin_aidmaRealisticSkin-FLUX-v0.1.safetensors"
-                    workflow["47"]["inputs"]["lora_strength"] = lora_settings.get("lora_strength", 1.0)
-                    logger.info(f"✅ 서양인 스타일 LoRA 적용 (strength: {workflow['47']['inputs']['lora_strength']})")
-                elif style_type == "mixed":
-                    # 혼합 스타일 - 중간 강도로 설정
-                    workflow["47"]["inputs"]["lora_name"] = "FLUX/LoRAhnb-North Shore - Korean Exquisite Sweet and Spicy Girl Face Model - Yoon Zhi_v1.safetensors"
-                    workflow["47"]["inputs"]["lora_strength"] = 0.3
-                    logger.info(f"✅ 혼합 스타일 LoRA 적용 (strength: 0.3)")
-                else:
-                    # 기본값 - LoRA 비활성화
-                    workflow["47"]["inputs"]["lora_strength"] = 0.0
-                    logger.info(f"✅ LoRA 비활성화 (기본 스타일)")
+            if style_type == "asian":
+                # 동양인 스타일 LoRA
+                params["style_lora_name"] = "FLUX/LoRAhnb-North Shore - Korean Exquisite Sweet and Spicy Girl Face Model - Yoon Zhi_v1.safetensors"
+                params["style_lora_strength"] = lora_settings.get("lora_strength", 0.6)
+            elif style_type == "western":
+                # 서양인 스타일 LoRA (기존 NSFW_master 대신 적절한 서양인 LoRA로 변경 필요)
+                params["style_lora_name"] = "FLUX/aidmarealisticskin_aidmaRealisticSkin-FLUX-v0.1.safetensors"
+                params["style_lora_strength"] = lora_settings.get("lora_strength", 1.0)
+            elif style_type == "mixed":
+                # 혼합 스타일 - 중간 강도로 설정
+                params["style_lora_name"] = "FLUX/LoRAhnb-North Shore - Korean Exquisite Sweet and Spicy Girl Face Model - Yoon Zhi_v1.safetensors"
+                params["style_lora_strength"] = 0.3
+            else:
+                # 기본값 - LoRA 비활성화
+                params["style_lora_strength"] = 0.0
+            logger.info(f"✅ {style_type} 스타일 LoRA 적용 (strength: {params['style_lora_strength']})")
         
-        return workflow
+        return self.templates.build(FLUX_T2I, **params)
     
     async def _execute_workflow(
         self, 
@@ -182,8 +132,11 @@ class ComfyUIFluxService:
             prompt_url = f"{comfyui_endpoint.rstrip('/')}/prompt"
             
             # 워크플로우 실행 요청 페이로드
+            # 실행 이벤트가 리스너 소켓으로 전달되도록 client_id 지정
+            listener = get_comfyui_event_hub().get_listener(comfyui_endpoint)
             payload = {
-                "prompt": workflow                
+                "prompt": workflow,
+                "client_id": listener.client_id,
             }
             
             # ComfyUI 연결 재시도 로직 (초기화 시간 고려)
@@ -192,7 +145,7 @@ class ComfyUIFluxService:
             
             for attempt in range(max_retries):
                 try:
-                    async with httpx.AsyncClient(timeout=60.0) as client:  # 타임아웃 60초로 연장
+                    async with pooled_client("runpod_pod") as client:
                         if attempt > 0:
                             logger.info(f"🔄 ComfyUI 연결 재시도 {attempt + 1}/{max_retries} (30초 대기 후)")
                             await asyncio.sleep(retry_delay)
@@ -202,7 +155,8 @@ class ComfyUIFluxService:
                         response = await client.post(
                             prompt_url,
                             json=payload,
-                            headers={"Content-Type": "application/json"}
+                            headers={"Content-Type": "application/json"},
+                            timeout=60.0,  # 타임아웃 60초로 연장
                         )
                         
                         if response.status_code == 200:
@@ -249,46 +203,18 @@ class ComfyUIFluxService:
         prompt_id: str,
         max_wait_time: int = 300
     ) -> Optional[Dict[str, Any]]:
-        """워크플로우 실행 완료 대기 및 결과 반환"""
+        """워크플로우 실행 완료 대기 및 결과 반환 (ComfyUI WebSocket 완료 이벤트)"""
         
-        history_url = f"{comfyui_endpoint.rstrip('/')}/history/{prompt_id}"
+        listener = get_comfyui_event_hub().get_listener(comfyui_endpoint)
+        execution = await listener.wait_for_execution(prompt_id, max_wait_time)
+        if execution is None:
+            return None
         
-        try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                
-                for attempt in range(max_wait_time // 5):  # 5초마다 체크
-                    await asyncio.sleep(5)
-                    
-                    try:
-                        response = await client.get(history_url)
-                        
-                        if response.status_code == 200:
-                            history = response.json()
-                            
-                            if prompt_id in history:
-                                execution = history[prompt_id]
-                                
-                                # 실행 완료 확인
-                                if "outputs" in execution:
-                                    logger.info(f"✅ 워크플로우 {prompt_id} 실행 완료")
-                                    return self._extract_image_info(execution)
-                                else:
-                                    logger.debug(f"⏳ 워크플로우 {prompt_id} 실행 중... ({attempt + 1}/{max_wait_time // 5})")
-                            else:
-                                logger.debug(f"⏳ 워크플로우 {prompt_id} 대기 중... ({attempt + 1}/{max_wait_time // 5})")
-                        else:
-                            logger.warning(f"⚠️ 히스토리 조회 실패: {response.status_code}")
-                            
-                    except httpx.TimeoutException:
-                        logger.debug(f"⏳ 히스토리 조회 타임아웃, 재시도... ({attempt + 1}/{max_wait_time // 5})")
-                        continue
-                
-                logger.error(f"❌ 워크플로우 {prompt_id} 실행 타임아웃 ({max_wait_time}초)")
-                return None
-                
-        except Exception as e:
-            logger.error(f"❌ 워크플로우 완료 대기 중 오류: {e}")
+        if "outputs" not in execution:
+            logger.error(f"❌ 워크플로우 {prompt_id} 실행 결과에 outputs 없음")
             return None
+        
+        return self._extract_image_info(execution)
     
     def _extract_image_info(self, execution: Dict[str, Any]) -> Dict[str, Any]:
         """실행 결과에서 이미지 정보 추출"""
@@ -345,8 +271,8 @@ class ComfyUIFluxService:
             if subfolder:
                 params["subfolder"] = subfolder
             
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.get(download_url, params=params)
+            async with pooled_client("runpod_pod") as client:
+                response = await client.get(download_url, params=params, timeout=60.0)
                 
                 if response.status_code == 200:
                     logger.info(f"✅ 이미지 다운로드 완료: {filename}")
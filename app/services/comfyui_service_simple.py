@@ -13,6 +13,7 @@ from abc import ABC, abstractmethod
 from pydantic import BaseModel
 import logging
 from app.core.config import settings
+from app.core.http_clients import pooled_aiohttp_session
 
 logger = logging.getLogger(__name__)
 
@@ -91,7 +92,7 @@ class ComfyUIService:
             if self.api_key:
                 headers["Authorization"] = f"Bearer {self.api_key}"
 
-            async with aiohttp.ClientSession() as session:
+            async with pooled_aiohttp_session("runpod_pod") as session:
                 # 워크플로우 큐에 추가
                 async with session.post(
                     f"{self.server_url}/prompt",
@@ -331,7 +332,7 @@ class ComfyUIService:
     async def get_generation_status(self, job_id: str) -> ImageGenerationResponse:
         """생성 상태 조회"""
         try:
-            async with aiohttp.ClientSession() as session:
+            async with pooled_aiohttp_session("runpod_pod") as session:
                 async with session.get(
                     f"{self.server_url}/history/{job_id}",
                     timeout=aiohttp.ClientTimeout(total=10),
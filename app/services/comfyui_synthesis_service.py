@@ -10,9 +10,11 @@ import asyncio
 import httpx
 import base64
 from typing import Optional, Dict, Any, Tuple
-from pathlib import Path
 
 from app.core.config import settings
+from app.core.http_clients import pooled_client
+from app.services.comfyui_event_listener import get_comfyui_event_hub
+from app.services.workflow_templates import IMAGE_SYNTHESIS, get_workflow_template_registry
 
 logger = logging.getLogger(__name__)
 
@@ -21,26 +23,8 @@ class ComfyUISynthesisService:
     """ComfyUI 이미지 합성 서비스"""
     
     def __init__(self):
-        self.workflow_path = Path("workflows/image_synthesis.json")
-        self.base_workflow = None
-        self._load_workflow()
-    
-    def _load_workflow(self):
-        """기본 워크플로우 JSON 로드"""
-        try:
-            workflow_file = Path(__file__).parent.parent.parent / "workflows" / "image_synthesis.json"
-            
-            if workflow_file.exists():
-                with open(workflow_file, 'r', encoding='utf-8') as f:
-                    self.base_workflow = json.load(f)
-                logger.info(f"✅ 이미지 합성 워크플로우 로드 완료: {workflow_file}")
-            else:
-                logger.error(f"❌ 워크플로우 파일을 찾을 수 없음: {workflow_file}")
-                raise Exception(f"필수 워크플로우 파일이 없습니다: {workflow_file}")
-                
-        except Exception as e:
-            logger.error(f"❌ 워크플로우 로드 실패: {e}")
-            raise Exception(f"이미지 합성 워크플로우 초기화 실패: {e}")
+        # 워크플로우는 레지스트리에서 한 번만 로드/검증 (변경 시 자동 갱신)
+        self.templates = get_workflow_template_registry()
     
     async def synthesize_images(
         self, 
@@ -70,10 +54,6 @@ class ComfyUISynthesisService:
             생성 결과 정보
         """
         try:
-            if not self.base_workflow:
-                logger.error("❌ 워크플로우가 로드되지 않음")
-                return None
-            
             # 이미지를 ComfyUI에 업로드
             image1_name = await self._upload_image(comfyui_endpoint, image1_data, "synthesis_image1.png")
             image2_name = await self._upload_image(comfyui_endpoint, image2_data, "synthesis_image2.png")
@@ -82,7 +62,7 @@ class ComfyUISynthesisService:
                 logger.error("❌ 이미지 업로드 실패")
                 return None
             
-            # 워크플로우 복사 및 파라미터 인젝션
+            # 워크플로우 템플릿에 파라미터 인젝션
             workflow = self._inject_synthesis_params(
                 prompt, image1_name, image2_name, width, height, guidance, steps
             )
@@ -110,7 +90,7 @@ class ComfyUISynthesisService:
                 'image': (filename, image_data, 'image/png')
             }
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client("runpod_pod") as client:
                 response = await client.post(upload_url, files=files)
                 
                 if response.status_code == 200:
@@ -138,37 +118,20 @@ class ComfyUISynthesisService:
     ) -> Dict[str, Any]:
         """워크플로우에 합성 파라미터 인젝션"""
         
-        workflow = json.loads(json.dumps(self.base_workflow))  # 깊은 복사
-        
-        # 프롬프트 인젝션 (노드 6)
-        if "6" in workflow and workflow["6"].get("class_type") == "CLIPTextEncode":
-            workflow["6"]["inputs"]["text"] = prompt
-            logger.info(f"✅ 프롬프트 인젝션 완료: {prompt[:50]}...")
-        
-        # 이미지 로드 노드 업데이트 (노드 142, 147)
-        if "142" in workflow and workflow["142"].get("class_type") == "LoadImageOutput":
-            workflow["142"]["inputs"]["image"] = image1_name
-            logger.info(f"✅ 첫 번째 이미지 설정 완료: {image1_name}")
-        
-        if "147" in workflow and workflow["147"].get("class_type") == "LoadImageOutput":
-            workflow["147"]["inputs"]["image"] = image2_name
-            logger.info(f"✅ 두 번째 이미지 설정 완료: {image2_name}")
-        
-        # 해상도 설정 (노드 191 - ImageResizeKJv2)
-        if "191" in workflow and workflow["191"].get("class_type") == "ImageResizeKJv2":
-            workflow["191"]["inputs"]["width"] = width
-            workflow["191"]["inputs"]["height"] = height
-            logger.info(f"✅ 해상도 설정 완료: {width}x{height}")
-        
-        # 가이던스 설정 (노드 35 - FluxGuidance)
-        if "35" in workflow and workflow["35"].get("class_type") == "FluxGuidance":
-            workflow["35"]["inputs"]["guidance"] = guidance
-            logger.info(f"✅ 가이던스 설정 완료: {guidance}")
-        
-        # 스텝 수 설정 (노드 31 - KSampler)
-        if "31" in workflow and workflow["31"].get("class_type") == "KSampler":
-            workflow["31"]["inputs"]["steps"] = steps
-            logger.info(f"✅ 스텝 수 설정 완료: {steps}")
+        workflow = self.templates.build(
+            IMAGE_SYNTHESIS,
+            prompt=prompt,
+            image1=image1_name,
+            image2=image2_name,
+            width=width,
+            height=height,
+            guidance=guidance,
+            steps=steps,
+        )
+        logger.info(
+            f"✅ 합성 파라미터 인젝션 완료: {prompt[:50]}... "
+            f"(이미지 {image1_name}, {image2_name}, {width}x{height}, guidance {guidance}, steps {steps})"
+        )
         
         return workflow
     
@@ -182,8 +145,11 @@ class ComfyUISynthesisService:
         try:
             prompt_url = f"{comfyui_endpoint.rstrip('/')}/prompt"
             
+            # 실행 이벤트가 리스너 소켓으로 전달되도록 client_id 지정
+            listener = get_comfyui_event_hub().get_listener(comfyui_endpoint)
             payload = {
-                "prompt": workflow                
+                "prompt": workflow,
+                "client_id": listener.client_id,
             }
             
             max_retries = 3
@@ -191,7 +157,7 @@ class ComfyUISynthesisService:
             
             for attempt in range(max_retries):
                 try:
-                    async with httpx.AsyncClient(timeout=60.0) as client:
+                    async with pooled_client("runpod_pod") as client:
                         if attempt > 0:
                             logger.info(f"🔄 ComfyUI 연결 재시도 {attempt + 1}/{max_retries}")
                             await asyncio.sleep(retry_delay)
@@ -201,7 +167,8 @@ class ComfyUISynthesisService:
                         response = await client.post(
                             prompt_url,
                             json=payload,
-                            headers={"Content-Type": "application/json"}
+                            headers={"Content-Type": "application/json"},
+                            timeout=60.0,
                         )
                         
                         if response.status_code == 200:
@@ -243,46 +210,18 @@ class ComfyUISynthesisService:
         prompt_id: str,
         max_wait_time: int = 300
     ) -> Optional[Dict[str, Any]]:
-        """워크플로우 실행 완료 대기 및 결과 반환"""
+        """워크플로우 실행 완료 대기 및 결과 반환 (ComfyUI WebSocket 완료 이벤트)"""
         
-        history_url = f"{comfyui_endpoint.rstrip('/')}/history/{prompt_id}"
+        listener = get_comfyui_event_hub().get_listener(comfyui_endpoint)
+        execution = await listener.wait_for_execution(prompt_id, max_wait_time)
+        if execution is None:
+            return None
         
-        try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                
-                for attempt in range(max_wait_time // 5):
-                    await asyncio.sleep(5)
-                    
-                    try:
-                        response = await client.get(history_url)
-                        
-                        if response.status_code == 200:
-                            history = response.json()
-                            
-                            if prompt_id in history:
-                                execution = history[prompt_id]
-                                
-                                if "outputs" in execution:
-                                    logger.info(f"✅ 워크플로우 {prompt_id} 실행 완료")
-                                    logger.info(f"📊 Execution 전체 구조: {json.dumps(execution, indent=2)}")
-                                    return self._extract_image_info(execution)
-                                else:
-                                    logger.debug(f"⏳ 워크플로우 {prompt_id} 실행 중...")
-                            else:
-                                logger.debug(f"⏳ 워크플로우 {prompt_id} 대기 중...")
-                        else:
-                            logger.warning(f"⚠️ 히스토리 조회 실패: {response.status_code}")
-                            
-                    except httpx.TimeoutException:
-                        logger.debug(f"⏳ 히스토리 조회 타임아웃, 재시도...")
-                        continue
-                
-                logger.error(f"❌ 워크플로우 {prompt_id} 실행 타임아웃")
-                return None
-                
-        except Exception as e:
-            logger.error(f"❌ 워크플로우 완료 대기 중 오류: {e}")
+        if "outputs" not in execution:
+            logger.error(f"❌ 워크플로우 {prompt_id} 실행 결과에 outputs 없음")
             return None
+        
+        return self._extract_image_info(execution)
     
     def _extract_image_info(self, execution: Dict[str, Any]) -> Dict[str, Any]:
         """실행 결과에서 이미지 정보 추출"""
@@ -371,8 +310,8 @@ class ComfyUISynthesisService:
             if subfolder:
                 params["subfolder"] = subfolder
             
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.get(download_url, params=params)
+            async with pooled_client("runpod_pod") as client:
+                response = await client.get(download_url, params=params, timeout=60.0)
                 
                 if response.status_code == 200:
                     logger.info(f"✅ 이미지 다운로드 완료: {filename}")
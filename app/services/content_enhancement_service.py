@@ -2,13 +2,18 @@ import uuid
 from openai import AsyncOpenAI
 from typing import Dict, Any, Optional, List
 from app.core.config import settings
+from app.core.http_clients import get_http_client
 
 
 class ContentEnhancementService:
     """게시글 설명 생성 + 인플루언서 말투 변환 통합 서비스"""
 
-    def __init__(self):
-        self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+    @property
+    def client(self) -> AsyncOpenAI:
+        """공유 커넥션 풀을 사용하는 OpenAI 클라이언트"""
+        return AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY, http_client=get_http_client("openai")
+        )
 
     async def generate_content(
         self,
@@ -0,0 +1,326 @@
+"""
+다운로드 스트리밍 프록시
+원격 객체를 메모리에 모두 올리지 않고 받은 청크를 바로 클라이언트로 전달
+- 자체 S3 버킷 객체는 get_object Body를 직접 스트리밍 (호출 측에서 접근 권한 확인 후)
+- presigned URL 서명(SigV2/SigV4 쿼리 서명)을 로컬에서 검증
+- 그 외 URL은 공유 httpx 커넥션 풀로 스트리밍
+- Range(206) / 조건부 요청(If-None-Match, If-Modified-Since → 304) 전달
+- 동시 스트리밍 수 제한 (초과 시 503)
+"""
+
+import hmac
+import base64
+import asyncio
+import hashlib
+import logging
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Dict, Optional, Set
+from urllib.parse import parse_qsl, quote, unquote, urlparse
+
+import httpx
+from botocore.exceptions import ClientError
+from fastapi import HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
+
+from app.core.config import settings
+from app.core.http_clients import get_http_client
+
+logger = logging.getLogger(__name__)
+
+# 클라이언트 요청에서 원본으로 전달하는 헤더
+FORWARD_REQUEST_HEADERS = ("range", "if-none-match", "if-modified-since", "if-range")
+
+# 원본 응답에서 클라이언트로 전달하는 헤더
+FORWARD_RESPONSE_HEADERS = (
+    "content-length",
+    "content-encoding",
+    "content-range",
+    "accept-ranges",
+    "etag",
+    "last-modified",
+)
+
+# 슬롯 대기 최대 시간 (초)
+ACQUIRE_TIMEOUT = 10.0
+
+_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(settings.PROXY_DOWNLOAD_CONCURRENCY)
+    return _semaphore
+
+
+async def _acquire_slot() -> asyncio.Semaphore:
+    """다운로드 슬롯 확보 (대기 시간 초과 시 503)"""
+    semaphore = _get_semaphore()
+    try:
+        await asyncio.wait_for(semaphore.acquire(), timeout=ACQUIRE_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=503, detail="다운로드 요청이 많습니다. 잠시 후 다시 시도해주세요.")
+    return semaphore
+
+
+async def _release_after(chunks: AsyncIterator[bytes], semaphore: asyncio.Semaphore, on_close=None) -> AsyncIterator[bytes]:
+    """스트리밍이 끝나거나 클라이언트가 끊기면 슬롯 반환"""
+    try:
+        async for chunk in chunks:
+            yield chunk
+    finally:
+        if on_close is not None:
+            await on_close()
+        semaphore.release()
+
+
+def _attachment_headers(filename: Optional[str], cache_control: Optional[str]) -> Dict[str, str]:
+    headers = {}
+    if filename:
+        if filename.isascii():
+            headers["Content-Disposition"] = f"attachment; filename={filename}"
+        else:
+            # 한글 등 비ASCII 파일명은 RFC 5987 형식으로 인코딩
+            headers["Content-Disposition"] = f"attachment; filename*=UTF-8''{quote(filename)}"
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    return headers
+
+
+def parse_own_s3_key(url: str, bucket_name: Optional[str], region: Optional[str]) -> Optional[str]:
+    """자체 버킷 S3 URL(virtual-hosted/path 스타일, presigned 포함)이면 객체 키 반환"""
+    if not bucket_name:
+        return None
+
+    parsed = urlparse(url)
+    host = (parsed.hostname or "").lower()
+    path = unquote(parsed.path.lstrip("/"))
+
+    virtual_hosts = {f"{bucket_name}.s3.amazonaws.com".lower()}
+    path_hosts = {"s3.amazonaws.com"}
+    if region:
+        virtual_hosts.add(f"{bucket_name}.s3.{region}.amazonaws.com".lower())
+        path_hosts.add(f"s3.{region}.amazonaws.com")
+
+    if host in virtual_hosts and path:
+        return path
+    if host in path_hosts and path.startswith(f"{bucket_name}/"):
+        return path[len(bucket_name) + 1:] or None
+    return None
+
+
+def own_s3_urls(key: str, bucket_name: str, region: Optional[str]) -> Set[str]:
+    """자체 버킷 객체 키로 만들 수 있는 S3 URL 형식들 (DB에 저장된 URL 비교용)"""
+    hosts = [f"https://{bucket_name}.s3.amazonaws.com/"]
+    if region:
+        hosts.append(f"https://{bucket_name}.s3.{region}.amazonaws.com/")
+        hosts.append(f"https://s3.{region}.amazonaws.com/{bucket_name}/")
+    hosts.append(f"https://s3.amazonaws.com/{bucket_name}/")
+    return {host + k for host in hosts for k in (key, quote(key, safe="/~"))}
+
+
+def _sigv4_signing_key(secret_key: str, date: str, region: str, service: str) -> bytes:
+    key = f"AWS4{secret_key}".encode("utf-8")
+    for part in (date, region, service, "aws4_request"):
+        key = hmac.new(key, part.encode("utf-8"), hashlib.sha256).digest()
+    return key
+
+
+def verify_presigned_s3_url(
+    url: str,
+    bucket_name: Optional[str],
+    access_key: Optional[str],
+    secret_key: Optional[str],
+    now: Optional[datetime] = None,
+) -> bool:
+    """자체 자격 증명으로 서명된 만료 전 GET presigned URL인지 확인
+
+    boto3가 만드는 SigV2(Signature/Expires)와 SigV4(X-Amz-*) 쿼리 서명을 지원하며,
+    host 외 헤더를 서명한 URL 등 검증할 수 없는 형식은 False
+    """
+    if not (bucket_name and access_key and secret_key):
+        return False
+
+    parsed = urlparse(url)
+    params = dict(parse_qsl(parsed.query, keep_blank_values=True))
+    now = now or datetime.now(timezone.utc)
+    host = parsed.netloc
+    path = parsed.path or "/"
+
+    if "X-Amz-Signature" in params:
+        try:
+            credential = params["X-Amz-Credential"].split("/")
+            amz_date = params["X-Amz-Date"]
+            signed_at = datetime.strptime(amz_date, "%Y%m%dT%H%M%SZ").replace(tzinfo=timezone.utc)
+            expires = int(params["X-Amz-Expires"])
+        except (KeyError, ValueError):
+            return False
+        if (
+            len(credential) != 5
+            or credential[0] != access_key
+            or credential[3] != "s3"
+            or params.get("X-Amz-Algorithm") != "AWS4-HMAC-SHA256"
+            or params.get("X-Amz-SignedHeaders") != "host"
+            or (now - signed_at).total_seconds() > expires
+        ):
+            return False
+
+        canonical_query = "&".join(
+            f"{quote(k, safe='-_.~')}={quote(v, safe='-_.~')}"
+            for k, v in sorted(params.items())
+            if k != "X-Amz-Signature"
+        )
+        canonical_request = "\n".join([
+            "GET", path, canonical_query, f"host:{host}", "", "host", "UNSIGNED-PAYLOAD",
+        ])
+        scope = "/".join(credential[1:])
+        string_to_sign = "\n".join([
+            "AWS4-HMAC-SHA256", amz_date, scope,
+            hashlib.sha256(canonical_request.encode("utf-8")).hexdigest(),
+        ])
+        signing_key = _sigv4_signing_key(secret_key, credential[1], credential[2], credential[3])
+        expected = hmac.new(signing_key, string_to_sign.encode("utf-8"), hashlib.sha256).hexdigest()
+        return hmac.compare_digest(expected, params["X-Amz-Signature"])
+
+    if "Signature" in params:
+        try:
+            expires_at = int(params["Expires"])
+        except (KeyError, ValueError):
+            return False
+        if params.get("AWSAccessKeyId") != access_key or now.timestamp() > expires_at:
+            return False
+
+        # virtual-hosted 스타일도 /bucket/key 리소스로 서명됨
+        virtual_hosted = (parsed.hostname or "").lower().startswith(f"{bucket_name.lower()}.")
+        resource = f"/{bucket_name}{path}" if virtual_hosted else path
+        string_to_sign = f"GET\n\n\n{expires_at}\n{resource}"
+        expected = base64.b64encode(
+            hmac.new(secret_key.encode("utf-8"), string_to_sign.encode("utf-8"), hashlib.sha1).digest()
+        ).decode("ascii")
+        return hmac.compare_digest(expected, params["Signature"])
+
+    return False
+
+
+async def stream_s3_object(
+    storage,
+    key: str,
+    request: Request,
+    filename: Optional[str] = None,
+    cache_control: Optional[str] = None,
+    media_type: Optional[str] = None,
+) -> Response:
+    """자체 버킷 객체를 get_object Body에서 직접 스트리밍"""
+    semaphore = await _acquire_slot()
+    try:
+        if_modified_since = request.headers.get("if-modified-since")
+        try:
+            if_modified_since = parsedate_to_datetime(if_modified_since) if if_modified_since else None
+        except (TypeError, ValueError):
+            if_modified_since = None
+
+        try:
+            meta, chunks = await storage.open_object(
+                key,
+                byte_range=request.headers.get("range"),
+                chunk_size=settings.PROXY_DOWNLOAD_CHUNK_SIZE,
+                if_none_match=request.headers.get("if-none-match"),
+                if_modified_since=if_modified_since,
+            )
+        except ClientError as e:
+            error = e.response.get("Error", {})
+            code = str(error.get("Code"))
+            status = e.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+            headers = e.response.get("ResponseMetadata", {}).get("HTTPHeaders", {})
+            if code in ("304", "NotModified") or status == 304:
+                semaphore.release()
+                return Response(status_code=304, headers={
+                    k: v for k, v in headers.items() if k.lower() in ("etag", "last-modified")
+                })
+            if code == "InvalidRange" or status == 416:
+                semaphore.release()
+                raise HTTPException(status_code=416, detail="요청한 범위를 제공할 수 없습니다")
+            if code in ("NoSuchKey", "404") or status == 404:
+                semaphore.release()
+                raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다")
+            raise
+
+        headers = _attachment_headers(filename, cache_control)
+        headers["Accept-Ranges"] = "bytes"
+        if meta.get("ContentLength") is not None:
+            headers["Content-Length"] = str(meta["ContentLength"])
+        if meta.get("ContentRange"):
+            headers["Content-Range"] = meta["ContentRange"]
+        if meta.get("ETag"):
+            headers["ETag"] = meta["ETag"]
+        if meta.get("LastModified"):
+            headers["Last-Modified"] = meta["LastModified"].strftime("%a, %d %b %Y %H:%M:%S GMT")
+
+        return StreamingResponse(
+            _release_after(chunks, semaphore),
+            status_code=206 if meta.get("ContentRange") else 200,
+            media_type=media_type or meta.get("ContentType") or "application/octet-stream",
+            headers=headers,
+        )
+    except HTTPException:
+        raise
+    except BaseException:
+        semaphore.release()
+        raise
+
+
+async def stream_url(
+    url: str,
+    request: Request,
+    filename: Optional[str] = None,
+    cache_control: Optional[str] = None,
+    default_media_type: str = "application/octet-stream",
+    upstream: str = "s3",
+) -> Response:
+    """원격 URL을 공유 커넥션 풀로 스트리밍 (받은 청크를 바로 전달)"""
+    semaphore = await _acquire_slot()
+    response: Optional[httpx.Response] = None
+    try:
+        forward_headers = {
+            name: request.headers[name] for name in FORWARD_REQUEST_HEADERS if name in request.headers
+        }
+        client = get_http_client(upstream)
+        upstream_request = client.build_request("GET", url, headers=forward_headers)
+        response = await client.send(upstream_request, stream=True, follow_redirects=True)
+
+        if response.status_code == 304:
+            headers = {k: v for k, v in response.headers.items() if k.lower() in ("etag", "last-modified")}
+            await response.aclose()
+            semaphore.release()
+            return Response(status_code=304, headers=headers)
+
+        if response.status_code not in (200, 206):
+            status_code = response.status_code
+            await response.aclose()
+            semaphore.release()
+            raise HTTPException(status_code=status_code, detail="파일 다운로드 실패")
+
+        headers = _attachment_headers(filename, cache_control)
+        for name in FORWARD_RESPONSE_HEADERS:
+            if name in response.headers:
+                headers[name] = response.headers[name]
+
+        return StreamingResponse(
+            # 원본 바이트를 디코딩 없이 그대로 전달 (content-encoding/length 유지)
+            _release_after(
+                response.aiter_raw(settings.PROXY_DOWNLOAD_CHUNK_SIZE),
+                semaphore,
+                on_close=response.aclose,
+            ),
+            status_code=response.status_code,
+            media_type=response.headers.get("content-type", default_media_type),
+            headers=headers,
+        )
+    except HTTPException:
+        raise
+    except BaseException:
+        if response is not None:
+            await response.aclose()
+        semaphore.release()
+        raise
@@ -3,7 +3,9 @@
 S3에서 QA 데이터를 가져와 EXAONE 모델 파인튜닝 수행
 """
 
+import io
 import os
+import asyncio
 import json
 import logging
 import tempfile
@@ -15,6 +17,8 @@ from dataclasses import dataclass
 from enum import Enum
 
 from app.services.s3_service import get_s3_service
+from app.services.object_storage import get_transfer_config, run_in_s3_executor
+from app.services.qa_result_pipeline import QAPipelineStats, iter_processed_qa_json
 from app.services.runpod_finetuning_client import RunPodFineTuningClient
 from app.core.encryption import decrypt_sensitive_data
 from app.services.hf_token_resolver import get_token_for_influencer
@@ -117,9 +121,11 @@ class InfluencerFineTuningService:
             logger.error(f"허깅페이스 정보 가져오기 실패: {e}", exc_info=True)
             raise
 
-    def download_qa_data_from_s3(self, s3_url: str) -> Optional[List[Dict]]:
+    async def download_qa_data_from_s3(self, s3_url: str) -> Optional[List[Dict]]:
         """
         S3에서 QA 데이터 다운로드
+        S3 객체는 임시 파일로 (멀티파트) 다운로드하고, 파싱은 스레드에서 청크/줄 단위로 처리하여
+        이벤트 루프를 막지 않고 파일 전체를 메모리에 올리지 않음
         Args:
             s3_url: S3 QA 데이터 URL
         Returns:
@@ -141,37 +147,81 @@ class InfluencerFineTuningService:
                 logger.error("S3 서비스를 사용할 수 없습니다")
                 return None
 
-            response = self.s3_service.s3_client.get_object(
-                Bucket=self.s3_service.bucket_name, Key=s3_key
-            )
+            stats = QAPipelineStats()
+            with tempfile.TemporaryFile() as raw_file:
+                started = time.perf_counter()
+                await run_in_s3_executor(
+                    self.s3_service.s3_client.download_fileobj,
+                    self.s3_service.bucket_name,
+                    s3_key,
+                    raw_file,
+                    Config=get_transfer_config(),
+                )
+                download_stage = stats.stage("download")
+                download_stage.items += 1
+                download_stage.bytes += raw_file.tell()
+                download_stage.seconds += time.perf_counter() - started
+
+                qa_pairs = await asyncio.to_thread(
+                    self._parse_qa_file, raw_file, s3_key, s3_url, stats
+                )
+            stats.log_summary(s3_key)
+            return qa_pairs
+
+        except Exception as e:
+            logger.error(f"S3에서 QA 데이터 다운로드 실패: {e}", exc_info=True)
+
+            # 처리된 QA 파일이 없는 경우 원본 파일 시도
+            if "NoSuchKey" in str(e) and "processed_qa" in s3_url:
+                logger.warning("처리된 QA 파일이 없습니다. 원본 파일로 시도합니다.")
+
+                # URL을 원본 파일로 변경
+                raw_url = s3_url.replace("qa_pairs/", "qa_results/").replace(
+                    f'processed_qa_{s3_url.split("_")[-1].replace(".json", "")}.json',
+                    "generated_qa_results.jsonl",
+                )
+
+                logger.info(f"원본 파일 URL로 재시도: {raw_url}")
+
+                # 재귀 호출로 원본 파일 다운로드 시도
+                return await self.download_qa_data_from_s3(raw_url)
+
+            return None
 
-            content = response["Body"].read().decode("utf-8")
+    def _parse_qa_file(
+        self, raw_file, s3_key: str, s3_url: str, stats: QAPipelineStats
+    ) -> Optional[List[Dict]]:
+        """다운로드한 QA 파일 파싱 (처리된 QA JSON은 청크 단위, 그 외는 JSONL 줄 단위)"""
+        raw_file.seek(0)
+        content = io.TextIOWrapper(raw_file, encoding="utf-8")
+        try:
             qa_pairs = []
 
-            # 먼저 전체 내용을 하나의 JSON으로 파싱 시도 (처리된 QA 형식)
+            # 먼저 처리된 QA 형식({..., "qa_pairs": [...]})으로 파싱 시도 (JSONL 파일은 건너뜀)
             try:
-                data = json.loads(content)
-                if isinstance(data, dict) and "qa_pairs" in data:
-                    qa_pairs = data["qa_pairs"]
+                pairs = None if s3_key.endswith(".jsonl") else iter_processed_qa_json(content, stats)
+                if pairs is not None:
+                    qa_pairs = list(pairs)
                     logger.info(
                         f"S3에서 처리된 QA 데이터 로드 완료: {len(qa_pairs)}개 QA 쌍"
                     )
 
                     # 비어있는 qa_pairs 체크
                     if not qa_pairs:
-                        logger.warning(
-                            f"QA 데이터가 비어있음. 전체 데이터 구조: {list(data.keys())}"
-                        )
-                        logger.warning(f"S3 키: {s3_key}")
+                        logger.warning(f"QA 데이터가 비어있음. S3 키: {s3_key}")
                         # JSONL 형식으로 재시도
                         logger.info("qa_pairs가 비어있어 JSONL 형식으로 재시도")
                     else:
                         return qa_pairs
             except json.JSONDecodeError:
-                logger.info("전체 JSON 파싱 실패, JSONL 형식으로 재시도")
+                logger.info("처리된 QA 형식 파싱 실패, JSONL 형식으로 재시도")
+                qa_pairs = []
 
             # JSONL 형식으로 파싱 (각 줄이 별도의 JSON)
-            for line in content.splitlines():
+            content.seek(0)
+            line_count = 0
+            for line in content:
+                line_count += 1
                 if not line.strip():  # 빈 줄 건너뛰기
                     continue
 
@@ -367,37 +417,21 @@ class InfluencerFineTuningService:
 
             if not qa_pairs:
                 logger.error(
-                    f"S3에서 유효한 QA 데이터를 추출하지 못했습니다. 총 라인 수: {len(content.splitlines())}"
+                    f"S3에서 유효한 QA 데이터를 추출하지 못했습니다. 총 라인 수: {line_count}"
                 )
                 logger.error(f"S3 URL: {s3_url}")
                 logger.error(f"S3 Key: {s3_key}")
 
                 # 컨텐츠 샘플 출력 (처음 500자)
-                logger.error(f"컨텐츠 샘플 (500자): {content[:500]}...")
+                content.seek(0)
+                logger.error(f"컨텐츠 샘플 (500자): {content.read(500)}...")
                 return None
 
             logger.info(f"S3에서 QA 데이터 다운로드 및 파싱 완료: {len(qa_pairs)}개")
             return qa_pairs
-
-        except Exception as e:
-            logger.error(f"S3에서 QA 데이터 다운로드 실패: {e}", exc_info=True)
-
-            # 처리된 QA 파일이 없는 경우 원본 파일 시도
-            if "NoSuchKey" in str(e) and "processed_qa" in s3_url:
-                logger.warning("처리된 QA 파일이 없습니다. 원본 파일로 시도합니다.")
-
-                # URL을 원본 파일로 변경
-                raw_url = s3_url.replace("qa_pairs/", "qa_results/").replace(
-                    f'processed_qa_{s3_url.split("_")[-1].replace(".json", "")}.json',
-                    "generated_qa_results.jsonl",
-                )
-
-                logger.info(f"원본 파일 URL로 재시도: {raw_url}")
-
-                # 재귀 호출로 원본 파일 다운로드 시도
-                return self.download_qa_data_from_s3(raw_url)
-
-            return None
+        finally:
+            # TextIOWrapper가 닫히면서 임시 파일을 닫지 않도록 분리
+            content.detach()
 
     async def prepare_finetuning_data(
         self, qa_data: List[Dict], influencer_data: AIInfluencer, system_prompt: Optional[str] = None
@@ -624,7 +658,7 @@ class InfluencerFineTuningService:
             task.updated_at = get_current_kst()
 
             # S3에서 QA 데이터 다운로드
-            qa_data = self.download_qa_data_from_s3(task.s3_qa_url)
+            qa_data = await self.download_qa_data_from_s3(task.s3_qa_url)
             if not qa_data:
                 raise Exception("S3에서 QA 데이터 다운로드 실패")
 
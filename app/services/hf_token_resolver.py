@@ -1,27 +1,93 @@
 """
 HuggingFace 토큰 리졸버 서비스
 인플루언서의 HF 토큰을 일관되게 조회하는 중앙화된 서비스
+- 인플루언서/그룹 → 복호화된 토큰을 하나의 크기 제한 TTL 캐시로 관리
+- 토큰 생성/수정/삭제/팀 할당 변경 시 관련 항목 무효화
 """
 
+import time
 import logging
-from typing import Optional, Dict, Tuple
-from datetime import datetime, timedelta
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional, Dict, Tuple
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.models.influencer import AIInfluencer
 from app.models.user import HFTokenManage
 from app.core.encryption import decrypt_sensitive_data
 
 logger = logging.getLogger(__name__)
 
+# ("influencer", influencer_id) 또는 ("group", group_id, prefer_default)
+CacheKey = Tuple[Any, ...]
+
+
+@dataclass(frozen=True)
+class _CachedToken:
+    token: str
+    hf_username: Optional[str]
+    hf_manage_id: str
+    # 토큰 조회에 사용된 그룹 (그룹 단위 무효화용)
+    group_id: Optional[int]
+    expires_at: float
+
 
 class HFTokenResolver:
     """HuggingFace 토큰 리졸버 - 인플루언서의 토큰을 일관되게 조회"""
     
-    def __init__(self):
-        # 캐시: {influencer_id: (token, hf_username, expiry_time)}
-        self._cache: Dict[str, Tuple[str, str, datetime]] = {}
-        self._cache_ttl = timedelta(minutes=30)  # 30분 캐시
+    def __init__(self, max_entries: Optional[int] = None, ttl: Optional[int] = None):
+        self.max_entries = max_entries or settings.HF_TOKEN_CACHE_SIZE
+        self.ttl = ttl or settings.HF_TOKEN_CACHE_TTL
+        self._cache: "OrderedDict[CacheKey, _CachedToken]" = OrderedDict()
+        self._lock = threading.Lock()
+        
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+    
+    def _get_cached(self, key: CacheKey) -> Optional[_CachedToken]:
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            if time.monotonic() >= entry.expires_at:
+                del self._cache[key]
+                self._misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self._hits += 1
+            return entry
+    
+    def _put(self, key: CacheKey, token: str, token_record: HFTokenManage, group_id: Optional[int]):
+        entry = _CachedToken(
+            token=token,
+            hf_username=token_record.hf_user_name,
+            hf_manage_id=str(token_record.hf_manage_id),
+            group_id=group_id,
+            expires_at=time.monotonic() + self.ttl,
+        )
+        with self._lock:
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+                self._evictions += 1
+    
+    @staticmethod
+    def _decrypt(token_record: HFTokenManage) -> Optional[str]:
+        try:
+            decrypted_token = decrypt_sensitive_data(token_record.hf_token_value)
+        except Exception as e:
+            logger.error(f"❌ 토큰 복호화 중 오류: {token_record.hf_token_nickname} - {str(e)}")
+            return None
+        if not decrypted_token:
+            logger.error(f"❌ 토큰 복호화 실패: {token_record.hf_token_nickname}")
+            return None
+        return decrypted_token
     
     def get_token_for_influencer(
         self, 
@@ -41,16 +107,14 @@ class HFTokenResolver:
             (decrypted_token, hf_username) 튜플, 없으면 (None, None)
         """
         influencer_id = str(influencer.influencer_id)
+        key = ("influencer", influencer_id)
         
         # 캐시 확인
-        if use_cache and influencer_id in self._cache:
-            token, username, expiry = self._cache[influencer_id]
-            if datetime.now() < expiry:
+        if use_cache:
+            cached = self._get_cached(key)
+            if cached is not None:
                 logger.debug(f"🎯 캐시에서 토큰 반환: {influencer.influencer_name}")
-                return token, username
-            else:
-                # 만료된 캐시 제거
-                del self._cache[influencer_id]
+                return cached.token, cached.hf_username
         
         # 토큰 조회 시작
         logger.info(f"🔍 {influencer.influencer_name}의 HF 토큰 조회 시작...")
@@ -97,33 +161,20 @@ class HFTokenResolver:
             return None, None
         
         # 토큰 복호화
-        try:
-            decrypted_token = decrypt_sensitive_data(token_record.hf_token_value)
-            if not decrypted_token:
-                logger.error(f"❌ 토큰 복호화 실패: {token_record.hf_token_nickname}")
-                return None, None
-            
-            # 캐시에 저장
-            if use_cache:
-                expiry = datetime.now() + self._cache_ttl
-                self._cache[influencer_id] = (
-                    decrypted_token, 
-                    token_record.hf_user_name,
-                    expiry
-                )
-            
-            logger.info(
-                f"✅ 토큰 조회 성공: {influencer.influencer_name} → "
-                f"{token_record.hf_token_nickname} ({token_record.hf_user_name})"
-            )
-            
-            return decrypted_token, token_record.hf_user_name
-            
-        except Exception as e:
-            logger.error(
-                f"❌ 토큰 복호화 중 오류: {token_record.hf_token_nickname} - {str(e)}"
-            )
+        decrypted_token = self._decrypt(token_record)
+        if not decrypted_token:
             return None, None
+        
+        # 캐시에 저장
+        if use_cache:
+            self._put(key, decrypted_token, token_record, influencer.group_id)
+        
+        logger.info(
+            f"✅ 토큰 조회 성공: {influencer.influencer_name} → "
+            f"{token_record.hf_token_nickname} ({token_record.hf_user_name})"
+        )
+        
+        return decrypted_token, token_record.hf_user_name
     
     def get_token_by_group(
         self, 
@@ -142,6 +193,11 @@ class HFTokenResolver:
         Returns:
             (decrypted_token, hf_username) 튜플
         """
+        key = ("group", group_id, prefer_default)
+        cached = self._get_cached(key)
+        if cached is not None:
+            return cached.token, cached.hf_username
+        
         logger.info(f"🔍 그룹 {group_id}의 HF 토큰 조회...")
         
         token_record = None
@@ -164,17 +220,12 @@ class HFTokenResolver:
             return None, None
         
         # 토큰 복호화
-        try:
-            decrypted_token = decrypt_sensitive_data(token_record.hf_token_value)
-            if not decrypted_token:
-                logger.error(f"❌ 토큰 복호화 실패: {token_record.hf_token_nickname}")
-                return None, None
-            
-            return decrypted_token, token_record.hf_user_name
-            
-        except Exception as e:
-            logger.error(f"❌ 토큰 복호화 중 오류: {str(e)}")
+        decrypted_token = self._decrypt(token_record)
+        if not decrypted_token:
             return None, None
+        
+        self._put(key, decrypted_token, token_record, group_id)
+        return decrypted_token, token_record.hf_user_name
     
     def clear_cache(self, influencer_id: Optional[str] = None):
         """
@@ -183,25 +234,49 @@ class HFTokenResolver:
         Args:
             influencer_id: 특정 인플루언서의 캐시만 삭제, None이면 전체 삭제
         """
-        if influencer_id:
-            if influencer_id in self._cache:
-                del self._cache[influencer_id]
-                logger.debug(f"🗑️ 캐시 삭제: influencer_id={influencer_id}")
-        else:
-            self._cache.clear()
-            logger.debug("🗑️ 전체 캐시 초기화")
+        with self._lock:
+            if influencer_id:
+                if self._cache.pop(("influencer", str(influencer_id)), None) is not None:
+                    self._invalidations += 1
+                    logger.debug(f"🗑️ 캐시 삭제: influencer_id={influencer_id}")
+            else:
+                self._cache.clear()
+                logger.debug("🗑️ 전체 캐시 초기화")
+    
+    def invalidate_token(self, hf_manage_id: Optional[str] = None, group_ids: Iterable[Optional[int]] = ()):
+        """
+        토큰 변경 시 관련 캐시 항목 제거
+        
+        Args:
+            hf_manage_id: 수정/삭제된 토큰 ID (이 토큰으로 해석된 항목 제거)
+            group_ids: 토큰 구성이 바뀐 그룹 (해당 그룹으로 해석된 항목 제거)
+        """
+        groups = {group_id for group_id in group_ids if group_id is not None}
+        with self._lock:
+            stale = [
+                key for key, entry in self._cache.items()
+                if (hf_manage_id and entry.hf_manage_id == str(hf_manage_id)) or entry.group_id in groups
+            ]
+            for key in stale:
+                del self._cache[key]
+            self._invalidations += len(stale)
+        if stale:
+            logger.debug(f"🗑️ HF 토큰 캐시 무효화: {len(stale)}개 (token={hf_manage_id}, groups={sorted(groups)})")
     
     def get_cache_stats(self) -> Dict:
         """캐시 통계 반환"""
-        now = datetime.now()
-        active_entries = sum(1 for _, _, expiry in self._cache.values() if expiry > now)
-        
-        return {
-            "total_entries": len(self._cache),
-            "active_entries": active_entries,
-            "expired_entries": len(self._cache) - active_entries,
-            "cache_ttl_minutes": self._cache_ttl.total_seconds() / 60
-        }
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "total_entries": len(self._cache),
+                "max_entries": self.max_entries,
+                "cache_ttl_minutes": self.ttl / 60,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / lookups, 3) if lookups else 0.0,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+            }
 
 
 # 전역 인스턴스
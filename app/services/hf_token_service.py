@@ -19,6 +19,7 @@ from app.schemas.hf_token import (
 )
 from app.core.encryption import encrypt_sensitive_data, decrypt_sensitive_data
 from app.core.security import get_current_user
+from app.services.hf_token_resolver import get_hf_token_resolver
 
 logger = logging.getLogger(__name__)
 
@@ -92,6 +93,9 @@ class HFTokenService:
             db.commit()
             db.refresh(hf_token)
             
+            # 그룹 토큰 구성이 바뀌었으므로 캐시된 그룹 토큰 무효화
+            get_hf_token_resolver().invalidate_token(group_ids=[hf_token.group_id])
+            
             logger.info(f"허깅페이스 토큰 생성 완료: {hf_token.hf_manage_id} (그룹: {token_data.group_id})")
             return hf_token
             
@@ -215,12 +219,17 @@ class HFTokenService:
                     raise Exception("같은 그룹 내에 이미 동일한 별칭의 토큰이 존재합니다")
             
             # 데이터 업데이트
+            previous_group_id = token.group_id
             for field, value in update_data.items():
                 setattr(token, field, value)
             
             db.commit()
             db.refresh(token)
             
+            get_hf_token_resolver().invalidate_token(
+                hf_manage_id, group_ids=[previous_group_id, token.group_id]
+            )
+            
             logger.info(f"허깅페이스 토큰 수정 완료: {hf_manage_id}")
             return token
             
@@ -260,9 +269,12 @@ class HFTokenService:
             if using_influencers > 0:
                 raise Exception(f"해당 토큰을 사용하는 인플루언서가 {using_influencers}개 존재합니다. 먼저 인플루언서의 토큰 연결을 해제해주세요.")
             
+            group_id = token.group_id
             db.delete(token)
             db.commit()
             
+            get_hf_token_resolver().invalidate_token(hf_manage_id, group_ids=[group_id])
+            
             logger.info(f"허깅페이스 토큰 삭제 완료: {hf_manage_id}")
             return True
             
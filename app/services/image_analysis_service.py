@@ -6,8 +6,8 @@ OpenAI Vision API를 사용하여 이미지의 인물을 분석하고 적절한
 import logging
 import base64
 from typing import Dict, Any, Optional
-import httpx
 from app.core.config import settings
+from app.core.http_clients import pooled_client
 
 logger = logging.getLogger(__name__)
 
@@ -48,7 +48,7 @@ class ImageAnalysisService:
             base64_image = base64.b64encode(image_data).decode('utf-8')
             
             # OpenAI API 호출
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("openai") as client:
                 response = await client.post(
                     "https://api.openai.com/v1/chat/completions",
                     headers={
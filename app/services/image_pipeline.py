@@ -0,0 +1,242 @@
+"""
+이미지 파생본 파이프라인
+같은 바이트를 검증/크기 확인 때마다 다시 여는 대신 한 번만 디코딩하여
+- 메타데이터(크기, 포맷, EXIF 방향)를 추출하고
+- 목록 화면용 썸네일 / 중간 크기 WebP 파생본을 생성
+원본 옆에 정해진 규칙의 S3 키로 저장 (예: a/b/c.png → a/b/c.thumb.webp, a/b/c.medium.webp)
+디코딩/리사이즈는 CPU 작업이므로 프로세스 풀에서 실행 (IMAGE_PIPELINE_WORKERS=0이면 스레드)
+"""
+
+import io
+import time
+import asyncio
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 파생본 이름 (크기는 IMAGE_THUMBNAIL_SIZE / IMAGE_MEDIUM_SIZE)
+THUMBNAIL = "thumb"
+MEDIUM = "medium"
+
+# EXIF Orientation 태그
+EXIF_ORIENTATION = 0x0112
+
+
+class ImageProcessingError(ValueError):
+    """이미지로 읽을 수 없는 데이터"""
+
+
+@dataclass
+class ImageMetadata:
+    """이미지 메타데이터 (크기는 EXIF 방향을 적용한 표시 기준)"""
+
+    width: int
+    height: int
+    format: Optional[str]
+    orientation: int = 1
+
+
+@dataclass
+class ProcessedImage:
+    """메타데이터와 WebP 파생본"""
+
+    metadata: ImageMetadata
+    variants: Dict[str, bytes] = field(default_factory=dict)
+    cpu_seconds: float = 0.0
+
+
+def variant_sizes() -> Dict[str, int]:
+    return {THUMBNAIL: settings.IMAGE_THUMBNAIL_SIZE, MEDIUM: settings.IMAGE_MEDIUM_SIZE}
+
+
+def derivative_key(s3_key: str, variant: str) -> str:
+    """원본 키에서 파생본 키 계산 (같은 경로, 확장자만 교체)"""
+    head, _, name = s3_key.rpartition("/")
+    stem = name.rsplit(".", 1)[0] if "." in name else name
+    return f"{head}/{stem}.{variant}.webp" if head else f"{stem}.{variant}.webp"
+
+
+def _open(data: bytes):
+    from PIL import Image, UnidentifiedImageError
+
+    try:
+        img = Image.open(io.BytesIO(data))
+    except Image.DecompressionBombError as e:
+        # 픽셀 수가 제한의 2배를 넘으면 PIL이 여는 단계에서 거부
+        raise ImageProcessingError(f"이미지 해상도가 너무 큽니다: {e}") from e
+    except (UnidentifiedImageError, OSError) as e:
+        raise ImageProcessingError(f"이미지로 읽을 수 없습니다: {e}") from e
+
+    # 제한~2배 구간은 PIL이 경고만 하므로 디코딩 전에 직접 거부 (압축 폭탄으로 워커 메모리 고갈 방지)
+    if Image.MAX_IMAGE_PIXELS and img.width * img.height > Image.MAX_IMAGE_PIXELS:
+        raise ImageProcessingError(
+            f"이미지 해상도가 너무 큽니다: {img.width}x{img.height} (최대 {Image.MAX_IMAGE_PIXELS} 픽셀)"
+        )
+    return img
+
+
+def _metadata(img) -> ImageMetadata:
+    try:
+        orientation = int(img.getexif().get(EXIF_ORIENTATION, 1))
+    except Exception:
+        orientation = 1
+    width, height = img.size
+    # 5~8은 90도 회전 (가로/세로가 바뀌어 표시됨)
+    if orientation in (5, 6, 7, 8):
+        width, height = height, width
+    return ImageMetadata(width=width, height=height, format=img.format, orientation=orientation)
+
+
+def inspect_image(data: bytes) -> ImageMetadata:
+    """헤더만 읽어 메타데이터 확인 및 손상 여부 검증 (픽셀 디코딩 없음)"""
+    img = _open(data)
+    metadata = _metadata(img)
+    try:
+        img.verify()
+    except Exception as e:
+        raise ImageProcessingError(f"손상된 이미지입니다: {e}") from e
+    return metadata
+
+
+def process_image(data: bytes, sizes: Tuple[Tuple[str, int], ...], quality: int) -> ProcessedImage:
+    """한 번 디코딩하여 메타데이터와 파생본 생성 (프로세스 풀 워커에서 실행)"""
+    from PIL import Image, ImageOps
+
+    started = time.process_time()
+    img = _open(data)
+    metadata = _metadata(img)
+    try:
+        # 잘린 파일 등 픽셀 디코딩 오류도 여기서 ImageProcessingError로 변환
+        img.load()
+        img = ImageOps.exif_transpose(img)
+        if img.mode not in ("RGB", "RGBA"):
+            img = img.convert("RGBA" if "A" in img.getbands() or "transparency" in img.info else "RGB")
+    except Exception as e:
+        raise ImageProcessingError(f"이미지 디코딩 실패: {e}") from e
+
+    variants = {}
+    # 큰 파생본부터 만들고 작은 파생본은 직전 결과에서 축소 (원본 재샘플링 비용 절감)
+    current = img
+    for name, max_edge in sorted(sizes, key=lambda item: item[1], reverse=True):
+        if max(current.size) > max_edge:
+            current = current.copy()
+            current.thumbnail((max_edge, max_edge), Image.LANCZOS)
+        buffer = io.BytesIO()
+        current.save(buffer, format="WEBP", quality=quality, method=4)
+        variants[name] = buffer.getvalue()
+
+    return ProcessedImage(metadata=metadata, variants=variants, cpu_seconds=time.process_time() - started)
+
+
+class ImagePipeline:
+    """이미지 메타데이터/파생본 생성 및 S3 저장"""
+
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = settings.IMAGE_PIPELINE_WORKERS if workers is None else workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+        # 지표
+        self._processed = 0
+        self._failures = 0
+        self._cpu_seconds = 0.0
+        self._bytes_in = 0
+        self._bytes_out = 0
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        if self.workers <= 0:
+            return None
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    async def inspect(self, data: bytes) -> ImageMetadata:
+        """업로드 검증용 메타데이터 확인 (헤더만 읽으므로 스레드에서 실행)"""
+        return await asyncio.to_thread(inspect_image, data)
+
+    async def process(self, data: bytes) -> ProcessedImage:
+        """메타데이터와 WebP 파생본 생성"""
+        sizes = tuple(variant_sizes().items())
+        quality = settings.IMAGE_WEBP_QUALITY
+        executor = self._get_executor()
+        if executor is None:
+            result = await asyncio.to_thread(process_image, data, sizes, quality)
+        else:
+            loop = asyncio.get_running_loop()
+            try:
+                result = await loop.run_in_executor(executor, process_image, data, sizes, quality)
+            except BrokenProcessPool:
+                # 워커가 비정상 종료되면 풀을 새로 만들고 한 번 더 시도
+                logger.warning("⚠️ 이미지 처리 프로세스 풀 재생성")
+                self._executor = None
+                result = await loop.run_in_executor(self._get_executor(), process_image, data, sizes, quality)
+
+        self._processed += 1
+        self._cpu_seconds += result.cpu_seconds
+        self._bytes_in += len(data)
+        self._bytes_out += sum(len(variant) for variant in result.variants.values())
+        return result
+
+    async def process_and_store(self, data: bytes, s3_key: str) -> Optional[ProcessedImage]:
+        """파생본 생성 후 원본 옆에 업로드 (실패해도 원본 사용에는 영향 없음)"""
+        from app.services.s3_service import get_s3_service
+
+        s3_service = get_s3_service()
+        if not s3_service.is_available():
+            return None
+        try:
+            result = await self.process(data)
+            storage = s3_service.storage
+            await asyncio.gather(*(
+                storage.put_object(derivative_key(s3_key, name), variant, "image/webp")
+                for name, variant in result.variants.items()
+            ))
+            logger.info(
+                f"🖼️ 이미지 파생본 저장: {s3_key} ({result.metadata.width}x{result.metadata.height}, "
+                + ", ".join(f"{name} {len(variant) // 1024}KB" for name, variant in result.variants.items())
+                + f", CPU {result.cpu_seconds * 1000:.0f}ms)"
+            )
+            return result
+        except Exception as e:
+            self._failures += 1
+            logger.warning(f"⚠️ 이미지 파생본 생성 실패 ({s3_key}): {e}")
+            return None
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """파이프라인 지표"""
+        return {
+            "workers": self.workers,
+            "processed": self._processed,
+            "failures": self._failures,
+            "avg_cpu_ms": round(self._cpu_seconds / self._processed * 1000, 1) if self._processed else None,
+            "bytes_in": self._bytes_in,
+            "bytes_out": self._bytes_out,
+        }
+
+
+# 싱글톤 인스턴스
+_image_pipeline: Optional[ImagePipeline] = None
+
+
+def get_image_pipeline() -> ImagePipeline:
+    """이미지 파이프라인 싱글톤 인스턴스 반환"""
+    global _image_pipeline
+    if _image_pipeline is None:
+        _image_pipeline = ImagePipeline()
+    return _image_pipeline
+
+
+def stop_image_pipeline():
+    """애플리케이션 종료시 호출 (프로세스 풀 종료)"""
+    if _image_pipeline is not None:
+        _image_pipeline.shutdown()
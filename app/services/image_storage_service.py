@@ -11,10 +11,11 @@ s3_url과 group_id만 사용하는 간소화된 구조
 
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete, and_
+from sqlalchemy import select, delete, update, and_
 from sqlalchemy.orm import selectinload
+import asyncio
 import logging
 import uuid
 from datetime import datetime
@@ -22,6 +23,7 @@ from datetime import datetime
 from app.models.image_storage import ImageStorage
 from app.models.user import User, Team
 from app.services.s3_service import get_s3_service
+from app.services.image_pipeline import MEDIUM, THUMBNAIL, derivative_key, get_image_pipeline
 
 logger = logging.getLogger(__name__)
 
@@ -36,13 +38,16 @@ class ImageStorageService:
     
     def __init__(self):
         self.s3_service = get_s3_service()
+        # 진행 중인 파생본 생성 작업 (GC 방지용 참조)
+        self._derivative_tasks: Set[asyncio.Task] = set()
         logger.info("ImageStorageService initialized")
     
     async def save_generated_image_url(
         self, 
         s3_url: str, 
         group_id: int, 
-        db: AsyncSession
+        db: AsyncSession,
+        image_data: Optional[bytes] = None
     ) -> Optional[str]:
         """
         생성된 이미지의 S3 URL을 데이터베이스에 저장
@@ -51,6 +56,7 @@ class ImageStorageService:
             s3_url: S3에 저장된 이미지 URL
             group_id: 그룹 ID
             db: 데이터베이스 세션
+            image_data: 원본 이미지 바이트 (주면 백그라운드에서 썸네일/중간 크기 파생본 생성)
             
         Returns:
             str: 저장된 레코드의 storage_id, 실패시 None
@@ -76,6 +82,14 @@ class ImageStorageService:
             await db.refresh(image_storage)
             
             logger.info(f"Saved image URL to storage: {storage_id}, group: {group_id}")
+            
+            # 파생본은 응답을 지연시키지 않도록 백그라운드에서 생성
+            s3_key = self._extract_s3_key(s3_url)
+            if image_data and s3_key:
+                task = asyncio.create_task(self._build_derivatives(storage_id, s3_key, image_data))
+                self._derivative_tasks.add(task)
+                task.add_done_callback(self._derivative_tasks.discard)
+            
             return storage_id
             
         except Exception as e:
@@ -112,24 +126,7 @@ class ImageStorageService:
             )
             
             images = result.scalars().all()
-            
-            image_list = []
-            for image in images:
-                # S3 key 추출 및 presigned URL 생성
-                s3_key = self._extract_s3_key(image.s3_url)
-                presigned_url = None
-                if s3_key:
-                    presigned_url = self.s3_service.generate_presigned_url(s3_key, expiration=86400)  # 24시간
-                
-                image_list.append({
-                    "storage_id": image.storage_id,
-                    "s3_url": presigned_url or image.s3_url,  # presigned URL 우선, 실패시 원본 URL
-                    "group_id": image.group_id,
-                    "created_at": image.created_at,
-                    "updated_at": image.updated_at
-                })
-            
-            return image_list
+            return self._serialize_images(images)
             
         except Exception as e:
             logger.error(f"Failed to get images for group {group_id}: {e}")
@@ -182,24 +179,7 @@ class ImageStorageService:
             )
             
             images = result.scalars().all()
-            
-            image_list = []
-            for image in images:
-                # S3 key 추출 및 presigned URL 생성
-                s3_key = self._extract_s3_key(image.s3_url)
-                presigned_url = None
-                if s3_key:
-                    presigned_url = self.s3_service.generate_presigned_url(s3_key, expiration=86400)  # 24시간
-                
-                image_list.append({
-                    "storage_id": image.storage_id,
-                    "s3_url": presigned_url or image.s3_url,  # presigned URL 우선, 실패시 원본 URL
-                    "group_id": image.group_id,
-                    "created_at": image.created_at,
-                    "updated_at": image.updated_at
-                })
-            
-            return image_list
+            return self._serialize_images(images)
             
         except Exception as e:
             logger.error(f"Failed to get images for user {user_id}: {e}")
@@ -229,19 +209,7 @@ class ImageStorageService:
             if not image:
                 return None
             
-            # S3 key 추출 및 presigned URL 생성
-            s3_key = self._extract_s3_key(image.s3_url)
-            presigned_url = None
-            if s3_key:
-                presigned_url = self.s3_service.generate_presigned_url(s3_key, expiration=86400)  # 24시간
-            
-            return {
-                "storage_id": image.storage_id,
-                "s3_url": presigned_url or image.s3_url,  # presigned URL 우선, 실패시 원본 URL
-                "group_id": image.group_id,
-                "created_at": image.created_at,
-                "updated_at": image.updated_at
-            }
+            return self._serialize_images([image])[0]
             
         except Exception as e:
             logger.error(f"Failed to get image {storage_id}: {e}")
@@ -287,9 +255,13 @@ class ImageStorageService:
                 try:
                     # S3 URL에서 키 추출하여 삭제
                     s3_key = self._extract_s3_key(image.s3_url)
-                    if s3_key:
-                        await self.s3_service.delete_object(s3_key)
-                        logger.info(f"Deleted from S3: {s3_key}")
+                    if s3_key and self.s3_service.is_available():
+                        # 파생본도 함께 삭제 (한 번의 일괄 삭제 요청)
+                        keys = [s3_key]
+                        if image.has_derivatives:
+                            keys += [derivative_key(s3_key, THUMBNAIL), derivative_key(s3_key, MEDIUM)]
+                        await self.s3_service.storage.delete_objects(keys)
+                        logger.info(f"Deleted from S3: {keys}")
                 except Exception as e:
                     logger.warning(f"Failed to delete from S3: {e}")
                     # S3 삭제 실패해도 DB 레코드는 삭제 진행
@@ -308,6 +280,68 @@ class ImageStorageService:
             await db.rollback()
             return False
     
+    def _serialize_images(self, images: List[ImageStorage]) -> List[Dict[str, Any]]:
+        """이미지 목록 응답 생성 (원본/파생본 presigned URL을 페이지 단위로 일괄 생성, 24시간)"""
+        s3_keys = {image.storage_id: self._extract_s3_key(image.s3_url) for image in images}
+        keys = []
+        for image in images:
+            s3_key = s3_keys[image.storage_id]
+            if not s3_key:
+                continue
+            keys.append(s3_key)
+            if image.has_derivatives:
+                keys.append(derivative_key(s3_key, THUMBNAIL))
+                keys.append(derivative_key(s3_key, MEDIUM))
+        presigned_urls = self.s3_service.generate_presigned_urls(keys, expiration=86400)
+        
+        image_list = []
+        for image in images:
+            s3_key = s3_keys[image.storage_id]
+            presigned_url = presigned_urls.get(s3_key) if s3_key else None
+            original_url = presigned_url or image.s3_url  # presigned URL 우선, 실패시 원본 URL
+            
+            # 목록 화면은 썸네일/중간 크기 WebP 사용 (파생본이 없는 이전 이미지는 원본)
+            thumbnail_url = medium_url = None
+            if s3_key and image.has_derivatives:
+                thumbnail_url = presigned_urls.get(derivative_key(s3_key, THUMBNAIL))
+                medium_url = presigned_urls.get(derivative_key(s3_key, MEDIUM))
+            
+            image_list.append({
+                "storage_id": image.storage_id,
+                "s3_url": original_url,
+                "thumbnail_url": thumbnail_url or original_url,
+                "medium_url": medium_url or original_url,
+                "width": image.image_width,
+                "height": image.image_height,
+                "group_id": image.group_id,
+                "created_at": image.created_at,
+                "updated_at": image.updated_at
+            })
+        
+        return image_list
+    
+    async def _build_derivatives(self, storage_id: str, s3_key: str, image_data: bytes):
+        """파생본 생성/업로드 후 이미지 크기와 파생본 여부 기록"""
+        processed = await get_image_pipeline().process_and_store(image_data, s3_key)
+        if processed is None:
+            return
+        try:
+            from app.database import new_async_session
+            
+            async with new_async_session() as session:
+                await session.execute(
+                    update(ImageStorage)
+                    .where(ImageStorage.storage_id == storage_id)
+                    .values(
+                        image_width=processed.metadata.width,
+                        image_height=processed.metadata.height,
+                        has_derivatives=True,
+                    )
+                )
+                await session.commit()
+        except Exception as e:
+            logger.warning(f"Failed to record derivatives for {storage_id}: {e}")
+    
     async def get_group_image_count(self, group_id: int, db: AsyncSession) -> int:
         """
         그룹의 저장된 이미지 수 조회
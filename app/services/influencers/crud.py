@@ -1,8 +1,14 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.exc import IntegrityError
 from app.models.influencer import AIInfluencer, ModelMBTI, StylePreset, InfluencerAPI
 from app.schemas.influencer import AIInfluencerCreate, AIInfluencerUpdate
 from app.utils.data_mapping import DataMapper
+from app.services.api_key_cache import get_api_key_cache
+from app.services.hf_token_resolver import get_hf_token_resolver
+from app.services.catalog_cache import INFLUENCERS, get_catalog_cache
+from app.core.permissions import get_user_group_ids_async
 from fastapi import HTTPException, status
 import uuid
 import logging
@@ -11,6 +17,14 @@ from datetime import datetime
 logger = logging.getLogger(__name__)
 
 
+def _influencer_access_filter(user_id: str, user_group_ids):
+    """권한 체크: 사용자가 속한 그룹의 인플루언서이거나 사용자가 직접 소유한 인플루언서"""
+    if user_group_ids:
+        return AIInfluencer.group_id.in_(user_group_ids) | (AIInfluencer.user_id == user_id)
+    # 그룹이 없는 경우 사용자가 직접 소유한 인플루언서만
+    return AIInfluencer.user_id == user_id
+
+
 async def get_influencer_by_id(db: Session, user_id: str, influencer_id: str):
     """인플루언서 조회 (권한 체크 포함)"""
     from app.models.user import User
@@ -26,19 +40,14 @@ async def get_influencer_by_id(db: Session, user_id: str, influencer_id: str):
     user_group_ids = [team.group_id for team in user.teams] if user.teams else []
 
     # 인플루언서 조회 (권한 체크 포함)
-    query = db.query(AIInfluencer).filter(AIInfluencer.influencer_id == influencer_id)
-
-    # 권한 체크: 사용자가 속한 그룹의 인플루언서이거나 사용자가 직접 소유한 인플루언서
-    if user_group_ids:
-        query = query.filter(
-            (AIInfluencer.group_id.in_(user_group_ids))
-            | (AIInfluencer.user_id == user_id)
+    influencer = (
+        db.query(AIInfluencer)
+        .filter(
+            AIInfluencer.influencer_id == influencer_id,
+            _influencer_access_filter(user_id, user_group_ids),
         )
-    else:
-        # 그룹이 없는 경우 사용자가 직접 소유한 인플루언서만
-        query = query.filter(AIInfluencer.user_id == user_id)
-
-    influencer = query.first()
+        .first()
+    )
     if not influencer:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -63,17 +72,7 @@ async def get_influencers_list(db: Session, user_id: str, skip: int = 0, limit:
     user_group_ids = [team.group_id for team in user.teams] if user.teams else []
 
     # 인플루언서 조회 (권한 체크 포함)
-    query = db.query(AIInfluencer)
-
-    # 권한 체크: 사용자가 속한 그룹의 인플루언서이거나 사용자가 직접 소유한 인플루언서
-    if user_group_ids:
-        query = query.filter(
-            (AIInfluencer.group_id.in_(user_group_ids))
-            | (AIInfluencer.user_id == user_id)
-        )
-    else:
-        # 그룹이 없는 경우 사용자가 직접 소유한 인플루언서만
-        query = query.filter(AIInfluencer.user_id == user_id)
+    query = db.query(AIInfluencer).filter(_influencer_access_filter(user_id, user_group_ids))
 
     # 정렬 및 페이징
     influencers = query.order_by(AIInfluencer.created_at.desc()).offset(skip).limit(limit).all()
@@ -81,6 +80,58 @@ async def get_influencers_list(db: Session, user_id: str, skip: int = 0, limit:
     return influencers
 
 
+async def _get_user_group_ids_or_404(db: AsyncSession, user_id: str):
+    user_group_ids = await get_user_group_ids_async(db, user_id)
+    if user_group_ids is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+        )
+    return user_group_ids
+
+
+async def get_influencer_by_id_async(db: AsyncSession, user_id: str, influencer_id: str):
+    """인플루언서 조회 (권한 체크 포함, 비동기 세션용)
+
+    응답에 포함되는 스타일 프리셋/MBTI를 함께 로드 (비동기 세션은 지연 로딩 불가)
+    """
+    user_group_ids = await _get_user_group_ids_or_404(db, user_id)
+
+    influencer = (
+        await db.execute(
+            select(AIInfluencer)
+            .options(selectinload(AIInfluencer.style_preset), selectinload(AIInfluencer.mbti))
+            .where(
+                AIInfluencer.influencer_id == influencer_id,
+                _influencer_access_filter(user_id, user_group_ids),
+            )
+        )
+    ).scalars().first()
+    if not influencer:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Influencer not found or access denied",
+        )
+
+    return influencer
+
+
+async def get_influencers_list_async(
+    db: AsyncSession, user_id: str, skip: int = 0, limit: int = 100
+):
+    """인플루언서 목록 조회 (권한 체크 포함, 비동기 세션용)"""
+    user_group_ids = await _get_user_group_ids_or_404(db, user_id)
+
+    result = await db.execute(
+        select(AIInfluencer)
+        .options(selectinload(AIInfluencer.style_preset), selectinload(AIInfluencer.mbti))
+        .where(_influencer_access_filter(user_id, user_group_ids))
+        .order_by(AIInfluencer.created_at.desc())
+        .offset(skip)
+        .limit(limit)
+    )
+    return result.scalars().all()
+
+
 async def create_influencer(db: Session, user_id: str, influencer_data: AIInfluencerCreate):
     """새 AI 인플루언서 생성"""
     logger.info(
@@ -274,6 +325,7 @@ async def create_influencer(db: Session, user_id: str, influencer_data: AIInflue
 
         db.commit()
         db.refresh(influencer)
+        get_catalog_cache().invalidate(INFLUENCERS)
 
         logger.info(
             f"🎉 인플루언서 생성 완료 - ID: {influencer.influencer_id}, 이름: {influencer.influencer_name}"
@@ -350,6 +402,10 @@ async def update_influencer(
 
     db.commit()
     db.refresh(influencer)
+    get_api_key_cache().invalidate_influencer(influencer_id)
+    # hf_manage_id/group_id 변경 시 다른 토큰으로 해석되어야 하므로 함께 무효화
+    get_hf_token_resolver().clear_cache(influencer_id)
+    get_catalog_cache().invalidate(INFLUENCERS)
     return influencer
 
 
@@ -388,6 +444,9 @@ async def delete_influencer(db: Session, user_id: str, influencer_id: str):
     # 4. 마지막으로 인플루언서 삭제
     db.delete(influencer)
     db.commit()
+    get_api_key_cache().invalidate_influencer(influencer_id)
+    get_hf_token_resolver().clear_cache(influencer_id)
+    get_catalog_cache().invalidate(INFLUENCERS)
 
     logger.info(f"✅ 인플루언서 {influencer_id} 삭제 완료")
     return {"message": "Influencer deleted successfully"}
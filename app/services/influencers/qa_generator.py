@@ -11,8 +11,9 @@ import random
 import tempfile
 import logging
 import asyncio
-from typing import List, Dict, Optional
-from openai import OpenAI
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Iterable, Iterator, Tuple
+from openai import OpenAI, AsyncOpenAI
 from datetime import datetime
 from dataclasses import dataclass
 from enum import Enum
@@ -22,6 +23,14 @@ from app.database import get_db
 from app.services.influencers.crud import get_influencer_by_id
 from app.models.influencer import BatchKey
 from app.core.config import settings
+from app.core.http_clients import get_http_client
+from app.services.qa_result_pipeline import (
+    QAPipelineStats,
+    download_openai_file,
+    iter_batch_qa_pairs,
+    iter_jsonl,
+    write_qa_json,
+)
 # Backend 내부 모델 사용
 from app.models.vllm_models import Gender, VLLMCharacterProfile
 from dotenv import load_dotenv
@@ -61,8 +70,14 @@ class InfluencerQAGenerator:
         Args:
             api_key: OpenAI API 키
         """
-        self.client = OpenAI(api_key=api_key or os.getenv('OPENAI_API_KEY'))
+        self.api_key = api_key or os.getenv('OPENAI_API_KEY')
+        self.client = OpenAI(api_key=self.api_key)
         self.speech_generator = SpeechGenerator(api_key)
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """공유 커넥션 풀을 사용하는 비동기 OpenAI 클라이언트 (상태 조회용)"""
+        return AsyncOpenAI(api_key=self.api_key, http_client=get_http_client("openai"))
         
     def influencer_to_character_profile(self, influencer_data: dict, style_preset: dict = None, mbti: dict = None) -> CharacterProfile:
         """
@@ -332,6 +347,15 @@ class InfluencerQAGenerator:
     def check_batch_status(self, batch_id: str) -> Dict:
         """배치 작업 상태 확인"""
         batch = self.client.batches.retrieve(batch_id)
+        return self._batch_status_to_dict(batch)
+
+    async def check_batch_status_async(self, batch_id: str) -> Dict:
+        """배치 작업 상태 확인 (이벤트 루프를 막지 않는 비동기 버전)"""
+        batch = await self.async_client.batches.retrieve(batch_id)
+        return self._batch_status_to_dict(batch)
+
+    @staticmethod
+    def _batch_status_to_dict(batch) -> Dict:
         return {
             "id": batch.id,
             "status": batch.status,
@@ -342,8 +366,8 @@ class InfluencerQAGenerator:
             "error_file_id": batch.error_file_id if hasattr(batch, 'error_file_id') else None
         }
     
-    def download_batch_results(self, batch_id: str, task_id: str) -> Optional[str]:
-        """배치 결과 다운로드"""
+    def download_batch_results(self, batch_id: str, task_id: str, stats: Optional[QAPipelineStats] = None) -> Optional[str]:
+        """배치 결과 다운로드 (청크 단위로 파일에 기록)"""
         batch = self.client.batches.retrieve(batch_id)
         
         if batch.status != "completed":
@@ -359,69 +383,47 @@ class InfluencerQAGenerator:
         temp_dir = tempfile.gettempdir()
         result_file_path = os.path.join(temp_dir, result_file_name)
         
-        file_response = self.client.files.content(batch.output_file_id)
-        
-        with open(result_file_path, 'wb') as f:
-            f.write(file_response.content)
+        download_openai_file(self.client, batch.output_file_id, result_file_path, stats)
         
         print(f"결과 파일 다운로드 완료: {result_file_path}")
         return result_file_path
     
+    def iter_qa_results(self, result_file_path: str, stats: Optional[QAPipelineStats] = None) -> Iterator[Dict]:
+        """결과 파일에서 QA 쌍을 한 건씩 추출 (검증 및 중복 제거 포함)"""
+        stats = stats or QAPipelineStats()
+        with open(result_file_path, 'r', encoding='utf-8') as f:
+            yield from iter_batch_qa_pairs(iter_jsonl(f, stats), stats)
+    
     def process_qa_results(self, result_file_path: str) -> List[Dict]:
         """결과 파일에서 QA 쌍 추출"""
-        qa_pairs = []
-        
-        with open(result_file_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                result = json.loads(line)
-                
-                if result.get('response', {}).get('status_code') == 200:
-                    # 응답 컨텐츠 가져오기
-                    content = result['response']['body']['choices'][0]['message']['content'].strip()
-                    
-                    try:
-                        # JSON 형식으로 파싱 시도 ({"q": "...", "a": "..."} 형식)
-                        qa_data = json.loads(content)
-                        if isinstance(qa_data, dict) and 'q' in qa_data and 'a' in qa_data:
-                            qa_pairs.append({
-                                "question": qa_data['q'],
-                                "answer": qa_data['a'],
-                                "custom_id": result.get('custom_id')
-                            })
-                            continue
-                    except json.JSONDecodeError:
-                        # JSON 파싱 실패 시 기존 방식으로 폴백
-                        pass
-                    
-                    # 기존 형식 (Q: ... A: ...) 처리
-                    if 'Q:' in content and 'A:' in content:
-                        parts = content.split('A:', 1)
-                        if len(parts) == 2:
-                            question = parts[0].replace('Q:', '').strip()
-                            answer = parts[1].strip()
-                            qa_pairs.append({
-                                "question": question,
-                                "answer": answer,
-                                "custom_id": result.get('custom_id')
-                            })
-                    else:
-                        # JSON도 아니고 Q:A: 형식도 아닌 경우
-                        print(f"QA 파싱 실패 - 컨텐츠: {content[:100]}...")
-        
-        return qa_pairs
+        return list(self.iter_qa_results(result_file_path))
     
-    def save_qa_pairs_to_db(self, influencer_id: str, qa_pairs: List[Dict], db: Session):
-        """생성된 QA 쌍을 데이터베이스에 저장"""
+    def save_qa_pairs_to_db(
+        self, influencer_id: str, qa_pairs: Iterable[Dict], db: Session,
+        task_id: str = None, stats: Optional[QAPipelineStats] = None
+    ) -> Tuple[str, int]:
+        """생성된 QA 쌍을 데이터베이스에 저장
+        
+        Returns:
+            (저장된 파일 경로, QA 쌍 수)
+        """
         # TODO: QA 쌍을 저장할 테이블이 필요 (예: influencer_qa_pairs)
-        # 현재는 JSON 파일로 임시 저장
-        filename = f"influencer_{influencer_id}_qa_pairs.json"
+        # 현재는 JSON 파일로 임시 저장 (S3 업로드용 처리 파일과 동일한 형식으로 스트리밍 기록)
+        # 같은 인플루언서의 작업이 동시에 처리돼도 파일이 겹치지 않도록 작업별 파일 사용
+        filename = f"influencer_{influencer_id}_{task_id or int(time.time() * 1000)}_qa_pairs.json"
         temp_dir = tempfile.gettempdir()
         filepath = os.path.join(temp_dir, filename)
         
+        header = {
+            "influencer_id": influencer_id,
+            "task_id": task_id,
+            "generated_at": datetime.now().isoformat(),
+        }
         with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(qa_pairs, f, ensure_ascii=False, indent=2)
+            count = write_qa_json(qa_pairs, f, header, stats)
         
-        print(f"QA 쌍 {len(qa_pairs)}개가 {filepath}에 저장되었습니다.")
+        print(f"QA 쌍 {count}개가 {filepath}에 저장되었습니다.")
+        return filepath, count
     
     async def start_qa_generation(self, influencer_id: str, db: Session, user_id: str = None) -> str:
         """
@@ -567,19 +569,20 @@ class InfluencerQAGenerator:
             
             logger.info(f"📦 배치 정보 확인: batch_id={batch_key.openai_batch_id}, influencer_id={batch_key.influencer_id}")
             
-            # 배치 결과 다운로드
-            result_file_path = self.download_batch_results(batch_key.openai_batch_id, task_id)
+            # 배치 결과 다운로드 -> 파싱/검증/중복 제거 -> 파일 기록까지 한 줄씩 스트리밍 처리
+            stats = QAPipelineStats()
+            result_file_path = self.download_batch_results(batch_key.openai_batch_id, task_id, stats)
             if not result_file_path:
                 raise Exception("결과 파일 다운로드 실패")
             
             logger.info(f"📥 배치 결과 다운로드 완료: {result_file_path}")
             
-            # QA 쌍 처리
-            qa_pairs = self.process_qa_results(result_file_path)
-            logger.info(f"🔍 QA 쌍 처리 완료: {len(qa_pairs)}개")
-            
-            # DB에 저장
-            self.save_qa_pairs_to_db(batch_key.influencer_id, qa_pairs, db)
+            # QA 쌍 처리 및 DB에 저장
+            processed_file_path, qa_count = self.save_qa_pairs_to_db(
+                batch_key.influencer_id, self.iter_qa_results(result_file_path, stats), db,
+                task_id=task_id, stats=stats
+            )
+            logger.info(f"🔍 QA 쌍 처리 완료: {qa_count}개")
             logger.info(f"💾 QA 쌍 DB 저장 완료")
             
             # S3에 업로드
@@ -590,12 +593,17 @@ class InfluencerQAGenerator:
                 
                 if s3_service.is_available():
                     # S3에 QA 결과 업로드
+                    upload_started = time.perf_counter()
                     s3_urls = s3_service.upload_qa_results(
                         influencer_id=batch_key.influencer_id,
                         task_id=task_id,
-                        qa_pairs=qa_pairs,
-                        raw_results_file=result_file_path
+                        raw_results_file=result_file_path,
+                        processed_qa_file=processed_file_path
                     )
+                    upload_stage = stats.stage("upload")
+                    upload_stage.items += 1
+                    upload_stage.bytes += os.path.getsize(processed_file_path) + os.path.getsize(result_file_path)
+                    upload_stage.seconds += time.perf_counter() - upload_started
                     
                     # S3 URL 저장
                     if s3_urls:
@@ -617,13 +625,14 @@ class InfluencerQAGenerator:
             
             # BatchKey 상태 업데이트
             batch_key.status = QAGenerationStatus.COMPLETED.value
-            batch_key.generated_qa_pairs = len(qa_pairs)
+            batch_key.generated_qa_pairs = qa_count
             batch_key.completed_at = datetime.now()
             batch_key.is_processed = True
             db.commit()
             logger.info(f"🧠 BatchKey 상태 업데이트 완료 (DB)")
             
-            logger.info(f"✅ QA 생성 완료 - Task ID: {task_id}, QA 쌍: {len(qa_pairs)}개, S3 업로드: {batch_key.is_uploaded_to_s3}")
+            stats.log_summary(task_id)
+            logger.info(f"✅ QA 생성 완료 - Task ID: {task_id}, QA 쌍: {qa_count}개, S3 업로드: {batch_key.is_uploaded_to_s3}")
             return True
             
         except Exception as e:
@@ -636,4 +645,36 @@ class InfluencerQAGenerator:
                 batch_key.error_message = f"결과 처리 오류: {str(e)}"
                 db.commit()
             
-            return False
\ No newline at end of file
+            return False
+
+    async def complete_qa_generation_async(self, task_id: str) -> bool:
+        """QA 생성 완료 처리를 결과 처리 워커 풀에서 실행
+
+        결과 다운로드/파싱/S3 업로드는 블로킹 작업이므로 별도 스레드와 별도 DB 세션에서 처리
+        """
+        def run() -> bool:
+            from app.database import SessionLocal
+
+            db = SessionLocal()
+            try:
+                return self.complete_qa_generation(task_id, db)
+            finally:
+                db.close()
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_batch_result_executor(), run)
+
+
+# 배치 결과 다운로드/처리 전용 워커 풀
+_batch_result_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_batch_result_executor() -> ThreadPoolExecutor:
+    """배치 결과 처리 워커 풀 반환"""
+    global _batch_result_executor
+    if _batch_result_executor is None:
+        _batch_result_executor = ThreadPoolExecutor(
+            max_workers=settings.OPENAI_BATCH_RESULT_WORKERS,
+            thread_name_prefix="batch-results",
+        )
+    return _batch_result_executor
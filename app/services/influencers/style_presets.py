@@ -1,9 +1,12 @@
+from sqlalchemy import and_, func
 from sqlalchemy.orm import Session
 from typing import List
 import uuid
 
 from app.models import StylePreset
+from app.models.influencer import AIInfluencer, ModelMBTI
 from app.schemas.influencer import StylePresetCreate
+from app.services.catalog_cache import STYLE_PRESETS, get_catalog_cache
 
 
 def get_style_presets(db: Session, skip: int = 0, limit: int = 100):
@@ -11,15 +14,73 @@ def get_style_presets(db: Session, skip: int = 0, limit: int = 100):
     return db.query(StylePreset).offset(skip).limit(limit).all()
 
 
+def get_style_presets_with_mbti(db: Session, skip: int = 0, limit: int = 100) -> List[dict]:
+    """스타일 프리셋 목록과 프리셋별 가장 많이 사용된 MBTI를 한 번의 쿼리로 조회"""
+    usage_count = func.count(AIInfluencer.influencer_id)
+    # 프리셋별 MBTI 사용 수 순위 (동률이면 mbti_id가 작은 쪽)
+    mbti_usage = (
+        db.query(
+            AIInfluencer.style_preset_id.label("style_preset_id"),
+            AIInfluencer.mbti_id.label("mbti_id"),
+            func.row_number()
+            .over(
+                partition_by=AIInfluencer.style_preset_id,
+                order_by=(usage_count.desc(), AIInfluencer.mbti_id),
+            )
+            .label("usage_rank"),
+        )
+        .filter(AIInfluencer.mbti_id.isnot(None))
+        .group_by(AIInfluencer.style_preset_id, AIInfluencer.mbti_id)
+        .subquery()
+    )
+
+    rows = (
+        db.query(StylePreset, ModelMBTI)
+        .outerjoin(
+            mbti_usage,
+            and_(
+                mbti_usage.c.style_preset_id == StylePreset.style_preset_id,
+                mbti_usage.c.usage_rank == 1,
+            ),
+        )
+        .outerjoin(ModelMBTI, ModelMBTI.mbti_id == mbti_usage.c.mbti_id)
+        .order_by(StylePreset.style_preset_id)
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
+
+    return [
+        {
+            "style_preset_id": preset.style_preset_id,
+            "style_preset_name": preset.style_preset_name,
+            "influencer_type": preset.influencer_type,
+            "influencer_gender": preset.influencer_gender,
+            "influencer_age_group": preset.influencer_age_group,
+            "influencer_hairstyle": preset.influencer_hairstyle,
+            "influencer_style": preset.influencer_style,
+            "influencer_personality": preset.influencer_personality,
+            "influencer_speech": preset.influencer_speech,
+            "created_at": preset.created_at,
+            "updated_at": preset.updated_at,
+            "mbti_name": mbti.mbti_name if mbti else None,
+            "mbti_traits": mbti.mbti_traits if mbti else None,
+            "mbti_speech": mbti.mbti_speech if mbti else None,
+        }
+        for preset, mbti in rows
+    ]
+
+
 def create_style_preset(db: Session, preset_data: StylePresetCreate):
     """새 스타일 프리셋 생성"""
     preset = StylePreset(
-        style_preset_id=str(uuid.uuid4()), 
+        style_preset_id=str(uuid.uuid4()),
         **preset_data.dict()
     )
 
     db.add(preset)
     db.commit()
     db.refresh(preset)
+    get_catalog_cache().invalidate(STYLE_PRESETS)
 
-    return preset
\ No newline at end of file
+    return preset
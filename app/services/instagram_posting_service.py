@@ -1,4 +1,5 @@
 import httpx
+import asyncio
 import logging
 import os
 import requests
@@ -6,9 +7,13 @@ from typing import Dict, Optional, List
 from datetime import datetime
 from fastapi import HTTPException, status
 from urllib.parse import urljoin
+from app.core.http_clients import pooled_client
 
 logger = logging.getLogger(__name__)
 
+# 배치 조회 시 Graph API 동시 요청 수 (instagram 커넥션 풀 크기 이내)
+BATCH_MAX_CONCURRENCY = 10
+
 
 class InstagramPostingService:
     """Instagram Graph API를 사용한 게시글 업로드 서비스"""
@@ -116,7 +121,7 @@ class InstagramPostingService:
                         detail="로컬 이미지 URL은 인스타그램 API에서 접근할 수 없습니다. 공개 URL을 사용하거나 S3 등의 클라우드 스토리지를 사용하세요.",
                     )
 
-                async with httpx.AsyncClient() as client:
+                async with pooled_client("instagram") as client:
 
                     # Instagram API 요청 데이터 (캡션 포함)
                     request_data = {
@@ -279,7 +284,7 @@ class InstagramPostingService:
                         detail="로컬 이미지 URL은 인스타그램 API에서 접근할 수 없습니다. 공개 URL을 사용하거나 S3 등의 클라우드 스토리지를 사용하세요.",
                     )
 
-                async with httpx.AsyncClient() as client:
+                async with pooled_client("instagram") as client:
                     # Instagram API 요청 데이터 (캡션 없음)
                     request_data = {
                         "image_url": public_image_url,
@@ -393,7 +398,7 @@ class InstagramPostingService:
                     logger.info(f"Adding caption to carousel: {safe_caption}")
 
             # 3. 캐러셀 생성 API 호출
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("instagram") as client:
                 response = await client.post(
                     f"{self.base_url}/{instagram_id}/media",
                     headers={
@@ -481,7 +486,7 @@ class InstagramPostingService:
             logger.info(f"Caption length: {len(caption)} characters")
             logger.info(f"Instagram ID: {instagram_id}")
 
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("instagram") as client:
                 # 캡션을 params로 전송 (Instagram API 요구사항)
                 # 빈 캡션이나 None인 경우 기본 텍스트 사용
                 safe_caption = (
@@ -714,7 +719,7 @@ class InstagramPostingService:
     ) -> bool:
         """Instagram 권한 확인"""
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("instagram") as client:
                 # 1. 기본 계정 정보 확인
                 response = await client.get(
                     f"{self.base_url}/{instagram_id}",
@@ -783,7 +788,7 @@ class InstagramPostingService:
     ) -> Dict:
         """인스타그램 게시물 정보 조회"""
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("instagram") as client:
                 response = await client.get(
                     f"{self.base_url}/{post_id}",
                     params={
@@ -817,7 +822,7 @@ class InstagramPostingService:
     ) -> Dict:
         """인스타그램 사용자의 게시물 목록 조회"""
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("instagram") as client:
                 response = await client.get(
                     f"{self.base_url}/{instagram_id}/media",
                     params={
@@ -852,7 +857,7 @@ class InstagramPostingService:
     ) -> Dict:
         """인스타그램 게시물 인사이트(통계) 조회"""
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("instagram") as client:
                 response = await client.get(
                     f"{self.base_url}/{post_id}/insights",
                     params={"access_token": access_token, "metric": ""},
@@ -883,7 +888,7 @@ class InstagramPostingService:
     ) -> Dict:
         """인스타그램 게시물 댓글 조회"""
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("instagram") as client:
                 response = await client.get(
                     f"{self.base_url}/{post_id}/comments",
                     params={
@@ -914,37 +919,47 @@ class InstagramPostingService:
             )
 
     async def get_instagram_post_info_batch(
-        self, post_ids: List[str], access_token: str, instagram_id: str
+        self,
+        post_ids: List[str],
+        access_token: str,
+        instagram_id: str,
+        max_concurrency: int = BATCH_MAX_CONCURRENCY,
     ) -> Dict[str, Dict]:
-        """인스타그램 게시물 정보 배치 조회"""
-        results = {}
+        """인스타그램 게시물 정보 배치 조회 (동시 요청 수 제한 병렬 조회)"""
+        semaphore = asyncio.Semaphore(max_concurrency)
 
-        for post_id in post_ids:
-            try:
-                post_info = await self.get_instagram_post_info(
-                    post_id, access_token, instagram_id
-                )
-                results[post_id] = post_info
-            except Exception as e:
-                logger.error(f"Failed to get post info for {post_id}: {str(e)}")
-                results[post_id] = None
+        async def fetch(post_id: str) -> Optional[Dict]:
+            async with semaphore:
+                try:
+                    return await self.get_instagram_post_info(
+                        post_id, access_token, instagram_id
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to get post info for {post_id}: {str(e)}")
+                    return None
 
-        return results
+        post_infos = await asyncio.gather(*(fetch(post_id) for post_id in post_ids))
+        return dict(zip(post_ids, post_infos))
 
     async def get_instagram_post_insights_batch(
-        self, post_ids: List[str], access_token: str, instagram_id: str
+        self,
+        post_ids: List[str],
+        access_token: str,
+        instagram_id: str,
+        max_concurrency: int = BATCH_MAX_CONCURRENCY,
     ) -> Dict[str, Dict]:
-        """인스타그램 게시물 인사이트 배치 조회"""
-        results = {}
+        """인스타그램 게시물 인사이트 배치 조회 (동시 요청 수 제한 병렬 조회)"""
+        semaphore = asyncio.Semaphore(max_concurrency)
 
-        for post_id in post_ids:
-            try:
-                insights = await self.get_instagram_post_insights(
-                    post_id, access_token, instagram_id
-                )
-                results[post_id] = insights
-            except Exception as e:
-                logger.error(f"Failed to get insights for {post_id}: {str(e)}")
-                results[post_id] = None
+        async def fetch(post_id: str) -> Optional[Dict]:
+            async with semaphore:
+                try:
+                    return await self.get_instagram_post_insights(
+                        post_id, access_token, instagram_id
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to get insights for {post_id}: {str(e)}")
+                    return None
 
-        return results
+        insights = await asyncio.gather(*(fetch(post_id) for post_id in post_ids))
+        return dict(zip(post_ids, insights))
@@ -0,0 +1,193 @@
+"""
+인스타그램 게시물 통계 캐시
+게시글 목록 조회 시 좋아요/댓글 수를 platform_post_id 기준으로 짧게 캐시
+- TTL 이내: 캐시 값 그대로 사용
+- TTL 경과 ~ stale 허용 시간 이내: 캐시 값을 먼저 반환하고 백그라운드에서 갱신
+- 캐시에 없으면 계정(access token)별로 묶어 병렬 조회
+"""
+
+import time
+import asyncio
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.services.instagram_posting_service import InstagramPostingService
+
+logger = logging.getLogger(__name__)
+
+EMPTY_STATS = {"like_count": 0, "comments_count": 0}
+
+
+@dataclass(frozen=True)
+class InstagramStatsRequest:
+    """통계 조회 대상 게시물"""
+
+    platform_post_id: str
+    access_token: str
+    instagram_id: str
+
+
+class InstagramStatsCache:
+    """platform_post_id → {like_count, comments_count} TTL 캐시"""
+
+    def __init__(
+        self,
+        ttl_seconds: Optional[float] = None,
+        stale_ttl_seconds: Optional[float] = None,
+        max_entries: int = 5000,
+    ):
+        self.ttl_seconds = (
+            ttl_seconds if ttl_seconds is not None else settings.INSTAGRAM_STATS_CACHE_TTL
+        )
+        self.stale_ttl_seconds = (
+            stale_ttl_seconds
+            if stale_ttl_seconds is not None
+            else settings.INSTAGRAM_STATS_STALE_TTL
+        )
+        self.max_entries = max_entries
+        self.instagram_service = InstagramPostingService()
+
+        self._entries: "OrderedDict[str, Tuple[Dict[str, int], float]]" = OrderedDict()
+        # 조회 실패한 게시물은 TTL 동안 다시 요청하지 않음 (삭제된 게시물 등)
+        self._failures: Dict[str, float] = {}
+        self._refreshing: Set[str] = set()
+        self._background_tasks: Set[asyncio.Task] = set()
+
+    async def get_many(
+        self, requests: Iterable[InstagramStatsRequest]
+    ) -> Dict[str, Dict[str, int]]:
+        """여러 게시물의 통계 조회
+
+        Returns:
+            Dict[str, Dict[str, int]]: platform_post_id별 통계 (조회 실패 시 0)
+        """
+        now = time.monotonic()
+        results: Dict[str, Dict[str, int]] = {}
+        missing: List[InstagramStatsRequest] = []
+        stale: List[InstagramStatsRequest] = []
+
+        for request in {r.platform_post_id: r for r in requests}.values():
+            entry = self._entries.get(request.platform_post_id)
+            if entry is None:
+                failed_at = self._failures.get(request.platform_post_id)
+                if failed_at is not None and now - failed_at < self.ttl_seconds:
+                    results[request.platform_post_id] = dict(EMPTY_STATS)
+                else:
+                    missing.append(request)
+                continue
+
+            stats, fetched_at = entry
+            age = now - fetched_at
+            if age < self.ttl_seconds:
+                results[request.platform_post_id] = stats
+            elif age < self.stale_ttl_seconds:
+                results[request.platform_post_id] = stats
+                stale.append(request)
+            else:
+                missing.append(request)
+
+        if stale:
+            self._refresh_in_background(stale)
+
+        if missing:
+            fetched = await self._fetch(missing)
+            for request in missing:
+                results[request.platform_post_id] = fetched.get(
+                    request.platform_post_id, dict(EMPTY_STATS)
+                )
+
+        return results
+
+    def invalidate(self, platform_post_id: Optional[str] = None) -> None:
+        """캐시 무효화 (게시물 삭제/재발행 시)"""
+        if platform_post_id is None:
+            self._entries.clear()
+            self._failures.clear()
+        else:
+            self._entries.pop(platform_post_id, None)
+            self._failures.pop(platform_post_id, None)
+
+    def _store(self, platform_post_id: str, stats: Dict[str, int]) -> None:
+        self._failures.pop(platform_post_id, None)
+        self._entries[platform_post_id] = (stats, time.monotonic())
+        self._entries.move_to_end(platform_post_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _fetch(
+        self, requests: List[InstagramStatsRequest]
+    ) -> Dict[str, Dict[str, int]]:
+        """계정별로 묶어 배치 조회 후 캐시에 저장"""
+        groups: Dict[Tuple[str, str], List[str]] = {}
+        for request in requests:
+            groups.setdefault((request.access_token, request.instagram_id), []).append(
+                request.platform_post_id
+            )
+
+        batches = await asyncio.gather(
+            *(
+                self.instagram_service.get_instagram_post_info_batch(
+                    post_ids, access_token, instagram_id
+                )
+                for (access_token, instagram_id), post_ids in groups.items()
+            ),
+            return_exceptions=True,
+        )
+
+        results: Dict[str, Dict[str, int]] = {}
+        for batch in batches:
+            if isinstance(batch, BaseException):
+                logger.error(f"Failed to fetch Instagram stats batch: {batch}")
+                continue
+            for post_id, post_info in batch.items():
+                if not post_info:
+                    if len(self._failures) >= self.max_entries:
+                        self._failures.clear()
+                    self._failures[post_id] = time.monotonic()
+                    continue
+                stats = {
+                    "like_count": post_info.get("like_count", 0),
+                    "comments_count": post_info.get("comments_count", 0),
+                }
+                self._store(post_id, stats)
+                results[post_id] = stats
+
+        logger.debug(
+            f"Instagram 통계 조회: 요청 {len(requests)}개, 성공 {len(results)}개, 계정 {len(groups)}개"
+        )
+        return results
+
+    def _refresh_in_background(self, requests: List[InstagramStatsRequest]) -> None:
+        """만료된 항목을 응답을 막지 않고 갱신 (이미 갱신 중인 게시물은 제외)"""
+        targets = [r for r in requests if r.platform_post_id not in self._refreshing]
+        if not targets:
+            return
+        post_ids = {r.platform_post_id for r in targets}
+        self._refreshing.update(post_ids)
+
+        async def refresh():
+            try:
+                await self._fetch(targets)
+            except Exception as e:
+                logger.warning(f"⚠️ Instagram 통계 백그라운드 갱신 실패: {e}")
+            finally:
+                self._refreshing.difference_update(post_ids)
+
+        task = asyncio.create_task(refresh())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+
+# 싱글톤 인스턴스
+_instagram_stats_cache: Optional[InstagramStatsCache] = None
+
+
+def get_instagram_stats_cache() -> InstagramStatsCache:
+    """인스타그램 통계 캐시 싱글톤 인스턴스 반환"""
+    global _instagram_stats_cache
+    if _instagram_stats_cache is None:
+        _instagram_stats_cache = InstagramStatsCache()
+    return _instagram_stats_cache
@@ -275,10 +275,11 @@ class IntegratedImageGenerationService:
         """S3에 이미지 저장"""
         try:
             import aiohttp
+            from app.core.http_clients import pooled_aiohttp_session
             
             # 이미지 다운로드
-            async with aiohttp.ClientSession() as session:
-                async with session.get(image_url) as response:
+            async with pooled_aiohttp_session("runpod_pod") as session:
+                async with session.get(image_url, timeout=aiohttp.ClientTimeout(total=60)) as response:
                     if response.status == 200:
                         image_data = await response.read()
                         
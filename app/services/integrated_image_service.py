@@ -20,6 +20,7 @@ from .s3_service import get_s3_service
 from app.models.image_generation import ImageGenerationRequest as ImageGenerationModel
 from app.database import get_db
 from app.core.config import settings
+from app.core.http_clients import pooled_aiohttp_session
 from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
@@ -230,8 +231,8 @@ class IntegratedImageGenerationService:
             
             # URL인 경우 (ComfyUI 서버에서 다운로드)
             elif image_data.startswith('http'):
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(image_data) as response:
+                async with pooled_aiohttp_session("runpod_pod") as session:
+                    async with session.get(image_data, timeout=aiohttp.ClientTimeout(total=60)) as response:
                         if response.status == 200:
                             return await response.read()
                         else:
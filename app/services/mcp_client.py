@@ -14,6 +14,7 @@ from langchain_mcp_adapters.client import MultiServerMCPClient
 from langchain_mcp_adapters.tools import load_mcp_tools
 import time
 from .mcp_tools_metadata import MCPToolMetadataExtractor
+from app.core.http_clients import build_http_client
 
 # 로깅 설정
 logging.basicConfig(
@@ -256,7 +257,7 @@ class MCPClientService:
 
             try:
                 # HTTP 클라이언트 생성
-                client = httpx.AsyncClient(base_url=server_url, timeout=30.0)
+                client = build_http_client("mcp", base_url=server_url)
                 self.clients[server_name] = client
                 logger.info(f"MCP HTTP 클라이언트 '{server_name}' 생성 완료")
 
@@ -0,0 +1,248 @@
+"""
+비동기 오브젝트 스토리지(S3) 백엔드
+boto3 호출을 전용 스레드 풀에서 실행하여 이벤트 루프를 막지 않도록 함
+- 큰 파일은 TransferConfig 기반 멀티파트 병렬 업로드
+- 청크 단위 스트리밍 다운로드
+- delete_objects 일괄 삭제 (요청당 최대 1000개)
+- S3_ENDPOINT_URL 지정 시 MinIO/moto 등 S3 호환 서버 사용
+"""
+
+import io
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+
+from app.core.config import settings
+from app.core.metrics import instrument_boto3_client
+
+logger = logging.getLogger(__name__)
+
+# delete_objects 요청당 최대 키 수 (S3 제한)
+DELETE_BATCH_SIZE = 1000
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_s3_executor() -> ThreadPoolExecutor:
+    """S3 작업 전용 스레드 풀 반환 (기본 executor와 분리하여 다른 작업을 굶기지 않음)"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.S3_MAX_WORKERS, thread_name_prefix="s3-io"
+        )
+    return _executor
+
+
+async def run_in_s3_executor(func: Callable, *args: Any, **kwargs: Any) -> Any:
+    """블로킹 boto3 호출을 S3 스레드 풀에서 실행"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_s3_executor(), partial(func, *args, **kwargs))
+
+
+def get_transfer_config() -> TransferConfig:
+    """멀티파트 업로드 설정"""
+    return TransferConfig(
+        multipart_threshold=settings.S3_MULTIPART_THRESHOLD,
+        multipart_chunksize=settings.S3_MULTIPART_CHUNKSIZE,
+        max_concurrency=settings.S3_MULTIPART_CONCURRENCY,
+        use_threads=True,
+    )
+
+
+def create_s3_client(
+    aws_access_key_id: Optional[str] = None,
+    aws_secret_access_key: Optional[str] = None,
+    region_name: Optional[str] = None,
+):
+    """boto3 S3 클라이언트 생성 (커넥션 풀을 스레드 풀 크기에 맞춤)"""
+    options: Dict[str, Any] = {
+        "aws_access_key_id": aws_access_key_id or settings.AWS_ACCESS_KEY_ID,
+        "aws_secret_access_key": aws_secret_access_key or settings.AWS_SECRET_ACCESS_KEY,
+        "region_name": region_name or settings.AWS_REGION,
+        "config": Config(
+            max_pool_connections=max(
+                settings.S3_MAX_WORKERS,
+                settings.S3_MULTIPART_CONCURRENCY * 2,
+            ),
+            retries={"max_attempts": 3, "mode": "standard"},
+        ),
+    }
+    if settings.S3_ENDPOINT_URL:
+        options["endpoint_url"] = settings.S3_ENDPOINT_URL
+    return instrument_boto3_client(boto3.client("s3", **options))
+
+
+class AsyncObjectStorage:
+    """boto3 S3 클라이언트를 감싼 비동기 인터페이스"""
+
+    def __init__(self, s3_client, bucket_name: str):
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+
+    async def put_object(
+        self,
+        key: str,
+        data: bytes,
+        content_type: str = "application/octet-stream",
+        **extra_args: Any,
+    ) -> None:
+        """바이트 데이터 업로드 (임계값 이상이면 멀티파트 병렬 업로드)"""
+        if len(data) >= settings.S3_MULTIPART_THRESHOLD:
+            await run_in_s3_executor(
+                self.s3_client.upload_fileobj,
+                io.BytesIO(data),
+                self.bucket_name,
+                key,
+                ExtraArgs={"ContentType": content_type, **extra_args},
+                Config=get_transfer_config(),
+            )
+            return
+
+        await run_in_s3_executor(
+            self.s3_client.put_object,
+            Bucket=self.bucket_name,
+            Key=key,
+            Body=data,
+            ContentType=content_type,
+            **extra_args,
+        )
+
+    async def upload_file(
+        self, local_file_path: str, key: str, content_type: str = "application/octet-stream"
+    ) -> None:
+        """로컬 파일 업로드 (큰 파일은 멀티파트)"""
+        await run_in_s3_executor(
+            self.s3_client.upload_file,
+            local_file_path,
+            self.bucket_name,
+            key,
+            ExtraArgs={"ContentType": content_type},
+            Config=get_transfer_config(),
+        )
+
+    async def get_object_bytes(self, key: str) -> bytes:
+        """객체 전체 다운로드"""
+
+        def download() -> bytes:
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
+            return response["Body"].read()
+
+        return await run_in_s3_executor(download)
+
+    async def open_object(
+        self,
+        key: str,
+        byte_range: Optional[str] = None,
+        chunk_size: int = 1024 * 1024,
+        if_none_match: Optional[str] = None,
+        if_modified_since: Optional[Any] = None,
+    ) -> Tuple[Dict[str, Any], AsyncIterator[bytes]]:
+        """객체를 스트리밍으로 열기
+
+        Args:
+            key: S3 키
+            byte_range: HTTP Range 헤더 값 (예: "bytes=0-1023")
+            chunk_size: 청크 크기
+            if_none_match: ETag 조건 (일치하면 ClientError 304)
+            if_modified_since: 수정 시각 조건 (변경 없으면 ClientError 304)
+
+        Returns:
+            (get_object 응답 메타데이터, 바이트 청크 async iterator)
+        """
+        params = {"Bucket": self.bucket_name, "Key": key}
+        if byte_range:
+            params["Range"] = byte_range
+        if if_none_match:
+            params["IfNoneMatch"] = if_none_match
+        if if_modified_since:
+            params["IfModifiedSince"] = if_modified_since
+        response = await run_in_s3_executor(self.s3_client.get_object, **params)
+        body = response.pop("Body")
+
+        async def iterate() -> AsyncIterator[bytes]:
+            try:
+                while True:
+                    chunk = await run_in_s3_executor(body.read, chunk_size)
+                    if not chunk:
+                        break
+                    yield chunk
+            finally:
+                body.close()
+
+        return response, iterate()
+
+    async def head_object(self, key: str, if_none_match: Optional[str] = None) -> Dict[str, Any]:
+        """객체 메타데이터 조회 (if_none_match ETag와 일치하면 ClientError 304)"""
+        params = {"Bucket": self.bucket_name, "Key": key}
+        if if_none_match:
+            params["IfNoneMatch"] = if_none_match
+        return await run_in_s3_executor(self.s3_client.head_object, **params)
+
+    async def head_bucket(self) -> None:
+        """버킷 접근 가능 여부 확인 (실패 시 ClientError)"""
+        await run_in_s3_executor(self.s3_client.head_bucket, Bucket=self.bucket_name)
+
+    async def list_objects(
+        self, prefix: str, max_keys: Optional[int] = 1000
+    ) -> List[Dict[str, Any]]:
+        """prefix 하위 객체 목록 조회 (페이지네이션 처리, max_keys=None이면 전체)"""
+
+        def list_all() -> List[Dict[str, Any]]:
+            objects: List[Dict[str, Any]] = []
+            paginator = self.s3_client.get_paginator("list_objects_v2")
+            page_size = min(max_keys, 1000) if max_keys else 1000
+            for page in paginator.paginate(
+                Bucket=self.bucket_name,
+                Prefix=prefix,
+                PaginationConfig={"PageSize": page_size},
+            ):
+                objects.extend(page.get("Contents", []))
+                if max_keys and len(objects) >= max_keys:
+                    return objects[:max_keys]
+            return objects
+
+        return await run_in_s3_executor(list_all)
+
+    async def delete_object(self, key: str) -> None:
+        """객체 하나 삭제"""
+        await run_in_s3_executor(
+            self.s3_client.delete_object, Bucket=self.bucket_name, Key=key
+        )
+
+    async def delete_objects(self, keys: List[str]) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """여러 객체 일괄 삭제
+
+        Returns:
+            (삭제된 키 목록, 실패 정보 목록)
+        """
+        deleted: List[str] = []
+        errors: List[Dict[str, Any]] = []
+        batches = [
+            keys[start:start + DELETE_BATCH_SIZE]
+            for start in range(0, len(keys), DELETE_BATCH_SIZE)
+        ]
+
+        responses = await asyncio.gather(
+            *(
+                run_in_s3_executor(
+                    self.s3_client.delete_objects,
+                    Bucket=self.bucket_name,
+                    Delete={
+                        "Objects": [{"Key": key} for key in batch],
+                        "Quiet": False,
+                    },
+                )
+                for batch in batches
+            )
+        )
+        for response in responses:
+            deleted.extend(item["Key"] for item in response.get("Deleted", []))
+            errors.extend(response.get("Errors", []))
+
+        return deleted, errors
@@ -17,6 +17,8 @@ import logging
 from app.models.pod_session import PodSession
 from app.services.runpod_service import get_runpod_service
 from app.services.comfyui_service import ComfyUIService
+from app.services.session_state_bus import get_session_state_bus
+from app.services.warm_pod_pool import get_warm_pod_pool
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -33,6 +35,7 @@ class PodSessionManager:
     def __init__(self):
         self.runpod_service = get_runpod_service()
         self.active_sessions: Dict[str, PodSession] = {}  # user_id -> session
+        self.state_bus = get_session_state_bus()
         
         # 백그라운드 타스크 관리
         self._cleanup_task = None
@@ -40,6 +43,23 @@ class PodSessionManager:
         
         logger.info("PodSessionManager initialized")
     
+    def _publish_session(self, session: PodSession, source: str):
+        """세션 상태 전이를 상태 버스로 발행 (WebSocket 세션 상태 형식으로 변환)"""
+        session_status = getattr(session.session_status, "value", session.session_status)
+        if session_status == "terminated":
+            self.state_bus.publish(session.user_id, None, source)
+            return
+        
+        self.state_bus.publish(session.user_id, {
+            "pod_id": session.pod_id,
+            # input_waiting/idle은 이미지 생성 가능 상태
+            "pod_status": "processing" if session_status == "processing" else "ready",
+            "session_created_at": session.created_at,
+            "session_expires_at": session.input_deadline,
+            "processing_expires_at": session.processing_deadline,
+            "total_generations": session.total_generations,
+        }, source)
+    
     async def start_background_tasks(self):
         """백그라운드 정리 작업 시작"""
         if not self._is_running:
@@ -119,6 +139,7 @@ class PodSessionManager:
             
             await db.commit()
             await db.refresh(session)
+            self._publish_session(session, "start_image_generation")
             
             logger.info(f"Started image generation for session {session.session_id}, deadline: {processing_deadline}")
             return session
@@ -146,6 +167,7 @@ class PodSessionManager:
             session.total_generations += 1
             
             await db.commit()
+            self._publish_session(session, "extend_processing_timeout")
             
             logger.info(f"Extended processing timeout for session {session.session_id}, new deadline: {new_deadline}")
             return True
@@ -171,6 +193,7 @@ class PodSessionManager:
             session.last_activity_at = datetime.now(timezone.utc)
             
             await db.commit()
+            self._publish_session(session, "complete_image_generation")
             
             logger.info(f"Completed image generation for session {session.session_id}")
             return True
@@ -199,17 +222,21 @@ class PodSessionManager:
         try:
             session_id = str(uuid.uuid4())
             
-            # RunPod 인스턴스 생성
-            logger.info(f"Creating RunPod instance for session {session_id}")
-            pod_response = await self.runpod_service.create_pod(f"session_{session_id}")
-            
-            if pod_response.status != "RUNNING":
-                logger.info(f"Waiting for RunPod instance {pod_response.pod_id} to start...")
-                await self._wait_for_pod_ready(pod_response.pod_id)
+            # 웜 풀에 준비된 Pod이 있으면 사용, 없으면 RunPod 인스턴스 생성
+            pod_response = get_warm_pod_pool().lease(user_id)
+            if pod_response is not None:
+                logger.info(f"Leased warm RunPod instance {pod_response.pod_id} for session {session_id}")
+            else:
+                logger.info(f"Creating RunPod instance for session {session_id}")
+                pod_response = await self.runpod_service.create_pod(f"session_{session_id}")
                 
-                # Pod 정보 다시 조회
-                pod_info = await self.runpod_service.get_pod_status(pod_response.pod_id)
-                pod_response = pod_info
+                if pod_response.status != "RUNNING":
+                    logger.info(f"Waiting for RunPod instance {pod_response.pod_id} to start...")
+                    await self._wait_for_pod_ready(pod_response.pod_id)
+                    
+                    # Pod 정보 다시 조회
+                    pod_info = await self.runpod_service.get_pod_status(pod_response.pod_id)
+                    pod_response = pod_info
             
             # 세션 생성
             now = datetime.now(timezone.utc)
@@ -234,6 +261,7 @@ class PodSessionManager:
             db.add(session)
             await db.commit()
             await db.refresh(session)
+            self._publish_session(session, "create_session")
             
             # ComfyUI 서버 준비 대기
             if pod_response.endpoint_url:
@@ -248,15 +276,16 @@ class PodSessionManager:
     async def _terminate_session(self, session: PodSession, db: AsyncSession):
         """세션 종료"""
         try:
-            # RunPod 인스턴스 종료
+            # RunPod 인스턴스 반환 (웜 풀 재사용 또는 종료)
             if session.pod_id:
-                await self.runpod_service.terminate_pod(session.pod_id)
+                await get_warm_pod_pool().release_pod(session.pod_id)
             
             # 세션 상태 업데이트
             session.session_status = "terminated"
             session.terminated_at = datetime.now(timezone.utc)
             
             await db.commit()
+            self._publish_session(session, "terminate_session")
             
             logger.info(f"Terminated session {session.session_id}")
             
@@ -294,13 +323,16 @@ class PodSessionManager:
         logger.info(f"Waiting for ComfyUI server to be ready at {comfyui_url}")
         import time
         import aiohttp
+        from app.core.http_clients import pooled_aiohttp_session
         
         start_time = time.time()
         
         while time.time() - start_time < max_wait_time:
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(f"{comfyui_url}/system_stats", timeout=15) as response:
+                async with pooled_aiohttp_session("runpod_pod") as session:
+                    async with session.get(
+                        f"{comfyui_url}/system_stats", timeout=aiohttp.ClientTimeout(total=15)
+                    ) as response:
                         if response.status == 200:
                             logger.info(f"ComfyUI server is ready at {comfyui_url}")
                             return
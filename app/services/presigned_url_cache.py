@@ -0,0 +1,123 @@
+"""
+Presigned URL 공유 캐시
+S3Service와 S3ImageService가 함께 사용하는 크기 제한 LRU 캐시
+- (버킷, 키, 만료 시간)별로 URL 보관
+- URL 만료 전에 여유 시간을 두고 캐시에서 제거
+- 적중/미스/제거 지표 제공
+"""
+
+import time
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, str, int]
+
+
+class PresignedURLCache:
+    """presigned URL LRU 캐시 (스레드 안전)"""
+
+    # URL 만료 전 캐시에서 내리는 여유 시간 (초, 만료 시간의 10%를 넘지 않음)
+    SAFETY_MARGIN = 300
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = max_entries or settings.PRESIGNED_URL_CACHE_SIZE
+        self._entries: "OrderedDict[CacheKey, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def _valid_for(self, expiration: int) -> float:
+        return expiration - min(self.SAFETY_MARGIN, expiration * 0.1)
+
+    def get(self, bucket: str, key: str, expiration: int) -> Optional[str]:
+        """캐시된 URL 반환 (없거나 만료 임박이면 None)"""
+        cache_key = (bucket, key, expiration)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            url, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[cache_key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(cache_key)
+            self._hits += 1
+            return url
+
+    def put(self, bucket: str, key: str, expiration: int, url: str) -> None:
+        """URL 저장 (용량 초과 시 가장 오래 사용하지 않은 항목 제거)"""
+        cache_key = (bucket, key, expiration)
+        expires_at = time.monotonic() + self._valid_for(expiration)
+        with self._lock:
+            self._entries[cache_key] = (url, expires_at)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def get_or_create(
+        self,
+        bucket: str,
+        key: str,
+        expiration: int,
+        factory: Callable[[], Optional[str]],
+    ) -> Optional[str]:
+        """캐시 조회 후 없으면 factory로 생성하여 저장"""
+        url = self.get(bucket, key, expiration)
+        if url is not None:
+            return url
+
+        url = factory()
+        if url:
+            self.put(bucket, key, expiration, url)
+        return url
+
+    def invalidate(self, bucket: str, key: str) -> None:
+        """특정 키의 모든 만료 시간 항목 제거 (객체 삭제/교체 시)"""
+        with self._lock:
+            for cache_key in [k for k in self._entries if k[0] == bucket and k[1] == key]:
+                del self._entries[cache_key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict:
+        """캐시 지표 반환"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "cache_size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / lookups, 3) if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
+
+
+# 싱글톤 인스턴스
+_presigned_url_cache: Optional[PresignedURLCache] = None
+
+
+def get_presigned_url_cache() -> PresignedURLCache:
+    """presigned URL 캐시 싱글톤 인스턴스 반환"""
+    global _presigned_url_cache
+    if _presigned_url_cache is None:
+        _presigned_url_cache = PresignedURLCache()
+    return _presigned_url_cache
@@ -14,6 +14,7 @@ from openai import OpenAI
 
 from app.schemas.qa_generation import CharacterProfile, Gender
 from app.core.encryption import decrypt_sensitive_data
+from app.services.qa_result_pipeline import QAPipelineStats, download_openai_file, iter_jsonl
 
 logger = logging.getLogger(__name__)
 
@@ -332,27 +333,24 @@ class QAGenerationService:
         if not self.openai_client:
             raise Exception("OpenAI 클라이언트가 초기화되지 않았습니다")
         
-        # 결과 파일 다운로드
-        file_response = self.openai_client.files.content(output_file_id)
-        
-        # 임시 파일에 저장
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False) as tmp_file:
-            tmp_file.write(file_response.text)
+        # 임시 파일 경로 확보
+        with tempfile.NamedTemporaryFile(suffix='.jsonl', delete=False) as tmp_file:
             tmp_file_path = tmp_file.name
         
         try:
+            # 결과 파일을 청크 단위로 다운로드 (전체 응답을 메모리에 올리지 않음)
+            stats = QAPipelineStats()
+            await asyncio.to_thread(
+                download_openai_file, self.openai_client, output_file_id, tmp_file_path, stats
+            )
+            
             # 결과 파싱
             qa_pairs = []
             errors = []
             
             with open(tmp_file_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    if not line.strip():
-                        continue
-                    
+                for result in iter_jsonl(f, stats):
                     try:
-                        result = json.loads(line)
-                        
                         # 성공적인 응답 처리
                         if result.get("response") and result["response"].get("body"):
                             choices = result["response"]["body"].get("choices", [])
@@ -374,9 +372,10 @@ class QAGenerationService:
                                 "error": result["error"]
                             })
                     
-                    except json.JSONDecodeError:
-                        logger.error(f"라인 파싱 실패: {line[:100]}...")
+                    except (AttributeError, TypeError):
+                        logger.error(f"라인 형식 오류: {str(result)[:100]}...")
             
+            stats.log_summary(batch_id)
             logger.info(f"✅ 배치 결과 처리 완료: {len(qa_pairs)}개 QA, {len(errors)}개 에러")
             
             return {
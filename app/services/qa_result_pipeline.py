@@ -0,0 +1,323 @@
+"""
+QA 배치 결과 스트리밍 파이프라인
+OpenAI 배치 결과와 S3 QA 파일을 한 줄씩 처리하여 메모리 사용량을 일정하게 유지
+- 다운로드: 결과 파일을 청크 단위로 임시 파일에 기록
+- 파싱/검증/중복 제거: 이터레이터로 한 건씩 처리
+- 기록: 처리된 QA를 파일에 스트리밍 기록 (이후 멀티파트 업로드)
+- 처리된 QA 파일 읽기: {"qa_pairs": [...]} 배열을 전체 json.load 없이 한 건씩 파싱
+- 단계별 처리량 지표 수집
+"""
+
+import re
+import json
+import time
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, IO, Iterable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# 다운로드/읽기 청크 크기
+CHUNK_SIZE = 1024 * 1024
+
+# 처리된 QA 파일 읽기 청크 크기 (문자 단위, 한글은 문자당 2바이트 이상으로 디코딩되므로 작게 유지)
+TEXT_CHUNK_SIZE = 64 * 1024
+
+# 처리된 QA 파일에서 "qa_pairs" 키를 찾을 최대 범위 (헤더 필드 뒤에 바로 위치)
+QA_PAIRS_KEY_SEARCH_LIMIT = 64 * 1024
+
+# 파이프라인 단계 순서 (지표 출력용)
+STAGE_ORDER = ("download", "read", "parse", "write", "upload")
+
+
+@dataclass
+class StageStats:
+    """파이프라인 단계별 처리 지표"""
+
+    items: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "items": self.items,
+            "bytes": self.bytes,
+            "seconds": round(self.seconds, 4),
+            "items_per_sec": round(self.items / self.seconds, 1) if self.seconds else None,
+            "mb_per_sec": round(self.bytes / self.seconds / 1024 / 1024, 2) if self.seconds and self.bytes else None,
+        }
+
+
+@dataclass
+class QAPipelineStats:
+    """QA 결과 파이프라인 지표 (단계별 처리량 + 검증/중복 제거 건수)"""
+
+    stages: Dict[str, StageStats] = field(default_factory=dict)
+    invalid_lines: int = 0
+    failed_responses: int = 0
+    unparsed: int = 0
+    duplicates: int = 0
+
+    def stage(self, name: str) -> StageStats:
+        if name not in self.stages:
+            self.stages[name] = StageStats()
+        return self.stages[name]
+
+    def _ordered_stages(self):
+        return sorted(
+            self.stages.items(),
+            key=lambda item: STAGE_ORDER.index(item[0]) if item[0] in STAGE_ORDER else len(STAGE_ORDER),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "stages": {name: stats.to_dict() for name, stats in self._ordered_stages()},
+            "invalid_lines": self.invalid_lines,
+            "failed_responses": self.failed_responses,
+            "unparsed": self.unparsed,
+            "duplicates": self.duplicates,
+        }
+
+    def log_summary(self, label: str):
+        summary = ", ".join(
+            f"{name} {stats.items}건/{stats.seconds:.2f}s" for name, stats in self._ordered_stages()
+        )
+        logger.info(
+            f"📈 QA 파이프라인 완료 ({label}): {summary} "
+            f"(중복 {self.duplicates}, 파싱 실패 {self.unparsed}, 응답 실패 {self.failed_responses}, "
+            f"잘못된 줄 {self.invalid_lines})"
+        )
+
+
+def download_openai_file(
+    client, file_id: str, dest_path: str, stats: Optional[QAPipelineStats] = None
+) -> int:
+    """OpenAI 파일을 전체 응답을 메모리에 올리지 않고 청크 단위로 저장
+
+    Returns:
+        int: 저장한 바이트 수
+    """
+    stage = (stats or QAPipelineStats()).stage("download")
+    started = time.perf_counter()
+    written = 0
+
+    with client.files.with_streaming_response.content(file_id) as response:
+        with open(dest_path, "wb") as f:
+            for chunk in response.iter_bytes(CHUNK_SIZE):
+                f.write(chunk)
+                written += len(chunk)
+
+    stage.bytes += written
+    stage.items += 1
+    stage.seconds += time.perf_counter() - started
+    return written
+
+
+def iter_jsonl(
+    source: Iterable, stats: Optional[QAPipelineStats] = None
+) -> Iterator[Any]:
+    """JSONL 줄 단위 파싱 (파일 객체 또는 줄 이터러블, 잘못된 줄은 건너뜀)"""
+    stats = stats or QAPipelineStats()
+    stage = stats.stage("read")
+
+    for line in source:
+        started = time.perf_counter()
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        stage.bytes += len(line)
+
+        if not line.strip():
+            stage.seconds += time.perf_counter() - started
+            continue
+
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            stats.invalid_lines += 1
+            stage.seconds += time.perf_counter() - started
+            logger.warning(f"JSONL 라인 파싱 실패 (건너뜀): {line[:100]}...")
+            continue
+
+        stage.items += 1
+        stage.seconds += time.perf_counter() - started
+        yield record
+
+
+def parse_qa_content(content: str) -> Optional[Dict[str, str]]:
+    """모델 응답 본문에서 QA 쌍 추출 ({"q", "a"} JSON 또는 Q:/A: 형식)"""
+    content = content.strip()
+
+    try:
+        qa_data = json.loads(content)
+        if isinstance(qa_data, dict) and "q" in qa_data and "a" in qa_data:
+            return {"question": qa_data["q"], "answer": qa_data["a"]}
+    except json.JSONDecodeError:
+        # JSON 파싱 실패 시 기존 방식으로 폴백
+        pass
+
+    if "Q:" in content and "A:" in content:
+        parts = content.split("A:", 1)
+        if len(parts) == 2:
+            return {"question": parts[0].replace("Q:", "").strip(), "answer": parts[1].strip()}
+
+    return None
+
+
+def _response_content(result: Dict) -> Optional[str]:
+    """배치 결과 한 줄에서 모델 응답 본문 추출"""
+    response = result.get("response") or {}
+    if response.get("status_code") != 200:
+        return None
+    try:
+        return response["body"]["choices"][0]["message"]["content"]
+    except (KeyError, IndexError, TypeError):
+        return None
+
+
+def _is_valid_pair(question: Any, answer: Any) -> bool:
+    return isinstance(question, str) and isinstance(answer, str) and bool(question.strip()) and bool(answer.strip())
+
+
+def iter_batch_qa_pairs(
+    results: Iterable[Dict], stats: Optional[QAPipelineStats] = None
+) -> Iterator[Dict[str, Any]]:
+    """배치 결과에서 QA 쌍을 파싱/검증/중복 제거하여 하나씩 반환
+
+    중복 판단은 정규화한 (질문, 답변)의 다이제스트만 보관하므로 결과 전체를 메모리에 두지 않음
+    """
+    stats = stats or QAPipelineStats()
+    stage = stats.stage("parse")
+    seen = set()
+
+    for result in results:
+        started = time.perf_counter()
+        content = _response_content(result) if isinstance(result, dict) else None
+        if content is None:
+            stats.failed_responses += 1
+            stage.seconds += time.perf_counter() - started
+            continue
+
+        qa_pair = parse_qa_content(content)
+        if not qa_pair or not _is_valid_pair(qa_pair["question"], qa_pair["answer"]):
+            stats.unparsed += 1
+            stage.seconds += time.perf_counter() - started
+            logger.warning(f"QA 파싱 실패 - 컨텐츠: {content[:100]}...")
+            continue
+
+        digest = hashlib.sha1(
+            f"{' '.join(qa_pair['question'].split())}\x00{' '.join(qa_pair['answer'].split())}".encode("utf-8")
+        ).digest()
+        if digest in seen:
+            stats.duplicates += 1
+            stage.seconds += time.perf_counter() - started
+            continue
+        seen.add(digest)
+
+        qa_pair["custom_id"] = result.get("custom_id")
+        stage.items += 1
+        stage.seconds += time.perf_counter() - started
+        yield qa_pair
+
+
+def write_qa_json(
+    qa_pairs: Iterable[Dict], f: IO[str], header: Dict[str, Any], stats: Optional[QAPipelineStats] = None
+) -> int:
+    """처리된 QA 쌍을 {"...header", "qa_pairs": [...], "total_qa_pairs": N} JSON으로 스트리밍 기록
+
+    QA 쌍은 한 줄에 하나씩 기록하며 총 개수는 마지막에 기록
+
+    Returns:
+        int: 기록한 QA 쌍 수
+    """
+    stage = (stats or QAPipelineStats()).stage("write")
+    started = time.perf_counter()
+
+    prefix = json.dumps(header, ensure_ascii=False)[:-1]
+    opening = f'{prefix}, "qa_pairs": [\n' if header else '{"qa_pairs": [\n'
+    f.write(opening)
+    stage.bytes += len(opening)
+    stage.seconds += time.perf_counter() - started
+
+    count = 0
+    for qa_pair in qa_pairs:
+        started = time.perf_counter()
+        line = ("" if count == 0 else ",\n") + json.dumps(qa_pair, ensure_ascii=False)
+        f.write(line)
+        count += 1
+        stage.items += 1
+        stage.bytes += len(line)
+        stage.seconds += time.perf_counter() - started
+
+    started = time.perf_counter()
+    closing = f'\n], "total_qa_pairs": {count}}}\n'
+    f.write(closing)
+    stage.bytes += len(closing)
+    stage.seconds += time.perf_counter() - started
+    return count
+
+
+_QA_PAIRS_KEY = re.compile(r'"qa_pairs"\s*:\s*\[')
+_SEPARATOR = re.compile(r'[\s,]*')
+_JSON_DECODER = json.JSONDecoder()
+
+
+def iter_processed_qa_json(
+    f: IO[str], stats: Optional[QAPipelineStats] = None, chunk_size: int = TEXT_CHUNK_SIZE
+) -> Optional[Iterator[Dict[str, Any]]]:
+    """처리된 QA 파일({..., "qa_pairs": [...]})의 QA 쌍을 청크 단위로 읽으며 하나씩 반환
+
+    파일 앞부분(QA_PAIRS_KEY_SEARCH_LIMIT)에 "qa_pairs" 배열이 없으면 처리된 QA 형식이 아니므로 None
+    (호출 측에서 JSONL로 다시 읽음). 메모리에는 현재 청크와 파싱 중인 QA 쌍 하나만 유지
+    """
+    stage = (stats or QAPipelineStats()).stage("read")
+    started = time.perf_counter()
+
+    buffer = ""
+    match = None
+    while match is None and len(buffer) < QA_PAIRS_KEY_SEARCH_LIMIT:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+        buffer += chunk
+        stage.bytes += len(chunk)
+        match = _QA_PAIRS_KEY.search(buffer)
+    stage.seconds += time.perf_counter() - started
+    if match is None:
+        return None
+
+    def iterate() -> Iterator[Dict[str, Any]]:
+        # buffer[pos:]가 아직 처리하지 않은 부분 (청크를 더 읽을 때만 앞부분을 잘라냄)
+        text, pos = buffer, match.end()
+        eof = False
+        while True:
+            started = time.perf_counter()
+            pos = _SEPARATOR.match(text, pos).end()
+            if pos >= len(text) and not eof:
+                chunk = f.read(chunk_size)
+                stage.bytes += len(chunk)
+                eof = not chunk
+                text, pos = chunk, 0
+                stage.seconds += time.perf_counter() - started
+                continue
+            if pos >= len(text) or text[pos] == "]":
+                stage.seconds += time.perf_counter() - started
+                return
+
+            try:
+                item, pos = _JSON_DECODER.raw_decode(text, pos)
+            except json.JSONDecodeError:
+                # QA 쌍이 청크 경계에 걸친 경우 다음 청크를 이어 붙여 재시도
+                chunk = "" if eof else f.read(chunk_size)
+                stage.seconds += time.perf_counter() - started
+                if not chunk:
+                    raise
+                stage.bytes += len(chunk)
+                text, pos = text[pos:] + chunk, 0
+                continue
+
+            stage.items += 1
+            stage.seconds += time.perf_counter() - started
+            yield item
+
+    return iterate()
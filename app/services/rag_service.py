@@ -17,6 +17,7 @@ from app.database import get_db
 from app.models.user import HFTokenManage
 from app.core.encryption import decrypt_sensitive_data
 from app.core.config import settings
+from app.core.http_clients import pooled_client
 from app.services.embedding_client import VLLMEmbeddingClient, generate_embeddings
 from app.services.runpod_manager import get_vllm_manager
 
@@ -184,8 +185,6 @@ class RAGVectorStore:
         try:
             logger.info(f"💾 vLLM 서버 벡터DB 저장 시작: {len(qa_data)}개")
 
-            import httpx
-
             # QA 쌍을 DocumentChunk 형식으로 변환
             documents = []
             for i, qa in enumerate(qa_data):
@@ -219,7 +218,7 @@ class RAGVectorStore:
             logger.info(f"🔗 vLLM 서버 URL: {vllm_url}")
             logger.info(f"📊 저장할 문서 수: {len(documents)}개")
 
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with pooled_client("vllm") as client:
                 logger.info(
                     f"📤 vLLM 서버로 요청 전송: {vllm_url}/vector-db/embed-and-store"
                 )
@@ -248,12 +247,10 @@ class RAGVectorStore:
     ) -> List[Dict]:
         """vLLM 서버의 Milvus 벡터DB에서 유사한 문서 검색"""
         try:
-            import httpx
-
             # vLLM 서버의 벡터 검색 API 호출
             vllm_url = settings.VLLM_BASE_URL or "http://localhost:8001"
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client("vllm") as client:
                 # score_threshold 설정 (파라미터 우선, 기본값 사용)
                 if score_threshold is None:
                     score_threshold = getattr(self.config, "score_threshold", 0.3)
@@ -268,6 +265,7 @@ class RAGVectorStore:
                         "top_k": top_k,
                         "score_threshold": score_threshold,
                     },
+                    timeout=30.0,
                 )
 
                 if response.status_code == 200:
@@ -4,12 +4,14 @@ RunPod Endpoint Manager
 """
 
 import os
-import httpx
 import logging
 from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
+from datetime import datetime
 import asyncio
 
+from app.core.http_clients import pooled_client
+from app.services.runpod_endpoint_registry import get_endpoint_registry
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,10 +33,9 @@ class RunPodEndpointManager:
         self.graphql_url = "https://api.runpod.io/graphql"
         self.base_url = "https://api.runpod.ai/v2"
         
-        # 엔드포인트 캐시 (타입: endpoint_id)
+        # 엔드포인트 캐시 (타입: endpoint_id) - 공유 레지스트리 목록에서 파생
         self._endpoint_cache: Dict[str, str] = {}
-        self._cache_timestamp: Optional[datetime] = None
-        self._cache_duration = timedelta(minutes=30)  # 30분 캐시
+        self._cache_fetched_at: float = 0.0
         
     @property
     def headers(self) -> Dict[str, str]:
@@ -53,105 +54,57 @@ class RunPodEndpointManager:
         Returns:
             Dict[str, str]: {endpoint_type: endpoint_id} 매핑
         """
-        # 캐시 확인
-        if not force_refresh and self._cache_timestamp:
-            if datetime.now() - self._cache_timestamp < self._cache_duration:
-                logger.info("📦 캐시된 엔드포인트 사용")
-                return self._endpoint_cache
-        
-        logger.info("🔍 RunPod 엔드포인트 검색 시작...")
+        registry = get_endpoint_registry()
         
-        query = """
-        query {
-            myself {
-                serverlessDiscount {
-                    discountedPrice
-                }
-                endpoints {
-                    id
-                    name
-                    templateId
-                    workersMin
-                    workersMax
-                    status
-                    gpuIds
-                    locations
-                    networkVolumeId
-                    template {
-                        id
-                        name
-                        imageName
-                        containerDiskInGb
-                        volumeInGb
-                        volumeMountPath
-                        env {
-                            key
-                            value
-                        }
-                    }
-                }
-            }
-        }
-        """
+        # 레지스트리 목록이 갱신되지 않았으면 기존 매핑 재사용
+        if not force_refresh and registry.is_fresh() and self._cache_fetched_at == registry.fetched_at:
+            return self._endpoint_cache
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.graphql_url,
-                    json={"query": query},
-                    headers=self.headers,
-                    timeout=30.0
-                )
-                
-                if response.status_code != 200:
-                    logger.error(f"❌ GraphQL 오류: {response.status_code} - {response.text}")
-                    raise Exception(f"GraphQL 오류: {response.status_code}")
-                
-                data = response.json()
-                endpoints = data.get("data", {}).get("myself", {}).get("endpoints", [])
-                
-                # 엔드포인트 매핑
-                endpoint_mapping = {}
-                
-                for endpoint in endpoints:
-                    template = endpoint.get("template", {})
-                    image_name = template.get("imageName", "")
-                    
-                    # Docker 이미지로 엔드포인트 타입 판별
-                    endpoint_type = None
-                    for docker_image, ep_type in self.DOCKER_IMAGE_MAPPING.items():
-                        if docker_image in image_name:
-                            endpoint_type = ep_type
-                            break
-                    
-                    if endpoint_type:
-                        endpoint_mapping[endpoint_type] = endpoint["id"]
-                        logger.info(f"✅ {endpoint_type} 엔드포인트 발견: {endpoint['id']}")
-                        logger.info(f"   - 이름: {endpoint['name']}")
-                        logger.info(f"   - 상태: {endpoint['status']}")
-                        logger.info(f"   - Docker 이미지: {image_name}")
-                        logger.info(f"   - GPU: {endpoint.get('gpuIds', 'N/A')}")
-                        logger.info(f"   - Workers: {endpoint['workersMin']}-{endpoint['workersMax']}")
-                
-                # 캐시 업데이트
-                self._endpoint_cache = endpoint_mapping
-                self._cache_timestamp = datetime.now()
-                
-                # 환경 변수로도 설정 (다른 서비스에서 사용할 수 있도록)
-                for ep_type, ep_id in endpoint_mapping.items():
-                    env_key = f"RUNPOD_{ep_type.upper()}_ENDPOINT_ID"
-                    os.environ[env_key] = ep_id
-                    logger.info(f"💾 환경 변수 설정: {env_key}={ep_id}")
-                
-                return endpoint_mapping
-                
+            endpoints = await registry.get_endpoints(force_refresh=force_refresh)
         except Exception as e:
             logger.error(f"❌ 엔드포인트 검색 실패: {e}")
-            # 캐시가 있으면 캐시 반환
-            if self._endpoint_cache:
-                logger.warning("⚠️ 오류 발생, 캐시된 엔드포인트 사용")
-                return self._endpoint_cache
             raise
+        
+        if self._cache_fetched_at == registry.fetched_at:
+            return self._endpoint_cache
+        
+        logger.info("🔍 RunPod 엔드포인트 매핑 갱신...")
+        
+        # 엔드포인트 매핑
+        endpoint_mapping = {}
+        
+        for endpoint in endpoints:
+            template = endpoint.get("template") or {}
+            image_name = template.get("imageName", "")
+            
+            # Docker 이미지로 엔드포인트 타입 판별
+            endpoint_type = None
+            for docker_image, ep_type in self.DOCKER_IMAGE_MAPPING.items():
+                if docker_image in image_name:
+                    endpoint_type = ep_type
+                    break
+            
+            if endpoint_type:
+                endpoint_mapping[endpoint_type] = endpoint["id"]
+                logger.info(
+                    f"✅ {endpoint_type} 엔드포인트 발견: {endpoint['id']} "
+                    f"(이름: {endpoint['name']}, 상태: {endpoint.get('status')}, "
+                    f"GPU: {endpoint.get('gpuIds', 'N/A')}, "
+                    f"Workers: {endpoint['workersMin']}-{endpoint['workersMax']})"
+                )
+        
+        # 캐시 업데이트
+        self._endpoint_cache = endpoint_mapping
+        self._cache_fetched_at = registry.fetched_at
+        
+        # 환경 변수로도 설정 (다른 서비스에서 사용할 수 있도록)
+        for ep_type, ep_id in endpoint_mapping.items():
+            env_key = f"RUNPOD_{ep_type.upper()}_ENDPOINT_ID"
+            os.environ[env_key] = ep_id
+            logger.info(f"💾 환경 변수 설정: {env_key}={ep_id}")
+        
+        return endpoint_mapping
     
     async def get_endpoint_id(self, endpoint_type: str) -> Optional[str]:
         """특정 타입의 엔드포인트 ID 가져오기
@@ -177,7 +130,7 @@ class RunPodEndpointManager:
         url = f"{self.base_url}/{endpoint_id}/health"
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("runpod_api") as client:
                 response = await client.get(
                     url,
                     headers=self.headers,
@@ -191,6 +144,7 @@ class RunPodEndpointManager:
                         "timestamp": datetime.now().isoformat()
                     }
                 else:
+                    get_endpoint_registry().invalidate_on_status(endpoint_id, response.status_code)
                     return {
                         "status": "unhealthy",
                         "endpoint_id": endpoint_id,
@@ -238,7 +192,7 @@ class RunPodEndpointManager:
         try:
             logger.info(f"📥 LoRA 어댑터 다운로드 요청: {adapter_name} from {hf_repo_id}")
             
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("runpod_api") as client:
                 response = await client.post(
                     url,
                     headers=self.headers,
@@ -251,6 +205,7 @@ class RunPodEndpointManager:
                     logger.info(f"✅ LoRA 어댑터 다운로드 요청 성공: {result}")
                     return result
                 else:
+                    get_endpoint_registry().invalidate_on_status(endpoint_id, response.status_code)
                     error_msg = f"다운로드 요청 실패: {response.status_code} - {response.text}"
                     logger.error(f"❌ {error_msg}")
                     raise Exception(error_msg)
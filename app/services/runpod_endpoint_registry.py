@@ -0,0 +1,236 @@
+"""
+RunPod 엔드포인트 레지스트리
+GraphQL `myself { endpoints }` 조회 결과를 프로세스 단위로 공유하는 TTL 캐시
+- 동시에 들어온 조회 요청은 하나의 진행 중인 조회 결과를 함께 기다림 (single-flight)
+- 작업 API가 404를 반환하면 해당 엔드포인트 정보를 무효화 (401은 API 키 문제이므로 제외)
+- 조회 실패 후 RUNPOD_ENDPOINT_FAILURE_BACKOFF 동안은 GraphQL을 다시 호출하지 않음 (force_refresh 제외)
+- 호출자에게는 목록 사본을 반환하여 캐시된 목록이 수정되지 않도록 함
+"""
+
+import os
+import time
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.http_clients import request_with_retry
+
+logger = logging.getLogger(__name__)
+
+
+class RunPodEndpointRegistryError(Exception):
+    """RunPod 엔드포인트 레지스트리 오류"""
+    pass
+
+
+# 작업 API 응답 중 캐시된 엔드포인트 정보가 더 이상 유효하지 않음을 의미하는 상태 코드
+INVALIDATING_STATUS_CODES = (404,)
+
+ENDPOINTS_QUERY = """
+query {
+    myself {
+        endpoints {
+            id
+            name
+            templateId
+            workersMin
+            workersMax
+            status
+            gpuIds
+            locations
+            networkVolumeId
+            template {
+                id
+                name
+                imageName
+                containerDiskInGb
+                volumeInGb
+                volumeMountPath
+            }
+        }
+    }
+}
+"""
+
+EndpointMatcher = Callable[[List[Dict[str, Any]]], Optional[Dict[str, Any]]]
+
+
+class RunPodEndpointRegistry:
+    """RunPod serverless 엔드포인트 목록 캐시"""
+
+    def __init__(self, ttl_seconds: Optional[float] = None, failure_backoff: Optional[float] = None):
+        self.graphql_url = "https://api.runpod.io/graphql"
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.RUNPOD_ENDPOINT_CACHE_TTL
+        self.failure_backoff = (
+            failure_backoff if failure_backoff is not None else settings.RUNPOD_ENDPOINT_FAILURE_BACKOFF
+        )
+
+        self._endpoints: Optional[List[Dict[str, Any]]] = None
+        self._fetched_at: float = 0.0
+        self._refresh_task: Optional[asyncio.Future] = None
+        # 마지막 조회 실패 시각/오류 (장애 중 매 호출마다 GraphQL을 두드리지 않도록)
+        self._failed_at: float = 0.0
+        self._last_error: Optional[Exception] = None
+        # 서비스 키(tts, vllm, ...)별로 매칭된 엔드포인트
+        self._resolved: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """API 요청 헤더"""
+        return {
+            "Authorization": f"Bearer {os.getenv('RUNPOD_API_KEY', '')}",
+            "Content-Type": "application/json"
+        }
+
+    @property
+    def fetched_at(self) -> float:
+        """마지막으로 목록을 성공적으로 조회한 시각 (monotonic)"""
+        return self._fetched_at
+
+    def is_fresh(self) -> bool:
+        """캐시된 목록이 TTL 이내인지 확인"""
+        return (
+            self._endpoints is not None
+            and time.monotonic() - self._fetched_at < self.ttl_seconds
+        )
+
+    def in_failure_backoff(self) -> bool:
+        """최근 조회 실패 후 재시도 대기 중인지 확인"""
+        return (
+            self._last_error is not None
+            and time.monotonic() - self._failed_at < self.failure_backoff
+        )
+
+    async def get_endpoints(self, force_refresh: bool = False) -> List[Dict[str, Any]]:
+        """엔드포인트 목록 조회 (캐시 우선)
+
+        Args:
+            force_refresh: 캐시와 실패 후 재시도 대기를 무시하고 강제 새로고침
+
+        Returns:
+            List[Dict[str, Any]]: GraphQL 엔드포인트 목록 (사본)
+        """
+        if not force_refresh and self.is_fresh():
+            return list(self._endpoints)
+        if not force_refresh and self.in_failure_backoff():
+            if self._endpoints is not None:
+                return list(self._endpoints)
+            raise RunPodEndpointRegistryError(f"엔드포인트 목록 조회 재시도 대기 중: {self._last_error}")
+
+        loop = asyncio.get_running_loop()
+        task = self._refresh_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            task = loop.create_task(self._fetch_endpoints())
+            self._refresh_task = task
+
+        try:
+            # 한 호출자가 취소되어도 진행 중인 조회는 다른 호출자를 위해 유지
+            return list(await asyncio.shield(task))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if self._endpoints is not None:
+                logger.warning(f"⚠️ 엔드포인트 목록 갱신 실패, 캐시된 목록 사용: {e}")
+                return list(self._endpoints)
+            raise
+
+    async def resolve(
+        self,
+        key: str,
+        matcher: EndpointMatcher,
+        force_refresh: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """서비스 키에 해당하는 엔드포인트 반환
+
+        Args:
+            key: 캐시 키 (서비스 타입)
+            matcher: 엔드포인트 목록에서 대상을 고르는 함수
+            force_refresh: 캐시와 실패 후 재시도 대기를 무시하고 강제 새로고침
+
+        Returns:
+            Optional[Dict[str, Any]]: 매칭된 엔드포인트
+        """
+        if not force_refresh and key in self._resolved and (self.in_failure_backoff() or self.is_fresh()):
+            return self._resolved[key]
+
+        endpoints = await self.get_endpoints(force_refresh=force_refresh)
+        endpoint = matcher(endpoints)
+        if endpoint:
+            self._resolved[key] = endpoint
+        else:
+            self._resolved.pop(key, None)
+        return endpoint
+
+    def invalidate(self, endpoint_id: Optional[str] = None) -> None:
+        """캐시 무효화
+
+        Args:
+            endpoint_id: 지정 시 해당 엔드포인트를 참조하는 매칭만 제거, 없으면 전체 제거
+        """
+        if endpoint_id is None:
+            self._resolved.clear()
+        else:
+            self._resolved = {
+                key: endpoint for key, endpoint in self._resolved.items()
+                if endpoint.get("id") != endpoint_id
+            }
+        # 다음 조회 시 목록을 다시 가져오도록 만료 처리 (실패 시 기존 목록은 fallback으로 유지)
+        self._fetched_at = 0.0
+        logger.info(f"🗑️ RunPod 엔드포인트 캐시 무효화: {endpoint_id or 'all'}")
+
+    def invalidate_on_status(self, endpoint_id: str, status_code: int) -> None:
+        """작업 API 응답 코드가 엔드포인트 변경을 의미하면 무효화"""
+        if status_code in INVALIDATING_STATUS_CODES:
+            self.invalidate(endpoint_id)
+
+    async def _fetch_endpoints(self) -> List[Dict[str, Any]]:
+        """GraphQL로 엔드포인트 목록 조회 (실패 시각 기록)"""
+        try:
+            endpoints = await self._query_endpoints()
+        except Exception as e:
+            self._failed_at = time.monotonic()
+            self._last_error = e
+            raise
+        self._last_error = None
+        return endpoints
+
+    async def _query_endpoints(self) -> List[Dict[str, Any]]:
+        response = await request_with_retry(
+            "runpod_graphql",
+            "POST",
+            self.graphql_url,
+            idempotent=True,
+            headers=self.headers,
+            json={"query": ENDPOINTS_QUERY}
+        )
+
+        if response.status_code != 200:
+            raise RunPodEndpointRegistryError(f"엔드포인트 목록 조회 실패: {response.text}")
+
+        data = response.json()
+
+        if "errors" in data:
+            logger.error(f"GraphQL 오류: {data['errors']}")
+            raise RunPodEndpointRegistryError(f"엔드포인트 조회 오류: {data['errors']}")
+
+        endpoints = data.get("data", {}).get("myself", {}).get("endpoints", []) or []
+
+        self._endpoints = endpoints
+        self._fetched_at = time.monotonic()
+        self._resolved.clear()
+
+        logger.info(f"📋 RunPod 엔드포인트 목록 갱신: {len(endpoints)}개")
+        return endpoints
+
+
+# 싱글톤 인스턴스
+_endpoint_registry: Optional[RunPodEndpointRegistry] = None
+
+
+def get_endpoint_registry() -> RunPodEndpointRegistry:
+    """엔드포인트 레지스트리 싱글톤 인스턴스 반환"""
+    global _endpoint_registry
+    if _endpoint_registry is None:
+        _endpoint_registry = RunPodEndpointRegistry()
+    return _endpoint_registry
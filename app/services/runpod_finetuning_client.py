@@ -3,10 +3,10 @@ RunPod Serverless 파인튜닝 클라이언트
 """
 
 import os
-import httpx
 import logging
 from typing import Dict, Any, Optional, List
 from datetime import datetime
+from app.core.http_clients import pooled_client
 from app.services.runpod_manager import get_finetuning_manager
 
 logger = logging.getLogger(__name__)
@@ -98,7 +98,7 @@ class RunPodFineTuningClient:
             logger.info(f"  - URL: {url}")
             logger.info(f"  - Endpoint ID: {endpoint_id}")
             
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("runpod_api") as client:
                 response = await client.post(
                     url,
                     json=payload,
@@ -159,7 +159,7 @@ class RunPodFineTuningClient:
         }
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("runpod_api") as client:
                 response = await client.get(
                     url,
                     headers=headers,
@@ -201,7 +201,7 @@ class RunPodFineTuningClient:
         }
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("runpod_api") as client:
                 response = await client.post(
                     url,
                     headers=headers,
@@ -6,18 +6,18 @@ TTS, vLLM, Fine-tuning 각각의 엔드포인트를 별도로 관리
 
 import os
 import json
+import asyncio
 import logging
 import httpx
-import base64
-from typing import Optional, Dict, Any, List, Literal
+from typing import Optional, Dict, Any, List, Literal, Set
 from datetime import datetime
 from dotenv import load_dotenv
 from abc import ABC, abstractmethod
 from enum import Enum
-from sqlalchemy.orm import Session
-from app.database import get_db
-from app.models.influencer import AIInfluencer
-from app.services.s3_service import S3Service
+from app.services.runpod_endpoint_registry import get_endpoint_registry
+from app.services.voice_asset_cache import get_voice_asset_cache
+from app.core.http_clients import pooled_client
+from app.core.config import settings
 
 load_dotenv()
 
@@ -79,6 +79,11 @@ class BaseRunPodManager(ABC):
         self.base_url = "https://api.runpod.io/graphql"
         self.service_type = service_type
         
+        # 최근 health check 결과 (cached_health_check용)
+        self._health_result: Optional[HealthCheckResult] = None
+        self._health_checked_at = 0.0
+        self._health_lock: Optional[asyncio.Lock] = None
+        
         if not self.api_key:
             raise RunPodManagerError("RUNPOD_API_KEY가 설정되지 않았습니다")
     
@@ -120,96 +125,61 @@ class BaseRunPodManager(ABC):
             "Content-Type": "application/json"
         }
     
-    async def list_endpoints(self) -> List[Dict[str, Any]]:
-        """모든 serverless 엔드포인트 목록 조회"""
-        query = """
-        query {
-            myself {
-                endpoints {
-                    id
-                    name
-                    templateId
-                    workersMin
-                    workersMax
-                    template {
-                        id
-                        name
-                        imageName
-                        containerDiskInGb
-                        volumeInGb
-                    }
-                }
-            }
-        }
-        """
-        
+    async def list_endpoints(self, force_refresh: bool = False) -> List[Dict[str, Any]]:
+        """모든 serverless 엔드포인트 목록 조회 (공유 레지스트리 캐시 사용)"""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.base_url,
-                    headers=self.headers,
-                    json={"query": query}
-                )
-                
-                if response.status_code != 200:
-                    raise RunPodManagerError(f"엔드포인트 목록 조회 실패: {response.text}")
-                
-                data = response.json()
-                
-                if "errors" in data:
-                    logger.error(f"GraphQL 오류: {data['errors']}")
-                    raise RunPodManagerError(f"엔드포인트 조회 오류: {data['errors']}")
-                
-                endpoints = data.get("data", {}).get("myself", {}).get("endpoints", [])
-                
-                logger.info(f"📋 RunPod 엔드포인트 목록: {len(endpoints)}개")
-                return endpoints
-                
+            return await get_endpoint_registry().get_endpoints(force_refresh=force_refresh)
         except Exception as e:
             logger.error(f"❌ 엔드포인트 목록 조회 실패: {e}")
             raise RunPodManagerError(f"엔드포인트 목록 조회 실패: {e}")
     
-    async def find_endpoint(self) -> Optional[Dict[str, Any]]:
-        """서비스별 엔드포인트 찾기"""
-        try:
-            endpoints = await self.list_endpoints()
+    def _match_endpoint(self, endpoints: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """엔드포인트 목록에서 서비스에 해당하는 엔드포인트 선택"""
+        for endpoint in endpoints:
+            logger.debug(f"엔드포인트 정보: {endpoint}")
+            template = endpoint.get("template") or {}
             
-            for endpoint in endpoints:
-                logger.info(f"엔드포인트 정보: {endpoint}")
-                template = endpoint.get("template", {})
-                
-                # 다양한 조건으로 매칭 시도
-                image_name = template.get("imageName", "")
-                endpoint_name = endpoint.get("name", "")
-                template_name = template.get("name", "")
-                
-                # Docker 이미지 정확 매칭 우선
-                if self.docker_image in image_name or image_name in self.docker_image:
-                    logger.info(f"✅ 기존 엔드포인트 찾음 (이미지 매칭): {endpoint['id']}")
-                    logger.info(f"   - 엔드포인트 이름: {endpoint_name}")
-                    logger.info(f"   - 템플릿 이름: {template_name}")
-                    logger.info(f"   - Docker 이미지: {image_name}")
-                    logger.info(f"   - 전체 엔드포인트 정보: {endpoint}")
-                    return endpoint
-                
-                # 키워드 매칭
-                for keyword in self.search_keywords:
-                    if (keyword in image_name.lower() or
-                        keyword in endpoint_name.lower() or
-                        keyword in template_name.lower()):
-                        logger.info(f"✅ 기존 엔드포인트 찾음 (키워드 '{keyword}' 매칭): {endpoint['id']}")
-                        logger.info(f"   - 엔드포인트 이름: {endpoint_name}")
-                        logger.info(f"   - 템플릿 이름: {template_name}")
-                        logger.info(f"   - Docker 이미지: {image_name}")
-                        return endpoint
+            # 다양한 조건으로 매칭 시도
+            image_name = template.get("imageName", "")
+            endpoint_name = endpoint.get("name", "")
+            template_name = template.get("name", "")
             
-            logger.info(f"ℹ️ {self.service_type} 엔드포인트를 찾을 수 없습니다")
-            return None
+            # Docker 이미지 정확 매칭 우선
+            if self.docker_image in image_name or image_name in self.docker_image:
+                logger.info(
+                    f"✅ 기존 엔드포인트 찾음 (이미지 매칭): {endpoint['id']} "
+                    f"(이름: {endpoint_name}, 템플릿: {template_name}, 이미지: {image_name})"
+                )
+                return endpoint
             
+            # 키워드 매칭
+            for keyword in self.search_keywords:
+                if (keyword in image_name.lower() or
+                    keyword in endpoint_name.lower() or
+                    keyword in template_name.lower()):
+                    logger.info(
+                        f"✅ 기존 엔드포인트 찾음 (키워드 '{keyword}' 매칭): {endpoint['id']} "
+                        f"(이름: {endpoint_name}, 템플릿: {template_name}, 이미지: {image_name})"
+                    )
+                    return endpoint
+        
+        logger.info(f"ℹ️ {self.service_type} 엔드포인트를 찾을 수 없습니다")
+        return None
+    
+    async def find_endpoint(self, force_refresh: bool = False) -> Optional[Dict[str, Any]]:
+        """서비스별 엔드포인트 찾기 (TTL 캐시, 동시 조회는 하나로 합침)"""
+        try:
+            return await get_endpoint_registry().resolve(
+                self.service_type, self._match_endpoint, force_refresh=force_refresh
+            )
         except Exception as e:
             logger.error(f"❌ {self.service_type} 엔드포인트 검색 실패: {e}")
             return None
     
+    def invalidate_endpoint(self, endpoint_id: str, status_code: int) -> None:
+        """작업 API가 404를 반환하면 캐시된 엔드포인트 무효화"""
+        get_endpoint_registry().invalidate_on_status(endpoint_id, status_code)
+    
     async def create_template(self) -> Dict[str, Any]:
         """새로운 serverless 템플릿 생성"""
         mutation = """
@@ -239,11 +209,12 @@ class BaseRunPodManager(ABC):
         try:
             logger.info(f"📝 새 RunPod 템플릿 생성 중: {self.endpoint_name}")
             
-            async with httpx.AsyncClient(timeout=60) as client:
+            async with pooled_client("runpod_graphql") as client:
                 response = await client.post(
                     self.base_url,
                     headers=self.headers,
-                    json={"query": mutation, "variables": variables}
+                    json={"query": mutation, "variables": variables},
+                    timeout=60
                 )
                 
                 if response.status_code != 200:
@@ -294,11 +265,12 @@ class BaseRunPodManager(ABC):
         try:
             logger.info(f"🚀 RunPod 엔드포인트 생성 중: {self.endpoint_name}")
             
-            async with httpx.AsyncClient(timeout=60) as client:
+            async with pooled_client("runpod_graphql") as client:
                 response = await client.post(
                     self.base_url,
                     headers=self.headers,
-                    json={"query": mutation, "variables": variables}
+                    json={"query": mutation, "variables": variables},
+                    timeout=60
                 )
                 
                 if response.status_code != 200:
@@ -367,7 +339,7 @@ class BaseRunPodManager(ABC):
         """
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("runpod_graphql") as client:
                 response = await client.post(
                     self.base_url,
                     headers=self.headers,
@@ -408,10 +380,11 @@ class BaseRunPodManager(ABC):
             
             logger.info(f"🔍 Direct health check: {url}")
             
-            async with httpx.AsyncClient(timeout=10) as client:
-                response = await client.get(url, headers=headers)
+            async with pooled_client("runpod_api") as client:
+                response = await client.get(url, headers=headers, timeout=10)
                 
                 if response.status_code != 200:
+                    self.invalidate_endpoint(endpoint_id, response.status_code)
                     logger.warning(f"⚠️ Direct health check 실패: {response.status_code} - {response.text}")
                     return {"error": f"HTTP {response.status_code}: {response.text}"}
                 
@@ -557,6 +530,25 @@ class BaseRunPodManager(ABC):
                 response_time_ms=(time.time() - start_time) * 1000
             )
     
+    async def cached_health_check(self, max_age: Optional[float] = None) -> HealthCheckResult:
+        """최근 health check 결과 재사용 (만료 시 동시 요청 중 하나만 다시 확인)"""
+        import time
+        
+        max_age = settings.RUNPOD_HEALTH_CACHE_TTL if max_age is None else max_age
+        if self._health_result is not None and time.monotonic() - self._health_checked_at < max_age:
+            return self._health_result
+        
+        if self._health_lock is None:
+            self._health_lock = asyncio.Lock()
+        
+        async with self._health_lock:
+            if self._health_result is not None and time.monotonic() - self._health_checked_at < max_age:
+                return self._health_result
+            
+            self._health_result = await self.health_check()
+            self._health_checked_at = time.monotonic()
+            return self._health_result
+    
     async def simple_health_check(self) -> bool:
         """간단한 boolean health check (기존 호환성)"""
         try:
@@ -607,89 +599,18 @@ class TTSRunPodManager(BaseRunPodManager):
     }
     
     async def _get_voice_data_from_s3(self, influencer_id: Optional[str], base_voice_id: Optional[str]) -> Optional[str]:
-        """S3에서 음성 파일을 가져와 base64로 변환"""
+        """인플루언서 참조 음성을 base64로 반환 (S3 키 + ETag 기준 캐시 사용)"""
         try:
             if not influencer_id and not base_voice_id:
                 return None
-                
-            # DB에서 인플루언서 정보 가져오기
-            db: Session = next(get_db())
-            try:
-                if influencer_id:
-                    influencer = db.query(AIInfluencer).filter(
-                        AIInfluencer.influencer_id == influencer_id
-                    ).first()
-                    
-                    if influencer and influencer.voice_base and influencer.voice_base.s3_url:
-                        s3_url = influencer.voice_base.s3_url
-                        logger.info(f"인플루언서 {influencer_id}의 voice_base S3 URL 찾음: {s3_url}")
-                    else:
-                        logger.warning(f"인플루언서 {influencer_id}의 voice_base를 찾을 수 없음")
-                        return None
-                else:
-                    # base_voice_id로 직접 조회하는 로직 필요시 구현
-                    logger.warning("base_voice_id로 직접 조회는 아직 구현되지 않음")
-                    return None
-                    
-            finally:
-                db.close()
-            
-            # S3에서 파일 다운로드
-            s3_service = S3Service()
-            
-            # S3 URL에서 키 추출
-            if s3_url.startswith('https://'):
-                # https://bucket-name.s3.region.amazonaws.com/key 형식
-                if '.amazonaws.com/' in s3_url:
-                    s3_key = s3_url.split('.amazonaws.com/')[-1]
-                else:
-                    s3_key = s3_url.split('/')[-1]
-            elif s3_url.startswith(f"s3://{s3_service.bucket_name}/"):
-                # s3://bucket-name/key 형식
-                s3_key = s3_url.replace(f"s3://{s3_service.bucket_name}/", "")
-            else:
-                # 이미 키 형식인 경우
-                s3_key = s3_url
-            
-            logger.info(f"S3 URL에서 추출한 키: {s3_key}")
-            
-            # presigned URL 생성
-            presigned_url = s3_service.generate_presigned_url(s3_key)
-            if not presigned_url:
-                logger.error(f"S3 presigned URL 생성 실패: {s3_key}")
-                return None
-            
-            logger.info(f"생성된 presigned URL: {presigned_url}")  # URL 일부만 로깅
-                
-            # HTTP로 파일 다운로드 (httpx 사용)
-            try:
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    response = await client.get(presigned_url)
-                    
-                    if response.status_code != 200:
-                        logger.error(f"S3 파일 다운로드 실패: {response.status_code}")
-                        return None
-                        
-                    # 바이너리 데이터를 base64로 인코딩
-                    file_data = response.content
-                    base64_data = base64.b64encode(file_data).decode('utf-8')
-                    logger.info(f"음성 파일을 base64로 변환 완료 (크기: {len(base64_data)})")
-                    return base64_data
-            except httpx.ConnectError as e:
-                logger.error(f"S3 연결 실패 (DNS 문제일 수 있음): {str(e)}")
-                # DNS 문제 해결을 위한 대체 방법 시도
-                try:
-                    # requests 라이브러리 사용 (동기적이지만 더 안정적)
-                    import requests
-                    response = requests.get(presigned_url, timeout=30)
-                    if response.status_code == 200:
-                        base64_data = base64.b64encode(response.content).decode('utf-8')
-                        logger.info(f"requests로 음성 파일 다운로드 성공 (크기: {len(base64_data)})")
-                        return base64_data
-                except Exception as req_e:
-                    logger.error(f"requests로도 다운로드 실패: {str(req_e)}")
+
+            if not influencer_id:
+                # base_voice_id로 직접 조회하는 로직 필요시 구현
+                logger.warning("base_voice_id로 직접 조회는 아직 구현되지 않음")
                 return None
-                    
+
+            return await get_voice_asset_cache().get_for_influencer(influencer_id)
+
         except Exception as e:
             logger.error(f"S3에서 음성 파일 가져오기 실패: {str(e)}")
             return None
@@ -752,10 +673,11 @@ class TTSRunPodManager(BaseRunPodManager):
             url = f"{base_url}/{endpoint_id}/run"
             logger.info(f"🎵 TTS run 요청: {url}")
             
-            async with httpx.AsyncClient(timeout=300) as client:
+            async with pooled_client("runpod_api") as client:
                 response = await client.post(url, headers=headers, json=payload)
                 
                 if response.status_code != 200:
+                    self.invalidate_endpoint(endpoint_id, response.status_code)
                     error_msg = f"RunPod TTS API 오류: {response.status_code} - {response.text}"
                     logger.error(f"❌ {error_msg}")
                     raise RunPodManagerError(error_msg)
@@ -824,9 +746,10 @@ class TTSRunPodManager(BaseRunPodManager):
             url = f"{base_url}/{endpoint_id}/runsync"
             logger.info(f"⏳ TTS runsync 요청: {url}")
             
-            async with httpx.AsyncClient(timeout=300) as client:
+            async with pooled_client("runpod_api") as client:
                 response = await client.post(url, headers=headers, json=payload)
                 if response.status_code != 200:
+                    self.invalidate_endpoint(endpoint_id, response.status_code)
                     error_msg = f"RunPod TTS API 오류: {response.status_code} - {response.text}"
                     logger.error(f"❌ {error_msg}")
                     raise RunPodManagerError(error_msg)
@@ -862,8 +785,6 @@ class TTSRunPodManager(BaseRunPodManager):
     
     async def check_tts_status(self, task_id: str) -> Dict[str, Any]:
         """TTS 작업 상태 확인"""
-        import httpx
-        
         try:
             # 엔드포인트 찾기
             endpoint = await self.find_endpoint()
@@ -888,10 +809,11 @@ class TTSRunPodManager(BaseRunPodManager):
             
             logger.info(f"🔍 TTS 상태 확인: {url}")
             
-            async with httpx.AsyncClient(timeout=10) as client:
-                response = await client.get(url, headers=headers)
+            async with pooled_client("runpod_api") as client:
+                response = await client.get(url, headers=headers, timeout=10)
                 
                 if response.status_code != 200:
+                    self.invalidate_endpoint(endpoint_id, response.status_code)
                     error_msg = f"RunPod 상태 확인 오류: {response.status_code} - {response.text}"
                     logger.error(f"❌ {error_msg}")
                     raise RunPodManagerError(error_msg)
@@ -962,6 +884,8 @@ class VLLMRunPodManager(BaseRunPodManager):
         super().__init__("vllm")
         self._api_key = os.getenv("RUNPOD_API_KEY")
         self._base_url = "https://api.runpod.ai/v2"
+        # 중단된 스트리밍 작업의 취소 요청 (완료될 때까지 참조 유지)
+        self._cancel_tasks: Set[asyncio.Task] = set()
         
         if not self._api_key:
             raise RunPodManagerError("RUNPOD_API_KEY가 설정되지 않았습니다")
@@ -1006,10 +930,11 @@ class VLLMRunPodManager(BaseRunPodManager):
         
         logger.info(f"🚀 RunPod run 요청: {url}")
         
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.post(url, headers=headers, json=payload)
+        async with pooled_client("runpod_api") as client:
+            response = await client.post(url, headers=headers, json=payload, timeout=30)
             
             if response.status_code != 200:
+                self.invalidate_endpoint(endpoint_id, response.status_code)
                 error_msg = f"RunPod API 오류: {response.status_code} - {response.text}"
                 logger.error(f"❌ {error_msg}")
                 raise RunPodManagerError(error_msg)
@@ -1017,7 +942,19 @@ class VLLMRunPodManager(BaseRunPodManager):
             return response.json()
     
     async def runsync(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        """동기 요청 (결과 대기)"""
+        """동기 요청 (결과 대기)
+
+        디스패처가 활성화되어 있으면 같은 어댑터의 동시 요청을 모아 /run으로 제출하고
+        공유 /status 폴러로 결과를 받음
+        """
+        if settings.VLLM_DISPATCH_ENABLED:
+            from app.services.vllm_dispatcher import get_vllm_dispatcher
+            
+            return await get_vllm_dispatcher().submit(payload)
+        return await self.runsync_direct(payload)
+    
+    async def runsync_direct(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """/runsync 직접 호출 (요청 하나당 작업 하나)"""
         endpoint = await self.find_endpoint()
         if not endpoint or not endpoint.get("id"):
             raise RunPodManagerError("vLLM 엔드포인트를 찾을 수 없습니다")
@@ -1034,13 +971,14 @@ class VLLMRunPodManager(BaseRunPodManager):
         logger.info(f"📦 Payload: {json.dumps(payload, ensure_ascii=False)[:500]}...")
         
         try:
-            async with httpx.AsyncClient(timeout=300) as client:
+            async with pooled_client("runpod_api") as client:
                 response = await client.post(url, headers=headers, json=payload)
                 
                 logger.info(f"📡 Response status: {response.status_code}")
                 logger.info(f"📋 Response headers: {dict(response.headers)}")
                 
                 if response.status_code != 200:
+                    self.invalidate_endpoint(endpoint_id, response.status_code)
                     error_msg = f"RunPod API 오류: {response.status_code} - {response.text}"
                     logger.error(f"❌ {error_msg}")
                     raise RunPodManagerError(error_msg)
@@ -1048,19 +986,7 @@ class VLLMRunPodManager(BaseRunPodManager):
                 result = response.json()
                 logger.info(f"✅ RunPod response: {json.dumps(result, ensure_ascii=False)[:500]}...")
                 
-                # RunPod 응답에서 실제 텍스트 추출
-                if "output" in result:
-                    # output이 문자열인 경우
-                    if isinstance(result["output"], str):
-                        return result["output"]["generated_text"]
-                    # output이 딕셔너리인 경우
-                    elif isinstance(result["output"], dict):
-                        return result["output"].get("generated_text", result["output"])
-                    else:
-                        return result["output"]
-                else:
-                    logger.warning(f"⚠️ Unexpected response format: {result}")
-                    return result
+                return self.extract_job_output(result)
                     
         except httpx.TimeoutException as e:
             logger.error(f"❌ RunPod 요청 타임아웃: {e}")
@@ -1069,44 +995,198 @@ class VLLMRunPodManager(BaseRunPodManager):
             logger.error(f"❌ RunPod runsync 실패: {e}")
             raise RunPodManagerError(f"RunPod runsync 실패: {e}")
     
-    async def stream(self, payload: Dict[str, Any]):
-        """스트리밍 요청"""
-        endpoint = await self.find_endpoint()
-        if not endpoint or not endpoint.get("id"):
-            raise RunPodManagerError("vLLM 엔드포인트를 찾을 수 없습니다")
+    @staticmethod
+    def extract_job_output(result: Dict[str, Any]) -> Any:
+        """runsync / status 응답에서 실제 결과 추출"""
+        if "output" in result:
+            # output이 문자열인 경우
+            if isinstance(result["output"], str):
+                return result["output"]
+            # output이 딕셔너리인 경우
+            elif isinstance(result["output"], dict):
+                return result["output"].get("generated_text", result["output"])
+            else:
+                return result["output"]
+        else:
+            logger.warning(f"⚠️ Unexpected response format: {result}")
+            return result
+    
+    async def get_job_status(self, job_id: str, endpoint_id: Optional[str] = None) -> Dict[str, Any]:
+        """작업 상태 조회 (/status/{job_id})"""
+        if endpoint_id is None:
+            endpoint = await self.find_endpoint()
+            if not endpoint or not endpoint.get("id"):
+                raise RunPodManagerError("vLLM 엔드포인트를 찾을 수 없습니다")
+            endpoint_id = endpoint["id"]
         
-        endpoint_id = endpoint["id"]
-        url = f"{self._base_url}/{endpoint_id}/stream"
+        url = f"{self._base_url}/{endpoint_id}/status/{job_id}"
+        headers = {
+            "Authorization": f"Bearer {self._api_key}",
+            "Content-Type": "application/json"
+        }
+        async with pooled_client("runpod_api") as client:
+            response = await client.get(url, headers=headers, timeout=30)
         
+        if response.status_code != 200:
+            self.invalidate_endpoint(endpoint_id, response.status_code)
+            raise RunPodManagerError(f"RunPod API 오류: {response.status_code} - {response.text}")
+        return response.json()
+    
+    async def stream(
+        self,
+        payload: Dict[str, Any],
+        poll_interval: Optional[float] = None,
+        max_poll_interval: Optional[float] = None,
+        timeout: float = 300,
+    ):
+        """스트리밍 요청 (/run 제출 후 /stream/{job_id} 폴링)
+
+        워커가 생성한 부분 결과(stream 항목)를 도착하는 대로 yield 합니다.
+        새 항목이 없으면 폴링 간격을 max_poll_interval까지 두 배씩 늘리고, 항목이 오면 다시 줄입니다.
+        워커가 스트리밍을 지원하지 않으면 완료 응답의 결과를 한 번에 yield 합니다.
+        """
+        min_interval = poll_interval if poll_interval is not None else settings.VLLM_STREAM_POLL_INTERVAL
+        max_interval = max(
+            min_interval,
+            max_poll_interval if max_poll_interval is not None else settings.VLLM_STREAM_MAX_POLL_INTERVAL,
+        )
+        stream_payload = {**payload, "input": {**payload.get("input", {}), "stream": True}}
+        job = await self.run(stream_payload)
+        job_id = job.get("id")
+        if not job_id:
+            raise RunPodManagerError(f"RunPod 작업 ID를 받지 못했습니다: {job}")
+        
+        endpoint = await self.find_endpoint()
+        endpoint_id = endpoint["id"]
         headers = {
             "Authorization": f"Bearer {self._api_key}",
-            "Content-Type": "application/json",
-            "Accept": "text/event-stream",
-            "Cache-Control": "no-cache"
+            "Content-Type": "application/json"
         }
+        stream_url = f"{self._base_url}/{endpoint_id}/stream/{job_id}"
         
-        logger.info(f"🌊 RunPod stream 요청: {url}")
+        logger.info(f"🌊 RunPod stream 폴링 시작: job_id={job_id}")
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        streamed_any = False
+        finished = False
+        interval = min_interval
         
         try:
-            async with httpx.AsyncClient(timeout=300) as client:
-                async with client.stream("POST", url, headers=headers, json=payload) as response:
+            async with pooled_client("runpod_api") as client:
+                while True:
+                    response = await client.get(stream_url, headers=headers, timeout=30)
                     if response.status_code != 200:
-                        error_msg = f"RunPod API 오류: {response.status_code} - {await response.aread()}"
+                        self.invalidate_endpoint(endpoint_id, response.status_code)
+                        error_msg = f"RunPod API 오류: {response.status_code} - {response.text}"
                         logger.error(f"❌ {error_msg}")
                         raise RunPodManagerError(error_msg)
                     
-                    async for line in response.aiter_lines():
-                        if line.startswith("data: "):
-                            data_str = line[6:]
-                            if data_str.strip():
-                                try:
-                                    data = json.loads(data_str)
-                                    yield data
-                                except json.JSONDecodeError:
-                                    continue
-        except httpx.HTTPStatusError as e:
+                    data = response.json()
+                    items = data.get("stream") or []
+                    for item in items:
+                        streamed_any = True
+                        yield item
+                    
+                    status = data.get("status")
+                    if status in ("FAILED", "CANCELLED", "TIMED_OUT"):
+                        raise RunPodManagerError(f"RunPod 스트리밍 작업 실패: {status} - {data.get('error')}")
+                    if status == "COMPLETED":
+                        finished = True
+                        break
+                    if loop.time() > deadline:
+                        raise RunPodManagerError(f"RunPod 스트리밍 타임아웃 ({timeout}초 초과)")
+                    
+                    # 토큰이 계속 오면 짧게, 대기 중(콜드 스타트/큐)이면 점점 길게
+                    interval = min_interval if items else min(interval * 2, max_interval)
+                    await asyncio.sleep(interval)
+                
+                if not streamed_any and data.get("output") is not None:
+                    # 스트리밍 미지원 워커: 완료 응답에 포함된 최종 결과 전달
+                    yield {"output": data["output"]}
+                elif not streamed_any:
+                    # 완료 응답에 결과가 없으면 /status에서 한 번 조회
+                    status_url = f"{self._base_url}/{endpoint_id}/status/{job_id}"
+                    response = await client.get(status_url, headers=headers, timeout=30)
+                    if response.status_code == 200:
+                        output = response.json().get("output")
+                        if output is not None:
+                            yield {"output": output}
+        except httpx.HTTPError as e:
             logger.error(f"❌ 스트리밍 요청 실패: {e}")
             raise RunPodManagerError(f"스트리밍 요청 실패: {e}")
+        finally:
+            if not finished:
+                # 소비자가 중단(연결 끊김 등)하거나 오류가 나면 남은 생성을 취소
+                self._schedule_cancel(job_id)
+    
+    def _schedule_cancel(self, job_id: str) -> None:
+        """작업 취소를 백그라운드로 요청 (태스크 참조 유지, 실패 로깅)"""
+        task = asyncio.get_running_loop().create_task(self.cancel(job_id))
+        self._cancel_tasks.add(task)
+
+        def on_done(done: asyncio.Task) -> None:
+            self._cancel_tasks.discard(done)
+            if done.cancelled():
+                logger.warning(f"⚠️ RunPod 작업 취소 요청이 중단됨: job_id={job_id}")
+            elif done.exception() is not None:
+                logger.warning(f"⚠️ RunPod 작업 취소 실패: job_id={job_id}, {done.exception()}")
+            elif not done.result():
+                logger.warning(f"⚠️ RunPod 작업 취소 응답 실패: job_id={job_id}")
+
+        task.add_done_callback(on_done)
+    
+    async def cancel(self, job_id: str) -> bool:
+        """진행 중인 작업 취소"""
+        try:
+            endpoint = await self.find_endpoint()
+            if not endpoint or not endpoint.get("id"):
+                return False
+            url = f"{self._base_url}/{endpoint['id']}/cancel/{job_id}"
+            headers = {
+                "Authorization": f"Bearer {self._api_key}",
+                "Content-Type": "application/json"
+            }
+            async with pooled_client("runpod_api") as client:
+                response = await client.post(url, headers=headers, timeout=10)
+            return response.status_code == 200
+        except Exception as e:
+            logger.warning(f"⚠️ RunPod 작업 취소 실패: job_id={job_id}, {e}")
+            return False
+    
+    @staticmethod
+    def extract_stream_text(output: Any) -> str:
+        """스트림 항목의 output에서 텍스트 조각 추출"""
+        if output is None:
+            return ""
+        if isinstance(output, str):
+            return output
+        if isinstance(output, list):
+            return "".join(VLLMRunPodManager.extract_stream_text(item) for item in output)
+        if isinstance(output, dict):
+            for key in ("text", "token", "delta", "generated_text"):
+                if isinstance(output.get(key), str):
+                    return output[key]
+            if "output" in output:
+                return VLLMRunPodManager.extract_stream_text(output["output"])
+            # OpenAI 호환 형식 (choices[].tokens / choices[].text / choices[].delta.content)
+            texts = []
+            for choice in output.get("choices") or []:
+                if choice.get("tokens"):
+                    texts.append("".join(choice["tokens"]))
+                elif isinstance(choice.get("text"), str):
+                    texts.append(choice["text"])
+                elif isinstance(choice.get("delta"), dict):
+                    texts.append(choice["delta"].get("content") or "")
+            return "".join(texts)
+        return ""
+    
+    async def stream_text(self, payload: Dict[str, Any]):
+        """스트리밍 요청의 텍스트 조각만 yield"""
+        async for item in self.stream(payload):
+            text = self.extract_stream_text(item.get("output") if isinstance(item, dict) else item)
+            if text:
+                yield text
     
     async def health_check(self) -> HealthCheckResult:
         """vLLM 전용 health check"""
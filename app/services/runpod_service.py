@@ -11,6 +11,7 @@ from typing import Dict, Optional, Any
 from datetime import datetime, timedelta
 from pydantic import BaseModel
 from app.core.config import settings
+from app.core.http_clients import pooled_aiohttp_session
 
 logger = logging.getLogger(__name__)
 
@@ -399,7 +400,7 @@ class RunPodService:
         if "RTX 4090" in gpu_type:
             logger.info(f"     ⚠️ RTX 4090 특별 보호: 24C/125GB 과할당 강력 차단")
         
-        async with aiohttp.ClientSession() as session:
+        async with pooled_aiohttp_session("runpod_graphql") as session:
             payload = {
                 "query": mutation,
                 "variables": variables
@@ -495,7 +496,7 @@ class RunPodService:
                 "Authorization": f"Bearer {self.api_key}"
             }
             
-            async with aiohttp.ClientSession() as session:
+            async with pooled_aiohttp_session("runpod_graphql") as session:
                 payload = {
                     "query": query,
                     "variables": variables
@@ -527,6 +528,62 @@ class RunPodService:
             logger.error(f"RunPod 상태 조회 실패: {e}")
             raise RuntimeError(f"RunPod 상태 조회 실패: {e}")
     
+    async def list_pods(self) -> Dict[str, RunPodPodResponse]:
+        """계정의 전체 Pod 상태를 한 번의 GraphQL 요청으로 조회
+        
+        Returns:
+            Dict[str, RunPodPodResponse]: pod_id별 Pod 정보
+        """
+        query = """
+        query myPods {
+            myself {
+                pods {
+                    id
+                    desiredStatus
+                    lastStatusChange
+                    runtime {
+                        uptimeInSeconds
+                    }
+                }
+            }
+        }
+        """
+        
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}"
+        }
+        
+        try:
+            async with pooled_aiohttp_session("runpod_graphql") as session:
+                async with session.post(
+                    self.base_url,
+                    json={"query": query},
+                    headers=headers,
+                    timeout=aiohttp.ClientTimeout(total=30)
+                ) as response:
+                    if response.status != 200:
+                        raise Exception(f"RunPod API 호출 실패: {response.status}")
+                    
+                    data = await response.json()
+                    if data.get("errors"):
+                        raise Exception(f"GraphQL 오류: {data['errors']}")
+                    
+                    pods = (data.get("data") or {}).get("myself", {}).get("pods") or []
+                    return {
+                        pod["id"]: RunPodPodResponse(
+                            pod_id=pod["id"],
+                            status=pod.get("desiredStatus") or "UNKNOWN",
+                            runtime=pod.get("runtime") or {},
+                            endpoint_url=self._generate_proxy_url(pod["id"], 8188)
+                        )
+                        for pod in pods
+                    }
+                    
+        except Exception as e:
+            logger.error(f"RunPod Pod 목록 조회 실패: {e}")
+            raise RuntimeError(f"RunPod Pod 목록 조회 실패: {e}")
+    
     async def _start_pod(self, pod_id: str) -> bool:
         """Pod 시작 (자동화용)"""
         
@@ -555,7 +612,7 @@ class RunPodService:
                 "Authorization": f"Bearer {self.api_key}"
             }
             
-            async with aiohttp.ClientSession() as session:
+            async with pooled_aiohttp_session("runpod_graphql") as session:
                 payload = {
                     "query": mutation,
                     "variables": variables
@@ -628,7 +685,7 @@ class RunPodService:
                 "Authorization": f"Bearer {self.api_key}"
             }
             
-            async with aiohttp.ClientSession() as session:
+            async with pooled_aiohttp_session("runpod_graphql") as session:
                 payload = {
                     "query": mutation,
                     "variables": variables
@@ -840,7 +897,7 @@ class RunPodService:
                     test_url = f"{endpoint_url}{endpoint}"
                     logger.info(f"     🌐 ComfyUI API 테스트: {test_url}")
                     
-                    async with aiohttp.ClientSession() as session:
+                    async with pooled_aiohttp_session("runpod_pod") as session:
                         async with session.get(
                             test_url,
                             timeout=aiohttp.ClientTimeout(total=10),  # 타임아웃 10초로 연장
@@ -896,7 +953,7 @@ class RunPodService:
             logger.info(f"     🔍 JupyterLab URL: {jupyter_url}")
             
             # RunPod proxy를 통한 JupyterLab 접근 시도
-            async with aiohttp.ClientSession() as session:
+            async with pooled_aiohttp_session("runpod_pod") as session:
                 async with session.get(
                     f"{jupyter_url}/tree",
                     timeout=aiohttp.ClientTimeout(total=5),
@@ -968,7 +1025,7 @@ class RunPodService:
             variables = {"input": {"podId": pod_id}}
             payload = {"query": query, "variables": variables}
             
-            async with aiohttp.ClientSession() as session:
+            async with pooled_aiohttp_session("runpod_graphql") as session:
                 async with session.post(
                     self.base_url,
                     json=payload,
@@ -1107,7 +1164,7 @@ class RunPodService:
                 "Authorization": f"Bearer {self.api_key}"
             }
             
-            async with aiohttp.ClientSession() as session:
+            async with pooled_aiohttp_session("runpod_graphql") as session:
                 payload = {"query": query}
                 
                 logger.info(f"Checking volume {volume_id} status...")
@@ -1190,7 +1247,7 @@ class RunPodService:
                 "Authorization": f"Bearer {self.api_key}"
             }
             
-            async with aiohttp.ClientSession() as session:
+            async with pooled_aiohttp_session("runpod_graphql") as session:
                 payload = {
                     "query": mutation,
                     "variables": variables
@@ -1256,7 +1313,7 @@ class RunPodService:
                 "Authorization": f"Bearer {self.api_key}"
             }
             
-            async with aiohttp.ClientSession() as session:
+            async with pooled_aiohttp_session("runpod_graphql") as session:
                 payload = {"query": query}
                 
                 async with session.post(
@@ -1330,7 +1387,7 @@ class RunPodService:
                 "query": query
             }
 
-            async with aiohttp.ClientSession() as session:
+            async with pooled_aiohttp_session("runpod_graphql") as session:
                 async with session.post(
                     self.base_url,
                     headers=headers,
@@ -1,4 +1,3 @@
-import boto3
 import logging
 import os
 from typing import Optional, Dict, Any, List
@@ -9,6 +8,12 @@ from fastapi import HTTPException, status
 from app.core.config import settings
 from botocore.exceptions import ClientError
 import time
+from app.services.object_storage import (
+    AsyncObjectStorage,
+    create_s3_client,
+    run_in_s3_executor,
+)
+from app.services.presigned_url_cache import get_presigned_url_cache
 
 logger = logging.getLogger(__name__)
 
@@ -20,14 +25,25 @@ class S3ImageService:
         self.s3_client = None
         self.bucket_name = settings.S3_BUCKET_NAME
         self.region = settings.AWS_REGION
-        self._url_cache: Dict[str, Dict] = {}  # URL 캐시 추가
-        self._cache_ttl = 3600  # 캐시 TTL (1시간)
+        self.storage: Optional[AsyncObjectStorage] = None
+        # 연결/버킷 확인 결과 캐시 (매 호출마다 list_buckets/head_bucket 요청 방지)
+        self._availability_ttl = 300
+        self._available_checked_at = 0.0
 
         # S3 클라이언트 초기화
         self._initialize_client()
 
+    def _availability_is_fresh(self) -> bool:
+        return (
+            self.s3_client is not None
+            and time.monotonic() - self._available_checked_at < self._availability_ttl
+        )
+
     def is_available(self) -> bool:
-        """S3 서비스 사용 가능 여부 확인"""
+        """S3 서비스 사용 가능 여부 확인 (확인 결과는 일정 시간 캐시)"""
+        if self._availability_is_fresh():
+            return True
+
         if self.s3_client is None:
             # 클라이언트가 None이면 재초기화 시도
             self._initialize_client()
@@ -36,11 +52,9 @@ class S3ImageService:
 
         # 실제 연결 테스트 및 버킷 존재 확인
         try:
-            # 연결 테스트
-            self.s3_client.list_buckets()
-
-            # 버킷 존재 확인
+            # 버킷 존재 확인 (연결 테스트 겸용)
             self.s3_client.head_bucket(Bucket=self.bucket_name)
+            self._available_checked_at = time.monotonic()
             logger.info(f"S3 버킷 확인 성공: {self.bucket_name}")
             return True
         except Exception as e:
@@ -49,6 +63,26 @@ class S3ImageService:
             self._initialize_client()
             return self.s3_client is not None
 
+    async def is_available_async(self) -> bool:
+        """is_available의 비동기 버전 (캐시 만료 시 비동기 storage로 버킷 확인)"""
+        if self._availability_is_fresh():
+            return True
+
+        if self.storage is None:
+            self._initialize_client()
+            if self.storage is None:
+                return False
+
+        try:
+            await self.storage.head_bucket()
+            self._available_checked_at = time.monotonic()
+            logger.info(f"S3 버킷 확인 성공: {self.bucket_name}")
+            return True
+        except Exception as e:
+            logger.warning(f"S3 연결 테스트 실패: {e}")
+            self._initialize_client()
+            return self.s3_client is not None
+
     def _initialize_client(self):
         """S3 클라이언트 초기화"""
         if (
@@ -57,12 +91,7 @@ class S3ImageService:
             and settings.AWS_SECRET_ACCESS_KEY
         ):
             try:
-                self.s3_client = boto3.client(
-                    "s3",
-                    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                    region_name=settings.AWS_REGION,
-                )
+                self.s3_client = create_s3_client()
                 logger.info(f"S3 클라이언트 재초기화 성공: {self.bucket_name}")
             except Exception as e:
                 logger.error(f"S3 클라이언트 재초기화 실패: {e}")
@@ -71,6 +100,13 @@ class S3ImageService:
             logger.warning("S3 설정이 완료되지 않았습니다.")
             self.s3_client = None
 
+        self._available_checked_at = 0.0
+        self.storage = (
+            AsyncObjectStorage(self.s3_client, self.bucket_name)
+            if self.s3_client
+            else None
+        )
+
     def check_bucket_exists(self) -> bool:
         """S3 버킷 존재 여부 확인"""
         if self.s3_client is None:
@@ -162,7 +198,7 @@ class S3ImageService:
         created_date: datetime = None,
     ) -> str:
         """이미지를 S3에 업로드하고 URL 반환"""
-        if not self.is_available():
+        if not await self.is_available_async():
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="S3 서비스를 사용할 수 없습니다.",
@@ -178,12 +214,9 @@ class S3ImageService:
                 file_extension = ".png"  # 기본값
 
             # S3에 업로드
-            if self.s3_client:
-                self.s3_client.put_object(
-                    Bucket=self.bucket_name,
-                    Key=s3_key,
-                    Body=image_data,
-                    ContentType=self._get_content_type(file_extension),
+            if self.storage:
+                await self.storage.put_object(
+                    s3_key, image_data, self._get_content_type(file_extension)
                 )
 
                 # S3 키만 반환 (Presigned URL은 필요할 때 생성)
@@ -207,16 +240,15 @@ class S3ImageService:
         self, local_image_path: str, board_id: str, user_id: Optional[str] = None
     ) -> str:
         """로컬 이미지 파일을 S3에 업로드"""
-        if not self.is_available():
+        if not await self.is_available_async():
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="S3 서비스를 사용할 수 없습니다.",
             )
 
         try:
-            # 파일 읽기
-            with open(local_image_path, "rb") as f:
-                image_data = f.read()
+            # 파일 읽기 (스레드 풀에서 실행)
+            image_data = await run_in_s3_executor(Path(local_image_path).read_bytes)
 
             # 파일명 추출
             filename = Path(local_image_path).name
@@ -251,7 +283,7 @@ class S3ImageService:
         created_date: datetime = None,
     ) -> str:
         """인플루언서 이미지를 S3에 업로드하고 URL 반환"""
-        if not self.is_available():
+        if not await self.is_available_async():
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="S3 서비스를 사용할 수 없습니다.",
@@ -269,12 +301,9 @@ class S3ImageService:
                 file_extension = ".png"  # 기본값
 
             # S3에 업로드
-            if self.s3_client:
-                self.s3_client.put_object(
-                    Bucket=self.bucket_name,
-                    Key=s3_key,
-                    Body=image_data,
-                    ContentType=self._get_content_type(file_extension),
+            if self.storage:
+                await self.storage.put_object(
+                    s3_key, image_data, self._get_content_type(file_extension)
                 )
 
                 # S3 키만 반환 (Presigned URL은 필요할 때 생성)
@@ -309,7 +338,7 @@ class S3ImageService:
 
     async def delete_image(self, s3_url: str) -> bool:
         """S3에서 이미지 삭제"""
-        if not self.is_available():
+        if not await self.is_available_async():
             return False
 
         try:
@@ -318,8 +347,9 @@ class S3ImageService:
                 f"https://{self.bucket_name}.s3.{self.region}.amazonaws.com/", ""
             )
 
-            if self.s3_client:
-                self.s3_client.delete_object(Bucket=self.bucket_name, Key=s3_key)
+            if self.storage:
+                await self.storage.delete_object(s3_key)
+                get_presigned_url_cache().invalidate(self.bucket_name, s3_key)
 
                 logger.info(f"S3 이미지 삭제 성공: {s3_key}")
                 return True
@@ -331,28 +361,24 @@ class S3ImageService:
             logger.error(f"S3 이미지 삭제 실패: {e}")
             return False
 
+    def _has_client(self) -> bool:
+        """서명용 클라이언트 확인 (네트워크 요청 없음)"""
+        if self.s3_client is None:
+            self._initialize_client()
+        return self.s3_client is not None
+
     def generate_presigned_url(self, s3_key: str, expiration: int = 3600) -> str:
-        """Presigned URL 생성 (캐싱 포함)"""
-        logger.info(f"Presigned URL 생성 시도: {s3_key}")
-        
-        # 캐시된 URL이 있고 아직 유효한지 확인
-        if s3_key in self._url_cache:
-            cached_data = self._url_cache[s3_key]
-            if time.time() < cached_data['expires_at']:
-                logger.info(f"Using cached presigned URL for key: {s3_key}")
-                return cached_data['url']
-            else:
-                # 만료된 캐시 제거
-                del self._url_cache[s3_key]
-                logger.info(f"Removed expired cache for key: {s3_key}")
-        
-        logger.info(f"S3 서비스 사용 가능: {self.is_available()}")
-        logger.info(f"S3 클라이언트 존재: {self.s3_client is not None}")
-        logger.info(f"버킷명: {self.bucket_name}")
-        logger.info(f"지역: {self.region}")
-
-        if not self.is_available() or not self.s3_client:
-            logger.error("S3 서비스가 사용 불가능하거나 클라이언트가 없습니다")
+        """Presigned URL 생성 (공유 캐시 사용)
+
+        서명은 로컬 HMAC 계산이므로 버킷 확인(head_bucket) 없이 클라이언트만 확인
+        """
+        cache = get_presigned_url_cache()
+        cached_url = cache.get(self.bucket_name, s3_key, expiration)
+        if cached_url:
+            return cached_url
+
+        if not self._has_client():
+            logger.error("S3 클라이언트가 없습니다")
             return ""
 
         try:
@@ -361,32 +387,37 @@ class S3ImageService:
                 Params={"Bucket": self.bucket_name, "Key": s3_key},
                 ExpiresIn=expiration,
             )
-            
-            # 캐시에 저장 (만료 시간을 현재 시간 + expiration으로 설정)
-            self._url_cache[s3_key] = {
-                'url': url,
-                'expires_at': time.time() + expiration - 300  # 5분 여유 시간
-            }
-            
-            logger.info(f"Presigned URL 생성 성공 및 캐시 저장: {s3_key}")
-            logger.info(f"생성된 URL: {url}")
+            cache.put(self.bucket_name, s3_key, expiration, url)
+            logger.debug(f"Presigned URL 생성: {s3_key}")
             return url
         except Exception as e:
-            logger.error(f"Presigned URL 생성 실패: {e}")
-            logger.error(f"오류 타입: {type(e)}")
-            logger.error(f"오류 상세: {str(e)}")
+            logger.error(f"Presigned URL 생성 실패 ({s3_key}): {e}")
             return ""
 
+    def generate_presigned_urls(
+        self, s3_keys: List[str], expiration: int = 3600
+    ) -> Dict[str, str]:
+        """여러 키의 Presigned URL 일괄 생성 (목록 화면에서 페이지당 한 번 호출)
+
+        서명은 로컬 HMAC 계산이므로 클라이언트만 확인 후 한 번에 처리
+        """
+        unique_keys = list(dict.fromkeys(s3_keys))
+        if not unique_keys:
+            return {}
+        if not self._has_client():
+            logger.error("S3 클라이언트가 없습니다")
+            return {key: "" for key in unique_keys}
+
+        return {key: self.generate_presigned_url(key, expiration) for key in unique_keys}
+
     async def get_image_info(self, s3_key: str) -> Optional[Dict[str, Any]]:
         """S3 이미지 정보 조회"""
-        if not self.is_available():
+        if not await self.is_available_async():
             return None
 
         try:
-            if self.s3_client:
-                response = self.s3_client.head_object(
-                    Bucket=self.bucket_name, Key=s3_key
-                )
+            if self.storage:
+                response = await self.storage.head_object(s3_key)
 
                 return {
                     "size": response.get("ContentLength"),
@@ -404,32 +435,29 @@ class S3ImageService:
 
     async def list_board_images(self, board_id: str) -> List[Dict[str, Any]]:
         """특정 게시글의 모든 이미지 목록 조회"""
-        if not self.is_available():
+        if not await self.is_available_async():
             return []
 
         try:
             # 게시글 경로 패턴으로 검색
             prefix = f"images/posts/"
 
-            if self.s3_client:
-                response = self.s3_client.list_objects_v2(
-                    Bucket=self.bucket_name, Prefix=prefix
-                )
+            if self.storage:
+                objects = await self.storage.list_objects(prefix)
 
                 board_images = []
-                if "Contents" in response:
-                    for obj in response["Contents"]:
-                        key = obj["Key"]
-                        # board_id가 포함된 경로만 필터링
-                        if f"/{board_id}/" in key:
-                            board_images.append(
-                                {
-                                    "key": key,
-                                    "size": obj["Size"],
-                                    "last_modified": obj["LastModified"],
-                                    "url": f"https://{self.bucket_name}.s3.{self.region}.amazonaws.com/{key}",
-                                }
-                            )
+                for obj in objects:
+                    key = obj["Key"]
+                    # board_id가 포함된 경로만 필터링
+                    if f"/{board_id}/" in key:
+                        board_images.append(
+                            {
+                                "key": key,
+                                "size": obj["Size"],
+                                "last_modified": obj["LastModified"],
+                                "url": f"https://{self.bucket_name}.s3.{self.region}.amazonaws.com/{key}",
+                            }
+                        )
 
                 return board_images
             else:
@@ -442,7 +470,7 @@ class S3ImageService:
 
     async def delete_board_images(self, board_id: str) -> bool:
         """특정 게시글의 모든 이미지 삭제"""
-        if not self.is_available():
+        if not await self.is_available_async():
             return False
 
         try:
@@ -453,17 +481,14 @@ class S3ImageService:
                 logger.info(f"삭제할 이미지가 없습니다: {board_id}")
                 return True
 
-            # 모든 이미지 삭제
-            deleted_count = 0
-            for image_info in board_images:
-                key = image_info["key"]
-                try:
-                    if self.s3_client:
-                        self.s3_client.delete_object(Bucket=self.bucket_name, Key=key)
-                        deleted_count += 1
-                        logger.info(f"이미지 삭제 성공: {key}")
-                except Exception as e:
-                    logger.error(f"이미지 삭제 실패: {key} - {e}")
+            # 모든 이미지 일괄 삭제 (delete_objects, 요청당 최대 1000개)
+            keys = [image_info["key"] for image_info in board_images]
+            deleted_keys, errors = await self.storage.delete_objects(keys)
+            deleted_count = len(deleted_keys)
+            for error in errors:
+                logger.error(
+                    f"이미지 삭제 실패: {error.get('Key')} - {error.get('Code')} {error.get('Message')}"
+                )
 
             logger.info(
                 f"게시글 이미지 삭제 완료: {board_id} ({deleted_count}/{len(board_images)} 개)"
@@ -476,15 +501,12 @@ class S3ImageService:
 
     def clear_cache(self):
         """캐시 정리"""
-        self._url_cache.clear()
+        get_presigned_url_cache().clear()
         logger.info("S3 URL cache cleared")
 
     def get_cache_stats(self) -> Dict:
         """캐시 통계 반환"""
-        return {
-            'cache_size': len(self._url_cache),
-            'cached_keys': list(self._url_cache.keys())
-        }
+        return get_presigned_url_cache().get_stats()
 
 
 # 싱글톤 인스턴스
@@ -4,13 +4,19 @@ QA 생성 결과 파일을 S3에 업로드하는 기능 제공
 """
 
 import os
-import boto3
 import json
 import logging
 from typing import Optional, Dict, List, Any
 from datetime import datetime
 from botocore.exceptions import ClientError, NoCredentialsError
 
+from app.services.object_storage import (
+    AsyncObjectStorage,
+    create_s3_client,
+    get_transfer_config,
+)
+from app.services.presigned_url_cache import get_presigned_url_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,8 +36,7 @@ class S3Service:
             self.s3_client = None
         else:
             try:
-                self.s3_client = boto3.client(
-                    's3',
+                self.s3_client = create_s3_client(
                     aws_access_key_id=self.aws_access_key_id,
                     aws_secret_access_key=self.aws_secret_access_key,
                     region_name=self.aws_region
@@ -41,6 +46,12 @@ class S3Service:
                 logger.error(f"S3 클라이언트 초기화 실패: {e}")
                 self.s3_client = None
 
+        self.storage = (
+            AsyncObjectStorage(self.s3_client, self.bucket_name)
+            if self.s3_client
+            else None
+        )
+
     def is_available(self) -> bool:
         """S3 서비스 사용 가능 여부 확인"""
         return self.s3_client is not None
@@ -81,7 +92,8 @@ class S3Service:
                 local_file_path, 
                 self.bucket_name, 
                 s3_key,
-                ExtraArgs=extra_args
+                ExtraArgs=extra_args,
+                Config=get_transfer_config()
             )
             
             # S3 URL 생성
@@ -120,13 +132,8 @@ class S3Service:
             return None
             
         try:
-            # 바이트 데이터를 직접 업로드
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=key,
-                Body=image_data,
-                ContentType=content_type
-            )
+            # 바이트 데이터를 직접 업로드 (스레드 풀에서 실행)
+            await self.storage.put_object(key, image_data, content_type)
             
             # Presigned URL 또는 일반 URL 반환
             if return_presigned:
@@ -183,16 +190,17 @@ class S3Service:
             logger.error(f"JSON 업로드 중 예상치 못한 오류: {e}")
             return None
 
-    def upload_qa_results(self, influencer_id: str, task_id: str, qa_pairs: List[Dict], 
-                         raw_results_file: str = None) -> Dict[str, Optional[str]]:
+    def upload_qa_results(self, influencer_id: str, task_id: str, qa_pairs: List[Dict] = None, 
+                         raw_results_file: str = None, processed_qa_file: str = None) -> Dict[str, Optional[str]]:
         """
         QA 생성 결과를 S3에 업로드
         
         Args:
             influencer_id: 인플루언서 ID
             task_id: 작업 ID
-            qa_pairs: 처리된 QA 쌍 리스트
+            qa_pairs: 처리된 QA 쌍 리스트 (processed_qa_file이 없을 때 사용)
             raw_results_file: 원본 결과 파일 경로 (선택사항)
+            processed_qa_file: 스트리밍 기록된 처리 QA JSON 파일 경로 (멀티파트 업로드)
             
         Returns:
             업로드된 파일들의 URL 정보
@@ -207,15 +215,18 @@ class S3Service:
         try:
             # 1. 처리된 QA 쌍을 JSON으로 업로드
             processed_qa_key = f"influencers/{influencer_id}/qa_pairs/{task_id}/processed_qa_{timestamp}.json"
-            processed_qa_data = {
-                "influencer_id": influencer_id,
-                "task_id": task_id,
-                "generated_at": datetime.now().isoformat(),
-                "total_qa_pairs": len(qa_pairs),
-                "qa_pairs": qa_pairs
-            }
-            
-            processed_qa_url = self.upload_json_data(processed_qa_data, processed_qa_key)
+            if processed_qa_file:
+                # 이미 파일로 기록된 경우 메모리에 올리지 않고 파일에서 바로 업로드
+                processed_qa_url = self.upload_file(processed_qa_file, processed_qa_key, 'application/json')
+            else:
+                processed_qa_data = {
+                    "influencer_id": influencer_id,
+                    "task_id": task_id,
+                    "generated_at": datetime.now().isoformat(),
+                    "total_qa_pairs": len(qa_pairs or []),
+                    "qa_pairs": qa_pairs or []
+                }
+                processed_qa_url = self.upload_json_data(processed_qa_data, processed_qa_key)
             upload_results["processed_qa_url"] = processed_qa_url
             
             # 2. 원본 결과 파일 업로드 (있는 경우)
@@ -274,9 +285,8 @@ class S3Service:
             logger.info(f"S3에서 이미지 다운로드 시작: {key}")
             logger.debug(f"원본 URL: {s3_url}")
             
-            # S3에서 객체 가져오기
-            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
-            image_data = response['Body'].read()
+            # S3에서 객체 가져오기 (스레드 풀에서 실행)
+            image_data = await self.storage.get_object_bytes(key)
             
             logger.info(f"S3 이미지 다운로드 성공: {len(image_data)} bytes")
             return image_data
@@ -308,13 +318,8 @@ class S3Service:
             if not content_type:
                 content_type = 'application/octet-stream'
             
-            # 바이트 데이터 업로드
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=key,
-                Body=file_bytes,
-                ContentType=content_type
-            )
+            # 바이트 데이터 업로드 (큰 파일은 멀티파트)
+            await self.storage.put_object(key, file_bytes, content_type)
             
             # S3 URL 생성
             s3_url = f"https://{self.bucket_name}.s3.{self.aws_region}.amazonaws.com/{key}"
@@ -351,37 +356,8 @@ class S3Service:
             return []
             
         try:
-            objects = []
-            continuation_token = None
-            
-            while True:
-                # list_objects_v2 파라미터 설정
-                params = {
-                    'Bucket': self.bucket_name,
-                    'Prefix': prefix,
-                    'MaxKeys': max_keys
-                }
-                
-                if continuation_token:
-                    params['ContinuationToken'] = continuation_token
-                
-                # S3 객체 목록 조회
-                response = self.s3_client.list_objects_v2(**params)
-                
-                # 객체 추가
-                if 'Contents' in response:
-                    objects.extend(response['Contents'])
-                
-                # 다음 페이지가 있는지 확인
-                if response.get('IsTruncated', False):
-                    continuation_token = response.get('NextContinuationToken')
-                else:
-                    break
-                    
-                # max_keys에 도달하면 중단
-                if len(objects) >= max_keys:
-                    objects = objects[:max_keys]
-                    break
+            # 페이지네이션 포함 목록 조회 (스레드 풀에서 실행)
+            objects = await self.storage.list_objects(prefix, max_keys)
             
             logger.info(f"S3에서 {len(objects)}개의 객체를 조회했습니다. (prefix: {prefix})")
             return objects
@@ -473,6 +449,9 @@ class S3Service:
             
             files = []
             if 'Contents' in response:
+                presigned_urls = self.generate_presigned_urls(
+                    [obj['Key'] for obj in response['Contents']], expiration
+                )
                 for obj in response['Contents']:
                     # 폴더는 제외 (키가 /로 끝나는 경우)
                     if obj['Key'].endswith('/'):
@@ -480,7 +459,7 @@ class S3Service:
                     
                     # 이미지 파일만 포함 (확장자 체크)
                     if any(obj['Key'].lower().endswith(ext) for ext in ['.png', '.jpg', '.jpeg', '.webp', '.gif']):
-                        presigned_url = self.generate_presigned_url(obj['Key'], expiration)
+                        presigned_url = presigned_urls.get(obj['Key'])
                         if presigned_url:
                             files.append({
                                 'key': obj['Key'],
@@ -502,7 +481,7 @@ class S3Service:
 
     def generate_presigned_url(self, s3_key: str, expiration: int = 3600) -> Optional[str]:
         """
-        S3 파일에 대한 사전 서명된 URL 생성
+        S3 파일에 대한 사전 서명된 URL 생성 (공유 캐시 사용)
         
         Args:
             s3_key: S3 파일 키
@@ -516,13 +495,16 @@ class S3Service:
             return None
             
         try:
-            url = self.s3_client.generate_presigned_url(
-                'get_object',
-                Params={'Bucket': self.bucket_name, 'Key': s3_key},
-                ExpiresIn=expiration
+            return get_presigned_url_cache().get_or_create(
+                self.bucket_name,
+                s3_key,
+                expiration,
+                lambda: self.s3_client.generate_presigned_url(
+                    'get_object',
+                    Params={'Bucket': self.bucket_name, 'Key': s3_key},
+                    ExpiresIn=expiration
+                ),
             )
-            logger.info(f"사전 서명된 URL 생성 성공: {s3_key}")
-            return url
             
         except ClientError as e:
             logger.error(f"사전 서명된 URL 생성 실패: {e}")
@@ -531,6 +513,21 @@ class S3Service:
             logger.error(f"URL 생성 중 예상치 못한 오류: {e}")
             return None
 
+    def generate_presigned_urls(self, s3_keys: List[str], expiration: int = 3600) -> Dict[str, Optional[str]]:
+        """
+        여러 S3 키의 사전 서명된 URL 일괄 생성 (목록 화면에서 페이지당 한 번 호출)
+        
+        Args:
+            s3_keys: S3 파일 키 목록
+            expiration: URL 만료 시간 (초)
+            
+        Returns:
+            키별 사전 서명된 URL (실패 시 None)
+        """
+        urls = {s3_key: self.generate_presigned_url(s3_key, expiration) for s3_key in dict.fromkeys(s3_keys)}
+        logger.debug(f"사전 서명된 URL 일괄 생성: {len(urls)}개")
+        return urls
+
 
 # 전역 S3 서비스 인스턴스
 s3_service = S3Service()
@@ -85,7 +85,7 @@ class SessionCleanupService:
             start_time = datetime.now()
             
             async with AsyncSessionLocal() as db:
-                # 1. 만료된 사용자 세션 및 종료된 RunPod 정리
+                # 1. 만료된 사용자 세션 및 종료된 RunPod 정리 (Pod 목록 1회 조회 + 일괄 UPDATE)
                 cleaned_sessions = await self.user_session_service.cleanup_expired_sessions(db)
                 
                 # 2. 고아 이미지 레코드 정리 (선택적) - 임시 비활성화
@@ -115,10 +115,14 @@ class SessionCleanupService:
     
     def get_status(self) -> dict:
         """서비스 상태 반환"""
+        from app.services.session_reconciler import get_session_reconciler
+        
         return {
             "is_running": self.is_running,
             "cleanup_interval": self.cleanup_interval,
-            "task_status": "active" if self.cleanup_task and not self.cleanup_task.done() else "inactive"
+            "task_status": "active" if self.cleanup_task and not self.cleanup_task.done() else "inactive",
+            # 마지막 정리 소요 시간 및 세션/Pod 드리프트 지표
+            "reconciliation": get_session_reconciler().get_stats()
         }
 
 
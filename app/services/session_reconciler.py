@@ -0,0 +1,246 @@
+"""
+이미지 생성 세션 / RunPod Pod 상태 일괄 정리 (reconciliation)
+
+세션 정리 주기마다:
+1. 활성 Pod을 가진 사용자 세션을 한 번의 쿼리로 조회
+2. 계정의 전체 Pod 상태를 한 번의 GraphQL 요청으로 조회
+3. 메모리에서 비교하여 만료 세션 / 사라진 Pod / 종료된 Pod 세션 판별
+4. 대상 세션을 조건부 UPDATE로 초기화하고 (조회 이후 연장된 세션 제외) 초기화된 만료 세션의 Pod은 동시 종료
+5. 정리 소요 시간 및 드리프트 지표 기록
+"""
+
+import time
+import asyncio
+import logging
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import and_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import User
+from app.services.runpod_service import get_runpod_service
+from app.services.session_state_bus import get_session_state_bus
+from app.services.warm_pod_pool import get_warm_pod_pool
+
+logger = logging.getLogger(__name__)
+
+# Pod이 더 이상 사용할 수 없는 상태
+TERMINATED_POD_STATUSES = {"TERMINATED", "STOPPED", "FAILED", "EXITED"}
+
+
+@dataclass
+class ReconcileReport:
+    """정리 1회 결과 및 드리프트 지표"""
+
+    started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    duration_seconds: float = 0.0
+    active_sessions: int = 0
+    # Pod 목록 조회 실패 시 None (Pod 드리프트 판별은 건너뜀)
+    pods_listed: Optional[int] = None
+    expired: int = 0
+    pod_missing: int = 0
+    pod_terminated: int = 0
+    # 계정에는 있지만 어떤 사용자 세션에도 연결되지 않은 Pod 수 (보고만 함)
+    untracked_pods: int = 0
+    pod_terminations_failed: int = 0
+    rows_updated: int = 0
+    # 조회 이후 연장/변경되어 초기화하지 않은 세션 수
+    skipped: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["started_at"] = self.started_at.isoformat()
+        return data
+
+
+class SessionReconciler:
+    """사용자 세션 컬럼과 RunPod Pod 상태 일괄 비교/정리"""
+
+    # 만료 세션 Pod 종료 동시 요청 수 및 재시도 횟수
+    TERMINATE_CONCURRENCY = 10
+    TERMINATE_ATTEMPTS = 3
+
+    def __init__(self):
+        self.state_bus = get_session_state_bus()
+        self.last_report: Optional[ReconcileReport] = None
+        self.sweeps = 0
+
+    @property
+    def runpod_service(self):
+        # RunPod 설정이 없는 환경에서도 지표 조회는 가능하도록 실제 정리 시점에 초기화
+        return get_runpod_service()
+
+    async def reconcile(self, db: AsyncSession) -> ReconcileReport:
+        """세션 정리 1회 실행"""
+        report = ReconcileReport()
+        started = time.perf_counter()
+
+        now = datetime.now(timezone.utc)
+        # 데이터베이스 비교를 위해 타임존 정보 제거 (UTC 시간 그대로 사용)
+        now_naive = now.replace(tzinfo=None)
+
+        # 1. 활성 세션 조회 (필요한 컬럼만)
+        result = await db.execute(
+            select(
+                User.user_id,
+                User.current_pod_id,
+                User.pod_status,
+                User.session_expires_at,
+                User.processing_expires_at,
+            ).where(
+                User.current_pod_id.isnot(None),
+                User.pod_status != "none",
+            )
+        )
+        sessions = result.all()
+        report.active_sessions = len(sessions)
+
+        # 2. 전체 Pod 상태 조회 (1회)
+        pods = None
+        try:
+            pods = await self.runpod_service.list_pods()
+            report.pods_listed = len(pods)
+        except Exception as e:
+            logger.warning(f"⚠️ Pod 목록 조회 실패 - 이번 정리에서는 만료 세션만 처리: {e}")
+
+        # 3. 메모리에서 비교
+        expired_sessions = []
+        gone_pod_ids: List[str] = []
+        tracked_pod_ids = set()
+
+        for session in sessions:
+            pod_id = session.current_pod_id
+            tracked_pod_ids.add(pod_id)
+
+            if _is_past(now, session.session_expires_at) or _is_past(now, session.processing_expires_at):
+                expired_sessions.append(session)
+                continue
+
+            # 생성 중(pending) 세션과 Pod 목록 조회 실패 시에는 Pod 상태를 판단하지 않음
+            if pods is None or pod_id == "pending":
+                continue
+
+            pod = pods.get(pod_id)
+            if pod is None:
+                report.pod_missing += 1
+                gone_pod_ids.append(pod_id)
+                logger.info(f"🛑 삭제된 Pod 감지: {pod_id} (사용자: {session.user_id})")
+            elif pod.status.upper() in TERMINATED_POD_STATUSES:
+                report.pod_terminated += 1
+                gone_pod_ids.append(pod_id)
+                logger.info(f"🛑 종료된 Pod 감지: {pod_id} (상태: {pod.status}, 사용자: {session.user_id})")
+
+        report.expired = len(expired_sessions)
+        pod_pool = get_warm_pod_pool()
+        if gone_pod_ids:
+            pod_pool.discard(gone_pod_ids)
+        if pods is not None:
+            # 웜 풀이 보유한 유휴/준비 중 Pod은 세션에 연결되지 않은 것이 정상
+            report.untracked_pods = len(set(pods) - tracked_pod_ids - pod_pool.owned_pod_ids())
+
+        # 4. 대상 세션 초기화 - 조회한 Pod이 그대로이고 (만료 세션은) 아직 만료 상태인 행만 조건부 UPDATE
+        # 조회 이후 연장/재생성된 세션은 rowcount 0으로 제외하고, 실제로 초기화된 세션만 통지/Pod 반환
+        expired_condition = (User.session_expires_at < now_naive) | (User.processing_expires_at < now_naive)
+        targets = [(session, True) for session in expired_sessions]
+        targets += [(session, False) for session in sessions if session.current_pod_id in gone_pod_ids]
+
+        cleared = []
+        if targets:
+            for session, expired in targets:
+                conditions = [User.user_id == session.user_id, User.current_pod_id == session.current_pod_id]
+                if expired:
+                    conditions.append(expired_condition)
+                result = await db.execute(
+                    update(User)
+                    .where(and_(*conditions))
+                    .values(
+                        current_pod_id=None,
+                        pod_status="none",
+                        session_created_at=None,
+                        session_expires_at=None,
+                        processing_expires_at=None,
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+                if not result.rowcount:
+                    report.skipped += 1
+                    logger.info(f"⏭️ 조회 이후 변경된 세션은 정리하지 않음: {session.user_id} (Pod: {session.current_pod_id})")
+                    continue
+                report.rows_updated += 1
+                cleared.append((session, expired))
+            await db.commit()
+
+            for session, _ in cleared:
+                self.state_bus.publish(session.user_id, None, "session_reconcile")
+
+        # 5. 초기화된 만료 세션의 Pod 반환 - 웜 풀 재사용 또는 종료 (동시 요청 수 제한, 실패한 Pod은 다음 정리에서 untracked로 보고됨)
+        terminate_ids = [
+            session.current_pod_id for session, expired in cleared
+            if expired and session.current_pod_id != "pending" and (pods is None or session.current_pod_id in pods)
+        ]
+        if terminate_ids:
+            report.pod_terminations_failed = await self._terminate_pods(terminate_ids)
+
+        report.duration_seconds = round(time.perf_counter() - started, 3)
+        self.last_report = report
+        self.sweeps += 1
+
+        if report.rows_updated or report.skipped or report.pod_terminations_failed or report.untracked_pods:
+            logger.info(
+                f"🧹 세션 정리: 활성 {report.active_sessions}개, 만료 {report.expired}개, "
+                f"삭제된 Pod {report.pod_missing}개, 종료된 Pod {report.pod_terminated}개, "
+                f"초기화 {report.rows_updated}행, 변경되어 제외 {report.skipped}개, 미연결 Pod {report.untracked_pods}개, "
+                f"종료 실패 {report.pod_terminations_failed}개, 소요시간 {report.duration_seconds:.2f}초"
+            )
+        return report
+
+    async def _terminate_pods(self, pod_ids: List[str]) -> int:
+        """Pod 동시 반환(웜 풀 재사용 또는 종료), 실패 수 반환"""
+        semaphore = asyncio.Semaphore(self.TERMINATE_CONCURRENCY)
+        pod_pool = get_warm_pod_pool()
+
+        async def terminate(pod_id: str) -> bool:
+            async with semaphore:
+                for attempt in range(1, self.TERMINATE_ATTEMPTS + 1):
+                    try:
+                        if await pod_pool.release_pod(pod_id):
+                            return True
+                        logger.warning(f"⚠️ 만료 세션 Pod {pod_id} 종료 실패 (시도 {attempt}/{self.TERMINATE_ATTEMPTS})")
+                    except Exception as e:
+                        logger.error(f"❌ 만료 세션 Pod {pod_id} 종료 시도 {attempt} 실패: {e}")
+                    if attempt < self.TERMINATE_ATTEMPTS:
+                        await asyncio.sleep(2)
+                return False
+
+        results = await asyncio.gather(*(terminate(pod_id) for pod_id in pod_ids))
+        return sum(1 for success in results if not success)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """정리 지표"""
+        return {
+            "sweeps": self.sweeps,
+            "last_report": self.last_report.to_dict() if self.last_report else None,
+        }
+
+
+def _is_past(now: datetime, deadline: Optional[datetime]) -> bool:
+    """deadline이 지났는지 확인 (타임존 없는 값은 UTC로 간주)"""
+    if deadline is None:
+        return False
+    if deadline.tzinfo is None:
+        deadline = deadline.replace(tzinfo=timezone.utc)
+    return now > deadline
+
+
+# 싱글톤 인스턴스
+_session_reconciler: Optional[SessionReconciler] = None
+
+
+def get_session_reconciler() -> SessionReconciler:
+    """세션 정리기 싱글톤 인스턴스 반환"""
+    global _session_reconciler
+    if _session_reconciler is None:
+        _session_reconciler = SessionReconciler()
+    return _session_reconciler
@@ -0,0 +1,154 @@
+"""
+세션 상태 변경 이벤트 버스
+UserSessionService / PodSessionManager / SessionCleanupService가 세션 상태 전이
+(starting → ready → processing → ready ... → none)를 발행하고,
+WebSocket 계층은 구독하여 변경이 있을 때만 클라이언트에 전송
+
+- 사용자별 최신 상태 스냅샷 보관 (재연결/하트비트 시 DB 조회 없이 전송)
+- 동일 상태 재발행은 무시
+- 구독 큐는 최신 상태만 유지 (느린 소비자는 중간 상태를 건너뜀)
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# 상태 변경 판단에 사용하는 필드 (남은 시간 등 시간에 따라 변하는 값은 제외)
+_SIGNATURE_FIELDS = (
+    "pod_id",
+    "pod_status",
+    "session_expires_at",
+    "processing_expires_at",
+    "total_generations",
+)
+
+_UNSET = object()
+
+
+def _signature(status: Optional[Dict[str, Any]]) -> Optional[tuple]:
+    if not status:
+        return None
+    return tuple(status.get(field) for field in _SIGNATURE_FIELDS)
+
+
+def refresh_remaining_seconds(status: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """스냅샷의 남은 시간 필드를 현재 시각 기준으로 다시 계산"""
+    if not status:
+        return status
+
+    now = datetime.now(timezone.utc)
+    refreshed = dict(status)
+    for expires_field, remaining_field in (
+        ("session_expires_at", "session_remaining_seconds"),
+        ("processing_expires_at", "processing_remaining_seconds"),
+    ):
+        expires_at = refreshed.get(expires_field)
+        if isinstance(expires_at, datetime):
+            if expires_at.tzinfo is None:
+                expires_at = expires_at.replace(tzinfo=timezone.utc)
+            refreshed[remaining_field] = int((expires_at - now).total_seconds())
+    return refreshed
+
+
+class SessionStateBus:
+    """사용자 세션 상태 변경 이벤트 버스 (프로세스 내)"""
+
+    def __init__(self):
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self._states: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self._published = 0
+        self._suppressed = 0
+
+    def subscribe(self, user_id: str) -> asyncio.Queue:
+        """사용자 상태 변경 구독 (큐에는 최신 상태 하나만 유지)"""
+        self._loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        self._subscribers.setdefault(user_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, user_id: str, queue: asyncio.Queue):
+        """구독 해제"""
+        queues = self._subscribers.get(user_id)
+        if not queues:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[user_id]
+            # 구독자가 없으면 스냅샷도 보관하지 않음
+            self._states.pop(user_id, None)
+
+    def prime(self, user_id: str, status: Optional[Dict[str, Any]]):
+        """DB에서 읽은 초기 상태를 스냅샷으로 등록 (이미 발행된 상태가 있으면 유지)"""
+        if user_id in self._subscribers and user_id not in self._states:
+            self._states[user_id] = status
+
+    def get_state(self, user_id: str, default: Any = None) -> Any:
+        """마지막으로 발행된 상태 스냅샷 (없으면 default, 세션 없음은 None)"""
+        state = self._states.get(user_id, _UNSET)
+        return default if state is _UNSET else state
+
+    def publish(self, user_id: str, status: Optional[Dict[str, Any]], source: str = ""):
+        """세션 상태 발행 (None은 세션 없음)
+
+        이벤트 루프 밖의 스레드에서 호출되면 루프로 넘겨 처리
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            if self._loop and not self._loop.is_closed():
+                self._loop.call_soon_threadsafe(self._publish, user_id, status, source)
+            return
+        self._publish(user_id, status, source)
+
+    def _publish(self, user_id: str, status: Optional[Dict[str, Any]], source: str):
+        # 구독자가 없으면 스냅샷을 남기지 않음 (연결 시 DB에서 초기 상태를 읽음)
+        queues = self._subscribers.get(user_id)
+        if not queues:
+            return
+
+        previous = self._states.get(user_id, _UNSET)
+        if previous is not _UNSET and _signature(previous) == _signature(status):
+            self._suppressed += 1
+            return
+
+        self._states[user_id] = status
+        self._published += 1
+        logger.debug(
+            f"📡 세션 상태 변경: user={user_id}, "
+            f"status={(status or {}).get('pod_status', 'none')}, source={source}"
+        )
+
+        for queue in queues:
+            # 최신 상태만 유지: 소비되지 않은 이전 상태는 버림
+            if queue.full():
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+            queue.put_nowait(status)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """버스 지표"""
+        return {
+            "subscribed_users": len(self._subscribers),
+            "subscriptions": sum(len(queues) for queues in self._subscribers.values()),
+            "published": self._published,
+            "suppressed": self._suppressed,
+        }
+
+
+# 싱글톤 인스턴스
+_session_state_bus: Optional[SessionStateBus] = None
+
+
+def get_session_state_bus() -> SessionStateBus:
+    """세션 상태 버스 싱글톤 인스턴스 반환"""
+    global _session_state_bus
+    if _session_state_bus is None:
+        _session_state_bus = SessionStateBus()
+    return _session_state_bus
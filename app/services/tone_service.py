@@ -17,6 +17,7 @@ import asyncio
 from app.schemas.influencer import ToneGenerationRequest
 from app.utils.data_mapping import create_character_data
 from app.core.config import settings
+from app.core.http_clients import get_http_client
 from fastapi import HTTPException
 import os
 import aiohttp
@@ -43,7 +44,7 @@ class ToneGenerationService:
         api_key = settings.OPENAI_API_KEY or os.getenv('OPENAI_API_KEY')
         if not api_key:
             raise HTTPException(status_code=500, detail="OpenAI API 키가 설정되지 않았습니다.")
-        return AsyncOpenAI(api_key=api_key)
+        return AsyncOpenAI(api_key=api_key, http_client=get_http_client("openai"))
     
     @staticmethod
     async def _call_openai_api(
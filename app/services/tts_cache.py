@@ -0,0 +1,289 @@
+"""
+TTS 결과 캐시
+같은 인플루언서가 같은 문장을 다시 말하는 경우(인사말, 안내 문구 등) RunPod 합성을 건너뛰기 위해
+(정규화 텍스트, 음성 ID, 감정, 출력 포맷, 모델 버전) 해시를 키로 오디오 바이트를 저장
+- 1차: 바이트 크기로 제한되는 메모리 LRU
+- 2차: 로컬 디스크 (재시작 후에도 유지, 오래 사용하지 않은 항목부터 삭제)
+같은 키로 동시에 들어온 요청은 하나의 합성 작업을 공유
+"""
+
+import os
+import json
+import asyncio
+import hashlib
+import logging
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TTSAudio:
+    """합성된 오디오 (base64가 아닌 원본 바이트)"""
+
+    audio: bytes
+    format: str = "wav"
+    duration: Optional[float] = None
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 텍스트 정규화 (유니코드 NFC, 연속 공백 하나로)"""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def tts_cache_key(
+    text: str,
+    voice_id: str,
+    emotion: str,
+    output_format: str = "wav",
+    model_version: Optional[str] = None,
+) -> str:
+    """캐시 키 계산"""
+    parts = [
+        model_version or settings.TTS_CACHE_MODEL_VERSION,
+        voice_id,
+        emotion,
+        output_format,
+        normalize_text(text),
+    ]
+    return hashlib.sha256(json.dumps(parts, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+class TTSCache:
+    """메모리 LRU + 로컬 디스크 TTS 캐시"""
+
+    def __init__(
+        self,
+        max_bytes: Optional[int] = None,
+        disk_dir: Optional[str] = None,
+        disk_max_bytes: Optional[int] = None,
+    ):
+        self.max_bytes = settings.TTS_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self.disk_dir = settings.TTS_CACHE_DIR if disk_dir is None else disk_dir
+        self.disk_max_bytes = (
+            settings.TTS_CACHE_DISK_MAX_BYTES if disk_max_bytes is None else disk_max_bytes
+        )
+
+        self._memory: "OrderedDict[str, TTSAudio]" = OrderedDict()
+        self._memory_bytes = 0
+        # 디스크 인덱스 (키 → 파일 크기, 오래 사용하지 않은 순), 첫 사용 시 디렉토리 스캔
+        self._disk: "OrderedDict[str, int]" = OrderedDict()
+        self._disk_bytes = 0
+        self._disk_loaded = False
+        self._disk_lock = asyncio.Lock()
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+        # 지표
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._disk_errors = 0
+
+    @property
+    def disk_enabled(self) -> bool:
+        return bool(self.disk_dir) and self.disk_max_bytes > 0
+
+    # ----- 메모리 -----
+
+    def _memory_get(self, key: str) -> Optional[TTSAudio]:
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+        return entry
+
+    def _memory_put(self, key: str, entry: TTSAudio):
+        size = len(entry.audio)
+        # 한 항목이 캐시의 1/4을 넘으면 다른 항목을 모두 밀어내므로 메모리에는 두지 않음
+        if size > self.max_bytes // 4:
+            return
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_bytes -= len(old.audio)
+        self._memory[key] = entry
+        self._memory_bytes += size
+        while self._memory_bytes > self.max_bytes and self._memory:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted.audio)
+
+    # ----- 디스크 -----
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, key[:2], key)
+
+    def _scan_disk(self) -> list:
+        """기존 캐시 파일 목록 (수정 시각 순)"""
+        entries = []
+        if not os.path.isdir(self.disk_dir):
+            return entries
+        for root, _, files in os.walk(self.disk_dir):
+            for name in files:
+                if name.endswith(".tmp"):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(root, name))
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, name, stat.st_size))
+        entries.sort()
+        return entries
+
+    async def _ensure_disk_index(self):
+        if self._disk_loaded:
+            return
+        async with self._disk_lock:
+            if self._disk_loaded:
+                return
+            for _, key, size in await asyncio.to_thread(self._scan_disk):
+                self._disk[key] = size
+                self._disk_bytes += size
+            self._disk_loaded = True
+            if self._disk:
+                logger.info(f"🔊 TTS 디스크 캐시 로드: {len(self._disk)}개 ({self._disk_bytes // 1024}KB)")
+
+    @staticmethod
+    def _read_file(path: str) -> TTSAudio:
+        with open(path, "rb") as f:
+            header = json.loads(f.readline())
+            audio = f.read()
+        # 최근 사용 시각 갱신 (재시작 후 스캔 시 삭제 순서에 반영)
+        os.utime(path)
+        return TTSAudio(audio=audio, format=header.get("format", "wav"), duration=header.get("duration"))
+
+    @staticmethod
+    def _write_file(path: str, entry: TTSAudio):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(json.dumps({"format": entry.format, "duration": entry.duration}).encode("utf-8"))
+            f.write(b"\n")
+            f.write(entry.audio)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _remove_files(paths: list):
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    async def _disk_get(self, key: str) -> Optional[TTSAudio]:
+        await self._ensure_disk_index()
+        if key not in self._disk:
+            return None
+        try:
+            entry = await asyncio.to_thread(self._read_file, self._path(key))
+        except Exception as e:
+            self._disk_errors += 1
+            self._disk_bytes -= self._disk.pop(key, 0)
+            logger.warning(f"⚠️ TTS 디스크 캐시 읽기 실패 ({key[:12]}): {e}")
+            return None
+        self._disk.move_to_end(key)
+        return entry
+
+    async def _disk_put(self, key: str, entry: TTSAudio):
+        await self._ensure_disk_index()
+        try:
+            await asyncio.to_thread(self._write_file, self._path(key), entry)
+        except Exception as e:
+            self._disk_errors += 1
+            logger.warning(f"⚠️ TTS 디스크 캐시 저장 실패 ({key[:12]}): {e}")
+            return
+        size = len(entry.audio)
+        self._disk_bytes += size - self._disk.pop(key, 0)
+        self._disk[key] = size
+
+        evicted = []
+        while self._disk_bytes > self.disk_max_bytes and len(self._disk) > 1:
+            old_key, old_size = self._disk.popitem(last=False)
+            self._disk_bytes -= old_size
+            evicted.append(self._path(old_key))
+        if evicted:
+            await asyncio.to_thread(self._remove_files, evicted)
+
+    # ----- 공개 API -----
+
+    async def get(self, key: str) -> Optional[TTSAudio]:
+        """캐시 조회 (디스크 적중 시 메모리로 승격)"""
+        entry = self._memory_get(key)
+        if entry is not None:
+            self._memory_hits += 1
+            return entry
+        if self.disk_enabled:
+            entry = await self._disk_get(key)
+            if entry is not None:
+                self._disk_hits += 1
+                self._memory_put(key, entry)
+                return entry
+        return None
+
+    async def put(self, key: str, entry: TTSAudio):
+        self._memory_put(key, entry)
+        if self.disk_enabled:
+            await self._disk_put(key, entry)
+
+    async def _synthesize(self, key: str, factory: Callable[[], Awaitable[Optional[TTSAudio]]]):
+        try:
+            entry = await factory()
+            if entry is not None:
+                await self.put(key, entry)
+            return entry
+        finally:
+            self._inflight.pop(key, None)
+
+    async def get_or_synthesize(
+        self, key: str, factory: Callable[[], Awaitable[Optional[TTSAudio]]]
+    ) -> Tuple[Optional[TTSAudio], bool]:
+        """캐시 조회 후 없으면 합성 (반환: (오디오, 캐시 적중 여부))
+
+        같은 키의 합성이 진행 중이면 새로 요청하지 않고 그 결과를 기다림.
+        합성은 별도 태스크로 실행되므로 요청한 WebSocket이 끊겨도 결과는 캐시에 저장됨.
+        합성 실패(None 또는 예외)는 캐시하지 않음
+        """
+        entry = await self.get(key)
+        if entry is not None:
+            return entry, True
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self._coalesced += 1
+        else:
+            self._misses += 1
+            task = asyncio.create_task(self._synthesize(key, factory))
+            self._inflight[key] = task
+        return await asyncio.shield(task), False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 지표"""
+        lookups = self._memory_hits + self._disk_hits + self._misses + self._coalesced
+        return {
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+            "disk_entries": len(self._disk),
+            "disk_bytes": self._disk_bytes,
+            "memory_hits": self._memory_hits,
+            "disk_hits": self._disk_hits,
+            "misses": self._misses,
+            "coalesced": self._coalesced,
+            "in_flight": len(self._inflight),
+            "disk_errors": self._disk_errors,
+            "hit_ratio": round((lookups - self._misses) / lookups, 3) if lookups else None,
+        }
+
+
+# 싱글톤 인스턴스
+_tts_cache: Optional[TTSCache] = None
+
+
+def get_tts_cache() -> TTSCache:
+    """TTS 캐시 싱글톤 인스턴스 반환"""
+    global _tts_cache
+    if _tts_cache is None:
+        _tts_cache = TTSCache()
+    return _tts_cache
@@ -6,6 +6,7 @@ USER 테이블의 Pod 세션 컬럼들을 사용하여
 
 """
 
+import time
 import asyncio
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any
@@ -17,6 +18,8 @@ import logging
 
 from app.models.user import User
 from app.services.runpod_service import get_runpod_service
+from app.services.session_state_bus import get_session_state_bus
+from app.services.warm_pod_pool import WarmPod, get_warm_pod_pool
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -50,10 +53,36 @@ class UserSessionService:
     - total_generations: 총 이미지 생성 횟수
     """
     
+    # failed 상태 Pod 재확인(RunPod 조회 + ComfyUI 확인) 최소 간격 (초)
+    FAILED_RECHECK_INTERVAL = 30
+    
     def __init__(self):
         self.runpod_service = get_runpod_service()
+        self.state_bus = get_session_state_bus()
+        self._failed_rechecked_at: Dict[str, float] = {}
         logger.info("UserSessionService initialized")
     
+    def _build_session_status(self, user: User, now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+        """USER 레코드에서 세션 상태 응답 구성 (세션이 없으면 None)"""
+        if not user.current_pod_id or user.pod_status == "none":
+            return None
+        
+        now = now or datetime.now(timezone.utc)
+        return {
+            "pod_id": user.current_pod_id,
+            "pod_status": user.pod_status,
+            "session_created_at": user.session_created_at,
+            "session_expires_at": user.session_expires_at,
+            "processing_expires_at": user.processing_expires_at,
+            "total_generations": user.total_generations,
+            "session_remaining_seconds": int((ensure_timezone_aware(user.session_expires_at) - now).total_seconds()) if user.session_expires_at else None,
+            "processing_remaining_seconds": int((ensure_timezone_aware(user.processing_expires_at) - now).total_seconds()) if user.processing_expires_at else None
+        }
+    
+    def _publish_status(self, user: User, source: str):
+        """커밋된 세션 상태를 상태 버스로 발행"""
+        self.state_bus.publish(user.user_id, self._build_session_status(user), source)
+    
     async def create_session(self, user_id: str, db: AsyncSession, background_tasks=None) -> bool:
         """
         사용자 페이지 진입시 세션 생성
@@ -120,6 +149,7 @@ class UserSessionService:
             
             logger.info(f"사용자 {user_id}의 세션 생성 데이터베이스 커밋")
             await db.commit()
+            self._publish_status(user, "create_session")
             
             logger.info(f"사용자 {user_id}의 세션 생성 작업 시작됨")
             return True
@@ -171,6 +201,7 @@ class UserSessionService:
             user.total_generations += 1
             
             await db.commit()
+            self._publish_status(user, "start_image_generation")
             
             logger.info(f"Started image generation for user {user_id}, expires: {processing_expires_at}")
             return True
@@ -218,7 +249,10 @@ class UserSessionService:
             user.processing_expires_at = processing_expires_at
             user.total_generations += 1
             
+            # 동기 세션은 커밋 시 속성이 만료되므로 커밋 전에 상태 구성
+            session_status = self._build_session_status(user)
             db.commit()
+            self.state_bus.publish(user_id, session_status, "start_image_generation")
             
             logger.info(f"Started image generation for user {user_id}, expires: {processing_expires_at}")
             return True
@@ -258,6 +292,7 @@ class UserSessionService:
             user.session_expires_at = new_session_expires
             
             await db.commit()
+            self._publish_status(user, "complete_image_generation")
             
             logger.info(f"Completed image generation for user {user_id}, session extended to: {new_session_expires}")
             return True
@@ -281,17 +316,23 @@ class UserSessionService:
             user = await self._get_user(user_id, db)
             if not user:
                 logger.error(f"User not found in database: {user_id}")
+                self._failed_rechecked_at.pop(user_id, None)
                 return None
             
             now = datetime.now(timezone.utc)
             
+            # failed 상태를 벗어난 사용자는 재확인 시각 기록 제거
+            if user.pod_status != "failed":
+                self._failed_rechecked_at.pop(user_id, None)
+            
             # 세션이 없으면 None 반환
             if not user.current_pod_id or user.pod_status == "none":
                 logger.info(f"No active session for user {user_id}: pod_id={user.current_pod_id}, status={user.pod_status}")
+                self.state_bus.publish(user_id, None, "get_session_status")
                 return None
             
-            # Failed 상태인 Pod는 재확인 시도 (ComfyUI가 늦게 준비될 수 있음)
-            if user.pod_status == "failed" and user.current_pod_id:
+            # Failed 상태인 Pod는 재확인 시도 (ComfyUI가 늦게 준비될 수 있음, 사용자별 최소 간격 적용)
+            if user.pod_status == "failed" and user.current_pod_id and self._should_recheck_failed(user_id):
                 logger.info(f"🔄 Failed 상태 Pod 재확인 시도: {user.current_pod_id}")
                 
                 # RunPod 상태 및 ComfyUI 응답 재확인
@@ -312,6 +353,7 @@ class UserSessionService:
                             user.session_expires_at = datetime.now(timezone.utc) + timedelta(minutes=10)
                             user.processing_expires_at = datetime.now(timezone.utc) + timedelta(minutes=10)
                             await db.commit()
+                            self._failed_rechecked_at.pop(user_id, None)
                             
                             logger.info(f"🕐 Pod 복구로 인한 세션 시간 10분 연장: {user.current_pod_id}")
                         else:
@@ -330,22 +372,32 @@ class UserSessionService:
             # 만료된 세션은 자동 정리
             if session_expired or processing_expired:
                 self._terminate_current_session(user, db)
+                self.state_bus.publish(user_id, None, "session_expired")
                 return None
             
-            return {
-                "pod_id": user.current_pod_id,
-                "pod_status": user.pod_status,
-                "session_created_at": user.session_created_at,
-                "session_expires_at": user.session_expires_at,
-                "processing_expires_at": user.processing_expires_at,
-                "total_generations": user.total_generations,
-                "session_remaining_seconds": int((ensure_timezone_aware(user.session_expires_at) - now).total_seconds()) if user.session_expires_at else None,
-                "processing_remaining_seconds": int((ensure_timezone_aware(user.processing_expires_at) - now).total_seconds()) if user.processing_expires_at else None
-            }
+            session_status = self._build_session_status(user, now)
+            self.state_bus.publish(user_id, session_status, "get_session_status")
+            return session_status
             
         except Exception as e:
             logger.error(f"Failed to get session status for user {user_id}: {e}")
             return None
+    
+    def _should_recheck_failed(self, user_id: str) -> bool:
+        """failed 상태 Pod 재확인 간격 확인 (연결 수/조회 빈도와 무관하게 RunPod 호출 제한)"""
+        now = time.monotonic()
+        last_checked = self._failed_rechecked_at.get(user_id)
+        if last_checked is not None and now - last_checked < self.FAILED_RECHECK_INTERVAL:
+            return False
+        # 간격이 지난 기록은 더 이상 필요 없으므로 제거 (다시 조회하지 않는 사용자 기록이 쌓이지 않도록)
+        stale = [
+            uid for uid, checked_at in self._failed_rechecked_at.items()
+            if now - checked_at >= self.FAILED_RECHECK_INTERVAL
+        ]
+        for uid in stale:
+            del self._failed_rechecked_at[uid]
+        self._failed_rechecked_at[user_id] = now
+        return True
 
     def get_session_status_sync(self, user_id: str, db: Session) -> Optional[Dict[str, Any]]:
         """
@@ -379,16 +431,7 @@ class UserSessionService:
                 self._terminate_current_session(user, db)
                 return None
             
-            return {
-                "pod_id": user.current_pod_id,
-                "pod_status": user.pod_status,
-                "session_created_at": user.session_created_at,
-                "session_expires_at": user.session_expires_at,
-                "processing_expires_at": user.processing_expires_at,
-                "total_generations": user.total_generations,
-                "session_remaining_seconds": int((ensure_timezone_aware(user.session_expires_at) - now).total_seconds()) if user.session_expires_at else None,
-                "processing_remaining_seconds": int((ensure_timezone_aware(user.processing_expires_at) - now).total_seconds()) if user.processing_expires_at else None
-            }
+            return self._build_session_status(user, now)
             
         except Exception as e:
             logger.error(f"Failed to get session status for user {user_id}: {e}")
@@ -414,6 +457,7 @@ class UserSessionService:
             
             if user.current_pod_id:
                 self._terminate_current_session(user, db)
+                self.state_bus.publish(user_id, None, "terminate_session")
                 logger.info(f"Session terminated for user {user_id}")
                 return True
             else:
@@ -428,6 +472,8 @@ class UserSessionService:
         """
         만료된 세션들 및 종료된 RunPod 정리 (백그라운드 작업용)
         
+        세션/Pod 상태를 일괄 비교하여 조회 이후 바뀌지 않은 세션만 조건부 UPDATE로 정리 (SessionReconciler)
+        
         Args:
             db: 비동기 데이터베이스 세션
             
@@ -435,65 +481,10 @@ class UserSessionService:
             int: 정리된 세션 수
         """
         try:
-            now = datetime.now(timezone.utc)
-            # 데이터베이스 비교를 위해 타임존 정보 제거 (UTC 시간 그대로 사용)
-            now_naive = now.replace(tzinfo=None)
-            
-            # 1. 만료된 세션을 가진 사용자들 조회
-            result = await db.execute(
-                select(User).where(
-                    User.current_pod_id.isnot(None),
-                    User.pod_status != "none",
-                    (User.session_expires_at < now_naive) | (User.processing_expires_at < now_naive)
-                )
-            )
+            from app.services.session_reconciler import get_session_reconciler
             
-            expired_users = result.scalars().all()
-            
-            # 2. 활성 Pod을 가진 모든 사용자들 조회 (RunPod 상태 확인용)
-            result = await db.execute(
-                select(User).where(
-                    User.current_pod_id.isnot(None),
-                    User.pod_status.in_(["starting", "running", "ready", "processing"])
-                )
-            )
-            
-            active_users = result.scalars().all()
-            cleaned_count = 0
-            
-            # 3. 만료된 세션 정리
-            for user in expired_users:
-                try:
-                    await self._terminate_current_session_async(user, db)
-                    cleaned_count += 1
-                    logger.info(f"🧹 만료된 세션 정리 완료: 사용자 {user.user_id}, Pod {user.current_pod_id}")
-                except Exception as e:
-                    logger.error(f"Failed to cleanup expired session for user {user.user_id}: {e}")
-            
-            # 4. RunPod 상태 확인 및 종료된 Pod 정리
-            terminated_count = 0
-            for user in active_users:
-                if user.current_pod_id and user.current_pod_id != "pending":
-                    try:
-                        old_pod_id = user.current_pod_id
-                        await self._check_and_cleanup_terminated_pod(user, db)
-                        # Pod이 정리되었는지 확인
-                        if user.current_pod_id != old_pod_id:
-                            terminated_count += 1
-                    except Exception as e:
-                        logger.error(f"Failed to check Pod status for user {user.user_id}: {e}")
-            
-            total_cleaned = cleaned_count + terminated_count
-            
-            # 변경사항 커밋
-            if total_cleaned > 0:
-                await db.commit()
-                if terminated_count > 0:
-                    logger.info(f"🧹 세션 정리 완료: 만료 {cleaned_count}개, 종료된 Pod {terminated_count}개")
-                else:
-                    logger.info(f"🧹 만료된 세션 {cleaned_count}개 정리 완료")
-            
-            return total_cleaned
+            report = await get_session_reconciler().reconcile(db)
+            return report.rows_updated
             
         except Exception as e:
             logger.error(f"Failed to cleanup expired sessions: {e}")
@@ -556,28 +547,15 @@ class UserSessionService:
                 pod_id = user.current_pod_id
                 logger.info(f"Terminating RunPod {pod_id} for user {user.user_id}")
                 
+                # 재사용 가능한 Pod은 웜 풀로 반환, 아니면 종료
+                pod_pool = get_warm_pod_pool()
                 if background_tasks:
                     # 백그라운드 태스크가 있으면 비동기로 처리
-                    background_tasks.add_task(self.runpod_service.terminate_pod, pod_id)
+                    background_tasks.add_task(pod_pool.release_pod, pod_id)
                 else:
-                    # 백그라운드 태스크가 없으면 즉시 처리를 위해 별도 스레드로 실행
-                    import threading
-                    
-                    def terminate_pod_sync():
-                        try:
-                            import asyncio
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                            loop.run_until_complete(self.runpod_service.terminate_pod(pod_id))
-                            loop.close()
-                            logger.info(f"✅ RunPod {pod_id} terminated successfully in background thread")
-                        except Exception as e:
-                            logger.error(f"❌ Failed to terminate RunPod {pod_id} in background thread: {e}")
-                    
-                    thread = threading.Thread(target=terminate_pod_sync)
-                    thread.daemon = True
-                    thread.start()
-                    logger.info(f"Started background thread to terminate RunPod {pod_id}")
+                    # 풀 상태가 현재 이벤트 루프에 묶여 있으므로 별도 스레드 대신 태스크로 처리
+                    asyncio.create_task(pod_pool.release_pod(pod_id))
+                    logger.info(f"Scheduled release of RunPod {pod_id}")
             
             # 사용자 세션 상태 초기화
             user.current_pod_id = None
@@ -589,85 +567,6 @@ class UserSessionService:
         except Exception as e:
             logger.error(f"Failed to terminate session for user {user.user_id}: {e}")
     
-    async def _terminate_current_session_async(self, user: User, db: AsyncSession):
-        """현재 세션 종료 (비동기 버전 - cleanup 전용, 건강성 체크 포함)"""
-        try:
-            if user.current_pod_id and user.current_pod_id != "pending":
-                pod_id = user.current_pod_id
-                logger.info(f"🗑️ RunPod {pod_id} 종료 시작 (user: {user.user_id})")
-                
-                # Pod 건강성 먼저 체크
-                try:
-                    health_check = await self.runpod_service.check_pod_health(pod_id)
-                    logger.info(f"   📊 Pod 건강성 체크: {health_check}")
-                    
-                    # 리소스 부족 감지 시 강제 종료 보장
-                    if health_check.get("needs_restart") or not health_check.get("healthy", False):
-                        logger.warning(f"   ⚠️ Pod {pod_id} 건강성 문제 감지 - 강제 종료 필요")
-                        
-                        # 강제 종료 시도 (여러 번)
-                        for attempt in range(3):
-                            try:
-                                success = await self.runpod_service.terminate_pod(pod_id)
-                                if success:
-                                    logger.info(f"   ✅ 강제 종료 성공 (시도 {attempt + 1}/3)")
-                                    break
-                                else:
-                                    logger.warning(f"   ⚠️ 강제 종료 실패 (시도 {attempt + 1}/3)")
-                                    if attempt < 2:  # 마지막 시도가 아니면 잠시 대기
-                                        await asyncio.sleep(2)
-                            except Exception as e:
-                                logger.error(f"   ❌ 강제 종료 시도 {attempt + 1} 실패: {e}")
-                                if attempt < 2:
-                                    await asyncio.sleep(2)
-                    else:
-                        # 정상 Pod는 일반 종료
-                        success = await self.runpod_service.terminate_pod(pod_id)
-                        if success:
-                            logger.info(f"✅ RunPod {pod_id} 정상 종료 완료")
-                        else:
-                            logger.warning(f"⚠️ RunPod {pod_id} 정상 종료 실패")
-                            
-                except Exception as health_error:
-                    logger.error(f"   ❌ Pod 건강성 체크 실패: {health_error}")
-                    # 건강성 체크 실패해도 일반 종료 시도
-                    try:
-                        success = await self.runpod_service.terminate_pod(pod_id)
-                        if success:
-                            logger.info(f"✅ RunPod {pod_id} 백업 종료 성공")
-                        else:
-                            logger.warning(f"⚠️ RunPod {pod_id} 백업 종료 실패")
-                    except Exception as e:
-                        logger.error(f"❌ 백업 종료도 실패: {e}")
-                        # Pod 종료 실패해도 DB는 정리
-            
-            # 사용자 세션 상태 초기화
-            user.current_pod_id = None
-            user.pod_status = "none"
-            user.session_created_at = None
-            user.session_expires_at = None
-            user.processing_expires_at = None
-            
-            logger.info(f"🧹 사용자 {user.user_id} 세션 상태 초기화 완료")
-            
-        except Exception as e:
-            logger.error(f"Failed to terminate session for user {user.user_id}: {e}")
-            raise
-            
-            # 사용자 세션 상태 즉시 초기화
-            user.current_pod_id = None
-            user.pod_status = "none"
-            user.session_created_at = None
-            user.session_expires_at = None
-            user.processing_expires_at = None
-            
-            db.commit()
-            
-        except Exception as e:
-            logger.error(f"Failed to terminate session for user {user.user_id}: {e}")
-            db.rollback()
-            raise
-
     async def _create_pod_and_update_db(self, user_id: str, db: Session):
         """백그라운드에서 Pod 생성 및 DB 업데이트 (비동기)"""
         try:
@@ -697,6 +596,13 @@ class UserSessionService:
         """백그라운드에서 Pod 생성 및 DB 업데이트 (비동기 DB 호환, 건강성 체크 포함)"""
         try:
             logger.info(f"📍 _create_pod_and_update_db_fixed 함수 시작: user {user_id}")
+            
+            # 웜 풀에 준비된 Pod이 있으면 콜드 스타트 없이 바로 할당
+            warm_pod = get_warm_pod_pool().lease(user_id)
+            if warm_pod is not None:
+                await self._assign_warm_pod(user_id, warm_pod, db)
+                return
+            
             logger.info(f"🔄 RunPod 서비스로 Pod 생성 요청 중...")
             pod_response = await self.runpod_service.create_pod(request_id=user_id)
             
@@ -714,6 +620,7 @@ class UserSessionService:
                     user.current_pod_id = pod_response.pod_id
                     user.pod_status = pod_response.status.lower() # 'STARTING' -> 'starting'
                     await db.commit()
+                    self._publish_status(user, "pod_created")
                     logger.info(f"DB updated for user {user_id} with pod info: {pod_response.pod_id}")
                     
                     # Pod 준비 상태 확인 시작
@@ -730,6 +637,7 @@ class UserSessionService:
                     user.pod_status = "failed"
                     user.current_pod_id = None
                     await db.commit()
+                    self._publish_status(user, "pod_create_failed")
             except Exception as db_error:
                 logger.error(f"Failed to update DB after error: {db_error}")
         finally:
@@ -774,6 +682,44 @@ class UserSessionService:
                 delattr(self, f'_creating_pod_{user_id}')
                 logger.info(f"🧹 Pod 생성 플래그 해제: user {user_id}")
     
+    async def _assign_warm_pod(self, user_id: str, warm_pod: WarmPod, db: AsyncSession):
+        """웜 풀에서 받은 준비된 Pod을 사용자 세션에 연결"""
+        try:
+            result = await db.execute(select(User).where(User.user_id == user_id))
+            user = result.scalar_one_or_none()
+            if not user:
+                raise Exception(f"User {user_id} not found")
+            
+            user.current_pod_id = warm_pod.pod_id
+            user.pod_status = "ready"
+            await db.commit()
+        except Exception:
+            # 세션에 연결하지 못한 Pod은 풀로 되돌림
+            await get_warm_pod_pool().release_pod(warm_pod.pod_id)
+            raise
+        
+        self._publish_status(user, "pod_leased")
+        logger.info(f"✅ 웜 Pod {warm_pod.pod_id} 할당 완료: user {user_id}")
+        await self._send_pod_ready_message(user_id, warm_pod.pod_id)
+    
+    async def _send_pod_ready_message(self, user_id: str, pod_id: str):
+        """WebSocket으로 Pod 준비 완료 메시지 전송"""
+        try:
+            from app.websocket import get_ws_manager
+            ws_manager = get_ws_manager()
+            await ws_manager.send_message(user_id, {
+                "type": "pod_ready",
+                "data": {
+                    "pod_id": pod_id,
+                    "pod_status": "ready",
+                    "endpoint_url": f"https://{pod_id}-8188.proxy.runpod.net",
+                    "message": "🎨 RunPod가 준비 완료되었습니다! 이제 이미지 생성이 가능합니다."
+                }
+            })
+            logger.info(f"📨 WebSocket으로 pod_ready 메시지 전송 완료: user {user_id}")
+        except Exception as ws_error:
+            logger.error(f"WebSocket 메시지 전송 실패: {ws_error}")
+    
     def _wait_for_pod_ready(self, user_id: str, pod_id: str, db: Session):
         """Pod 준비 완료 대기 (임시로 비활성화)"""
         # TODO: 실제 RunPod 연동 시 백그라운드 태스크로 구현 필요
@@ -796,24 +742,11 @@ class UserSessionService:
                 if user and user.current_pod_id == pod_id:
                     user.pod_status = "ready"
                     await db.commit()
+                    self._publish_status(user, "pod_ready")
                     logger.info(f"✅ Pod {pod_id} is ready for user {user_id}")
                     
                     # WebSocket으로 준비 완료 메시지 전송
-                    try:
-                        from app.websocket import get_ws_manager
-                        ws_manager = get_ws_manager()
-                        await ws_manager.send_message(user_id, {
-                            "type": "pod_ready",
-                            "data": {
-                                "pod_id": pod_id,
-                                "pod_status": "ready",
-                                "endpoint_url": f"https://{pod_id}-8188.proxy.runpod.net",
-                                "message": "🎨 RunPod가 준비 완료되었습니다! 이제 이미지 생성이 가능합니다."
-                            }
-                        })
-                        logger.info(f"📨 WebSocket으로 pod_ready 메시지 전송 완료: user {user_id}")
-                    except Exception as ws_error:
-                        logger.error(f"WebSocket 메시지 전송 실패: {ws_error}")
+                    await self._send_pod_ready_message(user_id, pod_id)
                 else:
                     logger.warning(f"User {user_id} not found or pod_id mismatch during ready update")
             else:
@@ -827,6 +760,7 @@ class UserSessionService:
                     user.pod_status = "failed"
                     # current_pod_id는 유지하여 나중에 재확인 가능하도록 함
                     await db.commit()
+                    self._publish_status(user, "pod_failed")
                     logger.error(f"❌ Pod {pod_id} failed to be ready for user {user_id}")
                     logger.info(f"🔄 Pod ID는 유지하여 나중에 재확인 가능하도록 설정")
                     
@@ -856,84 +790,10 @@ class UserSessionService:
                     user.pod_status = "failed"
                     # current_pod_id는 유지하여 나중에 재확인 가능하도록 함
                     await db.commit()
+                    self._publish_status(user, "pod_failed")
             except Exception as db_error:
                 logger.error(f"Failed to update failed status: {db_error}")
     
-    async def _check_and_cleanup_terminated_pod(self, user: User, db: AsyncSession):
-        """RunPod 상태를 확인하고 종료된 Pod을 정리"""
-        try:
-            pod_id = user.current_pod_id
-            if not pod_id or pod_id == "pending":
-                return
-            
-            # RunPod API에서 Pod 상태 확인
-            from app.services.runpod_service import get_runpod_service
-            runpod_service = get_runpod_service()
-            
-            try:
-                pod_info = await runpod_service.get_pod_status(pod_id)
-                
-                if not pod_info:
-                    # Pod 정보를 가져올 수 없는 경우 (삭제되었을 가능성)
-                    logger.warning(f"⚠️ Pod {pod_id} 정보를 가져올 수 없음 - 삭제된 것으로 추정")
-                    await self._cleanup_terminated_session(user, db, "Pod 정보 없음")
-                    return
-                
-                # RunPodPodResponse 객체에서 상태 추출
-                pod_status = pod_info.status.upper() if hasattr(pod_info, 'status') else "UNKNOWN"
-                logger.debug(f"🔍 Pod {pod_id} 상태 확인: {pod_status} (사용자: {user.user_id})")
-                
-                # 종료된 상태들 확인
-                terminated_statuses = ["TERMINATED", "STOPPED", "FAILED", "EXITED"]
-                
-                if pod_status in terminated_statuses:
-                    logger.info(f"🛑 종료된 Pod 감지: {pod_id} (상태: {pod_status}, 사용자: {user.user_id})")
-                    await self._cleanup_terminated_session(user, db, f"Pod 상태: {pod_status}")
-                    
-            except Exception as runpod_error:
-                # RunPod API 오류 시 더 구체적인 처리
-                error_msg = str(runpod_error).lower()
-                
-                # Pod이 존재하지 않는 경우의 특정 오류 메시지들 
-                not_found_indicators = [
-                    "not found", "does not exist", "404", 
-                    "no pod found", "invalid pod id", "pod does not exist"
-                ]
-                
-                if any(indicator in error_msg for indicator in not_found_indicators):
-                    logger.info(f"🛑 삭제된 Pod 감지: {pod_id} (오류: {str(runpod_error)[:100]}...)")
-                    await self._cleanup_terminated_session(user, db, f"Pod 삭제됨: {str(runpod_error)[:50]}...")
-                else:
-                    # 네트워크 오류 등 일시적 문제
-                    logger.warning(f"⚠️ RunPod API 일시적 오류로 Pod {pod_id} 상태 확인 실패: {str(runpod_error)[:100]}...")
-                    # API 오류인 경우 세션을 정리하지 않음 (일시적 문제일 수 있음)
-                
-        except Exception as e:
-            logger.error(f"Pod 상태 확인 중 오류 (사용자: {user.user_id}): {e}")
-    
-    async def _cleanup_terminated_session(self, user: User, db: AsyncSession, reason: str):
-        """종료된 Pod으로 인한 세션 정리"""
-        try:
-            old_pod_id = user.current_pod_id
-            old_status = user.pod_status
-            
-            # 세션 상태 초기화
-            user.current_pod_id = None
-            user.pod_status = "none"
-            user.session_created_at = None
-            user.session_expires_at = None
-            user.processing_expires_at = None
-            
-            logger.info(f"🧹 종료된 Pod으로 인한 세션 정리 완료")
-            logger.info(f"   📋 사용자: {user.user_id}")
-            logger.info(f"   🔴 이전 Pod: {old_pod_id} (상태: {old_status})")
-            logger.info(f"   📝 종료 원인: {reason}")
-            
-            # 변경사항은 상위 함수에서 커밋됨
-            
-        except Exception as e:
-            logger.error(f"종료된 세션 정리 중 오류 (사용자: {user.user_id}): {e}")
-
 
 # 싱글톤 패턴
 _user_session_service = None
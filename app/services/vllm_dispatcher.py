@@ -0,0 +1,305 @@
+"""
+vLLM 추론 요청 디스패처
+채팅 경로마다 /runsync로 요청 하나당 작업 하나를 보내며 연결을 붙잡고 있던 방식을 대체
+- 같은 어댑터(hf_repo, lora_adapter)에 대한 동시 요청을 짧은 시간 창 동안 모아 한 번에 /run 제출
+  (해당 어댑터에 대기/진행 중인 요청이 없으면 시간 창 없이 바로 제출)
+- 제출된 작업은 하나의 공유 /status 폴러가 추적하여 완료되면 대기 중인 호출자에게 결과 전달
+  (작업별 조회 간격은 경과 시간에 비례해 VLLM_DISPATCH_POLL_INTERVAL ~ VLLM_DISPATCH_MAX_POLL_INTERVAL 사이에서 증가,
+   짧은 작업은 기존처럼 최소 간격으로 조회하고 콜드 스타트 등 오래 걸리는 작업만 덜 자주 조회)
+- 호출자가 취소되면 (연결 끊김 등) RunPod 작업도 취소
+"""
+
+import time
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.services.runpod_manager import RunPodManagerError, get_vllm_manager
+
+logger = logging.getLogger(__name__)
+
+# 작업 종료 상태
+FAILED_JOB_STATUSES = {"FAILED", "CANCELLED", "TIMED_OUT"}
+
+# 완료되지 않은 작업의 /status 조회 간격 = 작업 경과 시간 × 비율 (완료 → 전달 지연을 경과 시간의 25% 이내로 제한)
+POLL_INTERVAL_AGE_RATIO = 0.25
+
+GroupKey = Tuple[Optional[str], Optional[str]]
+
+
+@dataclass
+class _PendingJob:
+    """/status 폴러가 추적하는 제출된 작업"""
+
+    job_id: str
+    endpoint_id: Optional[str]
+    future: asyncio.Future
+    submitted_at: float = field(default_factory=time.monotonic)
+    # 다음 /status 조회 시각
+    next_poll_at: float = 0.0
+
+
+class VLLMDispatcher:
+    """vLLM runsync 요청 묶음 제출 및 공유 상태 폴링"""
+
+    def __init__(
+        self,
+        window: Optional[float] = None,
+        max_batch: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        max_poll_interval: Optional[float] = None,
+        job_timeout: Optional[float] = None,
+        manager=None,
+    ):
+        self.window = settings.VLLM_DISPATCH_WINDOW_MS / 1000 if window is None else window
+        self.max_batch = max_batch or settings.VLLM_DISPATCH_MAX_BATCH
+        self.poll_interval = poll_interval or settings.VLLM_DISPATCH_POLL_INTERVAL
+        self.max_poll_interval = max(
+            max_poll_interval or settings.VLLM_DISPATCH_MAX_POLL_INTERVAL, self.poll_interval
+        )
+        self.job_timeout = job_timeout or settings.VLLM_DISPATCH_JOB_TIMEOUT
+        self._manager = manager
+
+        # 어댑터별로 제출 대기 중인 요청
+        self._groups: Dict[GroupKey, List[Tuple[Dict[str, Any], asyncio.Future]]] = {}
+        self._flush_handles: Dict[GroupKey, asyncio.TimerHandle] = {}
+        # 어댑터별로 제출되어 아직 결과를 받지 못한 요청 수
+        self._active: Dict[GroupKey, int] = {}
+        # 제출 후 결과 대기 중인 작업
+        self._jobs: Dict[str, _PendingJob] = {}
+        self._poller_task: Optional[asyncio.Task] = None
+        # 새 작업 등록 시 폴러를 깨움 (긴 간격으로 대기 중이어도 새 작업은 최소 간격으로 조회)
+        self._poller_wakeup = asyncio.Event()
+
+        # 지표
+        self._requests = 0
+        self._batches = 0
+        self._immediate = 0
+        self._status_calls = 0
+        self._max_batch_seen = 0
+        self._completed = 0
+        self._failed = 0
+        self._timed_out = 0
+        self._cancelled = 0
+
+    @property
+    def manager(self):
+        # RunPod 설정이 없는 환경에서도 지표 조회는 가능하도록 첫 제출 시점에 초기화
+        if self._manager is None:
+            self._manager = get_vllm_manager()
+        return self._manager
+
+    @staticmethod
+    def _group_key(payload: Dict[str, Any]) -> GroupKey:
+        job_input = payload.get("input") or {}
+        return job_input.get("hf_repo"), job_input.get("lora_adapter")
+
+    async def submit(self, payload: Dict[str, Any]) -> Any:
+        """요청을 묶음에 추가하고 결과를 기다림 (runsync와 같은 형식의 결과 반환)"""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        key = self._group_key(payload)
+
+        # 같은 어댑터에 대기/진행 중인 요청이 없으면 묶을 상대가 없으므로 바로 제출
+        idle = not self._groups.get(key) and not self._active.get(key)
+
+        group = self._groups.setdefault(key, [])
+        group.append((payload, future))
+        self._requests += 1
+
+        if idle:
+            self._immediate += 1
+            self._flush(key)
+        elif len(group) >= self.max_batch:
+            self._flush(key)
+        elif key not in self._flush_handles:
+            self._flush_handles[key] = loop.call_later(self.window, self._flush, key)
+
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # 호출자가 취소되면 제출 전이면 묶음에서 빼고, 제출 후면 폴러가 작업 취소
+            if not future.done():
+                future.cancel()
+            self._cancelled += 1
+            self._poller_wakeup.set()
+            raise
+
+    def _flush(self, key: GroupKey):
+        """대기 중인 묶음 제출 시작"""
+        handle = self._flush_handles.pop(key, None)
+        if handle is not None:
+            handle.cancel()
+
+        group = [(payload, future) for payload, future in self._groups.pop(key, []) if not future.done()]
+        if not group:
+            return
+
+        self._batches += 1
+        self._max_batch_seen = max(self._max_batch_seen, len(group))
+        self._active[key] = self._active.get(key, 0) + len(group)
+        for _, future in group:
+            future.add_done_callback(lambda _, key=key: self._release_active(key))
+        asyncio.create_task(self._submit_group(key, group))
+
+    def _release_active(self, key: GroupKey):
+        remaining = self._active.get(key, 0) - 1
+        if remaining > 0:
+            self._active[key] = remaining
+        else:
+            self._active.pop(key, None)
+
+    async def _submit_group(self, key: GroupKey, group: List[Tuple[Dict[str, Any], asyncio.Future]]):
+        """묶음의 요청을 /run으로 동시에 제출하고 폴러에 등록"""
+        endpoint_id = None
+        try:
+            endpoint = await self.manager.find_endpoint()
+            endpoint_id = endpoint.get("id") if endpoint else None
+        except Exception as e:
+            logger.warning(f"⚠️ vLLM 엔드포인트 조회 실패 (작업 제출 시 다시 확인): {e}")
+
+        results = await asyncio.gather(
+            *(self.manager.run(payload) for payload, _ in group), return_exceptions=True
+        )
+
+        for (_, future), result in zip(group, results):
+            job_id = result.get("id") if isinstance(result, dict) else None
+            if future.done():
+                # 제출 중 호출자가 취소한 경우 작업도 취소
+                if job_id:
+                    asyncio.create_task(self.manager.cancel(job_id))
+                continue
+            if isinstance(result, BaseException):
+                self._failed += 1
+                future.set_exception(result)
+                continue
+            if not job_id:
+                self._failed += 1
+                future.set_exception(RunPodManagerError(f"RunPod 작업 ID를 받지 못했습니다: {result}"))
+                continue
+            now = time.monotonic()
+            self._jobs[job_id] = _PendingJob(
+                job_id=job_id,
+                endpoint_id=endpoint_id,
+                future=future,
+                submitted_at=now,
+                next_poll_at=now + self.poll_interval,
+            )
+
+        logger.debug(
+            f"vLLM 요청 묶음 제출: adapter={key[1]}, {len(group)}건, 추적 중 작업 {len(self._jobs)}개"
+        )
+        self._ensure_poller()
+
+    def _ensure_poller(self):
+        if self._jobs and (self._poller_task is None or self._poller_task.done()):
+            self._poller_task = asyncio.create_task(self._poll_loop())
+        self._poller_wakeup.set()
+
+    def _backoff(self, job: _PendingJob):
+        now = time.monotonic()
+        interval = (now - job.submitted_at) * POLL_INTERVAL_AGE_RATIO
+        job.next_poll_at = now + min(max(interval, self.poll_interval), self.max_poll_interval)
+
+    async def _poll_loop(self):
+        """조회 시점이 된 작업들의 상태를 함께 조회 (완료되지 않은 작업은 조회 간격을 늘림)"""
+        semaphore = asyncio.Semaphore(settings.VLLM_DISPATCH_STATUS_CONCURRENCY)
+
+        async def poll(job: _PendingJob):
+            async with semaphore:
+                self._status_calls += 1
+                try:
+                    status = await self.manager.get_job_status(job.job_id, job.endpoint_id)
+                except Exception as e:
+                    # 일시적인 조회 실패는 다음 주기에 재시도
+                    logger.warning(f"⚠️ vLLM 작업 상태 조회 실패: job_id={job.job_id}, {e}")
+                    self._backoff(job)
+                    self._poller_wakeup.set()
+                    return
+                if not self._apply_status(job, status):
+                    self._backoff(job)
+            self._poller_wakeup.set()
+
+        polls = set()
+        while self._jobs:
+            now = time.monotonic()
+            for job in list(self._jobs.values()):
+                if job.future.done():
+                    # 호출자가 취소한 작업
+                    self._jobs.pop(job.job_id, None)
+                    asyncio.create_task(self.manager.cancel(job.job_id))
+                elif now - job.submitted_at > self.job_timeout:
+                    self._jobs.pop(job.job_id, None)
+                    self._timed_out += 1
+                    job.future.set_exception(
+                        RunPodManagerError(f"vLLM 작업 타임아웃 ({self.job_timeout:.0f}초 초과): {job.job_id}")
+                    )
+                    asyncio.create_task(self.manager.cancel(job.job_id))
+
+            # 조회 시점이 된 작업은 응답을 기다리지 않고 조회 시작 (조회 중에는 다시 조회하지 않음)
+            for job in self._jobs.values():
+                if job.next_poll_at <= now:
+                    job.next_poll_at = float("inf")
+                    polls.add(asyncio.create_task(poll(job)))
+            polls = {task for task in polls if not task.done()}
+            if not self._jobs:
+                break
+
+            # 가장 먼저 조회할 작업 시점까지 대기 (새 작업 등록/조회 완료/호출자 취소 시 바로 깨어남)
+            next_poll_at = min(job.next_poll_at for job in self._jobs.values())
+            delay = next_poll_at - now if next_poll_at != float("inf") else None
+            self._poller_wakeup.clear()
+            try:
+                await asyncio.wait_for(self._poller_wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def _apply_status(self, job: _PendingJob, status: Dict[str, Any]) -> bool:
+        """조회한 상태 반영 (작업이 끝났으면 True)"""
+        state = status.get("status")
+        if state == "COMPLETED":
+            self._jobs.pop(job.job_id, None)
+            if not job.future.done():
+                self._completed += 1
+                job.future.set_result(self.manager.extract_job_output(status))
+            return True
+        if state in FAILED_JOB_STATUSES:
+            self._jobs.pop(job.job_id, None)
+            if not job.future.done():
+                self._failed += 1
+                job.future.set_exception(
+                    RunPodManagerError(f"vLLM 작업 실패: {state} - {status.get('error')}")
+                )
+            return True
+        return False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """디스패처 지표"""
+        return {
+            "requests": self._requests,
+            "batches": self._batches,
+            "avg_batch_size": round(self._requests / self._batches, 2) if self._batches else 0.0,
+            "max_batch_size": self._max_batch_seen,
+            "immediate_submits": self._immediate,
+            "status_calls": self._status_calls,
+            "waiting_to_submit": sum(len(group) for group in self._groups.values()),
+            "in_flight_jobs": len(self._jobs),
+            "completed": self._completed,
+            "failed": self._failed,
+            "timed_out": self._timed_out,
+            "cancelled": self._cancelled,
+        }
+
+
+# 싱글톤 인스턴스
+_vllm_dispatcher: Optional[VLLMDispatcher] = None
+
+
+def get_vllm_dispatcher() -> VLLMDispatcher:
+    """vLLM 디스패처 싱글톤 인스턴스 반환"""
+    global _vllm_dispatcher
+    if _vllm_dispatcher is None:
+        _vllm_dispatcher = VLLMDispatcher()
+    return _vllm_dispatcher
@@ -0,0 +1,295 @@
+"""
+TTS 참조 음성(voice_base) 캐시
+인플루언서의 참조 음성은 거의 바뀌지 않는데 TTS 요청마다 S3에서 내려받아 base64로 변환하던 것을
+(S3 키, ETag) 기준으로 메모리에 보관
+- VOICE_CACHE_REVALIDATE_SECONDS 이내에는 S3 요청 없이 사용
+- 그 이후에는 조건부 HEAD(If-None-Match: ETag)로 변경 여부만 확인, 바뀌었으면 다시 다운로드
+- 전체 크기는 VOICE_CACHE_MAX_BYTES로 제한 (오래 사용하지 않은 음성부터 제거)
+채팅 WebSocket 연결 시 해당 인플루언서 음성을 미리 받아 두어 첫 TTS 지연을 줄임
+"""
+
+import time
+import base64
+import asyncio
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from botocore.exceptions import ClientError
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.core.metrics import VOICE_ASSET_CACHE_REQUESTS
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class VoiceAsset:
+    """base64로 인코딩된 참조 음성"""
+
+    s3_key: str
+    etag: str
+    data_base64: str
+    checked_at: float
+
+
+@dataclass
+class VoiceRef:
+    """인플루언서의 참조 음성 (voice_base 행)"""
+
+    voice_id: str
+    s3_key: str
+    # S3 키 + 수정 시각: 같은 키에 덮어써도 바뀌므로 TTS 결과 캐시 키에 포함
+    version: str
+
+
+def voice_s3_key(s3_url: str, bucket_name: Optional[str]) -> str:
+    """voice_base.s3_url에서 S3 키 추출"""
+    if s3_url.startswith("https://"):
+        # https://bucket-name.s3.region.amazonaws.com/key 형식
+        if ".amazonaws.com/" in s3_url:
+            return s3_url.split(".amazonaws.com/")[-1]
+        return s3_url.split("/")[-1]
+    if bucket_name and s3_url.startswith(f"s3://{bucket_name}/"):
+        # s3://bucket-name/key 형식
+        return s3_url.replace(f"s3://{bucket_name}/", "")
+    # 이미 키 형식인 경우
+    return s3_url
+
+
+def _status(error: ClientError) -> Tuple[str, Optional[int]]:
+    code = str(error.response.get("Error", {}).get("Code"))
+    status = error.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+    return code, status
+
+
+class VoiceAssetCache:
+    """(S3 키, ETag) 기준 참조 음성 캐시"""
+
+    def __init__(
+        self,
+        storage=None,
+        max_bytes: Optional[int] = None,
+        revalidate_seconds: Optional[float] = None,
+    ):
+        # storage: AsyncObjectStorage (None이면 S3 서비스의 storage 사용)
+        self._storage = storage
+        self.max_bytes = settings.VOICE_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self.revalidate_seconds = (
+            settings.VOICE_CACHE_REVALIDATE_SECONDS if revalidate_seconds is None else revalidate_seconds
+        )
+
+        self._assets: "OrderedDict[str, VoiceAsset]" = OrderedDict()
+        self._bytes = 0
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # 인플루언서 → 참조 음성 (DB 조회 결과, 재검증 주기 동안 유지)
+        self._voices: Dict[str, Tuple[Optional[VoiceRef], float]] = {}
+        self._warm_tasks: Dict[str, asyncio.Task] = {}
+
+        # 지표
+        self._hits = 0
+        self._misses = 0
+        self._revalidations = 0
+        self._invalidations = 0
+        self._errors = 0
+
+    @property
+    def storage(self):
+        if self._storage is None:
+            from app.services.s3_service import get_s3_service
+
+            self._storage = get_s3_service().storage
+        return self._storage
+
+    def _count(self, result: str):
+        VOICE_ASSET_CACHE_REQUESTS.inc(result=result)
+
+    def _store(self, asset: VoiceAsset):
+        self._drop(asset.s3_key)
+        size = len(asset.data_base64)
+        if size > self.max_bytes:
+            return
+        self._assets[asset.s3_key] = asset
+        self._bytes += size
+        while self._bytes > self.max_bytes and self._assets:
+            _, evicted = self._assets.popitem(last=False)
+            self._bytes -= len(evicted.data_base64)
+
+    def _drop(self, s3_key: str):
+        old = self._assets.pop(s3_key, None)
+        if old is not None:
+            self._bytes -= len(old.data_base64)
+
+    def invalidate(self, s3_key: Optional[str], influencer_id: Optional[str] = None):
+        """음성 교체/삭제 시 캐시 항목 제거 (influencer_id가 있으면 DB 조회 결과도 제거)"""
+        if s3_key:
+            self._drop(s3_key)
+        if influencer_id:
+            self._voices.pop(influencer_id, None)
+
+    async def _is_fresh(self, asset: VoiceAsset) -> Optional[bool]:
+        """조건부 HEAD로 변경 여부 확인 (삭제됐으면 None)"""
+        try:
+            meta = await self.storage.head_object(asset.s3_key, if_none_match=asset.etag)
+        except ClientError as e:
+            code, status = _status(e)
+            if code in ("304", "NotModified") or status == 304:
+                return True
+            if code in ("404", "NoSuchKey", "NotFound") or status == 404:
+                return None
+            raise
+        return meta.get("ETag") == asset.etag
+
+    async def _download(self, s3_key: str) -> VoiceAsset:
+        # 본문과 ETag를 같은 응답에서 받아 다운로드 도중 교체돼도 키/ETag가 어긋나지 않음
+        meta, chunks = await self.storage.open_object(s3_key)
+        data = b"".join([chunk async for chunk in chunks])
+        asset = VoiceAsset(
+            s3_key=s3_key,
+            etag=meta.get("ETag", ""),
+            data_base64=base64.b64encode(data).decode("utf-8"),
+            checked_at=time.monotonic(),
+        )
+        self._store(asset)
+        logger.info(f"🎙️ 참조 음성 캐시 저장: {s3_key} (base64 {len(asset.data_base64)} bytes)")
+        return asset
+
+    async def _load(self, s3_key: str) -> Optional[VoiceAsset]:
+        asset = self._assets.get(s3_key)
+        if asset is not None:
+            self._assets.move_to_end(s3_key)
+            if time.monotonic() - asset.checked_at < self.revalidate_seconds:
+                self._hits += 1
+                self._count("hit")
+                return asset
+
+            self._revalidations += 1
+            try:
+                fresh = await self._is_fresh(asset)
+            except Exception as e:
+                # S3 확인 실패 시에는 기존 음성을 그대로 사용 (참조 음성은 거의 바뀌지 않음)
+                self._errors += 1
+                logger.warning(f"⚠️ 참조 음성 변경 확인 실패, 캐시 사용: {s3_key} ({e})")
+                self._hits += 1
+                self._count("hit")
+                return asset
+            if fresh:
+                asset.checked_at = time.monotonic()
+                self._hits += 1
+                self._count("hit")
+                return asset
+
+            self._invalidations += 1
+            self._count("stale")
+            self._drop(s3_key)
+            if fresh is None:
+                logger.warning(f"⚠️ 참조 음성이 S3에서 삭제됨: {s3_key}")
+                return None
+            logger.info(f"🔄 참조 음성 변경 감지 (ETag 불일치): {s3_key}")
+
+        self._misses += 1
+        self._count("miss")
+        return await self._download(s3_key)
+
+    async def get(self, s3_key: str) -> Optional[str]:
+        """S3 키의 base64 음성 반환 (같은 키의 동시 요청은 한 번만 다운로드)"""
+        task = self._inflight.get(s3_key)
+        if task is None:
+            task = asyncio.create_task(self._load(s3_key))
+            self._inflight[s3_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(s3_key, None))
+        try:
+            asset = await asyncio.shield(task)
+        except Exception as e:
+            self._errors += 1
+            self._count("error")
+            logger.error(f"❌ 참조 음성 가져오기 실패: {s3_key} ({e})")
+            return None
+        return asset.data_base64 if asset else None
+
+    async def _lookup_voice(self, influencer_id: str) -> Optional[VoiceRef]:
+        from app.database import new_async_session
+        from app.models.voice import VoiceBase
+
+        async with new_async_session() as db:
+            row = (await db.execute(
+                select(
+                    VoiceBase.id, VoiceBase.s3_key, VoiceBase.s3_url, VoiceBase.created_at, VoiceBase.updated_at
+                ).where(VoiceBase.influencer_id == influencer_id)
+            )).first()
+        if row is None:
+            return None
+        s3_key = row.s3_key
+        if not s3_key and row.s3_url:
+            s3_key = voice_s3_key(row.s3_url, getattr(self.storage, "bucket_name", None))
+        if not s3_key:
+            return None
+        modified_at = row.updated_at or row.created_at
+        version = f"{s3_key}@{modified_at.isoformat() if modified_at else ''}"
+        return VoiceRef(voice_id=str(row.id), s3_key=s3_key, version=version)
+
+    async def resolve_voice(self, influencer_id: str) -> Optional[VoiceRef]:
+        """인플루언서의 참조 음성 (DB 조회 결과를 재검증 주기 동안 재사용)"""
+        cached = self._voices.get(influencer_id)
+        if cached is not None and time.monotonic() - cached[1] < self.revalidate_seconds:
+            return cached[0]
+        voice = await self._lookup_voice(influencer_id)
+        self._voices[influencer_id] = (voice, time.monotonic())
+        return voice
+
+    async def resolve_voice_key(self, influencer_id: str) -> Optional[str]:
+        """인플루언서의 참조 음성 S3 키"""
+        voice = await self.resolve_voice(influencer_id)
+        return voice.s3_key if voice else None
+
+    async def get_for_influencer(self, influencer_id: str) -> Optional[str]:
+        """인플루언서 참조 음성의 base64 데이터"""
+        s3_key = await self.resolve_voice_key(influencer_id)
+        if not s3_key:
+            logger.warning(f"인플루언서 {influencer_id}의 voice_base를 찾을 수 없음")
+            return None
+        return await self.get(s3_key)
+
+    async def _warm(self, influencer_id: str):
+        try:
+            s3_key = await self.resolve_voice_key(influencer_id)
+            if s3_key:
+                await self.get(s3_key)
+        except Exception as e:
+            logger.warning(f"⚠️ 참조 음성 미리 받기 실패 ({influencer_id}): {e}")
+        finally:
+            self._warm_tasks.pop(influencer_id, None)
+
+    def warm(self, influencer_id: str):
+        """채팅 세션 시작 시 백그라운드로 참조 음성 미리 받기"""
+        if not influencer_id or influencer_id in self._warm_tasks:
+            return
+        self._warm_tasks[influencer_id] = asyncio.create_task(self._warm(influencer_id))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 지표"""
+        lookups = self._hits + self._misses
+        return {
+            "entries": len(self._assets),
+            "bytes": self._bytes,
+            "hits": self._hits,
+            "misses": self._misses,
+            "revalidations": self._revalidations,
+            "invalidations": self._invalidations,
+            "errors": self._errors,
+            "hit_ratio": round(self._hits / lookups, 3) if lookups else None,
+        }
+
+
+# 싱글톤 인스턴스
+_voice_asset_cache: Optional[VoiceAssetCache] = None
+
+
+def get_voice_asset_cache() -> VoiceAssetCache:
+    """참조 음성 캐시 싱글톤 인스턴스 반환"""
+    global _voice_asset_cache
+    if _voice_asset_cache is None:
+        _voice_asset_cache = VoiceAssetCache()
+    return _voice_asset_cache
@@ -0,0 +1,491 @@
+"""
+ComfyUI 웜 Pod 풀
+세션마다 create_pod → wait_for_ready로 수 분씩 콜드 스타트하고 세션 종료 시 Pod을 지우던 방식을 보완
+- ComfyUI 준비가 끝난 유휴 Pod을 목표 개수만큼 미리 띄워 두고 세션에 바로 할당
+- 세션이 끝난 Pod은 큐/히스토리를 비우고 풀에 반환 (재사용 횟수/수명 초과 시 종료)
+  ComfyUI API로는 input/output 파일을 지울 수 없으므로 반환된 Pod은 같은 사용자에게만 다시 할당하고
+  RUNPOD_POOL_IDLE_TTL 동안 쓰이지 않으면 종료 (다른 사용자에게는 한 번도 쓰이지 않은 Pod만 할당)
+- 풀이 할당하지 않은 Pod(풀 미스로 새로 만든 Pod, 서버 재시작 이전 할당 등)은 반환 시 종료
+- 목표 개수: 최소 유휴 수 / 시간대별 프로필 / 최근 세션 유입률 × Pod 준비 시간 중 큰 값 (최대 크기 제한)
+- 예산 보호: get_remaining_credits 잔액이 기준보다 적으면 보충을 멈추고 유휴 Pod 종료
+- RUNPOD_POOL_MAX_SIZE가 0이면 비활성화 (기존처럼 세션마다 생성/종료)
+"""
+
+import math
+import time
+import uuid
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.core.http_clients import pooled_client
+
+logger = logging.getLogger(__name__)
+
+# Pod을 더 이상 사용할 수 없는 상태
+UNUSABLE_POD_STATUSES = {"TERMINATED", "STOPPED", "FAILED", "EXITED"}
+
+# 준비 시간 측정값이 없을 때 사용할 예상 준비 시간 (초)
+DEFAULT_BOOT_SECONDS = 300.0
+
+
+@dataclass
+class WarmPod:
+    """풀이 관리하는 ComfyUI Pod"""
+
+    pod_id: str
+    endpoint_url: Optional[str]
+    cost_per_hour: Optional[float] = None
+    created_at: float = field(default_factory=time.monotonic)
+    idle_since: float = field(default_factory=time.monotonic)
+    leases: int = 0
+    # 이 Pod을 사용한 사용자 (input/output 파일이 남아 있으므로 이 사용자에게만 재할당, None이면 미사용 Pod)
+    owner: Optional[str] = None
+
+
+def parse_pool_profile(profile: str) -> List[Tuple[int, int, int]]:
+    """시간대별 유휴 Pod 수 설정 파싱 (예: 9-18:2,22-6:1 → [(시작, 끝, 개수)])"""
+    entries = []
+    for item in filter(None, (part.strip() for part in profile.split(","))):
+        try:
+            hours, size = item.split(":")
+            start, end = (int(hour) for hour in hours.split("-"))
+            entries.append((start % 24, end % 24 if end != 24 else 24, int(size)))
+        except ValueError:
+            logger.warning(f"⚠️ 잘못된 웜 풀 시간대 설정 무시: {item}")
+    return entries
+
+
+def _profile_size(entries: List[Tuple[int, int, int]], hour: int) -> int:
+    size = 0
+    for start, end, count in entries:
+        # 자정을 넘는 구간 (예: 22-6) 지원
+        inside = start <= hour < end if start < end else (hour >= start or hour < end)
+        if inside:
+            size = max(size, count)
+    return size
+
+
+class WarmPodPool:
+    """준비된 유휴 ComfyUI Pod 풀"""
+
+    def __init__(self, runpod_service=None, max_size: Optional[int] = None, min_idle: Optional[int] = None):
+        self._runpod_service = runpod_service
+        self.max_size = settings.RUNPOD_POOL_MAX_SIZE if max_size is None else max_size
+        self.min_idle = settings.RUNPOD_POOL_MIN_IDLE if min_idle is None else min_idle
+        self.profile = parse_pool_profile(settings.RUNPOD_POOL_PROFILE)
+        self.rate_window = settings.RUNPOD_POOL_RATE_WINDOW
+        self.max_reuse = settings.RUNPOD_POOL_MAX_REUSE
+        self.max_pod_age = settings.RUNPOD_POOL_MAX_POD_AGE
+        self.idle_ttl = settings.RUNPOD_POOL_IDLE_TTL
+        self.check_interval = settings.RUNPOD_POOL_CHECK_INTERVAL
+        self.max_concurrent_boots = settings.RUNPOD_POOL_MAX_CONCURRENT_BOOTS
+        self.min_credits = settings.RUNPOD_POOL_MIN_CREDITS
+        self.credits_check_interval = settings.RUNPOD_POOL_CREDITS_CHECK_INTERVAL
+
+        # 오른쪽 끝이 가장 최근에 준비/반환된 Pod (할당은 오른쪽, 축소는 왼쪽에서)
+        self._idle: Deque[WarmPod] = deque()
+        self._leased: Dict[str, WarmPod] = {}
+        self._booting: Set[asyncio.Task] = set()
+        self._booting_pod_ids: Set[str] = set()
+        self._arrivals: Deque[float] = deque()
+
+        self._task: Optional[asyncio.Task] = None
+        self._wake = asyncio.Event()
+        self._avg_boot_seconds: Optional[float] = None
+        self._boot_backoff_until = 0.0
+        self._consecutive_boot_failures = 0
+
+        self._remaining_credits: Optional[float] = None
+        self._credits_checked_at = 0.0
+        self._budget_blocked = False
+        self._health_checked_at = 0.0
+
+        # 지표
+        self._hits = 0
+        self._misses = 0
+        self._recycled = 0
+        self._provisioned = 0
+        self._boot_failures = 0
+        self._terminated = 0
+
+    @property
+    def runpod_service(self):
+        # RunPod 설정이 없는 환경에서도 지표 조회는 가능하도록 실제 사용 시점에 초기화
+        if self._runpod_service is None:
+            from app.services.runpod_service import get_runpod_service
+
+            self._runpod_service = get_runpod_service()
+        return self._runpod_service
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    # ------------------------------------------------------------------
+    # 할당 / 반환
+    # ------------------------------------------------------------------
+
+    def lease(self, user_id: str) -> Optional[WarmPod]:
+        """준비된 유휴 Pod 하나를 세션에 할당 (없으면 None → 호출자가 새로 생성)
+
+        이 사용자가 쓰던 Pod이 있으면 우선 할당하고, 없으면 한 번도 쓰이지 않은 Pod 할당
+        """
+        if not self.enabled:
+            return None
+
+        self._arrivals.append(time.monotonic())
+        self._wake.set()
+
+        pod = self._take_idle(user_id)
+        if pod is None:
+            self._misses += 1
+            return None
+
+        pod.leases += 1
+        pod.owner = user_id
+        self._leased[pod.pod_id] = pod
+        self._hits += 1
+        logger.info(f"♻️ 웜 Pod 할당: {pod.pod_id} (남은 유휴 {len(self._idle)}개, 사용 {pod.leases}회차)")
+        return pod
+
+    def _take_idle(self, user_id: str) -> Optional[WarmPod]:
+        """할당할 유휴 Pod을 풀에서 꺼냄 (최근에 준비/반환된 Pod부터)"""
+        fallback = None
+        for index in range(len(self._idle) - 1, -1, -1):
+            pod = self._idle[index]
+            if pod.owner == user_id:
+                del self._idle[index]
+                return pod
+            if pod.owner is None and fallback is None:
+                fallback = index
+        if fallback is None:
+            return None
+        pod = self._idle[fallback]
+        del self._idle[fallback]
+        return pod
+
+    async def release_pod(self, pod_id: str) -> bool:
+        """세션이 끝난 Pod 반환 - 재사용 가능하면 풀에 넣고 아니면 종료
+
+        Returns:
+            bool: 풀 반환 또는 종료 성공 여부
+        """
+        pod = self._leased.pop(pod_id, None)
+        if pod is None or not self.enabled:
+            # 풀이 할당하지 않은 Pod은 어떤 사용자의 파일이 남아 있는지 알 수 없으므로 종료
+            return await self._terminate(pod_id)
+
+        # 초기화하는 동안 다른 반환으로 풀이 찼을 수 있으므로 다시 확인
+        if self._can_recycle(pod) and await self._reset_pod(pod) and self._can_recycle(pod):
+            pod.idle_since = time.monotonic()
+            self._idle.append(pod)
+            self._recycled += 1
+            logger.info(f"♻️ Pod {pod_id} 풀로 반환 (유휴 {len(self._idle)}개)")
+            return True
+
+        return await self._terminate(pod_id)
+
+    def discard(self, pod_ids) -> None:
+        """이미 사라진 Pod을 풀 추적 대상에서 제거 (세션 정리 시 호출)"""
+        gone = set(pod_ids)
+        for pod_id in gone:
+            self._leased.pop(pod_id, None)
+        if any(pod.pod_id in gone for pod in self._idle):
+            self._idle = deque(pod for pod in self._idle if pod.pod_id not in gone)
+
+    def owned_pod_ids(self) -> Set[str]:
+        """풀이 보유한 유휴/준비 중 Pod ID (사용자 세션에 연결되지 않은 것이 정상인 Pod)"""
+        return {pod.pod_id for pod in self._idle} | set(self._booting_pod_ids)
+
+    def _can_recycle(self, pod: WarmPod) -> bool:
+        if not self.enabled or self._budget_blocked:
+            return False
+        if len(self._idle) >= self.max_size:
+            return False
+        if pod.leases >= self.max_reuse:
+            return False
+        return time.monotonic() - pod.created_at < self.max_pod_age
+
+    async def _reset_pod(self, pod: WarmPod) -> bool:
+        """이전 세션의 대기열/실행 기록을 비우고 응답 여부 확인 (input/output 파일은 남으므로 pod.owner 유지)"""
+        if not pod.endpoint_url:
+            return False
+        base = pod.endpoint_url.rstrip("/")
+        try:
+            async with pooled_client("runpod_pod") as client:
+                for path in ("/queue", "/history"):
+                    response = await client.post(f"{base}{path}", json={"clear": True}, timeout=10.0)
+                    if response.status_code != 200:
+                        logger.warning(f"⚠️ Pod {pod.pod_id} 초기화 실패 ({path}: {response.status_code})")
+                        return False
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ Pod {pod.pod_id} 초기화 중 오류: {e}")
+            return False
+
+    async def _terminate(self, pod_id: str) -> bool:
+        try:
+            terminated = await self.runpod_service.terminate_pod(pod_id)
+        except Exception as e:
+            logger.error(f"❌ Pod {pod_id} 종료 실패: {e}")
+            return False
+        if terminated:
+            self._terminated += 1
+        return terminated
+
+    # ------------------------------------------------------------------
+    # 목표 크기 / 보충
+    # ------------------------------------------------------------------
+
+    def _arrival_rate(self, now: float) -> float:
+        """최근 구간의 초당 세션 유입 수"""
+        while self._arrivals and self._arrivals[0] < now - self.rate_window:
+            self._arrivals.popleft()
+        return len(self._arrivals) / self.rate_window if self.rate_window else 0.0
+
+    def target_size(self) -> int:
+        """현재 유지해야 할 유휴 Pod 수"""
+        if not self.enabled or self._budget_blocked:
+            return 0
+        boot_seconds = self._avg_boot_seconds or DEFAULT_BOOT_SECONDS
+        # Pod 하나가 준비되는 동안 도착할 것으로 예상되는 세션 수
+        predicted = math.ceil(self._arrival_rate(time.monotonic()) * boot_seconds)
+        scheduled = _profile_size(self.profile, datetime.now().hour)
+        return min(self.max_size, max(self.min_idle, scheduled, predicted))
+
+    async def _refresh_budget(self, now: float):
+        if now - self._credits_checked_at < self.credits_check_interval and self._credits_checked_at:
+            return
+        self._credits_checked_at = now
+        credits = await self.runpod_service.get_remaining_credits()
+        if credits is None:
+            # 조회 실패 시 이전 판단 유지
+            return
+        try:
+            self._remaining_credits = float(credits.get("remaining_credits") or 0)
+        except (TypeError, ValueError):
+            return
+
+        blocked = self._remaining_credits < self.min_credits
+        if blocked != self._budget_blocked:
+            if blocked:
+                logger.warning(
+                    f"💸 RunPod 잔액 부족 ({self._remaining_credits:.2f} < {self.min_credits}) - 웜 풀 보충 중단"
+                )
+            else:
+                logger.info(f"💰 RunPod 잔액 회복 ({self._remaining_credits:.2f}) - 웜 풀 보충 재개")
+        self._budget_blocked = blocked
+
+    async def _check_idle_health(self, now: float):
+        """유휴 Pod 상태를 한 번의 목록 조회로 확인하여 사용할 수 없는 Pod 제거"""
+        if not self._idle or now - self._health_checked_at < self.check_interval * 2:
+            return
+        self._health_checked_at = now
+        try:
+            pods = await self.runpod_service.list_pods()
+        except Exception as e:
+            logger.warning(f"⚠️ 웜 풀 Pod 상태 확인 실패: {e}")
+            return
+        unusable = [
+            pod.pod_id for pod in self._idle
+            if pod.pod_id not in pods or pods[pod.pod_id].status.upper() in UNUSABLE_POD_STATUSES
+        ]
+        if unusable:
+            logger.info(f"🛑 웜 풀에서 사용할 수 없는 Pod 제거: {unusable}")
+            self.discard(unusable)
+
+    def _clean_idle(self) -> List[WarmPod]:
+        """누구에게나 할당할 수 있는 (한 번도 쓰이지 않은) 유휴 Pod"""
+        return [pod for pod in self._idle if pod.owner is None]
+
+    async def _shrink(self, now: float, target: int):
+        """예산 부족 / 수명 초과 / 목표 초과 유휴 Pod, 사용자가 돌아오지 않은 반환 Pod 종료"""
+        expired = [
+            pod for pod in self._idle
+            if self._budget_blocked
+            or now - pod.created_at >= self.max_pod_age
+            or (pod.owner is not None and now - pod.idle_since >= self.idle_ttl)
+        ]
+        clean = [pod for pod in self._clean_idle() if pod not in expired]
+        surplus = len(clean) - target
+        for pod in clean:
+            if surplus <= 0:
+                break
+            # 앞쪽일수록 오래 유휴 상태였던 Pod
+            if now - pod.idle_since >= self.idle_ttl:
+                expired.append(pod)
+                surplus -= 1
+
+        if not expired:
+            return
+        removed = {pod.pod_id for pod in expired}
+        self._idle = deque(pod for pod in self._idle if pod.pod_id not in removed)
+        logger.info(f"🧹 웜 풀 유휴 Pod {len(removed)}개 종료 (목표 {target}개)")
+        await asyncio.gather(*(self._terminate(pod_id) for pod_id in removed))
+
+    def _replenish(self, now: float, target: int):
+        if self._budget_blocked or now < self._boot_backoff_until:
+            return
+        # 목표는 아무 사용자에게나 할당할 수 있는 Pod 수 기준 (반환된 Pod은 이전 사용자 전용)
+        deficit = target - len(self._clean_idle()) - len(self._booting)
+        room = self.max_size - len(self._idle) - len(self._booting)
+        slots = self.max_concurrent_boots - len(self._booting)
+        for _ in range(max(0, min(deficit, room, slots))):
+            task = asyncio.create_task(self._provision_one())
+            self._booting.add(task)
+            task.add_done_callback(self._booting.discard)
+
+    async def _provision_one(self):
+        """새 Pod 생성 후 ComfyUI 준비가 끝나면 풀에 추가"""
+        pod_id = None
+        started = time.monotonic()
+        try:
+            response = await self.runpod_service.create_pod(f"pool_{uuid.uuid4().hex[:8]}")
+            pod_id = response.pod_id
+            self._booting_pod_ids.add(pod_id)
+
+            if not await self.runpod_service.wait_for_ready(pod_id, max_wait_time=600):
+                raise RuntimeError(f"Pod {pod_id} 준비 실패")
+
+            boot_seconds = time.monotonic() - started
+            self._avg_boot_seconds = (
+                boot_seconds if self._avg_boot_seconds is None
+                else self._avg_boot_seconds * 0.7 + boot_seconds * 0.3
+            )
+            self._consecutive_boot_failures = 0
+
+            if self._budget_blocked or len(self._idle) >= self.max_size:
+                await self._terminate(pod_id)
+                return
+
+            self._idle.append(WarmPod(
+                pod_id=pod_id,
+                endpoint_url=response.endpoint_url,
+                cost_per_hour=response.cost_per_hour,
+                created_at=started,
+            ))
+            self._provisioned += 1
+            logger.info(f"🔥 웜 Pod 준비 완료: {pod_id} ({boot_seconds:.0f}초, 유휴 {len(self._idle)}개)")
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._boot_failures += 1
+            self._consecutive_boot_failures += 1
+            # 자원 부족 등으로 연속 실패하면 점점 늦게 재시도
+            backoff = min(600, 30 * 2 ** (self._consecutive_boot_failures - 1))
+            self._boot_backoff_until = time.monotonic() + backoff
+            logger.warning(f"⚠️ 웜 Pod 준비 실패 ({backoff}초 후 재시도): {e}")
+            if pod_id:
+                await self._terminate(pod_id)
+        finally:
+            if pod_id:
+                self._booting_pod_ids.discard(pod_id)
+
+    async def _tick(self):
+        now = time.monotonic()
+        await self._refresh_budget(now)
+        await self._check_idle_health(now)
+        target = self.target_size()
+        await self._shrink(now, target)
+        self._replenish(now, target)
+
+    async def _run(self):
+        while True:
+            try:
+                await self._tick()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ 웜 풀 관리 중 오류: {e}")
+
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.check_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    # ------------------------------------------------------------------
+    # 시작 / 종료 / 지표
+    # ------------------------------------------------------------------
+
+    async def start(self):
+        if not self.enabled:
+            logger.info("🔥 웜 Pod 풀 비활성화 (RUNPOD_POOL_MAX_SIZE=0)")
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"🔥 웜 Pod 풀 시작 (최소 유휴 {self.min_idle}개, 최대 {self.max_size}개)")
+
+    async def stop(self):
+        """관리 작업 중지 후 유휴/준비 중 Pod 종료 (세션에 할당된 Pod은 유지)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        booting_ids = set(self._booting_pod_ids)
+        for task in list(self._booting):
+            task.cancel()
+        if self._booting:
+            await asyncio.gather(*self._booting, return_exceptions=True)
+
+        pod_ids = [pod.pod_id for pod in self._idle] + list(booting_ids)
+        self._idle.clear()
+        if pod_ids:
+            logger.info(f"🛑 웜 풀 Pod {len(pod_ids)}개 종료")
+            await asyncio.gather(*(self._terminate(pod_id) for pod_id in pod_ids))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """풀 지표"""
+        lookups = self._hits + self._misses
+        return {
+            "enabled": self.enabled,
+            "target_idle": self.target_size(),
+            "idle": len(self._idle),
+            "idle_reserved": len(self._idle) - len(self._clean_idle()),
+            "leased": len(self._leased),
+            "booting": len(self._booting),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_ratio": round(self._hits / lookups, 3) if lookups else 0.0,
+            "recycled": self._recycled,
+            "provisioned": self._provisioned,
+            "boot_failures": self._boot_failures,
+            "terminated": self._terminated,
+            "avg_boot_seconds": round(self._avg_boot_seconds, 1) if self._avg_boot_seconds else None,
+            "idle_cost_per_hour": round(sum(pod.cost_per_hour or 0 for pod in self._idle), 2),
+            "remaining_credits": self._remaining_credits,
+            "budget_blocked": self._budget_blocked,
+        }
+
+
+# 싱글톤 인스턴스
+_warm_pod_pool: Optional[WarmPodPool] = None
+
+
+def get_warm_pod_pool() -> WarmPodPool:
+    """웜 Pod 풀 싱글톤 인스턴스 반환"""
+    global _warm_pod_pool
+    if _warm_pod_pool is None:
+        _warm_pod_pool = WarmPodPool()
+    return _warm_pod_pool
+
+
+# 애플리케이션 시작/종료 시 호출
+async def start_warm_pod_pool():
+    """애플리케이션 시작시 호출"""
+    await get_warm_pod_pool().start()
+
+
+async def stop_warm_pod_pool():
+    """애플리케이션 종료시 호출 (유휴 Pod 종료)"""
+    await get_warm_pod_pool().stop()
@@ -0,0 +1,320 @@
+"""
+ComfyUI 워크플로우 템플릿 레지스트리
+요청마다 workflows/*.json을 읽고 깊은 복사한 뒤 노드를 찾아 값을 넣던 방식을 보완
+- 워크플로우별 파라미터 → (노드 ID, 입력 키) 경로를 로드 시 한 번만 계산하고 검증
+- 페이로드는 얕은 복사 한 번 + 값이 바뀌는 노드만 복사 후 직접 대입으로 생성
+- 바인딩이 기대하는 노드/입력이 없으면 시작 시 바로 실패 (잘못된 워크플로우로 요청을 받지 않도록)
+- workflows 디렉토리 변경 감지 시 다시 로드 (검증 실패 시 이전 버전 유지)
+"""
+
+import os
+import json
+import time
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+WORKFLOWS_DIR = Path(__file__).parent.parent.parent / "workflows"
+
+# 워크플로우 이름
+FLUX_T2I = "flux_t2i"
+IMAGE_SYNTHESIS = "image_synthesis"
+IMAGE_MODIFY = "image_modify"
+
+
+class WorkflowTemplateError(Exception):
+    """워크플로우 템플릿 로드/검증/생성 오류"""
+
+
+@dataclass(frozen=True)
+class WorkflowSpec:
+    """워크플로우 파일과 파라미터 바인딩 정의
+
+    bindings: 파라미터 이름 → [(노드 ID, class_type, 입력 키)] (중첩 입력은 "lora_1.on"처럼 점으로 구분)
+    required_nodes: 바인딩은 없지만 실행에 꼭 필요한 노드 (출력 노드 등)
+    """
+
+    filename: str
+    bindings: Dict[str, List[Tuple[str, str, str]]]
+    required_nodes: Tuple[str, ...] = field(default_factory=tuple)
+
+
+WORKFLOW_SPECS: Dict[str, WorkflowSpec] = {
+    FLUX_T2I: WorkflowSpec(
+        filename="t2i_generate_ComfyUI_Flux_Nunchaku_flux.1-dev.json",
+        bindings={
+            "prompt": [("6", "CLIPTextEncode", "text")],
+            "width": [("27", "EmptySD3LatentImage", "width"), ("30", "ModelSamplingFlux", "width")],
+            "height": [("27", "EmptySD3LatentImage", "height"), ("30", "ModelSamplingFlux", "height")],
+            "style_lora_name": [("47", "NunchakuFluxLoraLoader", "lora_name")],
+            "style_lora_strength": [("47", "NunchakuFluxLoraLoader", "lora_strength")],
+        },
+    ),
+    IMAGE_SYNTHESIS: WorkflowSpec(
+        filename="image_synthesis.json",
+        bindings={
+            "prompt": [("6", "CLIPTextEncode", "text")],
+            "image1": [("142", "LoadImageOutput", "image")],
+            "image2": [("147", "LoadImageOutput", "image")],
+            "width": [("191", "ImageResizeKJv2", "width")],
+            "height": [("191", "ImageResizeKJv2", "height")],
+            "guidance": [("35", "FluxGuidance", "guidance")],
+            "steps": [("31", "KSampler", "steps")],
+        },
+    ),
+    IMAGE_MODIFY: WorkflowSpec(
+        filename="image_modify_text_simple.json",
+        bindings={
+            "image": [("1", "DiptychCreate", "image")],
+            "edit_text": [("9", "InContextEditInstruction", "editText")],
+            "seed": [("6", "KSampler", "seed")],
+            "lora_1_on": [("22", "Power Lora Loader (rgthree)", "lora_1.on")],
+            "lora_1_strength": [("22", "Power Lora Loader (rgthree)", "lora_1.strength")],
+            "lora_2_on": [("22", "Power Lora Loader (rgthree)", "lora_2.on")],
+            "lora_2_strength": [("22", "Power Lora Loader (rgthree)", "lora_2.strength")],
+            "crop_width": [("19", "ImageCrop", "width")],
+            "crop_height": [("19", "ImageCrop", "height")],
+            "crop_x": [("19", "ImageCrop", "x")],
+            "crop_y": [("19", "ImageCrop", "y")],
+        },
+        required_nodes=("15", "24"),
+    ),
+}
+
+
+class CompiledWorkflow:
+    """검증이 끝난 워크플로우와 파라미터별 대입 경로"""
+
+    def __init__(
+        self,
+        name: str,
+        workflow: Dict[str, Any],
+        bindings: Dict[str, Tuple[Tuple[str, ...], ...]],
+        mtime_ns: int,
+    ):
+        self.name = name
+        self.workflow = workflow
+        self.bindings = bindings
+        self.mtime_ns = mtime_ns
+        self.loaded_at = time.time()
+
+    def build(self, **values: Any) -> Dict[str, Any]:
+        """파라미터를 대입한 실행용 워크플로우 생성
+
+        값이 바뀌는 노드(와 그 inputs)만 복사하고 나머지 노드는 원본과 공유하므로
+        반환된 워크플로우는 읽기/전송 용도로만 사용 (추가 수정은 build 파라미터로)
+        """
+        payload = dict(self.workflow)
+        copied: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+        for name, value in values.items():
+            paths = self.bindings.get(name)
+            if paths is None:
+                raise WorkflowTemplateError(f"워크플로우 {self.name}에 없는 파라미터: {name}")
+            for path in paths:
+                _writable(payload, copied, path[:-1])[path[-1]] = value
+        return payload
+
+
+def _writable(payload: Dict[str, Any], copied: Dict[Tuple[str, ...], Dict[str, Any]], keys: Tuple[str, ...]) -> Dict[str, Any]:
+    """경로상의 dict를 처음 접근할 때만 복사하여 원본 워크플로우를 보호"""
+    container = payload
+    for depth in range(1, len(keys) + 1):
+        prefix = keys[:depth]
+        child = copied.get(prefix)
+        if child is None:
+            child = dict(container[keys[depth - 1]])
+            container[keys[depth - 1]] = child
+            copied[prefix] = child
+        container = child
+    return container
+
+
+def compile_workflow(name: str, spec: WorkflowSpec, path: Path) -> CompiledWorkflow:
+    """워크플로우 파일을 읽고 바인딩을 검증하여 대입 경로 계산"""
+    mtime_ns = os.stat(path).st_mtime_ns
+    with open(path, "r", encoding="utf-8") as f:
+        workflow = json.load(f)
+
+    # API 형식(노드 ID → 노드)만 지원, UI 저장 형식(nodes 배열)은 /prompt로 실행할 수 없음
+    if not isinstance(workflow, dict) or isinstance(workflow.get("nodes"), list):
+        raise WorkflowTemplateError(f"워크플로우 {name}({path.name})가 API 형식이 아닙니다")
+
+    errors = [f"노드 {node_id} 없음" for node_id in spec.required_nodes if node_id not in workflow]
+    bindings: Dict[str, Tuple[Tuple[str, ...], ...]] = {}
+    for param, targets in spec.bindings.items():
+        paths = []
+        for node_id, class_type, input_path in targets:
+            node = workflow.get(node_id)
+            if not isinstance(node, dict):
+                errors.append(f"{param}: 노드 {node_id} 없음")
+                continue
+            if node.get("class_type") != class_type:
+                errors.append(f"{param}: 노드 {node_id}가 {class_type}이 아님 ({node.get('class_type')})")
+                continue
+            keys = tuple(input_path.split("."))
+            container = node.get("inputs")
+            for key in keys:
+                if not isinstance(container, dict) or key not in container:
+                    errors.append(f"{param}: 노드 {node_id}에 입력 {input_path} 없음")
+                    break
+                container = container[key]
+            else:
+                paths.append((node_id, "inputs") + keys)
+        bindings[param] = tuple(paths)
+
+    if errors:
+        raise WorkflowTemplateError(f"워크플로우 {name}({path.name}) 검증 실패: " + "; ".join(errors))
+    return CompiledWorkflow(name, workflow, bindings, mtime_ns)
+
+
+class WorkflowTemplateRegistry:
+    """워크플로우 템플릿 로드/조회/변경 감지"""
+
+    def __init__(self, workflows_dir: Optional[Path] = None, specs: Optional[Dict[str, WorkflowSpec]] = None):
+        self.workflows_dir = Path(workflows_dir) if workflows_dir else WORKFLOWS_DIR
+        self.specs = dict(WORKFLOW_SPECS if specs is None else specs)
+        self.reload_interval = settings.WORKFLOW_RELOAD_INTERVAL
+
+        self._templates: Dict[str, CompiledWorkflow] = {}
+        # 같은 변경에 대해 오류 로그가 반복되지 않도록 실패한 파일 버전 기록
+        self._failed_versions: Dict[str, Optional[int]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+        # 지표
+        self._reloads = 0
+        self._reload_failures = 0
+
+    def _compile(self, name: str) -> CompiledWorkflow:
+        spec = self.specs.get(name)
+        if spec is None:
+            raise WorkflowTemplateError(f"등록되지 않은 워크플로우: {name}")
+        try:
+            return compile_workflow(name, spec, self.workflows_dir / spec.filename)
+        except (OSError, ValueError) as e:
+            raise WorkflowTemplateError(f"워크플로우 {name}({spec.filename}) 로드 실패: {e}") from e
+
+    def load_all(self):
+        """모든 워크플로우 로드 및 검증 (하나라도 실패하면 예외)"""
+        templates = {}
+        errors = []
+        for name in self.specs:
+            try:
+                templates[name] = self._compile(name)
+            except WorkflowTemplateError as e:
+                errors.append(str(e))
+        if errors:
+            raise WorkflowTemplateError("\n".join(errors))
+        self._templates.update(templates)
+        logger.info(f"✅ ComfyUI 워크플로우 템플릿 {len(templates)}개 로드 완료: {', '.join(templates)}")
+
+    def get(self, name: str) -> CompiledWorkflow:
+        """컴파일된 워크플로우 조회 (시작 시 로드 전이면 지금 로드)"""
+        template = self._templates.get(name)
+        if template is None:
+            template = self._templates[name] = self._compile(name)
+        return template
+
+    def build(self, name: str, **values: Any) -> Dict[str, Any]:
+        """파라미터를 대입한 실행용 워크플로우 생성"""
+        return self.get(name).build(**values)
+
+    def reload_changed(self) -> List[str]:
+        """수정된 워크플로우 파일만 다시 로드 (검증 실패 시 이전 버전 유지)"""
+        reloaded = []
+        for name, spec in self.specs.items():
+            path = self.workflows_dir / spec.filename
+            try:
+                version: Optional[int] = os.stat(path).st_mtime_ns
+            except OSError:
+                version = None
+
+            current = self._templates.get(name)
+            if current is not None and current.mtime_ns == version:
+                continue
+            if name in self._failed_versions and self._failed_versions[name] == version:
+                continue
+
+            try:
+                self._templates[name] = self._compile(name)
+            except WorkflowTemplateError as e:
+                self._failed_versions[name] = version
+                self._reload_failures += 1
+                logger.error(f"❌ 워크플로우 다시 로드 실패 - 이전 버전 유지: {e}")
+                continue
+
+            self._failed_versions.pop(name, None)
+            self._reloads += 1
+            reloaded.append(name)
+            logger.info(f"🔄 워크플로우 다시 로드: {name} ({spec.filename})")
+        return reloaded
+
+    async def _watch(self):
+        while True:
+            await asyncio.sleep(self.reload_interval)
+            try:
+                await asyncio.to_thread(self.reload_changed)
+            except Exception as e:
+                logger.error(f"❌ 워크플로우 변경 감지 중 오류: {e}")
+
+    async def start(self):
+        if self.reload_interval <= 0:
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._watch())
+            logger.info(f"👀 워크플로우 변경 감지 시작 ({self.workflows_dir}, {self.reload_interval}초 간격)")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """템플릿 지표"""
+        return {
+            "templates": {
+                name: {
+                    "nodes": len(template.workflow),
+                    "params": len(template.bindings),
+                    "loaded_at": template.loaded_at,
+                }
+                for name, template in self._templates.items()
+            },
+            "reloads": self._reloads,
+            "reload_failures": self._reload_failures,
+            "watching": self._task is not None and not self._task.done(),
+        }
+
+
+# 싱글톤 인스턴스
+_workflow_template_registry: Optional[WorkflowTemplateRegistry] = None
+
+
+def get_workflow_template_registry() -> WorkflowTemplateRegistry:
+    """워크플로우 템플릿 레지스트리 싱글톤 인스턴스 반환"""
+    global _workflow_template_registry
+    if _workflow_template_registry is None:
+        _workflow_template_registry = WorkflowTemplateRegistry()
+    return _workflow_template_registry
+
+
+# 애플리케이션 시작/종료 시 호출
+async def start_workflow_templates():
+    """애플리케이션 시작시 호출 - 워크플로우 검증 실패 시 예외로 시작 중단"""
+    registry = get_workflow_template_registry()
+    registry.load_all()
+    await registry.start()
+
+
+async def stop_workflow_templates():
+    """애플리케이션 종료시 호출"""
+    await get_workflow_template_registry().stop()
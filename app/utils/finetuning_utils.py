@@ -9,6 +9,7 @@ import json
 from typing import List, Dict, Any
 import os
 from app.core.config import settings
+from app.core.http_clients import pooled_aiohttp_session
 from app.utils.korean_romanizer import korean_name_to_roman
 logger = logging.getLogger(__name__)
 
@@ -17,7 +18,7 @@ VLLM_SERVER_URL = settings.VLLM_BASE_URL
 async def create_system_message(influencer_name: str, personality: str, style_info: str = "") -> str:
     """vLLM 서버에 시스템 메시지 생성 요청"""
     try:
-        async with aiohttp.ClientSession() as session:
+        async with pooled_aiohttp_session("vllm") as session:
             payload = {
                 "influencer_name": influencer_name,
                 "personality": personality,
@@ -83,7 +84,7 @@ def convert_qa_data_for_finetuning(qa_data: List[Dict], influencer_name: str,
 async def validate_qa_data(qa_data: List[Dict]) -> bool:
     """vLLM 서버에 QA 데이터 유효성 검증 요청"""
     try:
-        async with aiohttp.ClientSession() as session:
+        async with pooled_aiohttp_session("vllm") as session:
             payload = {"qa_data": qa_data}
             
             async with session.post(
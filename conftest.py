@@ -0,0 +1,17 @@
+"""
+pytest 공통 설정
+여러 테스트 스크립트를 한 번에 실행하면 app 설정(settings)은 처음 import한 스크립트의 환경 변수로 한 번만 로드되므로
+테스트용 환경 변수를 수집 전에 지정 (각 스크립트를 단독 실행할 때는 스크립트 안의 설정 사용)
+"""
+import os
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ.setdefault("RUNPOD_API_KEY", "test")
+os.environ.setdefault("OPENAI_API_KEY", "test")
+# S3 테스트는 moto 사용 - 실제 AWS 자격 증명/엔드포인트가 쓰이지 않도록 고정
+os.environ["AWS_ACCESS_KEY_ID"] = "testing"
+os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
+os.environ["AWS_REGION"] = "us-east-1"
+os.environ["S3_BUCKET_NAME"] = "aimex-test-bucket"
+os.environ.pop("S3_ENDPOINT_URL", None)
@@ -0,0 +1,94 @@
+"""
+ComfyUI 완료 → 통지 지연 벤치마크 (가짜 ComfyUI 서버 사용)
+워크플로우 여러 개를 동시에 실행하고 ComfyUI가 history를 저장한 시점부터 호출자가 결과를 받은 시점까지의 지연 비교
+- poll: 기존 방식 - 프롬프트마다 /history를 --poll-interval 간격으로 폴링
+- push: ComfyUIEventListener - 이벤트 소켓 완료 통지 후 /history 한 번 조회
+
+    python scripts/bench_comfyui_events.py --prompts 20 --poll-interval 5
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+
+# 프로젝트 루트 경로를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "bench")
+
+from app.services.comfyui_event_listener import ComfyUIEventHub, ComfyUIEventListener
+from scripts.fake_comfyui_server import FakeComfyUIServer
+
+
+async def poll_history(listener: ComfyUIEventListener, prompt_id: str, poll_interval: float):
+    """기존 방식: 끝날 때까지 /history 폴링"""
+    while True:
+        await asyncio.sleep(poll_interval)
+        execution = await listener._fetch_history(prompt_id)
+        if execution is not None:
+            return execution
+
+
+async def run(args, mode: str):
+    rng = random.Random(args.seed)
+    server = FakeComfyUIServer()
+    url = await server.start()
+    hub = ComfyUIEventHub()
+    try:
+        if mode == "push":
+            listener = hub.get_listener(url)
+            while not listener.connected:
+                await asyncio.sleep(0.01)
+        else:
+            listener = ComfyUIEventListener(url)
+
+        async def workflow():
+            prompt_id = server.queue_prompt(listener.client_id, duration=rng.uniform(args.min_duration, args.max_duration))
+            if mode == "push":
+                execution = await listener.wait_for_execution(prompt_id, max_wait_time=args.max_duration * 4)
+            else:
+                execution = await poll_history(listener, prompt_id, args.poll_interval)
+            assert execution is not None
+            return time.monotonic() - server.completed_at[prompt_id]
+
+        delays = await asyncio.gather(*(workflow() for _ in range(args.prompts)))
+        return {
+            "mean": statistics.mean(delays),
+            "p95": sorted(delays)[int(len(delays) * 0.95)],
+            "max": max(delays),
+            "history": sum(server.history_requests.values()),
+        }
+    finally:
+        await hub.close()
+        await server.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--prompts", type=int, default=20, help="동시에 실행할 워크플로우 수")
+    parser.add_argument("--min-duration", type=float, default=1.0, help="워크플로우 최소 실행 시간 (초)")
+    parser.add_argument("--max-duration", type=float, default=4.0, help="워크플로우 최대 실행 시간 (초)")
+    parser.add_argument("--poll-interval", type=float, default=5.0, help="기존 /history 폴링 간격 (초)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(
+        f"🚀 워크플로우 {args.prompts}개, 실행 시간 {args.min_duration}~{args.max_duration}초, "
+        f"기존 폴링 간격 {args.poll_interval}초"
+    )
+    print(f"  {'mode':<6}{'평균 지연':>10}{'p95':>10}{'max':>10}{'/history':>10}")
+    for mode in ("poll", "push"):
+        result = asyncio.run(run(args, mode))
+        print(
+            f"  {mode:<6}{result['mean'] * 1000:8.0f}ms{result['p95'] * 1000:8.0f}ms"
+            f"{result['max'] * 1000:8.0f}ms{result['history']:10}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
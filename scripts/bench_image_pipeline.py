@@ -0,0 +1,112 @@
+"""
+이미지 파생본 파이프라인 벤치마크
+로컬 이미지 코퍼스로 이미지당 CPU 시간과 갤러리 한 페이지의 전송 바이트(원본 vs 썸네일/중간 크기 WebP) 측정
+- --corpus 디렉터리의 jpg/png/webp 사용, 지정하지 않으면 휴대폰 사진/스크린샷 크기의 합성 이미지를 생성
+- 원본 전송: 목록 화면이 원본 URL을 그대로 쓰는 경우
+- 썸네일/중간: process_image가 만든 파생본을 쓰는 경우
+
+    python scripts/bench_image_pipeline.py --page-size 20
+    python scripts/bench_image_pipeline.py --corpus ~/Pictures/samples
+"""
+import argparse
+import io
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 경로를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "bench")
+
+from PIL import Image
+
+from app.core.config import settings
+from app.services.image_pipeline import MEDIUM, THUMBNAIL, ImageProcessingError, process_image, variant_sizes
+
+IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".webp"}
+
+# 합성 코퍼스: (크기, 포맷) - 휴대폰 사진, 생성 이미지, 스크린샷
+SYNTHETIC = [((4032, 3024), "JPEG"), ((1024, 1024), "PNG"), ((1920, 1080), "PNG"), ((3024, 4032), "JPEG")]
+
+
+def _synthetic_image(size, format, seed: int) -> bytes:
+    """그라디언트에 노이즈를 섞어 실제 사진과 비슷한 압축률의 이미지 생성"""
+    gradient = Image.linear_gradient("L").resize(size).rotate(seed * 37 % 360)
+    noise = Image.effect_noise(size, 40 + seed % 30)
+    channels = [Image.blend(gradient, noise, 0.3 + 0.1 * i) for i in range(3)]
+    img = Image.merge("RGB", channels)
+    buffer = io.BytesIO()
+    options = {"quality": 90} if format == "JPEG" else {}
+    img.save(buffer, format=format, **options)
+    return buffer.getvalue()
+
+
+def load_corpus(directory, count: int):
+    if directory:
+        paths = sorted(p for p in Path(directory).expanduser().iterdir() if p.suffix.lower() in IMAGE_SUFFIXES)
+        return [(p.name, p.read_bytes()) for p in paths[:count]]
+    corpus = []
+    for i in range(count):
+        size, format = SYNTHETIC[i % len(SYNTHETIC)]
+        corpus.append((f"synthetic-{i}-{size[0]}x{size[1]}.{format.lower()}", _synthetic_image(size, format, i)))
+    return corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", help="이미지 디렉터리 (없으면 합성 이미지 사용)")
+    parser.add_argument("--count", type=int, default=12, help="사용할 이미지 수")
+    parser.add_argument("--page-size", type=int, default=20, help="갤러리 한 페이지의 이미지 수")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus, args.count)
+    if not corpus:
+        print("❌ 코퍼스에 이미지가 없습니다")
+        return 1
+
+    sizes = tuple(variant_sizes().items())
+    quality = settings.IMAGE_WEBP_QUALITY
+    cpu_ms, wall_ms, originals, thumbs, mediums = [], [], [], [], []
+    failures = 0
+    for name, data in corpus:
+        started = time.perf_counter()
+        try:
+            result = process_image(data, sizes, quality)
+        except ImageProcessingError as e:
+            failures += 1
+            print(f"  ⚠️ {name}: {e}")
+            continue
+        wall_ms.append((time.perf_counter() - started) * 1000)
+        cpu_ms.append(result.cpu_seconds * 1000)
+        originals.append(len(data))
+        thumbs.append(len(result.variants[THUMBNAIL]))
+        mediums.append(len(result.variants[MEDIUM]))
+
+    if not cpu_ms:
+        print("❌ 처리된 이미지가 없습니다")
+        return 1
+
+    print(
+        f"🖼️ 이미지 {len(cpu_ms)}개 처리 (실패 {failures}개, 썸네일 {settings.IMAGE_THUMBNAIL_SIZE}px, "
+        f"중간 {settings.IMAGE_MEDIUM_SIZE}px, WebP 품질 {quality})"
+    )
+    print(
+        f"  CPU/이미지: 평균 {statistics.mean(cpu_ms):.1f} ms, 최대 {max(cpu_ms):.1f} ms "
+        f"(경과 평균 {statistics.mean(wall_ms):.1f} ms)"
+    )
+
+    # 갤러리 한 페이지 = 코퍼스 평균 크기 × 페이지 크기
+    page = args.page_size
+    print(f"  갤러리 한 페이지({page}개) 전송량:")
+    for label, values in (("원본", originals), ("중간 WebP", mediums), ("썸네일 WebP", thumbs)):
+        total = statistics.mean(values) * page
+        print(f"    {label:<12}{total / 1024:10.0f} KB{statistics.mean(originals) / statistics.mean(values):8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
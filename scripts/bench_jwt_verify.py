@@ -0,0 +1,70 @@
+"""
+JWT 검증 캐시 마이크로벤치마크
+매 요청 jwt.decode 하던 방식과 검증 캐시 적중(반환 페이로드 깊은 복사 포함)의 요청당 비용을 비교
+
+    python scripts/bench_jwt_verify.py --iterations 20000
+"""
+import argparse
+import copy
+import os
+import sys
+import timeit
+from datetime import timedelta
+
+# 프로젝트 루트 경로를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("SECRET_KEY", "bench-secret")
+
+from jose import jwt
+
+from app.core.config import settings
+from app.core.security import _copy_claims, create_access_token, verified_token_cache, verify_token
+
+
+def report(label: str, seconds: float, iterations: int, baseline: float = None):
+    per_call = seconds / iterations * 1_000_000
+    speedup = f"  (x{baseline / seconds:.1f})" if baseline else ""
+    print(f"  {label:<36} {per_call:8.2f} µs/요청{speedup}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20000, help="반복 횟수")
+    parser.add_argument("--groups", type=int, default=5, help="페이로드 groups 항목 수")
+    args = parser.parse_args()
+
+    token = create_access_token(
+        {
+            "sub": "bench-user",
+            "provider": "google",
+            "email": "bench@example.com",
+            "groups": list(range(args.groups)),
+            "teams": [{"group_id": i, "group_name": f"team{i}"} for i in range(args.groups)],
+        },
+        expires_delta=timedelta(hours=1),
+    )
+    n = args.iterations
+
+    verified_token_cache.clear()
+    verify_token(token)
+    payload = verify_token(token)
+
+    decode = timeit.timeit(lambda: jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]), number=n)
+    cached = timeit.timeit(lambda: verify_token(token), number=n)
+    claims_copy = timeit.timeit(lambda: _copy_claims(payload), number=n)
+    deep = timeit.timeit(lambda: copy.deepcopy(payload), number=n)
+    shallow = timeit.timeit(lambda: dict(payload), number=n)
+
+    print(f"🔐 JWT 검증 {n}회 (payload groups={args.groups})")
+    report("jwt.decode (캐시 없음)", decode, n)
+    report("verify_token 캐시 적중", cached, n, baseline=decode)
+    report("  └ 그중 클레임 깊은 복사", claims_copy, n)
+    report("  └ 참고: copy.deepcopy", deep, n)
+    report("  └ 참고: dict() 얕은 복사", shallow, n)
+    print(f"  캐시 지표: {verified_token_cache.get_stats()}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
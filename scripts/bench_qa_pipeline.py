@@ -0,0 +1,97 @@
+"""
+QA 결과 파이프라인 단계별 처리량 벤치마크
+합성 OpenAI 배치 결과(JSONL)를 만들어 읽기 → 파싱/중복 제거 → 처리된 QA 파일 기록 → 파인튜닝용 다시 읽기
+각 단계의 처리량과 최대 메모리를 출력하고, 다시 읽기는 기존 json.load 방식과 비교
+
+    python scripts/bench_qa_pipeline.py --lines 200000
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# 프로젝트 루트 경로를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.qa_result_pipeline import (
+    TEXT_CHUNK_SIZE,
+    QAPipelineStats,
+    iter_batch_qa_pairs,
+    iter_jsonl,
+    iter_processed_qa_json,
+    write_qa_json,
+)
+
+
+def make_batch_results(path: str, lines: int, duplicate_ratio: float):
+    """합성 배치 결과 파일 생성 (일부는 중복, 일부는 실패 응답)"""
+    unique = max(1, int(lines * (1 - duplicate_ratio)))
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(lines):
+            n = i % unique
+            content = json.dumps({"q": f"질문 {n}: 오늘 하루는 어땠나요?", "a": f"답변 {n}: " + "좋은 하루였어요. " * 8}, ensure_ascii=False)
+            status = 500 if i % 97 == 0 else 200
+            f.write(json.dumps({
+                "custom_id": f"influencer_qa_bench_일상생활_{i}",
+                "response": {"status_code": status, "body": {"choices": [{"message": {"content": content}}]}},
+            }, ensure_ascii=False))
+            f.write("\n")
+
+
+def measure(label: str, func):
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<32} {elapsed:8.3f}s  peak {peak / 1024 / 1024:8.2f} MB")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, default=100000, help="배치 결과 줄 수")
+    parser.add_argument("--duplicate-ratio", type=float, default=0.1, help="중복 QA 비율")
+    parser.add_argument("--chunk-size", type=int, default=TEXT_CHUNK_SIZE, help="처리된 QA 파일 읽기 청크 크기")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        results_path = os.path.join(temp_dir, "results.jsonl")
+        processed_path = os.path.join(temp_dir, "processed.json")
+        make_batch_results(results_path, args.lines, args.duplicate_ratio)
+        print(f"📦 배치 결과 {args.lines}줄, {os.path.getsize(results_path) / 1024 / 1024:.1f} MB")
+
+        stats = QAPipelineStats()
+
+        def process():
+            with open(results_path, encoding="utf-8") as src, open(processed_path, "w", encoding="utf-8") as dst:
+                return write_qa_json(iter_batch_qa_pairs(iter_jsonl(src, stats), stats), dst, {"task_id": "bench"}, stats)
+
+        count = measure("read → parse → write", process)
+        print(f"  처리된 QA {count}개, {os.path.getsize(processed_path) / 1024 / 1024:.1f} MB")
+
+        def stream_reload():
+            with open(processed_path, encoding="utf-8") as f:
+                return sum(1 for _ in iter_processed_qa_json(f, chunk_size=args.chunk_size))
+
+        def json_load_reload():
+            with open(processed_path, encoding="utf-8") as f:
+                return len(json.load(f)["qa_pairs"])
+
+        streamed = measure("reload (iter_processed_qa_json)", stream_reload)
+        loaded = measure("reload (json.load)", json_load_reload)
+        assert streamed == loaded == count
+
+    print("📈 단계별 처리량")
+    for name, stage in stats.to_dict()["stages"].items():
+        print(f"  {name:<8} {stage['items']:>9}건 {stage['seconds']:8.3f}s  {stage['items_per_sec'] or '-'}건/s  {stage['mb_per_sec'] or '-'} MB/s")
+    print(f"  중복 {stats.duplicates}, 응답 실패 {stats.failed_responses}, 파싱 실패 {stats.unparsed}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,122 @@
+"""
+vLLM 디스패처 오프라인 벤치마크 (가짜 RunPod 워커 사용)
+동시 사용자들이 메시지를 주고받는 부하를 만들어 아래 방식을 비교
+- runsync: 메시지마다 /runsync 직접 호출
+- dispatcher (고정 폴링): 디스패처 + 고정 간격 /status 폴링 (이전 동작)
+- dispatcher (백오프): 디스패처 + 작업 경과 시간에 비례한 폴링 간격 (현재 기본값)
+일부 요청은 콜드 스타트/긴 생성처럼 오래 걸리도록 섞음 (--long-job-ratio, --long-job-time)
+처리량, 응답 지연(p50/p95), 작업 완료 → 호출자 전달 지연, RunPod API 호출 수를 출력
+
+    python scripts/bench_vllm_dispatcher.py --users 32 --messages 5
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+
+# 프로젝트 루트 경로를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("RUNPOD_API_KEY", "bench")
+
+from app.core.config import settings
+from app.services.vllm_dispatcher import VLLMDispatcher
+from scripts.fake_runpod_worker import FakeRunPodWorker
+
+
+def percentile(values, ratio):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+async def run_load(args, mode: str):
+    rng = random.Random(args.seed)
+    worker = FakeRunPodWorker(
+        workers=args.workers,
+        queue_overhead=args.queue_overhead,
+        api_latency=args.api_latency,
+        # 응답 길이에 따라 추론 시간이 달라지는 것을 흉내 (짧은 답변 위주, 가끔 긴 답변, 드물게 콜드 스타트)
+        inference_time_fn=lambda payload: (
+            args.long_job_time if rng.random() < args.long_job_ratio else rng.choice([0.3, 0.5, 0.8, 1.2, 3.0])
+        ),
+    )
+    if mode == "runsync":
+        send = worker.runsync_direct
+        dispatcher = None
+    else:
+        if mode == "fixed":
+            poll_interval = max_poll_interval = args.fixed_poll_interval
+        else:
+            poll_interval, max_poll_interval = args.poll_interval, args.max_poll_interval
+        dispatcher = VLLMDispatcher(
+            poll_interval=poll_interval, max_poll_interval=max_poll_interval, manager=worker
+        )
+        send = dispatcher.submit
+
+    latencies, delivery_delays = [], []
+
+    async def user(user_index: int):
+        adapter = f"adapter-{user_index % args.adapters}"
+        for message_index in range(args.messages):
+            prompt = f"user{user_index}-msg{message_index}"
+            payload = {"input": {"prompt": prompt, "hf_repo": "org/base", "lora_adapter": adapter}}
+            started = time.monotonic()
+            result = await send(payload)
+            received = time.monotonic()
+            assert result == f"echo: {prompt}"
+            latencies.append(received - started)
+            delivery_delays.append(received - worker.completed_at[worker.job_ids_by_prompt[prompt]])
+            await asyncio.sleep(rng.uniform(0, args.think_time))
+
+    started = time.monotonic()
+    await asyncio.gather(*(user(i) for i in range(args.users)))
+    elapsed = time.monotonic() - started
+    return {
+        "elapsed": elapsed,
+        "throughput": len(latencies) / elapsed,
+        "p50": percentile(latencies, 0.5),
+        "p95": percentile(latencies, 0.95),
+        "delivery": statistics.mean(delivery_delays),
+        "calls": dict(worker.calls),
+        "batches": dispatcher.get_stats()["batches"] if dispatcher else len(latencies),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=32, help="동시 사용자 수")
+    parser.add_argument("--messages", type=int, default=5, help="사용자당 메시지 수")
+    parser.add_argument("--adapters", type=int, default=4, help="LoRA 어댑터 수")
+    parser.add_argument("--workers", type=int, default=16, help="가짜 RunPod 워커 수")
+    parser.add_argument("--queue-overhead", type=float, default=0.15, help="작업당 큐 대기 시간 (초)")
+    parser.add_argument("--api-latency", type=float, default=0.01, help="RunPod API 호출 지연 (초)")
+    parser.add_argument("--think-time", type=float, default=0.5, help="메시지 사이 최대 대기 (초)")
+    parser.add_argument("--long-job-ratio", type=float, default=0.1, help="오래 걸리는 작업 비율")
+    parser.add_argument("--long-job-time", type=float, default=15.0, help="오래 걸리는 작업의 처리 시간 (초)")
+    parser.add_argument("--fixed-poll-interval", type=float, default=0.5, help="고정 폴링 간격 (이전 기본값)")
+    parser.add_argument("--poll-interval", type=float, default=settings.VLLM_DISPATCH_POLL_INTERVAL)
+    parser.add_argument("--max-poll-interval", type=float, default=settings.VLLM_DISPATCH_MAX_POLL_INTERVAL)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(
+        f"🚀 사용자 {args.users}명 × 메시지 {args.messages}개, 어댑터 {args.adapters}개, 워커 {args.workers}개 "
+        f"(고정 폴링 {args.fixed_poll_interval}s / 백오프 {args.poll_interval}s → 최대 {args.max_poll_interval}s)"
+    )
+    print(f"  {'mode':<22}{'msg/s':>8}{'p50':>8}{'p95':>8}{'전달 지연':>10}{'/status':>9}{'/run':>7}{'/runsync':>9}{'묶음':>6}")
+    for mode, label in (("runsync", "runsync"), ("fixed", "dispatcher (고정 폴링)"), ("backoff", "dispatcher (백오프)")):
+        result = asyncio.run(run_load(args, mode))
+        calls = result["calls"]
+        print(
+            f"  {label:<22}{result['throughput']:8.1f}{result['p50']:8.2f}{result['p95']:8.2f}"
+            f"{result['delivery'] * 1000:8.0f}ms{calls.get('status', 0):9}{calls.get('run', 0):7}"
+            f"{calls.get('runsync', 0):9}{result['batches']:6}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,86 @@
+"""
+ComfyUI 워크플로우 페이로드 생성 마이크로벤치마크
+저장소의 workflows/*.json으로 요청당 워크플로우를 만드는 비용 비교
+- 파일 읽기: 요청마다 json 파일을 읽고 노드를 찾아 값 대입 (이전 이미지 합성/수정 경로)
+- JSON 깊은 복사: 메모리의 원본을 json.loads(json.dumps())로 복사 후 대입 (이전 Flux 경로)
+- 템플릿 build: 컴파일된 템플릿에서 바뀌는 노드만 복사 후 대입 (현재)
+
+    python scripts/bench_workflow_templates.py --iterations 5000
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+
+# 프로젝트 루트 경로를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "bench")
+
+from app.services.workflow_templates import (
+    FLUX_T2I,
+    IMAGE_MODIFY,
+    IMAGE_SYNTHESIS,
+    WORKFLOW_SPECS,
+    WORKFLOWS_DIR,
+    WorkflowTemplateRegistry,
+)
+
+# 워크플로우별 요청 파라미터 예시
+PARAMS = {
+    FLUX_T2I: {"prompt": "a portrait photo", "width": 768, "height": 1024, "style_lora_strength": 0.6},
+    IMAGE_SYNTHESIS: {"prompt": "two people", "image1": "a.png", "image2": "b.png", "width": 1024, "height": 1024},
+    IMAGE_MODIFY: {"image": "in.png", "edit_text": "add glasses", "seed": 42, "lora_1_on": True, "crop_width": 512},
+}
+
+
+def assign_legacy(workflow, spec, values):
+    """이전 방식: 노드를 찾아 class_type을 확인한 뒤 값 대입"""
+    for name, value in values.items():
+        for node_id, class_type, input_path in spec.bindings[name]:
+            node = workflow.get(node_id)
+            if node is not None and node.get("class_type") == class_type:
+                container = node["inputs"]
+                keys = input_path.split(".")
+                for key in keys[:-1]:
+                    container = container[key]
+                container[keys[-1]] = value
+    return workflow
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=5000, help="반복 횟수")
+    args = parser.parse_args()
+    n = args.iterations
+
+    registry = WorkflowTemplateRegistry()
+    compile_time = timeit.timeit(lambda: WorkflowTemplateRegistry().load_all(), number=20) / 20
+    registry.load_all()
+
+    print(f"🧩 워크플로우 페이로드 생성 {n}회 (전체 템플릿 로드+검증 1회 {compile_time * 1000:.2f} ms)")
+    print(f"  {'workflow':<18}{'파일 읽기':>12}{'JSON 깊은 복사':>16}{'템플릿 build':>14}{'배수':>8}")
+    for name, values in PARAMS.items():
+        spec = WORKFLOW_SPECS[name]
+        path = WORKFLOWS_DIR / spec.filename
+        base = registry.get(name).workflow
+
+        def from_file():
+            with open(path, "r", encoding="utf-8") as f:
+                return assign_legacy(json.load(f), spec, values)
+
+        read = timeit.timeit(from_file, number=n)
+        deep = timeit.timeit(lambda: assign_legacy(json.loads(json.dumps(base)), spec, values), number=n)
+        build = timeit.timeit(lambda: registry.build(name, **values), number=n)
+        assert registry.build(name, **values) == from_file()
+        print(
+            f"  {name:<18}{read / n * 1e6:9.1f} µs{deep / n * 1e6:13.1f} µs{build / n * 1e6:11.1f} µs"
+            f"{deep / build:7.0f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
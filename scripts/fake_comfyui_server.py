@@ -0,0 +1,138 @@
+"""
+로컬 가짜 ComfyUI 서버 (aiohttp)
+ComfyUIEventListener가 사용하는 /ws?clientId=... 이벤트 소켓과 /history/{prompt_id}를 흉내내어
+네트워크 없이 완료 통지, 폴링 대체, 재연결 동작과 완료 → 통지 지연을 확인
+- queue_prompt(client_id, duration): /prompt 요청 대신 실행을 예약 (progress → executed → executing(node=None) 전송)
+- drop_connections(): 열린 소켓을 모두 끊어 연결 끊김 상황 재현
+- POST /queue, POST /history {"clear": true}: 대기열/실행 기록 비우기 (웜 풀 Pod 초기화)
+- completed_at / history_requests / clear_requests: 완료 시각과 /history 조회 수, 비우기 요청 기록
+"""
+import asyncio
+import itertools
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from aiohttp import web
+
+
+class FakeComfyUIServer:
+    """ComfyUI 파드 대체"""
+
+    def __init__(self, steps: int = 4):
+        self.steps = steps
+        self.url: Optional[str] = None
+        self.history: Dict[str, Dict[str, Any]] = {}
+        self.completed_at: Dict[str, float] = {}
+        self.history_requests: Counter = Counter()
+        self.clear_requests: Counter = Counter()
+        self.ws_connections = 0
+        self.accept_connections = True
+        self.fail_clear = False
+
+        self._ids = itertools.count(1)
+        self._sockets: Dict[str, List[web.WebSocketResponse]] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._runner: Optional[web.AppRunner] = None
+
+    async def start(self) -> str:
+        app = web.Application()
+        app.router.add_get("/ws", self._handle_ws)
+        app.router.add_get("/history/{prompt_id}", self._handle_history)
+        app.router.add_post("/queue", self._handle_clear)
+        app.router.add_post("/history", self._handle_clear)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+        return self.url
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await self.drop_connections()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _handle_ws(self, request: web.Request):
+        if not self.accept_connections:
+            raise web.HTTPServiceUnavailable()
+        client_id = request.query.get("clientId", "")
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.ws_connections += 1
+        self._sockets.setdefault(client_id, []).append(ws)
+        await ws.send_json({"type": "status", "data": {"status": {"exec_info": {"queue_remaining": 0}}}})
+        try:
+            async for _ in ws:
+                pass
+        finally:
+            sockets = self._sockets.get(client_id, [])
+            if ws in sockets:
+                sockets.remove(ws)
+        return ws
+
+    async def _handle_history(self, request: web.Request):
+        prompt_id = request.match_info["prompt_id"]
+        self.history_requests[prompt_id] += 1
+        if prompt_id not in self.history:
+            return web.json_response({})
+        return web.json_response({prompt_id: self.history[prompt_id]})
+
+    async def _handle_clear(self, request: web.Request):
+        if self.fail_clear:
+            raise web.HTTPInternalServerError()
+        body = await request.json()
+        if body.get("clear"):
+            self.clear_requests[request.path] += 1
+            if request.path == "/history":
+                self.history.clear()
+        return web.json_response({})
+
+    async def _send(self, client_id: str, message: Dict[str, Any]):
+        for ws in list(self._sockets.get(client_id, [])):
+            try:
+                await ws.send_json(message)
+            except (ConnectionError, RuntimeError):
+                pass
+
+    async def drop_connections(self):
+        for sockets in list(self._sockets.values()):
+            for ws in list(sockets):
+                await ws.close()
+        self._sockets.clear()
+
+    def queue_prompt(self, client_id: str, duration: float = 0.1, error: bool = False) -> str:
+        """워크플로우 실행 예약 후 prompt_id 반환"""
+        prompt_id = f"fake-prompt-{next(self._ids)}"
+        self._tasks.append(asyncio.create_task(self._execute(client_id, prompt_id, duration, error)))
+        return prompt_id
+
+    async def _execute(self, client_id: str, prompt_id: str, duration: float, error: bool):
+        await self._send(client_id, {"type": "execution_start", "data": {"prompt_id": prompt_id}})
+        for step in range(1, self.steps + 1):
+            await asyncio.sleep(duration / self.steps)
+            await self._send(
+                client_id, {"type": "progress", "data": {"prompt_id": prompt_id, "value": step, "max": self.steps}}
+            )
+
+        if error:
+            self.history[prompt_id] = {"status": {"status_str": "error", "completed": False}, "outputs": {}}
+            self.completed_at[prompt_id] = time.monotonic()
+            await self._send(
+                client_id,
+                {"type": "execution_error", "data": {"prompt_id": prompt_id, "exception_message": "fake error"}},
+            )
+            return
+
+        # 실제 ComfyUI처럼 history 저장 후 executing(node=None) 전송
+        self.history[prompt_id] = {
+            "status": {"status_str": "success", "completed": True},
+            "outputs": {"9": {"images": [{"filename": f"{prompt_id}.png", "subfolder": "", "type": "output"}]}},
+        }
+        self.completed_at[prompt_id] = time.monotonic()
+        await self._send(client_id, {"type": "executed", "data": {"prompt_id": prompt_id, "node": "9"}})
+        await self._send(client_id, {"type": "executing", "data": {"prompt_id": prompt_id, "node": None}})
@@ -0,0 +1,113 @@
+"""
+로컬 가짜 RunPod vLLM 워커
+VLLMRunPodManager가 디스패처에 제공하는 메서드(find_endpoint/run/get_job_status/cancel/runsync_direct)를
+프로세스 안에서 흉내내어 네트워크 없이 디스패처 동작과 처리량을 확인
+- 작업마다 큐 대기(queue_overhead) 후 제한된 워커 수(workers) 안에서 추론 시간만큼 실행
+- 완료 시각을 기록하여 완료 → 호출자 전달까지의 지연 측정
+- API 호출 종류별 횟수 집계
+"""
+import asyncio
+import itertools
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Optional
+
+from app.services.runpod_manager import RunPodManagerError, VLLMRunPodManager
+
+
+class FakeRunPodWorker:
+    """RunPod 서버리스 vLLM 엔드포인트 대체"""
+
+    extract_job_output = staticmethod(VLLMRunPodManager.extract_job_output)
+
+    def __init__(
+        self,
+        workers: int = 4,
+        queue_overhead: float = 0.1,
+        inference_time: float = 0.3,
+        api_latency: float = 0.005,
+        inference_time_fn: Optional[Callable[[Dict[str, Any]], float]] = None,
+    ):
+        self.workers = workers
+        self.queue_overhead = queue_overhead
+        self.inference_time = inference_time
+        self.api_latency = api_latency
+        self.inference_time_fn = inference_time_fn
+
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._ids = itertools.count(1)
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self.tasks: Dict[str, asyncio.Task] = {}
+        self.completed_at: Dict[str, float] = {}
+        self.job_ids_by_prompt: Dict[str, str] = {}
+        self.calls: Counter = Counter()
+
+    def _duration(self, payload: Dict[str, Any]) -> float:
+        job_input = payload.get("input") or {}
+        if "fake_inference_time" in job_input:
+            return job_input["fake_inference_time"]
+        if self.inference_time_fn is not None:
+            return self.inference_time_fn(payload)
+        return self.inference_time
+
+    async def _execute(self, job_id: str, payload: Dict[str, Any]):
+        job_input = payload.get("input") or {}
+        self.job_ids_by_prompt[job_input.get("prompt", "")] = job_id
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.workers)
+        await asyncio.sleep(self.queue_overhead)
+        async with self._slots:
+            self.jobs[job_id]["status"] = "IN_PROGRESS"
+            await asyncio.sleep(self._duration(payload))
+
+        if job_input.get("fake_fail"):
+            self.jobs[job_id].update(status="FAILED", error="fake failure")
+        else:
+            self.jobs[job_id].update(
+                status="COMPLETED",
+                output={"generated_text": f"echo: {job_input.get('prompt', '')}", "job_id": job_id},
+            )
+        self.completed_at[job_id] = time.monotonic()
+
+    async def find_endpoint(self, force_refresh: bool = False) -> Dict[str, Any]:
+        self.calls["find_endpoint"] += 1
+        return {"id": "fake-endpoint"}
+
+    async def run(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """/run: 작업을 큐에 넣고 바로 ID 반환"""
+        self.calls["run"] += 1
+        await asyncio.sleep(self.api_latency)
+        job_id = f"fake-job-{next(self._ids)}"
+        self.jobs[job_id] = {"id": job_id, "status": "IN_QUEUE"}
+        self.tasks[job_id] = asyncio.create_task(self._execute(job_id, payload))
+        return {"id": job_id, "status": "IN_QUEUE"}
+
+    async def get_job_status(self, job_id: str, endpoint_id: Optional[str] = None) -> Dict[str, Any]:
+        """/status/{job_id}"""
+        self.calls["status"] += 1
+        await asyncio.sleep(self.api_latency)
+        if job_id not in self.jobs:
+            raise RunPodManagerError(f"RunPod API 오류: 404 - job {job_id} not found")
+        return dict(self.jobs[job_id])
+
+    async def cancel(self, job_id: str) -> bool:
+        """/cancel/{job_id}"""
+        self.calls["cancel"] += 1
+        task = self.tasks.get(job_id)
+        if task is not None and not task.done():
+            task.cancel()
+        if job_id in self.jobs:
+            self.jobs[job_id]["status"] = "CANCELLED"
+        return True
+
+    async def runsync_direct(self, payload: Dict[str, Any]) -> Any:
+        """/runsync: 작업 완료까지 연결을 붙잡고 결과 반환"""
+        self.calls["runsync"] += 1
+        await asyncio.sleep(self.api_latency)
+        job_id = f"fake-job-{next(self._ids)}"
+        self.jobs[job_id] = {"id": job_id, "status": "IN_QUEUE"}
+        await self._execute(job_id, payload)
+        result = self.jobs[job_id]
+        if result["status"] != "COMPLETED":
+            raise RunPodManagerError(f"vLLM 작업 실패: {result['status']}")
+        return self.extract_job_output(result)
@@ -0,0 +1,193 @@
+"""
+DB 조회 경로 이벤트 루프 지연 부하 테스트 (오프라인, SQLite + 쿼리 지연 주입)
+인플루언서 목록 조회를 동시에 여러 번 실행하면서 이벤트 루프 지연(lag)을 측정
+- sync: 기존 방식 - 동기 Session으로 get_influencers_list 실행 (블로킹 쿼리가 이벤트 루프에서 실행,
+        응답 직렬화 시 style_preset/mbti 지연 로딩)
+- async: 현재 방식 - 비동기 세션으로 get_influencers_list_async 실행
+         (aiomysql 대신 쿼리를 스레드에서 실행하는 세션 어댑터로 "이벤트 루프 밖에서 대기"를 재현)
+쿼리마다 --query-latency 만큼 드라이버 대기(네트워크 왕복)를 흉내냄
+
+    python scripts/load_test_db_event_loop.py --requests 200 --concurrency 20
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# 프로젝트 루트 경로를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "bench")
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+import app.models  # noqa: F401
+import app.models.conversation  # noqa: F401
+from app.models.base import Base
+from app.models.influencer import AIInfluencer, ModelMBTI, StylePreset
+from app.models.user import Team, User
+from app.schemas.influencer import AIInfluencer as AIInfluencerSchema
+from app.services.influencers.crud import get_influencers_list, get_influencers_list_async
+
+
+class ThreadedAsyncSession:
+    """AsyncSession.execute 대체 - 쿼리와 결과 적재를 스레드에서 실행하여 이벤트 루프를 막지 않음"""
+
+    def __init__(self, engine):
+        self._session = Session(engine)
+
+    async def execute(self, statement):
+        frozen = await asyncio.to_thread(lambda: self._session.execute(statement).freeze())
+        return frozen()
+
+    def close(self):
+        self._session.close()
+
+
+def build_database(path: str, users: int, influencers: int, query_latency: float, pool_size: int):
+    engine = create_engine(
+        f"sqlite:///{path}", connect_args={"check_same_thread": False}, pool_size=pool_size, max_overflow=0
+    )
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as db:
+        team = Team(group_id=1, group_name="bench-team")
+        db.add(team)
+        db.add(ModelMBTI(mbti_id=1, mbti_name="ENFP", mbti_traits="활발함", mbti_speech="밝은 말투"))
+        db.add(
+            StylePreset(
+                style_preset_id="preset-1",
+                style_preset_name="기본",
+                influencer_type=0,
+                influencer_gender=2,
+                influencer_age_group=20,
+                influencer_hairstyle="단발",
+                influencer_style="캐주얼",
+                influencer_personality="친근함",
+                influencer_speech="반말",
+                system_prompt="prompt",
+                influencer_description="설명",
+            )
+        )
+        for i in range(users):
+            user = User(user_id=f"user-{i}", provider_id=f"p-{i}", provider="google", user_name=f"u{i}", email=f"u{i}@example.com")
+            user.teams.append(team)
+            db.add(user)
+        for i in range(influencers):
+            db.add(
+                AIInfluencer(
+                    influencer_id=f"inf-{i}",
+                    user_id="user-0",
+                    group_id=1,
+                    style_preset_id="preset-1",
+                    mbti_id=1,
+                    influencer_name=f"influencer-{i}",
+                    learning_status=1,
+                    influencer_model_repo=f"org/model-{i}",
+                    chatbot_option=True,
+                )
+            )
+        db.commit()
+
+    # 드라이버가 DB 응답을 기다리는 시간 (이 스레드를 블로킹)
+    @event.listens_for(engine, "before_cursor_execute")
+    def _simulate_latency(*_):
+        time.sleep(query_latency)
+
+    return engine
+
+
+async def sync_request(engine, user_id: str):
+    db = Session(engine)
+    try:
+        influencers = await get_influencers_list(db, user_id)
+        return [AIInfluencerSchema.model_validate(inf, from_attributes=True) for inf in influencers]
+    finally:
+        db.close()
+
+
+async def async_request(engine, user_id: str):
+    db = ThreadedAsyncSession(engine)
+    try:
+        influencers = await get_influencers_list_async(db, user_id)
+        return [AIInfluencerSchema.model_validate(inf, from_attributes=True) for inf in influencers]
+    finally:
+        db.close()
+
+
+async def run_load(engine, handler, args):
+    lags = []
+    latencies = []
+    done = asyncio.Event()
+
+    async def monitor():
+        # 짧게 잠들었다 깨어나는 시점이 늦어진 만큼이 이벤트 루프 지연
+        while not done.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(args.tick)
+            lags.append(time.perf_counter() - started - args.tick)
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+    results = []
+
+    async def request(index: int):
+        async with semaphore:
+            # 요청 본문 수신 등 실제 서버에서 요청 사이에 다른 작업이 끼어드는 지점
+            await asyncio.sleep(0)
+            started = time.perf_counter()
+            results.append(await handler(engine, f"user-{index % args.users}"))
+            latencies.append(time.perf_counter() - started)
+
+    monitor_task = asyncio.create_task(monitor())
+    started = time.perf_counter()
+    await asyncio.gather(*(request(i) for i in range(args.requests)))
+    elapsed = time.perf_counter() - started
+    done.set()
+    await monitor_task
+
+    assert all(len(result) == args.influencers for result in results)
+    ordered = sorted(lags)
+    return {
+        "throughput": args.requests / elapsed,
+        "p50": statistics.median(latencies),
+        "p95": sorted(latencies)[int(len(latencies) * 0.95)],
+        "lag_p50": statistics.median(ordered),
+        "lag_p99": ordered[int(len(ordered) * 0.99)],
+        "lag_max": ordered[-1],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200, help="총 요청 수")
+    parser.add_argument("--concurrency", type=int, default=20, help="동시 요청 수")
+    parser.add_argument("--users", type=int, default=20, help="사용자 수")
+    parser.add_argument("--influencers", type=int, default=30, help="목록에 나오는 인플루언서 수")
+    parser.add_argument("--query-latency", type=float, default=0.005, help="쿼리당 DB 대기 시간 (초)")
+    parser.add_argument("--tick", type=float, default=0.005, help="이벤트 루프 지연 측정 주기 (초)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = build_database(os.path.join(tmp, "load.db"), args.users, args.influencers, args.query_latency, args.concurrency)
+        print(
+            f"🚀 요청 {args.requests}개 (동시 {args.concurrency}), 인플루언서 {args.influencers}명, "
+            f"쿼리 지연 {args.query_latency * 1000:.0f}ms"
+        )
+        print(f"  {'mode':<8}{'req/s':>8}{'p50':>9}{'p95':>9}{'루프 지연 p50':>14}{'p99':>9}{'max':>9}")
+        for label, handler in (("sync", sync_request), ("async", async_request)):
+            result = asyncio.run(run_load(engine, handler, args))
+            print(
+                f"  {label:<8}{result['throughput']:8.1f}{result['p50'] * 1000:7.0f}ms{result['p95'] * 1000:7.0f}ms"
+                f"{result['lag_p50'] * 1000:12.1f}ms{result['lag_p99'] * 1000:7.1f}ms{result['lag_max'] * 1000:7.1f}ms"
+            )
+        engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+공개 API 사용량 집계(APIUsageCounter)와 API 키 캐시(APIKeyCache) 테스트 스크립트
+결정적인 집계 행 ID, 저장 실패 시 카운트 복원 후 재시도, 인플루언서 단위 무효화, TTL/LRU 제거 확인
+    python -m pytest test_api_usage_and_key_cache.py   또는   python test_api_usage_and_key_cache.py
+"""
+import asyncio
+import os
+import sys
+from datetime import date
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+# app 설정 로드 전에 테스트용 환경 변수 지정
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "test")
+
+from sqlalchemy.dialects import mysql
+
+import app.services.api_key_cache as key_cache_module
+import app.services.api_usage_counter as counter_module
+from app.services.api_key_cache import APIKeyCache, APIKeyContext
+from app.services.api_usage_counter import APIUsageCounter, aggregation_id
+
+
+class RecordingSession:
+    """new_async_session() 대체 - 실행된 문장을 MySQL 방언으로 컴파일하여 기록"""
+
+    def __init__(self, statements):
+        self.statements = statements
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+    async def execute(self, statement):
+        self.statements.append(statement.compile(dialect=mysql.dialect()))
+
+    async def commit(self):
+        pass
+
+    async def rollback(self):
+        pass
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+def _context(influencer_id, api_id=None):
+    return APIKeyContext(
+        api_id=api_id or f"api-{influencer_id}", influencer_id=influencer_id, influencer_name=influencer_id,
+        system_prompt=None, influencer_model_repo=None, group_id=1, learning_status=1,
+    )
+
+
+def test_aggregation_id_is_deterministic():
+    """같은 (api_id, 날짜)는 항상 같은 행 ID, 날짜나 API가 다르면 다른 행 ID"""
+    day = date(2026, 3, 1)
+    assert aggregation_id("api-1", day) == aggregation_id("api-1", date(2026, 3, 1))
+    assert aggregation_id("api-1", day) != aggregation_id("api-1", date(2026, 3, 2))
+    assert aggregation_id("api-1", day) != aggregation_id("api-2", day)
+    assert len(aggregation_id("api-1", day)) == 36
+
+
+def test_flush_upserts_daily_rows():
+    """저장 시 (api_id, 날짜)별 결정적 ID로 INSERT ... ON DUPLICATE KEY UPDATE"""
+    async def run():
+        statements = []
+        original = counter_module.new_async_session
+        counter_module.new_async_session = lambda: RecordingSession(statements)
+        try:
+            counter = APIUsageCounter(flush_interval=60)
+            counter.increment("api-1", "inf-1")
+            counter.increment("api-1", "inf-1", count=2)
+            counter.increment("api-2", "inf-2")
+            await counter.flush()
+        finally:
+            counter_module.new_async_session = original
+
+        assert len(statements) == 1
+        sql, params = str(statements[0]), statements[0].params
+        assert "ON DUPLICATE KEY UPDATE" in sql
+        assert "daily_call_count = (`API_CALL_AGGREGATION`.daily_call_count + VALUES(daily_call_count))" in sql
+        today = date.today()
+        assert aggregation_id("api-1", today) in params.values()
+        assert aggregation_id("api-2", today) in params.values()
+        assert sorted(v for k, v in params.items() if k.startswith("daily_call_count")) == [1, 3]
+
+        stats = counter.get_stats()
+        assert stats["flushed_total"] == 4 and stats["flushes_total"] == 1 and stats["pending_calls"] == 0
+
+    asyncio.run(run())
+
+
+def test_failed_flush_is_restored_and_retried():
+    """저장 실패 시 카운트를 되돌리고 저장 중 증가분과 합쳐 다음 주기에 저장"""
+    async def run():
+        counter = APIUsageCounter(flush_interval=60)
+        written = []
+        attempts = []
+
+        async def write_counts(pending):
+            attempts.append(dict(pending))
+            # 저장 중 들어온 호출
+            counter.increment("api-1", "inf-1")
+            if len(attempts) == 1:
+                raise ConnectionError("DB 연결 오류")
+            written.append(dict(pending))
+
+        counter._write_counts = write_counts
+        counter.increment("api-1", "inf-1", count=5)
+        await counter.flush()
+        stats = counter.get_stats()
+        assert written == [] and stats["failed_flushes"] == 1
+        assert stats["pending_keys"] == 1 and stats["pending_calls"] == 6
+
+        await counter.flush()
+        assert written == [{("api-1", "inf-1", date.today()): 6}]
+        stats = counter.get_stats()
+        assert stats["flushed_total"] == 6 and stats["pending_calls"] == 1 and stats["counted_total"] == 7
+
+    asyncio.run(run())
+
+
+def test_invalidate_influencer_uses_index():
+    """인플루언서 단위 무효화는 해당 인플루언서 항목만 제거하고, 키 재발급 시 이전 키 항목 제거"""
+    cache = APIKeyCache(max_entries=10, ttl=60)
+    cache.put("key-a", _context("inf-1"))
+    cache.put("key-b", _context("inf-2"))
+
+    cache.invalidate_influencer("inf-1")
+    assert cache.get("key-a") is None and cache.get("key-b") is not None
+    assert cache.get_stats()["invalidations"] == 1
+    # 없는 인플루언서는 무시
+    cache.invalidate_influencer("inf-404")
+    assert cache.get_stats()["invalidations"] == 1
+
+    # 같은 인플루언서의 새 키 저장 시 이전 키 항목 제거
+    cache.put("key-b2", _context("inf-2"))
+    assert cache.get("key-b") is None and cache.get("key-b2") is not None
+    assert cache.get_stats()["cache_size"] == 1
+    cache.invalidate_influencer("inf-2")
+    assert cache.get_stats()["cache_size"] == 0 and cache._by_influencer == {}
+
+
+def test_ttl_and_lru_eviction():
+    """TTL이 지나면 미스, 용량을 넘으면 가장 오래 사용하지 않은 항목 제거"""
+    clock = FakeClock()
+    original = key_cache_module.time
+    key_cache_module.time = clock
+    try:
+        cache = APIKeyCache(max_entries=2, ttl=30)
+        cache.put("key-1", _context("inf-1"))
+        cache.put("key-2", _context("inf-2"))
+        # key-1 사용 → key-2가 가장 오래된 항목
+        assert cache.get("key-1") is not None
+        cache.put("key-3", _context("inf-3"))
+        assert cache.get("key-2") is None
+        assert cache.get("key-1") is not None and cache.get("key-3") is not None
+        assert cache.get_stats()["evictions"] == 1 and "inf-2" not in cache._by_influencer
+
+        clock.now += 30
+        assert cache.get("key-1") is None and cache.get("key-3") is None
+        stats = cache.get_stats()
+        assert stats["cache_size"] == 0 and stats["hits"] == 3 and stats["misses"] == 3
+        assert cache._by_influencer == {}
+    finally:
+        key_cache_module.time = original
+
+
+if __name__ == "__main__":
+    test_aggregation_id_is_deterministic()
+    test_flush_upserts_daily_rows()
+    test_failed_flush_is_restored_and_retried()
+    test_invalidate_influencer_uses_index()
+    test_ttl_and_lru_eviction()
+    print("✅ 모든 테스트 완료!")
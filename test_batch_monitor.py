@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+배치 모니터(BatchMonitor) 테스트 스크립트
+OpenAI 배치 API를 흉내내는 FakeOpenAIBatchAPI와 인메모리 SQLite로 오프라인에서 폴링 스케줄을 확인
+    python -m pytest test_batch_monitor.py   또는   python test_batch_monitor.py
+"""
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+# app 설정 로드 전에 테스트용 환경 변수 지정
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ.setdefault("OPENAI_API_KEY", "test")
+os.environ.setdefault("RUNPOD_API_KEY", "test")
+os.environ["AUTO_FINETUNING_ENABLED"] = "false"
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401  (relationship 대상 모델 등록)
+import app.models.conversation  # noqa: F401
+import app.services.batch_monitor as batch_monitor_module
+from app.models.influencer import BatchKey
+from app.services.batch_monitor import BatchMonitor
+
+
+class FakeClock:
+    """time.monotonic 대체 (테스트에서 시간을 직접 진행)"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+class FakeOpenAIBatchAPI:
+    """OpenAI 배치 API 대체
+
+    배치마다 정해진 상태 순서를 조회할 때마다 하나씩 진행하고,
+    동시 조회 수와 완료 처리 호출을 기록
+    """
+
+    def __init__(self, timelines):
+        # openai_batch_id → 조회 시 차례로 반환할 상태 목록 (마지막 상태는 계속 유지)
+        self.timelines = {batch_id: list(states) for batch_id, states in timelines.items()}
+        self.calls = {batch_id: 0 for batch_id in timelines}
+        self.completed_tasks = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def check_batch_status_async(self, batch_id: str):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0)
+            states = self.timelines[batch_id]
+            state = states[min(self.calls[batch_id], len(states) - 1)]
+            self.calls[batch_id] += 1
+            if isinstance(state, Exception):
+                raise state
+            if isinstance(state, tuple):
+                status, done = state
+                return {"id": batch_id, "status": status, "request_counts": {"total": 100, "completed": done, "failed": 0}}
+            return {"id": batch_id, "status": state, "output_file_id": f"file-{batch_id}" if state == "completed" else None}
+        finally:
+            self.in_flight -= 1
+
+    async def complete_qa_generation_async(self, task_id: str) -> bool:
+        self.completed_tasks.append(task_id)
+        return True
+
+
+def _setup(monkeypatch_targets, batches):
+    """인메모리 DB에 배치 생성 후 batch_monitor의 get_db/time을 교체"""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    BatchKey.__table__.create(engine)
+    Session = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+    db = Session()
+    for batch_key_id, openai_batch_id, status in batches:
+        db.add(BatchKey(
+            batch_key_id=batch_key_id,
+            influencer_id="influencer-1",
+            batch_key="key",
+            task_id=f"task-{batch_key_id}",
+            openai_batch_id=openai_batch_id,
+            status=status,
+        ))
+    db.commit()
+    db.close()
+
+    def fake_get_db():
+        session = Session()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    clock = FakeClock()
+    monkeypatch_targets.append(("get_db", batch_monitor_module.get_db))
+    monkeypatch_targets.append(("time", batch_monitor_module.time))
+    batch_monitor_module.get_db = fake_get_db
+    batch_monitor_module.time = clock
+    return Session, clock
+
+
+def _restore(monkeypatch_targets):
+    for name, value in monkeypatch_targets:
+        setattr(batch_monitor_module, name, value)
+
+
+def test_state_based_schedule_until_completion():
+    """상태별 간격으로 폴링하고 완료되면 결과 처리 후 스케줄에서 제거"""
+    saved = []
+    Session, clock = _setup(saved, [("b1", "batch_1", "batch_submitted")])
+    api = FakeOpenAIBatchAPI({
+        "batch_1": ["validating", ("in_progress", 10), ("in_progress", 95), "finalizing", "completed"],
+    })
+    try:
+        monitor = BatchMonitor(qa_generator=api)
+        base = monitor.base_interval
+
+        async def run():
+            sleeps = []
+            for _ in range(5):
+                sleep = await monitor._check_batch_status()
+                sleeps.append(sleep)
+                clock.now += max(sleep, monitor._next_check_at.get("b1", clock.now) - clock.now)
+            # 결과 처리 작업 완료 대기
+            await asyncio.gather(*monitor._completion_tasks.values())
+            final_sleep = await monitor._check_batch_status()
+            return sleeps, final_sleep
+
+        sleeps, final_sleep = asyncio.run(run())
+        # validating 60초 → 진행 10% 기본 간격 → 진행 95% 60초 → finalizing 30초 → 완료
+        assert sleeps[:4] == [60, base, 60, 30]
+        assert api.calls["batch_1"] == 5
+        assert api.completed_tasks == ["task-b1"]
+
+        db = Session()
+        assert db.get(BatchKey, "b1").status == "completed"
+        db.close()
+        assert final_sleep == base
+        assert monitor._next_check_at == {}
+    finally:
+        _restore(saved)
+
+
+def test_unpollable_batches_do_not_shorten_sleep():
+    """OpenAI 배치 ID가 없는 배치만 남으면 15초마다 돌지 않고 기본 간격으로 대기"""
+    saved = []
+    _setup(saved, [("orphan", None, "pending"), ("b1", "batch_1", "batch_submitted")])
+    api = FakeOpenAIBatchAPI({"batch_1": [("in_progress", 10)]})
+    try:
+        monitor = BatchMonitor(qa_generator=api)
+
+        async def run():
+            first = await monitor._check_batch_status()
+            second = await monitor._check_batch_status()
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert first == monitor.base_interval
+        assert second == monitor.base_interval
+        # 두 번째 확인 시점에는 아직 due가 아니므로 API를 다시 부르지 않음
+        assert api.calls["batch_1"] == 1
+        assert "orphan" not in monitor._next_check_at
+    finally:
+        _restore(saved)
+
+
+def test_concurrent_status_checks_and_error_backoff():
+    """여러 배치를 동시에 조회 (동시 요청 수 제한), 조회 실패는 지수 backoff"""
+    saved = []
+    batches = [(f"b{i}", f"batch_{i}", "batch_submitted") for i in range(12)]
+    _setup(saved, batches)
+    timelines = {f"batch_{i}": [("in_progress", 10)] for i in range(12)}
+    timelines["batch_0"] = [RuntimeError("rate limited")]
+    api = FakeOpenAIBatchAPI(timelines)
+    try:
+        monitor = BatchMonitor(qa_generator=api)
+        limit = batch_monitor_module.settings.OPENAI_BATCH_STATUS_CONCURRENCY
+
+        asyncio.run(monitor._check_batch_status())
+        assert all(count == 1 for count in api.calls.values())
+        assert 1 < api.max_in_flight <= limit
+        assert monitor._error_counts == {"b0": 1}
+        assert monitor._next_check_at["b0"] - 1000.0 == monitor.base_interval
+    finally:
+        _restore(saved)
+
+
+if __name__ == "__main__":
+    test_state_based_schedule_until_completion()
+    test_unpollable_batches_do_not_shorten_sleep()
+    test_concurrent_status_checks_and_error_backoff()
+    print("✅ 모든 테스트 완료!")
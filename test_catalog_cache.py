@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+카탈로그 응답 캐시(CatalogResponseCache) 테스트 스크립트
+공개 MBTI 엔드포인트 함수를 SQLite 메모리 DB로 직접 호출하여 ETag/If-None-Match → 304 재검증과,
+조회 도중 무효화된 결과를 캐시에 저장하지 않는 세대(generation) 확인
+    python -m pytest test_catalog_cache.py   또는   python test_catalog_cache.py
+"""
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+from typing import List
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+# app 설정 로드 전에 테스트용 환경 변수 지정
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "test")
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+from starlette.requests import Request
+
+import app.models  # noqa: F401
+import app.models.conversation  # noqa: F401
+import app.services.catalog_cache as catalog_module
+from app.api.v1.endpoints.public import mbti
+from app.models.base import Base
+from app.models.influencer import ModelMBTI
+from app.schemas.influencer import ModelMBTI as ModelMBTISchema
+from app.services.catalog_cache import INFLUENCERS, MBTI, STYLE_PRESETS, CatalogResponseCache
+
+
+def _request(if_none_match=None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+def _mbti(mbti_id, name):
+    return ModelMBTI(mbti_id=mbti_id, mbti_name=name, mbti_traits=f"{name} 특성", mbti_speech=f"{name} 말투")
+
+
+def test_if_none_match_returns_304():
+    """같은 ETag로 재요청하면 본문 없이 304, 무효화 후에는 새 ETag로 200"""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    db = Session(engine)
+    db.add(_mbti(1, "INTJ"))
+    db.commit()
+
+    queries = []
+    original_query = db.query
+
+    def counting_query(*args, **kwargs):
+        queries.append(args)
+        return original_query(*args, **kwargs)
+
+    db.query = counting_query
+
+    def get(if_none_match=None):
+        return asyncio.run(mbti.get_mbti_list(_request(if_none_match), db=db))
+
+    cache = CatalogResponseCache(ttl=300, max_entries=10)
+    original = catalog_module._catalog_cache
+    catalog_module._catalog_cache = cache
+    try:
+        first = get()
+        assert first.status_code == 200
+        assert [item["mbti_name"] for item in json.loads(first.body)] == ["INTJ"]
+        etag = first.headers["etag"]
+        assert first.headers["cache-control"] == "public, no-cache"
+
+        revalidated = get(etag)
+        assert revalidated.status_code == 304 and revalidated.body == b""
+        assert revalidated.headers["etag"] == etag
+        # 약한 ETag / 여러 후보 형식도 일치로 처리
+        assert get(f'"other", W/{etag}').status_code == 304
+        assert get('"other"').status_code == 200
+        assert len(queries) == 1
+
+        # 데이터 변경 + 무효화 → 이전 ETag는 더 이상 일치하지 않음
+        db.add(_mbti(2, "ENFP"))
+        db.commit()
+        cache.invalidate(MBTI)
+        changed = get(etag)
+        assert changed.status_code == 200 and changed.headers["etag"] != etag
+        assert [item["mbti_name"] for item in json.loads(changed.body)] == ["INTJ", "ENFP"]
+        assert len(queries) == 2
+
+        stats = cache.get_stats()
+        assert stats["not_modified"] == 2 and stats["invalidations"] == 1
+    finally:
+        catalog_module._catalog_cache = original
+        db.close()
+
+
+def test_result_read_during_invalidation_is_not_stored():
+    """조회 도중 같은 namespace가 무효화되면 그 응답은 내보내기만 하고 캐시하지 않음"""
+    cache = CatalogResponseCache(ttl=300, max_entries=10)
+    rows = [{"mbti_id": 1, "mbti_name": "INTJ", "mbti_traits": "t", "mbti_speech": "s"}]
+    builds = []
+
+    def build_with_concurrent_write():
+        builds.append(1)
+        snapshot = [dict(row) for row in rows]
+        if len(builds) == 1:
+            # 이전 데이터를 읽은 직후 다른 요청이 수정 후 무효화
+            rows[0]["mbti_name"] = "ENFP"
+            cache.invalidate(MBTI)
+        return snapshot
+
+    def respond():
+        return cache.respond(
+            _request(), key="mbti", namespaces=(MBTI,),
+            build=build_with_concurrent_write, response_type=List[ModelMBTISchema],
+        )
+
+    stale = respond()
+    assert b"INTJ" in stale.body
+    assert cache.get_stats()["cache_size"] == 0
+
+    # 다음 요청은 다시 조회하여 새 데이터를 캐시
+    fresh = respond()
+    assert b"ENFP" in fresh.body and len(builds) == 2
+    assert respond().body == fresh.body and len(builds) == 2
+
+    # 다른 namespace의 무효화는 저장에 영향 없음
+    def build_with_unrelated_write():
+        cache.invalidate(STYLE_PRESETS, INFLUENCERS)
+        return rows
+
+    cache.respond(_request(), key="mbti:other", namespaces=(MBTI,), build=build_with_unrelated_write,
+                  response_type=List[ModelMBTISchema])
+    assert cache.get_stats()["cache_size"] == 2
+
+
+if __name__ == "__main__":
+    test_if_none_match_returns_304()
+    test_result_read_during_invalidation_is_not_stored()
+    print("✅ 모든 테스트 완료!")
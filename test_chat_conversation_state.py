@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+채팅 WebSocket 연결별 대화 상태(ChatConversationState) 테스트 스크립트
+최근 대화 창 유지, 밀려난 대화쌍의 요약 인계, MCP 서버 목록의 fingerprint 기반 갱신 확인
+    python -m pytest test_chat_conversation_state.py   또는   python test_chat_conversation_state.py
+"""
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+# app 설정 로드 전에 테스트용 환경 변수 지정
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "test")
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401
+import app.models.conversation  # noqa: F401
+import app.services.chat_conversation_state as state_module
+from app.models.base import Base
+from app.models.mcp_server import MCPServer, ai_influencer_mcp_server
+from app.services.chat_conversation_state import ChatConversationState
+
+
+class RecordingSummarizer:
+    """요약 요청 기록, release() 전까지 요약 완료를 미룸"""
+
+    def __init__(self):
+        self.requests = []
+        self.released = asyncio.Event()
+        self.fail = False
+
+    async def __call__(self, history):
+        self.requests.append(history)
+        await self.released.wait()
+        if self.fail:
+            raise RuntimeError("요약 모델 오류")
+        return f"요약 {len(self.requests)}"
+
+
+class FakeHFTokenResolver:
+    def __init__(self):
+        self.tokens = {}
+
+    def get_token_by_group(self, group_id, db, prefer_default=True):
+        return self.tokens.get(group_id), None
+
+
+def _fill(state, count, start=0):
+    for i in range(start, start + count):
+        state.append_turn(f"질문 {i}", f"답변 {i}")
+
+
+def test_recent_window_is_trimmed():
+    """최근 대화 창은 RECENT_PAIR_WINDOW개만 유지하고 밀려난 대화쌍은 요약 대기열로 이동"""
+    state = ChatConversationState("inf-1", 1)
+    state.reset("session-1")
+    _fill(state, state.RECENT_PAIR_WINDOW + 2)
+    state.append_turn("   ", "빈 질문은 무시")
+
+    assert len(state.history) == state.RECENT_PAIR_WINDOW + 2
+    assert [pair["query"] for pair in state.recent_pairs] == [f"질문 {i}" for i in range(2, state.RECENT_PAIR_WINDOW + 2)]
+    assert [pair["query"] for pair in state._unsummarized] == ["질문 0", "질문 1"]
+    # 요약기가 없으면 요약 없이 최근 대화만 사용
+    assert state.conversation_pairs() == list(state.recent_pairs)
+
+    state.reset("session-2")
+    assert state.history == [] and not state.recent_pairs and state._unsummarized == []
+
+
+def test_summary_handoff():
+    """밀려난 대화쌍이 모이면 이전 요약과 합쳐 요약하고, 실패하면 다음 배치에서 다시 시도"""
+    async def run():
+        summarizer = RecordingSummarizer()
+        state = ChatConversationState("inf-1", 1, summarizer=summarizer)
+        state.reset("session-1")
+        window, batch = state.RECENT_PAIR_WINDOW, state.SUMMARY_BATCH_SIZE
+
+        _fill(state, window + batch)
+        await asyncio.sleep(0)
+        assert [pair["query"] for pair in summarizer.requests[0]] == ["질문 0", "질문 1", "질문 2"]
+        # 요약 중에 밀려난 대화쌍은 다음 배치로 대기
+        _fill(state, batch, start=window + batch)
+        assert len(summarizer.requests) == 1 and len(state._unsummarized) == batch
+
+        summarizer.released.set()
+        await state._summary_task
+        assert state.summary == "요약 1"
+        assert state.conversation_pairs()[0] == {"query": "이전 대화 요약", "response": "요약 1"}
+        assert len(state.conversation_pairs()) == window + 1
+
+        # 다음 배치(대기 중이던 대화쌍 포함)는 이전 요약을 앞에 붙여 요약, 실패하면 대기열로 되돌림
+        summarizer.fail = True
+        _fill(state, 1, start=window + 2 * batch)
+        await state._summary_task
+        assert summarizer.requests[1][0] == {"query": "이전 대화 요약", "response": "요약 1"}
+        assert [pair["query"] for pair in summarizer.requests[1][1:]] == ["질문 3", "질문 4", "질문 5", "질문 6"]
+        assert state.summary == "요약 1"
+        assert [pair["query"] for pair in state._unsummarized] == ["질문 3", "질문 4", "질문 5", "질문 6"]
+
+    asyncio.run(run())
+
+
+def test_summary_from_previous_session_is_dropped():
+    """요약 중에 세션이 바뀌면 요약 작업을 취소하고 새 세션에 적용하지 않음"""
+    async def run():
+        summarizer = RecordingSummarizer()
+        state = ChatConversationState("inf-1", 1, summarizer=summarizer)
+        state.reset("session-1")
+        _fill(state, state.RECENT_PAIR_WINDOW + state.SUMMARY_BATCH_SIZE)
+        task = state._summary_task
+        await asyncio.sleep(0)
+
+        state.reset("session-2")
+        summarizer.released.set()
+        await asyncio.gather(task, return_exceptions=True)
+        assert state.summary == "" and state._unsummarized == []
+        assert state.conversation_pairs() == []
+
+    asyncio.run(run())
+
+
+def test_mcp_servers_refresh_by_fingerprint():
+    """확인 주기가 지나야 다시 조회하고, 연결된 MCP 서버 ID가 바뀐 경우에만 이름 목록 갱신"""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    db = Session(engine)
+    for mcp_id, name in ((1, "search"), (2, "weather")):
+        db.add(MCPServer(mcp_id=mcp_id, mcp_name=name, mcp_status=0, mcp_config="{}"))
+    db.execute(ai_influencer_mcp_server.insert().values(influencer_id="inf-1", mcp_id=1))
+    db.commit()
+
+    resolver = FakeHFTokenResolver()
+    resolver.tokens[1] = "hf_old"
+    original = state_module.get_hf_token_resolver
+    state_module.get_hf_token_resolver = lambda: resolver
+    try:
+        state = ChatConversationState("inf-1", 1)
+        state.load_resources(db)
+        assert state.mcp_servers == ["search"] and state.hf_token == "hf_old"
+
+        db.execute(ai_influencer_mcp_server.insert().values(influencer_id="inf-1", mcp_id=2))
+        db.commit()
+        resolver.tokens[1] = "hf_new"
+        # 확인 주기 이내에는 조회하지 않음
+        assert state.refresh_resources_if_stale(db) is False
+        assert state.mcp_servers == ["search"] and state.hf_token == "hf_old"
+
+        state.RESOURCE_REFRESH_INTERVAL = 0
+        assert state.refresh_resources_if_stale(db) is True
+        assert sorted(state.mcp_servers) == ["search", "weather"] and state.hf_token == "hf_new"
+
+        # 연결된 서버 ID가 같으면 이름 목록은 다시 조회하지 않음
+        db.get(MCPServer, 2).mcp_name = "weather-v2"
+        db.commit()
+        state.refresh_resources_if_stale(db)
+        assert sorted(state.mcp_servers) == ["search", "weather"]
+
+        db.execute(ai_influencer_mcp_server.delete())
+        db.commit()
+        state.refresh_resources_if_stale(db)
+        assert state.mcp_servers == []
+    finally:
+        state_module.get_hf_token_resolver = original
+        db.close()
+
+
+if __name__ == "__main__":
+    test_recent_window_is_trimmed()
+    test_summary_handoff()
+    test_summary_from_previous_session_is_dropped()
+    test_mcp_servers_refresh_by_fingerprint()
+    print("✅ 모든 테스트 완료!")
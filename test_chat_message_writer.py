@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+채팅 메시지 write-behind 저장기(ChatMessageWriter) 테스트 스크립트
+SQLite 메모리 DB를 비동기 세션처럼 감싸 실제 bulk INSERT 경로로 배치 저장, 재시도, 행 단위 대체 저장, 종료 시 저장 확인
+    python -m pytest test_chat_message_writer.py   또는   python test_chat_message_writer.py
+"""
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+# app 설정 로드 전에 테스트용 환경 변수 지정
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "test")
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401
+import app.models.conversation  # noqa: F401
+import app.services.chat_message_writer as writer_module
+from app.models.base import Base
+from app.models.chat_message import ChatMessage
+from app.services.chat_message_writer import ChatMessageWriter
+
+
+class SQLiteAsyncSession:
+    """new_async_session() 대체 - 동기 SQLite 세션으로 execute/commit/rollback 실행"""
+
+    def __init__(self, database):
+        self.database = database
+        self._session = Session(database.engine)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self._session.close()
+
+    async def execute(self, statement, params=None):
+        self.database.executes += 1
+        if self.database.transient_failures:
+            self.database.transient_failures -= 1
+            raise ConnectionError("일시적인 DB 연결 오류")
+        return self._session.execute(statement, params)
+
+    async def commit(self):
+        self._session.commit()
+
+    async def rollback(self):
+        self._session.rollback()
+
+
+class SQLiteDatabase:
+    def __init__(self):
+        self.engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(self.engine)
+        self.executes = 0
+        self.transient_failures = 0
+
+    def session(self):
+        return SQLiteAsyncSession(self)
+
+    def contents(self):
+        with Session(self.engine) as db:
+            return [row.message_content for row in db.query(ChatMessage).order_by(ChatMessage.created_at).all()]
+
+
+def _run(scenario, **options):
+    async def run():
+        database = SQLiteDatabase()
+        original = writer_module.new_async_session
+        writer_module.new_async_session = database.session
+        try:
+            options.setdefault("retry_backoff", 0.001)
+            writer = ChatMessageWriter(**options)
+            await scenario(writer, database)
+        finally:
+            writer_module.new_async_session = original
+
+    asyncio.run(run())
+
+
+def test_batches_and_stats():
+    """배치 크기 단위로 bulk INSERT하고 저장 지표 기록"""
+    async def scenario(writer, database):
+        await writer.start()
+        ids = [await writer.enqueue("session-1", "inf-1", f"메시지 {i}") for i in range(12)]
+        assert len(set(ids)) == 12
+        await writer.stop()
+
+        assert database.contents() == [f"메시지 {i}" for i in range(12)]
+        stats = writer.get_stats()
+        assert stats["enqueued_total"] == 12 and stats["flushed_total"] == 12
+        assert stats["batches_total"] == 3 and stats["last_batch_size"] == 2
+        assert stats["failed_total"] == 0 and stats["queue_depth"] == 0 and stats["in_flight"] == 0
+        assert database.executes == 3
+
+    _run(scenario, batch_size=5, flush_interval=0.05)
+
+
+def test_transient_failure_is_retried():
+    """일시적인 오류는 backoff 후 같은 배치를 다시 저장"""
+    async def scenario(writer, database):
+        database.transient_failures = 2
+        await writer.start()
+        for i in range(4):
+            await writer.enqueue("session-1", "inf-1", f"메시지 {i}")
+        await writer.stop()
+
+        assert len(database.contents()) == 4
+        stats = writer.get_stats()
+        assert stats["flushed_total"] == 4 and stats["batches_total"] == 1 and stats["failed_total"] == 0
+        assert database.executes == 3
+
+    _run(scenario, batch_size=10, flush_interval=0.05)
+
+
+def test_bad_row_falls_back_to_row_inserts():
+    """재시도해도 실패하는 배치는 한 건씩 저장하여 잘못된 행만 버림"""
+    async def scenario(writer, database):
+        await writer.start()
+        await writer.enqueue("session-1", "inf-1", "정상 1")
+        await writer.enqueue("session-2", "inf-1", None)
+        await writer.enqueue("session-3", "inf-2", "정상 2")
+        await writer.stop()
+
+        assert database.contents() == ["정상 1", "정상 2"]
+        stats = writer.get_stats()
+        assert stats["flushed_total"] == 2 and stats["failed_total"] == 1 and stats["batches_total"] == 1
+        # 배치 3회 시도 + 한 건씩 3회
+        assert database.executes == 3 + 3
+
+    _run(scenario, batch_size=10, flush_interval=0.05, max_retries=3)
+
+
+def test_stop_drains_queue_without_loss():
+    """종료 시 flush 간격을 기다리지 않고 큐에 남은 메시지를 모두 저장, 종료 후에는 즉시 저장"""
+    async def scenario(writer, database):
+        await writer.start()
+        for i in range(25):
+            await writer.enqueue("session-1", "inf-1", f"메시지 {i}")
+        # flush 간격(10초)보다 훨씬 빨리 종료
+        await asyncio.wait_for(writer.stop(), timeout=2)
+        assert len(database.contents()) == 25
+
+        await writer.enqueue("session-1", "inf-1", "종료 후 메시지")
+        stats = writer.get_stats()
+        assert not stats["is_running"] and stats["fallback_total"] == 1
+        assert stats["flushed_total"] == 26 and len(database.contents()) == 26
+
+    _run(scenario, batch_size=10, flush_interval=10)
+
+
+if __name__ == "__main__":
+    test_batches_and_stats()
+    test_transient_failure_is_retried()
+    test_bad_row_falls_back_to_row_inserts()
+    test_stop_drains_queue_without_loss()
+    print("✅ 모든 테스트 완료!")
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+ComfyUI 실행 완료 이벤트 리스너(ComfyUIEventListener / ComfyUIEventHub) 테스트 스크립트
+scripts/fake_comfyui_server.py의 가짜 ComfyUI 서버로 네트워크 없이 완료 통지/폴링 대체/유휴 제거 확인
+    python -m pytest test_comfyui_event_listener.py   또는   python test_comfyui_event_listener.py
+"""
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+# app 설정 로드 전에 테스트용 환경 변수 지정
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "test")
+
+from app.services.comfyui_event_listener import ComfyUIEventHub
+from scripts.fake_comfyui_server import FakeComfyUIServer
+
+
+async def _wait_until(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("조건을 기다리다 시간 초과")
+        await asyncio.sleep(0.01)
+
+
+def test_completion_is_pushed_without_polling():
+    """완료 통지를 받으면 /history를 한 번만 조회하고 진행률도 전달"""
+    async def run():
+        server = FakeComfyUIServer()
+        url = await server.start()
+        hub = ComfyUIEventHub(poll_interval=5, reconnect_delay=0.05, idle_timeout=30)
+        try:
+            listener = hub.get_listener(url)
+            await _wait_until(lambda: listener.connected)
+
+            progress = []
+
+            async def on_progress(value, maximum):
+                progress.append((value, maximum))
+
+            prompt_id = server.queue_prompt(listener.client_id, duration=0.2)
+            execution = await listener.wait_for_execution(prompt_id, max_wait_time=5, on_progress=on_progress)
+            notified_at = time.monotonic()
+
+            assert execution["outputs"]["9"]["images"][0]["filename"] == f"{prompt_id}.png"
+            assert progress and progress == sorted(set(progress))
+            assert server.history_requests[prompt_id] == 1
+            # 폴링 간격(5초)과 무관하게 완료 직후 전달
+            assert notified_at - server.completed_at[prompt_id] < 0.5
+            stats = hub.get_stats()
+            assert stats["push_completions"] == 1 and stats["fallback_polls"] == 0
+        finally:
+            await hub.close()
+            await server.stop()
+
+    asyncio.run(run())
+
+
+def test_idle_listener_is_removed_from_hub():
+    """대기 작업 없이 유휴 시간이 지나면 소켓을 닫고 보관소에서 제거, 다음 요청은 새 리스너"""
+    async def run():
+        server = FakeComfyUIServer()
+        url = await server.start()
+        hub = ComfyUIEventHub(poll_interval=5, reconnect_delay=0.05, idle_timeout=0.3)
+        try:
+            listener = hub.get_listener(url)
+            await _wait_until(lambda: listener.connected)
+            prompt_id = server.queue_prompt(listener.client_id, duration=0.05)
+            assert await listener.wait_for_execution(prompt_id, max_wait_time=5) is not None
+
+            await _wait_until(lambda: hub.get_stats()["listeners"] == 0)
+            await _wait_until(lambda: not listener.running)
+            stats = hub.get_stats()
+            assert stats["removed_listeners"] == 1
+            # 제거된 리스너의 누적 지표는 합계에 남음
+            assert stats["push_completions"] == 1
+
+            # 종료된 파드(연결 불가)의 리스너도 유휴 시간이 지나면 제거
+            dead = hub.get_listener("http://127.0.0.1:9")
+            await _wait_until(lambda: not dead.running)
+            assert hub.get_stats()["removed_listeners"] == 2
+
+            again = hub.get_listener(url)
+            assert again is not listener
+            await _wait_until(lambda: again.connected)
+        finally:
+            await hub.close()
+            await server.stop()
+
+    asyncio.run(run())
+
+
+def test_disconnect_falls_back_to_history_polling():
+    """소켓이 끊긴 동안 완료된 작업은 /history 폴링으로 확인"""
+    async def run():
+        server = FakeComfyUIServer()
+        url = await server.start()
+        hub = ComfyUIEventHub(poll_interval=0.1, reconnect_delay=0.05, idle_timeout=30)
+        try:
+            listener = hub.get_listener(url)
+            await _wait_until(lambda: listener.connected)
+
+            prompt_id = server.queue_prompt(listener.client_id, duration=0.3)
+            waiter = asyncio.create_task(listener.wait_for_execution(prompt_id, max_wait_time=5))
+            await asyncio.sleep(0.05)
+            server.accept_connections = False
+            await server.drop_connections()
+
+            execution = await waiter
+            assert execution["status"]["completed"] is True
+            assert hub.get_stats()["fallback_polls"] >= 1
+
+            # 서버가 다시 연결을 받으면 재연결
+            server.accept_connections = True
+            await _wait_until(lambda: listener.connected)
+            assert hub.get_stats()["reconnects"] >= 1
+        finally:
+            await hub.close()
+            await server.stop()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    test_completion_is_pushed_without_polling()
+    test_idle_listener_is_removed_from_hub()
+    test_disconnect_falls_back_to_history_polling()
+    print("✅ 모든 테스트 완료!")
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+HF 토큰 리졸버(HFTokenResolver) 캐시 테스트 스크립트
+SQLite 메모리 DB로 크기 제한 TTL LRU 캐시와, 토큰 수정/삭제 및 관리자 팀 할당/해제 시 인플루언서/그룹 항목 무효화 확인
+    python -m pytest test_hf_token_resolver.py   또는   python test_hf_token_resolver.py
+"""
+import asyncio
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+# app 설정 로드 전에 테스트용 환경 변수 지정
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "test")
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401
+import app.models.conversation  # noqa: F401
+import app.services.hf_token_resolver as resolver_module
+from app.api.v1.endpoints import admin
+from app.core.encryption import encrypt_sensitive_data
+from app.models.base import Base
+from app.models.user import HFTokenManage, Team
+from app.schemas.hf_token import HFTokenManageUpdate
+from app.services.hf_token_resolver import HFTokenResolver
+from app.services.hf_token_service import get_hf_token_service
+
+ADMIN = {"sub": "admin"}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+def _database():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    db = Session(engine)
+    for group_id in (1, 2, 3):
+        db.add(Team(group_id=group_id, group_name=f"팀 {group_id}"))
+    return db
+
+
+def _add_token(db, hf_manage_id, group_id, user_name, is_default=False):
+    db.add(HFTokenManage(
+        hf_manage_id=hf_manage_id, group_id=group_id, hf_token_value=encrypt_sensitive_data(f"hf_{hf_manage_id}"),
+        hf_token_nickname=hf_manage_id, hf_user_name=user_name, is_default=is_default,
+    ))
+    db.commit()
+
+
+def _influencer(influencer_id, group_id, hf_manage_id=None):
+    return SimpleNamespace(
+        influencer_id=influencer_id, influencer_name=influencer_id, group_id=group_id, hf_manage_id=hf_manage_id,
+    )
+
+
+def _with_resolver(scenario):
+    """전역 리졸버를 새 인스턴스로 교체하고, 관리자 권한 확인은 통과시킴"""
+    resolver = HFTokenResolver(max_entries=100, ttl=300)
+    service = get_hf_token_service()
+    originals = (resolver_module._hf_token_resolver, admin.check_admin_permission)
+    resolver_module._hf_token_resolver = resolver
+    admin.check_admin_permission = lambda current_user, db: None
+    service._check_admin_permission = lambda db, current_user: True
+    try:
+        scenario(resolver, service)
+    finally:
+        resolver_module._hf_token_resolver, admin.check_admin_permission = originals
+        del service._check_admin_permission
+
+
+def test_bounded_ttl_lru():
+    """캐시 적중 시 DB를 다시 조회하지 않고, 용량을 넘으면 가장 오래 사용하지 않은 항목, TTL이 지나면 만료"""
+    db = _database()
+    for group_id in (1, 2, 3):
+        _add_token(db, f"token-{group_id}", group_id, f"user-{group_id}")
+
+    clock = FakeClock()
+    original = resolver_module.time
+    resolver_module.time = clock
+    try:
+        resolver = HFTokenResolver(max_entries=2, ttl=60)
+        assert resolver.get_token_by_group(1, db) == ("hf_token-1", "user-1")
+        assert resolver.get_token_by_group(2, db) == ("hf_token-2", "user-2")
+        # 그룹 1 사용 → 그룹 2가 가장 오래된 항목
+        assert resolver.get_token_by_group(1, db) == ("hf_token-1", "user-1")
+        resolver.get_token_by_group(3, db)
+        stats = resolver.get_cache_stats()
+        assert stats["total_entries"] == 2 and stats["evictions"] == 1
+        assert stats["hits"] == 1 and stats["misses"] == 3
+        assert ("group", 2, True) not in resolver._cache and ("group", 1, True) in resolver._cache
+
+        # 캐시된 값은 DB 변경과 무관하게 TTL 동안 유지
+        db.get(HFTokenManage, "token-1").hf_user_name = "renamed"
+        db.commit()
+        assert resolver.get_token_by_group(1, db) == ("hf_token-1", "user-1")
+        clock.now += 60
+        assert resolver.get_token_by_group(1, db) == ("hf_token-1", "renamed")
+        assert resolver.get_cache_stats()["misses"] == 4
+    finally:
+        resolver_module.time = original
+        db.close()
+
+
+def test_token_update_and_delete_invalidate():
+    """토큰 수정 시 그 토큰으로 해석된 인플루언서/그룹 항목, 삭제 시 그룹 항목 제거"""
+    db = _database()
+    _add_token(db, "direct", None, "direct-user")
+    _add_token(db, "group-default", 1, "default-user", is_default=True)
+    _add_token(db, "group-other", 2, "other-user")
+
+    def scenario(resolver, service):
+        direct = _influencer("inf-direct", 3, hf_manage_id="direct")
+        grouped = _influencer("inf-grouped", 1)
+        assert resolver.get_token_for_influencer(direct, db)[1] == "direct-user"
+        assert resolver.get_token_for_influencer(grouped, db)[1] == "default-user"
+        assert resolver.get_token_by_group(2, db)[1] == "other-user"
+
+        # 직접 할당 토큰 수정 → 해당 인플루언서 항목만 제거
+        service.update_hf_token(db, "direct", HFTokenManageUpdate(hf_user_name="direct-renamed"), ADMIN)
+        assert ("influencer", "inf-direct") not in resolver._cache
+        assert resolver.get_token_for_influencer(direct, db)[1] == "direct-renamed"
+        assert ("influencer", "inf-grouped") in resolver._cache and ("group", 2, True) in resolver._cache
+
+        # 그룹 기본 토큰 수정 → 그 그룹으로 해석된 인플루언서 항목도 제거
+        service.update_hf_token(db, "group-default", HFTokenManageUpdate(hf_user_name="default-renamed"), ADMIN)
+        assert resolver.get_token_for_influencer(grouped, db)[1] == "default-renamed"
+
+        # 그룹 토큰 삭제 → 그룹 항목 제거
+        service.delete_hf_token(db, "group-other", ADMIN)
+        assert ("group", 2, True) not in resolver._cache
+        assert resolver.get_token_by_group(2, db) == (None, None)
+        assert ("influencer", "inf-direct") in resolver._cache
+
+        # 인플루언서 수정/삭제 시에는 인플루언서 항목만 제거
+        resolver.clear_cache("inf-direct")
+        assert ("influencer", "inf-direct") not in resolver._cache
+        assert ("influencer", "inf-grouped") in resolver._cache
+
+    try:
+        _with_resolver(scenario)
+    finally:
+        db.close()
+
+
+def test_admin_assign_and_unassign_invalidate():
+    """관리자 팀 할당은 이전/새 팀 항목, 할당 해제는 이전 팀 항목 제거"""
+    db = _database()
+    _add_token(db, "token-a", 1, "user-a")
+    _add_token(db, "token-b", 2, "user-b")
+
+    def scenario(resolver, service):
+        team1_influencer = _influencer("inf-1", 1)
+        team3_influencer = _influencer("inf-3", 3)
+        assert resolver.get_token_for_influencer(team1_influencer, db)[1] == "user-a"
+        assert resolver.get_token_by_group(2, db)[1] == "user-b"
+        assert resolver.get_token_for_influencer(team3_influencer, db) == (None, None)
+
+        # token-a를 팀 1 → 팀 3으로 이동
+        asyncio.run(admin.admin_assign_token_to_team("token-a", 3, db=db, current_user=ADMIN))
+        assert ("influencer", "inf-1") not in resolver._cache
+        assert resolver.get_token_for_influencer(team1_influencer, db) == (None, None)
+        assert resolver.get_token_for_influencer(team3_influencer, db)[1] == "user-a"
+        assert ("group", 2, True) in resolver._cache
+
+        # token-b 할당 해제 → 팀 2 항목 제거
+        asyncio.run(admin.admin_unassign_token("token-b", db=db, current_user=ADMIN))
+        assert ("group", 2, True) not in resolver._cache
+        assert resolver.get_token_by_group(2, db) == (None, None)
+        assert ("influencer", "inf-3") in resolver._cache
+
+    try:
+        _with_resolver(scenario)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    test_bounded_ttl_lru()
+    test_token_update_and_delete_invalidate()
+    test_admin_assign_and_unassign_invalidate()
+    print("✅ 모든 테스트 완료!")
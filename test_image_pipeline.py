@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+이미지 파생본 파이프라인(image_pipeline) 테스트 스크립트
+압축 폭탄/잘린 파일/이미지가 아닌 데이터가 ImageProcessingError(400)로 변환되는지, 정상 이미지의 파생본 생성 확인
+    python -m pytest test_image_pipeline.py   또는   python test_image_pipeline.py
+"""
+import asyncio
+import io
+import os
+import struct
+import sys
+import warnings
+import zlib
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+# app 설정 로드 전에 테스트용 환경 변수 지정
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "test")
+
+from PIL import Image
+
+from app.services.image_pipeline import (
+    EXIF_ORIENTATION,
+    MEDIUM,
+    THUMBNAIL,
+    ImagePipeline,
+    ImageProcessingError,
+    inspect_image,
+    process_image,
+)
+
+SIZES = ((THUMBNAIL, 64), (MEDIUM, 256))
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def _png_header_only(width: int, height: int) -> bytes:
+    """헤더에 큰 해상도만 적은 작은 PNG (압축 폭탄처럼 디코딩 시점에 메모리를 요구)"""
+    ihdr = struct.pack(">IIBBBBB", width, height, 1, 0, 0, 0, 0)
+    idat = zlib.compress(b"\x00" * 16)
+    return b"\x89PNG\r\n\x1a\n" + _png_chunk(b"IHDR", ihdr) + _png_chunk(b"IDAT", idat) + _png_chunk(b"IEND", b"")
+
+
+def _image_bytes(size=(400, 300), format="JPEG", orientation=None) -> bytes:
+    img = Image.new("RGB", size, (200, 80, 40))
+    buffer = io.BytesIO()
+    if orientation is not None:
+        exif = Image.Exif()
+        exif[EXIF_ORIENTATION] = orientation
+        img.save(buffer, format=format, exif=exif)
+    else:
+        img.save(buffer, format=format)
+    return buffer.getvalue()
+
+
+def _assert_rejected(data: bytes, expected: str):
+    for func in (inspect_image, lambda d: process_image(d, SIZES, 80)):
+        try:
+            func(data)
+            raise AssertionError("ImageProcessingError가 발생해야 함")
+        except ImageProcessingError as e:
+            assert expected in str(e), str(e)
+
+
+def test_decompression_bomb_is_rejected():
+    """PIL이 예외를 내는 구간(제한의 2배 초과)과 경고만 내는 구간 모두 ImageProcessingError"""
+    limit = Image.MAX_IMAGE_PIXELS
+    _assert_rejected(_png_header_only(30000, 30000), "해상도가 너무 큽니다")
+    side = int((limit * 1.5) ** 0.5)
+    assert limit < side * side < limit * 2
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", Image.DecompressionBombWarning)
+        _assert_rejected(_png_header_only(side, side), "해상도가 너무 큽니다")
+
+
+def test_broken_data_is_rejected():
+    """이미지가 아닌 데이터와 잘린 파일은 ImageProcessingError"""
+    _assert_rejected(b"not an image at all", "이미지로 읽을 수 없습니다")
+
+    truncated = _image_bytes(size=(800, 600), format="PNG")[:400]
+    try:
+        process_image(truncated, SIZES, 80)
+        raise AssertionError("잘린 파일은 디코딩에 실패해야 함")
+    except ImageProcessingError as e:
+        assert "디코딩 실패" in str(e)
+
+
+def test_variants_and_orientation():
+    """EXIF 방향을 적용한 크기로 메타데이터를 만들고 큰 변을 기준으로 파생본 축소"""
+    data = _image_bytes(size=(400, 300), orientation=6)
+    metadata = inspect_image(data)
+    assert (metadata.width, metadata.height, metadata.orientation) == (300, 400, 6)
+
+    result = process_image(data, SIZES, 80)
+    assert result.metadata == metadata
+    assert set(result.variants) == {THUMBNAIL, MEDIUM}
+    for name, max_edge in SIZES:
+        with Image.open(io.BytesIO(result.variants[name])) as variant:
+            assert variant.format == "WEBP"
+            assert variant.size == (max_edge * 3 // 4, max_edge)
+
+
+def test_pipeline_stats_in_thread_mode():
+    """워커 0이면 스레드에서 처리하고, 잘못된 데이터는 예외로 전달"""
+    async def run():
+        pipeline = ImagePipeline(workers=0)
+        result = await pipeline.process(_image_bytes())
+        assert result.variants
+        try:
+            await pipeline.inspect(_png_header_only(30000, 30000))
+            raise AssertionError("압축 폭탄은 거부되어야 함")
+        except ImageProcessingError:
+            pass
+        stats = pipeline.get_stats()
+        assert stats["processed"] == 1 and stats["bytes_out"] > 0
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    test_decompression_bomb_is_rejected()
+    test_broken_data_is_rejected()
+    test_variants_and_orientation()
+    test_pipeline_stats_in_thread_mode()
+    print("✅ 모든 테스트 완료!")
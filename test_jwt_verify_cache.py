@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+검증된 JWT 캐시(VerifiedTokenCache / verify_token) 테스트 스크립트
+    python -m pytest test_jwt_verify_cache.py   또는   python test_jwt_verify_cache.py
+"""
+import os
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+# app 설정 로드 전에 테스트용 환경 변수 지정
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "test")
+
+from app.core.security import VerifiedTokenCache, create_access_token, verified_token_cache, verify_token
+
+
+def _token(**claims):
+    data = {"sub": "user-1", "provider": "google", "groups": [1, 2], "profile": {"teams": [{"group_id": 1}]}}
+    data.update(claims)
+    return create_access_token(data, expires_delta=timedelta(minutes=5))
+
+
+def test_cached_payload_is_isolated_from_callers():
+    """반환된 페이로드의 중첩 값을 수정해도 다음 검증 결과는 그대로"""
+    verified_token_cache.clear()
+    token = _token()
+
+    first = verify_token(token)
+    first["groups"].append(999)
+    first["profile"]["teams"].clear()
+    first["sub"] = "attacker"
+
+    second = verify_token(token)
+    assert second["sub"] == "user-1"
+    assert second["groups"] == [1, 2]
+    assert second["profile"] == {"teams": [{"group_id": 1}]}
+
+    second["groups"].append(7)
+    assert verify_token(token)["groups"] == [1, 2]
+    assert verified_token_cache.get_stats()["hits"] >= 2
+
+
+def test_cache_expiry_and_lru_eviction():
+    """exp가 지난 항목은 제거, 용량 초과 시 가장 오래 쓰지 않은 항목부터 제거"""
+    cache = VerifiedTokenCache(max_entries=2)
+    cache.put(b"a", {"sub": "a"}, time.time() + 60)
+    cache.put(b"b", {"sub": "b"}, time.time() + 60)
+    assert cache.get(b"a") == {"sub": "a"}
+    cache.put(b"c", {"sub": "c"}, time.time() + 60)
+    assert cache.get(b"b") is None
+    assert cache.get(b"a") == {"sub": "a"}
+
+    cache.put(b"old", {"sub": "old"}, time.time() - 1)
+    assert cache.get(b"old") is None
+    stats = cache.get_stats()
+    assert stats["evictions"] >= 1 and stats["expirations"] == 1
+
+
+def test_invalid_tokens_are_rejected():
+    assert verify_token("") is None
+    assert verify_token("not-a-jwt") is None
+    assert verify_token(_token()[:-2] + "xx") is None
+
+
+if __name__ == "__main__":
+    test_cached_payload_is_isolated_from_callers()
+    test_cache_expiry_and_lru_eviction()
+    test_invalid_tokens_are_rejected()
+    print("✅ 모든 테스트 완료!")
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+이미지 프록시 다운로드(/proxy-download) 접근 권한 테스트 스크립트
+- presigned URL 서명 검증 (SigV2 / SigV4)
+- 자체 버킷 객체는 사용자 그룹의 IMAGE_STORAGE 이미지이거나 유효한 presigned URL일 때만 직접 스트리밍
+moto S3와 인메모리 SQLite 사용
+    python -m pytest test_proxy_download.py   또는   python test_proxy_download.py
+"""
+import asyncio
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+# app 설정 로드 전에 테스트용 환경 변수 지정
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ.setdefault("RUNPOD_API_KEY", "test")
+os.environ.setdefault("OPENAI_API_KEY", "test")
+os.environ["AWS_ACCESS_KEY_ID"] = "testing"
+os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
+os.environ["AWS_REGION"] = "us-east-1"
+os.environ["S3_BUCKET_NAME"] = "aimex-test-bucket"
+os.environ.pop("S3_ENDPOINT_URL", None)
+
+from fastapi import HTTPException
+from moto import mock_aws
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from starlette.requests import Request
+
+import app.models  # noqa: F401  (relationship 대상 모델 등록)
+import app.models.conversation  # noqa: F401
+import app.api.v1.endpoints.image_generation as image_generation
+from app.models.base import Base
+from app.models.image_storage import ImageStorage
+from app.models.user import Team, User
+from app.services.download_proxy import own_s3_urls, verify_presigned_s3_url
+from app.services.object_storage import AsyncObjectStorage, create_s3_client
+
+BUCKET = "aimex-test-bucket"
+OWN_KEY = "generate_image/team_1/own.png"
+OTHER_KEY = "generate_image/team_2/other.png"
+
+
+class AsyncSessionAdapter:
+    """엔드포인트가 쓰는 AsyncSession.execute만 동기 세션으로 흉내"""
+
+    def __init__(self, session):
+        self.session = session
+
+    async def execute(self, statement):
+        return self.session.execute(statement)
+
+
+def _request(headers=None) -> Request:
+    raw = [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+    return Request({"type": "http", "method": "GET", "path": "/proxy-download", "headers": raw, "query_string": b""})
+
+
+def _db():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    team1 = Team(group_id=1, group_name="team1")
+    team2 = Team(group_id=2, group_name="team2")
+    user = User(user_id="u1", provider_id="p1", provider="google", user_name="user1", email="u1@example.com")
+    user.teams = [team1]
+    session.add_all([team1, team2, user])
+    session.add(ImageStorage(s3_url=f"https://{BUCKET}.s3.us-east-1.amazonaws.com/{OWN_KEY}", group_id=1))
+    session.add(ImageStorage(s3_url=f"https://{BUCKET}.s3.us-east-1.amazonaws.com/{OTHER_KEY}", group_id=2))
+    session.commit()
+    return AsyncSessionAdapter(session)
+
+
+def test_presigned_signature_verification():
+    """boto3가 만든 SigV2/SigV4 presigned URL만 통과 (키 변경/다른 비밀키/만료는 거부)"""
+    for region in ("us-east-1", "ap-northeast-2"):
+        client = create_s3_client(region_name=region)
+        url = client.generate_presigned_url(
+            "get_object", Params={"Bucket": BUCKET, "Key": "images/한 글+1.png"}, ExpiresIn=600
+        )
+        assert verify_presigned_s3_url(url, BUCKET, "testing", "testing")
+        assert not verify_presigned_s3_url(url.replace("images/", "secret/"), BUCKET, "testing", "testing")
+        assert not verify_presigned_s3_url(url, BUCKET, "testing", "other-secret")
+        assert not verify_presigned_s3_url(url, BUCKET, "other-key", "testing")
+        later = datetime.now(timezone.utc) + timedelta(minutes=20)
+        assert not verify_presigned_s3_url(url, BUCKET, "testing", "testing", now=later)
+
+    assert not verify_presigned_s3_url(f"https://{BUCKET}.s3.amazonaws.com/{OWN_KEY}", BUCKET, "testing", "testing")
+    assert f"https://{BUCKET}.s3.us-east-1.amazonaws.com/a%20b.png" in own_s3_urls("a b.png", BUCKET, "us-east-1")
+
+
+@mock_aws
+def test_proxy_download_requires_group_or_presigned():
+    """그룹 이미지/presigned URL은 S3에서 직접 (private 캐시), 나머지는 stream_url로"""
+    client = create_s3_client()
+    client.create_bucket(Bucket=BUCKET)
+    client.put_object(Bucket=BUCKET, Key=OWN_KEY, Body=b"own-image", ContentType="image/png")
+    client.put_object(Bucket=BUCKET, Key=OTHER_KEY, Body=b"other-image", ContentType="image/png")
+
+    s3_service = image_generation.get_s3_service()
+    saved = (s3_service.s3_client, s3_service.storage, s3_service.bucket_name, s3_service.aws_region, image_generation.stream_url)
+    s3_service.s3_client = client
+    s3_service.storage = AsyncObjectStorage(client, BUCKET)
+    s3_service.bucket_name = BUCKET
+    s3_service.aws_region = "us-east-1"
+
+    forwarded = []
+
+    async def fake_stream_url(url, request, filename=None, cache_control=None, **kwargs):
+        forwarded.append((url, cache_control))
+        raise HTTPException(status_code=403, detail="upstream denied")
+
+    image_generation.stream_url = fake_stream_url
+    db = _db()
+    user = {"sub": "u1"}
+
+    async def download(url):
+        response = await image_generation.proxy_download_image(_request(), url=url, current_user=user, db=db)
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        return response, body
+
+    async def run():
+        # 1) 자기 그룹 이미지 → 직접 스트리밍, private 캐시
+        response, body = await download(f"https://{BUCKET}.s3.us-east-1.amazonaws.com/{OWN_KEY}")
+        assert body == b"own-image"
+        assert response.headers["cache-control"].startswith("private")
+
+        # 2) 다른 그룹 이미지 → 직접 스트리밍하지 않고 stream_url(S3가 판단)로
+        try:
+            await download(f"https://{BUCKET}.s3.amazonaws.com/{OTHER_KEY}")
+            raise AssertionError("다른 그룹 이미지는 직접 스트리밍되면 안 됨")
+        except HTTPException as e:
+            assert e.status_code == 403
+        assert forwarded[-1] == (f"https://{BUCKET}.s3.amazonaws.com/{OTHER_KEY}", "private, max-age=3600")
+
+        # 3) 다른 그룹 이미지라도 유효한 presigned URL이면 허용
+        presigned = client.generate_presigned_url("get_object", Params={"Bucket": BUCKET, "Key": OTHER_KEY}, ExpiresIn=600)
+        response, body = await download(presigned)
+        assert body == b"other-image"
+
+        # 4) 서명을 조작한 URL은 stream_url로
+        forwarded.clear()
+        try:
+            await download(presigned.replace("team_2", "team_1"))
+        except HTTPException:
+            pass
+        assert len(forwarded) == 1
+
+        # 5) 그룹이 없는 사용자
+        forwarded.clear()
+        try:
+            await image_generation.proxy_download_image(
+                _request(), url=f"https://{BUCKET}.s3.us-east-1.amazonaws.com/{OWN_KEY}", current_user={"sub": "nobody"}, db=db
+            )
+        except HTTPException:
+            pass
+        assert len(forwarded) == 1
+
+    try:
+        asyncio.run(run())
+    finally:
+        s3_service.s3_client, s3_service.storage, s3_service.bucket_name, s3_service.aws_region, image_generation.stream_url = saved
+        db.session.close()
+
+
+if __name__ == "__main__":
+    test_presigned_signature_verification()
+    test_proxy_download_requires_group_or_presigned()
+    print("✅ 모든 테스트 완료!")
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+QA 결과 스트리밍 파이프라인 테스트 스크립트
+- 처리된 QA 파일(write_qa_json / 기존 indent=2 형식)을 청크 단위로 다시 읽기
+- 파인튜닝 서비스의 S3 QA 다운로드 (moto S3)
+    python -m pytest test_qa_result_pipeline.py   또는   python test_qa_result_pipeline.py
+"""
+import asyncio
+import io
+import json
+import os
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+# app 설정 로드 전에 테스트용 환경 변수 지정
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ.setdefault("RUNPOD_API_KEY", "test")
+os.environ["AWS_ACCESS_KEY_ID"] = "testing"
+os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
+os.environ["AWS_REGION"] = "us-east-1"
+os.environ["S3_BUCKET_NAME"] = "aimex-test-bucket"
+os.environ.pop("S3_ENDPOINT_URL", None)
+
+from moto import mock_aws
+
+from app.services.qa_result_pipeline import (
+    QAPipelineStats,
+    iter_batch_qa_pairs,
+    iter_processed_qa_json,
+    write_qa_json,
+)
+
+BUCKET = "aimex-test-bucket"
+
+
+def _qa_pairs(count):
+    return [
+        {"question": f"질문 {i}, \"따옴표\"와 ] 괄호", "answer": f"답변 {i} " + "가" * (i % 50), "custom_id": f"c_{i}"}
+        for i in range(count)
+    ]
+
+
+def _batch_line(custom_id, content):
+    return json.dumps({
+        "custom_id": custom_id,
+        "response": {"status_code": 200, "body": {"choices": [{"message": {"content": content}}]}},
+    }, ensure_ascii=False)
+
+
+def test_processed_qa_round_trip_across_chunks():
+    """write_qa_json으로 기록한 파일을 작은 청크로 읽어도 같은 QA 쌍"""
+    pairs = _qa_pairs(500)
+    f = io.StringIO()
+    count = write_qa_json(iter(pairs), f, {"influencer_id": "inf", "task_id": "t"})
+    assert count == 500
+
+    for chunk_size in (7, 64, 4096):
+        f.seek(0)
+        stats = QAPipelineStats()
+        assert list(iter_processed_qa_json(f, stats, chunk_size=chunk_size)) == pairs
+        assert stats.stage("read").items == 500
+
+
+def test_processed_qa_legacy_indented_and_empty():
+    """이전 json.dumps(indent=2) 형식과 빈 qa_pairs도 읽음"""
+    pairs = _qa_pairs(20)
+    legacy = json.dumps({"influencer_id": "inf", "qa_pairs": pairs, "total_qa_pairs": 20}, ensure_ascii=False, indent=2)
+    assert list(iter_processed_qa_json(io.StringIO(legacy), chunk_size=16)) == pairs
+    assert list(iter_processed_qa_json(io.StringIO('{"qa_pairs": []}'))) == []
+
+
+def test_non_processed_file_returns_none():
+    """qa_pairs 배열이 없는 파일(JSONL 배치 결과)은 None으로 JSONL 파싱에 넘김"""
+    jsonl = "\n".join(_batch_line(f"c_{i}", json.dumps({"q": f"q{i}", "a": f"a{i}"})) for i in range(3))
+    assert iter_processed_qa_json(io.StringIO(jsonl)) is None
+
+
+def test_batch_results_dedup():
+    """배치 결과 파싱 시 같은 QA 쌍은 한 번만"""
+    results = [json.loads(_batch_line(f"c_{i}", "Q: 안녕\nA: 반가워")) for i in range(3)]
+    stats = QAPipelineStats()
+    assert len(list(iter_batch_qa_pairs(results, stats))) == 1
+    assert stats.duplicates == 2
+
+
+@mock_aws
+def test_finetuning_download_streams_processed_and_jsonl():
+    """파인튜닝 서비스가 S3의 처리된 QA 파일과 JSONL 원본을 비동기로 내려받아 파싱"""
+    from app.services.finetuning_service import InfluencerFineTuningService
+    from app.services.object_storage import create_s3_client
+
+    client = create_s3_client()
+    client.create_bucket(Bucket=BUCKET)
+    pairs = _qa_pairs(300)
+    processed = io.StringIO()
+    write_qa_json(iter(pairs), processed, {"influencer_id": "inf", "task_id": "t"})
+    client.put_object(Bucket=BUCKET, Key="influencers/inf/qa_pairs/t/processed_qa_1.json", Body=processed.getvalue().encode("utf-8"))
+    jsonl = "\n".join(_batch_line(f"c_{i}", json.dumps({"q": f"q{i}", "a": f"a{i}"})) for i in range(5))
+    client.put_object(Bucket=BUCKET, Key="influencers/inf/qa_results/t/generated_qa_results.jsonl", Body=jsonl.encode("utf-8"))
+
+    service = InfluencerFineTuningService()
+    service.s3_service.s3_client = client
+    base = f"https://{BUCKET}.s3.us-east-1.amazonaws.com/"
+
+    async def run():
+        loaded = await service.download_qa_data_from_s3(base + "influencers/inf/qa_pairs/t/processed_qa_1.json")
+        raw = await service.download_qa_data_from_s3(base + "influencers/inf/qa_results/t/generated_qa_results.jsonl")
+        missing = await service.download_qa_data_from_s3(base + "influencers/inf/none.json")
+        return loaded, raw, missing
+
+    loaded, raw, missing = asyncio.run(run())
+    assert loaded == pairs
+    assert raw == [{"question": f"q{i}", "answer": f"a{i}"} for i in range(5)]
+    assert missing is None
+
+
+if __name__ == "__main__":
+    test_processed_qa_round_trip_across_chunks()
+    test_processed_qa_legacy_indented_and_empty()
+    test_non_processed_file_returns_none()
+    test_batch_results_dedup()
+    test_finetuning_download_streams_processed_and_jsonl()
+    print("✅ 모든 테스트 완료!")
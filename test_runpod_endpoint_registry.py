@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+RunPod 엔드포인트 레지스트리(RunPodEndpointRegistry) 테스트 스크립트
+가짜 GraphQL 응답으로 single-flight 조회, 목록 사본 반환, 실패 후 재시도 대기와 force_refresh 확인
+    python -m pytest test_runpod_endpoint_registry.py   또는   python test_runpod_endpoint_registry.py
+"""
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+# app 설정 로드 전에 테스트용 환경 변수 지정
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "test")
+
+import app.services.runpod_endpoint_registry as registry_module
+from app.services.runpod_endpoint_registry import RunPodEndpointRegistry, RunPodEndpointRegistryError
+
+
+class FakeResponse:
+    def __init__(self, status_code, payload=None, text=""):
+        self.status_code = status_code
+        self._payload = payload
+        self.text = text
+
+    def json(self):
+        return self._payload
+
+
+class FakeGraphQL:
+    """request_with_retry 대체 - 호출 수 기록, fail=True면 500 응답"""
+
+    def __init__(self, endpoints):
+        self.endpoints = endpoints
+        self.calls = 0
+        self.fail = False
+
+    async def __call__(self, upstream, method, url, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if self.fail:
+            return FakeResponse(500, text="internal error")
+        return FakeResponse(200, {"data": {"myself": {"endpoints": [dict(e) for e in self.endpoints]}}})
+
+
+def _match(name):
+    return lambda endpoints: next((e for e in endpoints if e["name"] == name), None)
+
+
+def _run(scenario, endpoints, **options):
+    async def run():
+        graphql = FakeGraphQL(endpoints)
+        original = registry_module.request_with_retry
+        registry_module.request_with_retry = graphql
+        try:
+            await scenario(RunPodEndpointRegistry(**options), graphql)
+        finally:
+            registry_module.request_with_retry = original
+
+    asyncio.run(run())
+
+
+def test_single_flight_and_copies():
+    """동시 조회는 GraphQL 한 번으로 처리하고, 반환된 목록을 수정해도 캐시는 그대로"""
+    async def scenario(registry, graphql):
+        results = await asyncio.gather(*(registry.get_endpoints() for _ in range(5)))
+        assert graphql.calls == 1 and all(len(r) == 2 for r in results)
+
+        results[0].clear()
+        cached = await registry.get_endpoints()
+        assert len(cached) == 2 and graphql.calls == 1
+        cached.append({"id": "ep-x", "name": "injected"})
+        assert len(await registry.get_endpoints()) == 2
+
+        assert (await registry.resolve("tts", _match("tts")))["id"] == "ep-1"
+        assert graphql.calls == 1
+
+    _run(scenario, [{"id": "ep-1", "name": "tts"}, {"id": "ep-2", "name": "vllm"}], ttl_seconds=60, failure_backoff=30)
+
+
+def test_force_refresh_bypasses_failure_backoff():
+    """조회 실패 후 대기 중에는 캐시된 목록을 쓰지만, force_refresh는 다시 조회"""
+    async def scenario(registry, graphql):
+        assert (await registry.resolve("tts", _match("tts")))["id"] == "ep-1"
+
+        graphql.fail = True
+        registry.invalidate()
+        # 실패 시 캐시된 목록으로 대체, 이후 대기 기간에는 GraphQL 호출 없음
+        assert len(await registry.get_endpoints()) == 1 and graphql.calls == 2
+        assert registry.in_failure_backoff()
+        assert len(await registry.get_endpoints()) == 1 and graphql.calls == 2
+        assert (await registry.resolve("tts", _match("tts")))["id"] == "ep-1" and graphql.calls == 2
+
+        # 엔드포인트 교체 후 복구 → force_refresh는 대기 기간이어도 새 목록 조회
+        graphql.fail = False
+        graphql.endpoints = [{"id": "ep-9", "name": "tts"}]
+        assert (await registry.get_endpoints(force_refresh=True))[0]["id"] == "ep-9"
+        assert graphql.calls == 3 and not registry.in_failure_backoff()
+
+        graphql.fail = True
+        await registry.get_endpoints(force_refresh=True)
+        assert registry.in_failure_backoff()
+        graphql.fail = False
+        graphql.endpoints = [{"id": "ep-10", "name": "tts"}]
+        assert (await registry.resolve("tts", _match("tts"), force_refresh=True))["id"] == "ep-10"
+        assert graphql.calls == 5
+
+    _run(scenario, [{"id": "ep-1", "name": "tts"}], ttl_seconds=60, failure_backoff=30)
+
+
+def test_failure_without_cache_raises_during_backoff():
+    """캐시된 목록이 없으면 대기 기간에는 GraphQL 호출 없이 오류, force_refresh는 다시 시도"""
+    async def scenario(registry, graphql):
+        graphql.fail = True
+        for _ in range(2):
+            try:
+                await registry.get_endpoints()
+                raise AssertionError("오류가 발생해야 함")
+            except RunPodEndpointRegistryError:
+                pass
+        assert graphql.calls == 1
+
+        graphql.fail = False
+        assert len(await registry.get_endpoints(force_refresh=True)) == 1
+        assert graphql.calls == 2
+
+    _run(scenario, [{"id": "ep-1", "name": "tts"}], ttl_seconds=60, failure_backoff=30)
+
+
+if __name__ == "__main__":
+    test_single_flight_and_copies()
+    test_force_refresh_bypasses_failure_backoff()
+    test_failure_without_cache_raises_during_backoff()
+    print("✅ 모든 테스트 완료!")
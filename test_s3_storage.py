@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+비동기 S3 스토리지(AsyncObjectStorage / S3ImageService) 테스트 스크립트
+moto로 S3를 로컬에서 흉내내어 boto3 호출 경로를 실제로 실행
+    python -m pytest test_s3_storage.py   또는   python test_s3_storage.py
+"""
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+# app 설정 로드 전에 테스트용 환경 변수 지정
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ["AWS_ACCESS_KEY_ID"] = "testing"
+os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
+os.environ["AWS_REGION"] = "us-east-1"
+os.environ["S3_BUCKET_NAME"] = "aimex-test-bucket"
+os.environ.pop("S3_ENDPOINT_URL", None)
+
+from botocore.exceptions import ClientError
+from moto import mock_aws
+
+from app.services.object_storage import AsyncObjectStorage, create_s3_client
+
+BUCKET = "aimex-test-bucket"
+
+
+def _client():
+    client = create_s3_client()
+    client.create_bucket(Bucket=BUCKET)
+    return client
+
+
+@mock_aws
+def test_object_storage_round_trip():
+    """업로드 → 다운로드/Range/조건부 요청 → 목록 → 일괄 삭제"""
+    storage = AsyncObjectStorage(_client(), BUCKET)
+    data = os.urandom(300 * 1024)
+
+    async def run():
+        await storage.put_object("images/a.png", data, "image/png")
+        await storage.put_object("images/b.png", b"b", "image/png")
+
+        assert await storage.get_object_bytes("images/a.png") == data
+
+        meta, chunks = await storage.open_object("images/a.png", chunk_size=64 * 1024)
+        assert meta["ContentType"] == "image/png"
+        assert b"".join([chunk async for chunk in chunks]) == data
+
+        meta, chunks = await storage.open_object("images/a.png", byte_range="bytes=0-9")
+        assert b"".join([chunk async for chunk in chunks]) == data[:10]
+
+        head = await storage.head_object("images/a.png")
+        assert head["ContentLength"] == len(data)
+        try:
+            await storage.head_object("images/a.png", if_none_match=head["ETag"])
+            raise AssertionError("같은 ETag 조건부 HEAD는 304여야 함")
+        except ClientError as e:
+            assert e.response["ResponseMetadata"]["HTTPStatusCode"] == 304
+
+        await storage.head_bucket()
+
+        keys = sorted(obj["Key"] for obj in await storage.list_objects("images/"))
+        assert keys == ["images/a.png", "images/b.png"]
+        assert len(await storage.list_objects("images/", max_keys=1)) == 1
+
+        deleted, errors = await storage.delete_objects(keys)
+        assert sorted(deleted) == keys and not errors
+        assert await storage.list_objects("images/") == []
+
+    asyncio.run(run())
+
+
+@mock_aws
+def test_presigned_urls_do_not_check_bucket():
+    """presigned URL 생성은 로컬 서명이므로 head_bucket을 호출하지 않음"""
+    _client()
+    from app.services.s3_image_service import S3ImageService
+
+    service = S3ImageService()
+    calls = []
+    original = service.s3_client.head_bucket
+    service.s3_client.head_bucket = lambda **kwargs: calls.append(kwargs) or original(**kwargs)
+
+    url = service.generate_presigned_url("images/a.png")
+    urls = service.generate_presigned_urls(["images/a.png", "images/b.png", "images/a.png"])
+    assert "images/a.png" in url and "Signature" in url
+    assert set(urls) == {"images/a.png", "images/b.png"}
+    assert calls == []
+
+    # 사용 가능 여부 확인은 비동기 storage로 한 번만 하고 결과를 캐시
+    async def run():
+        assert await service.is_available_async()
+        assert await service.is_available_async()
+
+    asyncio.run(run())
+    assert len(calls) == 1
+
+
+if __name__ == "__main__":
+    test_object_storage_round_trip()
+    test_presigned_urls_do_not_check_bucket()
+    print("✅ 모든 테스트 완료!")
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+세션 정리기(SessionReconciler) 테스트 스크립트
+SQLite 메모리 DB와 가짜 RunPod/웜 풀로 만료 세션 정리, 사라진 Pod 정리, 정리 도중 연장된 세션 보호 확인
+    python -m pytest test_session_reconciler.py   또는   python test_session_reconciler.py
+"""
+import asyncio
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+# app 설정 로드 전에 테스트용 환경 변수 지정
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "test")
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401
+import app.models.conversation  # noqa: F401
+import app.services.session_reconciler as reconciler_module
+from app.models.base import Base
+from app.models.user import User
+from app.services.runpod_service import RunPodPodResponse
+from app.services.session_reconciler import SessionReconciler
+
+
+class SyncBackedAsyncSession:
+    """AsyncSession 대체 - 동기 Session으로 execute/commit 실행"""
+
+    def __init__(self, session: Session):
+        self._session = session
+
+    async def execute(self, statement):
+        return self._session.execute(statement)
+
+    async def commit(self):
+        self._session.commit()
+
+
+class FakeRunPod:
+    def __init__(self, pods, on_list=None):
+        self.pods = pods
+        self.on_list = on_list
+
+    async def list_pods(self):
+        # 세션 조회(SELECT)와 초기화(UPDATE) 사이에 실행됨
+        if self.on_list:
+            self.on_list()
+        return dict(self.pods)
+
+
+class FakePodPool:
+    def __init__(self):
+        self.released = []
+        self.discarded = []
+
+    async def release_pod(self, pod_id):
+        self.released.append(pod_id)
+        return True
+
+    def discard(self, pod_ids):
+        self.discarded.extend(pod_ids)
+
+    def owned_pod_ids(self):
+        return set()
+
+
+class FakeStateBus:
+    def __init__(self):
+        self.published = []
+
+    def publish(self, user_id, state, source):
+        self.published.append((user_id, state, source))
+
+
+def _now():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _running(pod_id):
+    return RunPodPodResponse(pod_id=pod_id, status="RUNNING", endpoint_url=None, cost_per_hour=0.5)
+
+
+def _run(sessions, pods, on_list=None):
+    """sessions: user_id → (pod_id, session_expires_at)"""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    db = Session(engine)
+    for i, (user_id, (pod_id, expires_at)) in enumerate(sessions.items()):
+        db.add(User(
+            user_id=user_id, provider_id=f"p-{i}", provider="google", user_name=user_id, email=f"{user_id}@example.com",
+            current_pod_id=pod_id, pod_status="ready", session_created_at=_now(), session_expires_at=expires_at,
+        ))
+    db.commit()
+
+    pool = FakePodPool()
+    originals = (reconciler_module.get_warm_pod_pool, reconciler_module.get_runpod_service)
+    reconciler_module.get_warm_pod_pool = lambda: pool
+    reconciler_module.get_runpod_service = lambda: FakeRunPod(pods, on_list and (lambda: on_list(db)))
+    try:
+        reconciler = SessionReconciler()
+        reconciler.state_bus = FakeStateBus()
+        report = asyncio.run(reconciler.reconcile(SyncBackedAsyncSession(db)))
+    finally:
+        reconciler_module.get_warm_pod_pool, reconciler_module.get_runpod_service = originals
+
+    db.expire_all()
+    rows = {user.user_id: user for user in db.query(User).all()}
+    return report, rows, pool, reconciler.state_bus.published
+
+
+def test_expired_and_gone_sessions_are_cleared():
+    """만료 세션은 초기화 후 Pod 반환, Pod이 사라진 세션은 초기화만"""
+    past, future = _now() - timedelta(minutes=1), _now() + timedelta(minutes=10)
+    report, rows, pool, published = _run(
+        {"expired": ("pod-1", past), "gone": ("pod-2", future), "active": ("pod-3", future)},
+        {"pod-1": _running("pod-1"), "pod-3": _running("pod-3")},
+    )
+    assert report.expired == 1 and report.pod_missing == 1 and report.rows_updated == 2
+    assert rows["expired"].current_pod_id is None and rows["expired"].pod_status == "none"
+    assert rows["gone"].current_pod_id is None
+    assert rows["active"].current_pod_id == "pod-3"
+    assert pool.released == ["pod-1"] and pool.discarded == ["pod-2"]
+    assert sorted(user_id for user_id, _, _ in published) == ["expired", "gone"]
+
+
+def test_session_extended_mid_sweep_keeps_its_pod():
+    """조회 후 UPDATE 전에 연장된 세션은 행도 Pod도 그대로 두고 통지하지 않음"""
+    past = _now() - timedelta(minutes=1)
+
+    def extend(db):
+        user = db.get(User, "extended")
+        user.session_expires_at = _now() + timedelta(minutes=15)
+        db.commit()
+
+    report, rows, pool, published = _run(
+        {"extended": ("pod-1", past), "expired": ("pod-2", past)},
+        {"pod-1": _running("pod-1"), "pod-2": _running("pod-2")},
+        on_list=extend,
+    )
+    assert report.expired == 2 and report.rows_updated == 1 and report.skipped == 1
+    assert rows["extended"].current_pod_id == "pod-1" and rows["extended"].pod_status == "ready"
+    assert rows["expired"].current_pod_id is None
+    assert pool.released == ["pod-2"]
+    assert [user_id for user_id, _, _ in published] == ["expired"]
+
+
+def test_session_with_new_pod_mid_sweep_is_left_alone():
+    """조회 후 새 Pod을 할당받은 세션은 이전 Pod 기준 정리 대상에서 제외"""
+    past = _now() - timedelta(minutes=1)
+
+    def reassign(db):
+        user = db.get(User, "alice")
+        user.current_pod_id = "pod-new"
+        user.session_expires_at = _now() + timedelta(minutes=15)
+        db.commit()
+
+    report, rows, pool, published = _run({"alice": ("pod-old", past)}, {"pod-old": _running("pod-old")}, on_list=reassign)
+    assert report.rows_updated == 0 and report.skipped == 1
+    assert rows["alice"].current_pod_id == "pod-new"
+    assert pool.released == [] and published == []
+
+
+if __name__ == "__main__":
+    test_expired_and_gone_sessions_are_cleared()
+    test_session_extended_mid_sweep_keeps_its_pod()
+    test_session_with_new_pod_mid_sweep_is_left_alone()
+    print("✅ 모든 테스트 완료!")
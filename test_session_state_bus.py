@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+세션 상태 이벤트 버스(SessionStateBus) 테스트 스크립트
+구독 큐의 최신 상태 유지, 동일 상태 재발행 무시, 이벤트 루프 밖 스레드에서의 발행,
+UserSessionService의 failed 재확인 시각 기록 정리 확인
+    python -m pytest test_session_state_bus.py   또는   python test_session_state_bus.py
+"""
+import asyncio
+import os
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+# app 설정 로드 전에 테스트용 환경 변수 지정
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "test")
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401
+import app.models.conversation  # noqa: F401
+import app.services.runpod_service as runpod_module
+import app.services.user_session_service as session_module
+from app.models.base import Base
+from app.models.user import User
+from app.services.runpod_service import RunPodPodResponse
+from app.services.session_state_bus import SessionStateBus
+from app.services.user_session_service import UserSessionService
+
+
+def _status(pod_status, remaining=600, total_generations=0):
+    expires_at = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+    return {
+        "pod_id": "pod-1",
+        "pod_status": pod_status,
+        "session_expires_at": expires_at,
+        "processing_expires_at": None,
+        "session_remaining_seconds": remaining,
+        "total_generations": total_generations,
+    }
+
+
+def test_queue_keeps_latest_state_only():
+    """소비되지 않은 이전 상태는 버리고 최신 상태 하나만 전달"""
+    async def run():
+        bus = SessionStateBus()
+        queue = bus.subscribe("user-1")
+        for pod_status in ("starting", "ready", "processing"):
+            bus.publish("user-1", _status(pod_status), "test")
+
+        assert queue.qsize() == 1
+        assert (await queue.get())["pod_status"] == "processing"
+        assert bus.get_state("user-1")["pod_status"] == "processing"
+
+        # 세션 종료(None)도 상태로 전달
+        bus.publish("user-1", None, "test")
+        assert await queue.get() is None
+        assert bus.get_state("user-1", default="unset") is None
+        assert bus.get_stats()["published"] == 4
+
+    asyncio.run(run())
+
+
+def test_duplicate_state_is_suppressed():
+    """남은 시간만 바뀐 재발행은 무시하고, 구독자가 없으면 스냅샷을 남기지 않음"""
+    async def run():
+        bus = SessionStateBus()
+        bus.publish("user-1", _status("ready"), "test")
+        assert bus.get_state("user-1", default="unset") == "unset"
+
+        queue = bus.subscribe("user-1")
+        bus.prime("user-1", _status("ready", remaining=600))
+        bus.publish("user-1", _status("ready", remaining=540), "test")
+        assert queue.empty()
+        assert bus.get_stats()["suppressed"] == 1
+
+        bus.publish("user-1", _status("ready", total_generations=1), "test")
+        assert (await queue.get())["total_generations"] == 1
+        # 이미 발행된 상태가 있으면 prime은 덮어쓰지 않음
+        bus.prime("user-1", _status("starting"))
+        assert bus.get_state("user-1")["total_generations"] == 1
+
+        bus.unsubscribe("user-1", queue)
+        assert bus.get_state("user-1", default="unset") == "unset"
+        assert bus.get_stats()["subscribed_users"] == 0
+
+    asyncio.run(run())
+
+
+def test_publish_from_worker_thread():
+    """이벤트 루프 밖의 스레드에서 발행하면 루프로 넘겨 구독 큐에 전달"""
+    async def run():
+        bus = SessionStateBus()
+        queue = bus.subscribe("user-1")
+        worker = threading.Thread(target=bus.publish, args=("user-1", _status("ready"), "worker"))
+        worker.start()
+        worker.join()
+
+        state = await asyncio.wait_for(queue.get(), timeout=1)
+        assert state["pod_status"] == "ready"
+        assert bus.get_stats()["published"] == 1
+
+    asyncio.run(run())
+
+
+class SQLiteAsyncSession:
+    """AsyncSession 대체 - 동기 Session으로 execute/refresh/commit 실행"""
+
+    def __init__(self, session: Session):
+        self._session = session
+
+    async def execute(self, statement):
+        return self._session.execute(statement)
+
+    async def refresh(self, instance):
+        self._session.refresh(instance)
+
+    async def commit(self):
+        self._session.commit()
+
+
+class FakeRunPod:
+    def __init__(self):
+        self.status_checks = 0
+
+    async def get_pod_status(self, pod_id):
+        self.status_checks += 1
+        return RunPodPodResponse(pod_id=pod_id, status="STARTING", endpoint_url=None, cost_per_hour=0.5)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+def test_failed_recheck_entries_are_evicted():
+    """failed 상태를 벗어나거나 재확인 간격이 지난 사용자의 재확인 시각 기록은 남지 않음"""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    db = Session(engine)
+    expires_at = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(minutes=10)
+    for i, user_id in enumerate(("alice", "bob")):
+        db.add(User(
+            user_id=user_id, provider_id=f"p-{i}", provider="google", user_name=user_id, email=f"{user_id}@example.com",
+            current_pod_id=f"pod-{user_id}", pod_status="failed", session_expires_at=expires_at,
+        ))
+    db.commit()
+
+    runpod = FakeRunPod()
+    clock = FakeClock()
+    originals = (runpod_module.get_runpod_service, session_module.get_runpod_service, session_module.time)
+    runpod_module.get_runpod_service = session_module.get_runpod_service = lambda: runpod
+    session_module.time = clock
+    try:
+        service = UserSessionService()
+
+        async def status(user_id):
+            return await service.get_session_status(user_id, SQLiteAsyncSession(db))
+
+        async def run():
+            await status("alice")
+            await status("alice")
+            assert runpod.status_checks == 1 and set(service._failed_rechecked_at) == {"alice"}
+
+            # 복구된 세션은 기록 제거
+            db.get(User, "alice").pod_status = "ready"
+            db.commit()
+            assert (await status("alice"))["pod_status"] == "ready"
+            assert service._failed_rechecked_at == {}
+
+            # 다시 조회하지 않는 사용자 기록은 간격이 지나면 다음 재확인 때 제거
+            await status("bob")
+            db.get(User, "alice").pod_status = "failed"
+            db.commit()
+            clock.now += service.FAILED_RECHECK_INTERVAL
+            await status("alice")
+            assert set(service._failed_rechecked_at) == {"alice"}
+            assert runpod.status_checks == 3
+
+        asyncio.run(run())
+    finally:
+        runpod_module.get_runpod_service, session_module.get_runpod_service, session_module.time = originals
+        db.close()
+
+
+if __name__ == "__main__":
+    test_queue_keeps_latest_state_only()
+    test_duplicate_state_is_suppressed()
+    test_publish_from_worker_thread()
+    test_failed_recheck_entries_are_evicted()
+    print("✅ 모든 테스트 완료!")
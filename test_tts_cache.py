@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+채팅 TTS 결과 캐시 테스트 스크립트
+가짜 TTS 매니저와 가짜 WebSocket으로 _process_tts_async를 실행하여
+같은 음성/문장은 합성 없이 재사용하고, 참조 음성이 바뀌면(음성 버전 변경) 다시 합성하는지 확인
+    python -m pytest test_tts_cache.py   또는   python test_tts_cache.py
+"""
+import asyncio
+import base64
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+# app 설정 로드 전에 테스트용 환경 변수 지정
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "test")
+
+import app.services.tts_cache as tts_cache_module
+import app.services.voice_asset_cache as voice_cache_module
+from app.api.v1.endpoints import chatbot
+from app.services.tts_cache import TTSCache
+from app.services.voice_asset_cache import VoiceAssetCache, VoiceRef
+
+
+class FakeTTSManager:
+    """RunPod TTS 매니저 대체 (runsync 요청 기록)"""
+
+    def __init__(self):
+        self.requests = []
+
+    async def runsync(self, job_input):
+        self.requests.append(job_input)
+        await asyncio.sleep(0.01)
+        audio = f"{job_input['text']}|{job_input['base_voice_id']}|{len(self.requests)}".encode("utf-8")
+        return {
+            "id": f"tts-{len(self.requests)}",
+            "status": "COMPLETED",
+            "output": {"audio_base64": base64.b64encode(audio).decode("ascii"), "format": "wav", "duration": 1.5},
+        }
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.texts = []
+        self.frames = []
+
+    async def send_text(self, text):
+        self.texts.append(json.loads(text))
+
+    async def send_bytes(self, data):
+        self.frames.append(data)
+
+
+class FakeVoiceAssetCache(VoiceAssetCache):
+    """DB 대신 메모리의 voice_base 행으로 참조 음성 조회"""
+
+    def __init__(self, **kwargs):
+        super().__init__(storage=object(), **kwargs)
+        self.rows = {}
+        self.lookups = 0
+
+    async def _lookup_voice(self, influencer_id):
+        self.lookups += 1
+        row = self.rows.get(influencer_id)
+        if row is None:
+            return None
+        voice_id, s3_key, updated_at = row
+        return VoiceRef(voice_id=voice_id, s3_key=s3_key, version=f"{s3_key}@{updated_at.isoformat()}")
+
+
+def _run(scenario, revalidate_seconds=60):
+    async def run():
+        tts_manager = FakeTTSManager()
+        voice_cache = FakeVoiceAssetCache(revalidate_seconds=revalidate_seconds)
+        originals = (chatbot.get_tts_manager, tts_cache_module._tts_cache, voice_cache_module._voice_asset_cache)
+        chatbot.get_tts_manager = lambda: tts_manager
+        tts_cache_module._tts_cache = TTSCache(disk_dir=tempfile.mkdtemp(), disk_max_bytes=0)
+        voice_cache_module._voice_asset_cache = voice_cache
+        try:
+            await scenario(tts_manager, voice_cache)
+        finally:
+            chatbot.get_tts_manager, tts_cache_module._tts_cache, voice_cache_module._voice_asset_cache = originals
+
+    asyncio.run(run())
+
+
+async def _speak(text, influencer_id="inf-1", binary_audio=False):
+    websocket = FakeWebSocket()
+    await chatbot._process_tts_async(websocket, text, influencer_id, binary_audio)
+    return websocket
+
+
+def test_same_voice_and_text_is_cached():
+    """같은 음성/문장은 한 번만 합성하고, 음성 조회는 재검증 주기 동안 재사용"""
+    async def scenario(tts_manager, voice_cache):
+        voice_cache.rows["inf-1"] = ("7", "audio_base/inf-1/base.wav", datetime(2026, 1, 1))
+
+        first = await _speak("안녕하세요")
+        assert first.texts[0]["type"] == "audio" and first.texts[0]["cached"] is False
+        assert tts_manager.requests[0]["base_voice_id"] == "7"
+
+        second = await _speak("안녕하세요 ", binary_audio=True)
+        header = second.texts[0]
+        assert header["type"] == "audio_header" and header["cached"] is True
+        assert second.frames[0] == base64.b64decode(first.texts[0]["audio_base64"])
+        assert len(tts_manager.requests) == 1
+        assert voice_cache.lookups == 1
+
+        # 다른 인플루언서(참조 음성 없음)는 따로 합성
+        await _speak("안녕하세요", influencer_id="inf-2")
+        assert len(tts_manager.requests) == 2
+        assert tts_manager.requests[1]["base_voice_id"] is None
+
+    _run(scenario)
+
+
+def test_replaced_voice_is_resynthesized():
+    """같은 S3 키에 음성을 다시 올리면(수정 시각 변경) 이전 TTS 결과를 쓰지 않음"""
+    async def scenario(tts_manager, voice_cache):
+        uploaded_at = datetime(2026, 1, 1)
+        voice_cache.rows["inf-1"] = ("7", "audio_base/inf-1/base.wav", uploaded_at)
+        await _speak("반가워요")
+        assert len(tts_manager.requests) == 1
+
+        voice_cache.rows["inf-1"] = ("7", "audio_base/inf-1/base.wav", uploaded_at + timedelta(minutes=5))
+        again = await _speak("반가워요")
+        assert again.texts[0]["cached"] is False
+        assert len(tts_manager.requests) == 2
+
+        cached = await _speak("반가워요")
+        assert cached.texts[0]["cached"] is True
+        assert len(tts_manager.requests) == 2
+
+    # 재검증 주기 0: 매 요청마다 voice_base 행을 다시 조회
+    _run(scenario, revalidate_seconds=0)
+
+
+def test_failed_synthesis_is_not_cached():
+    """합성 실패는 캐시하지 않고 오디오도 보내지 않음"""
+    async def scenario(tts_manager, voice_cache):
+        async def failing(job_input):
+            tts_manager.requests.append(job_input)
+            return {"id": "tts-failed", "status": "FAILED"}
+
+        tts_manager.runsync = failing
+        websocket = await _speak("실패")
+        assert websocket.texts == [] and websocket.frames == []
+        await _speak("실패")
+        assert len(tts_manager.requests) == 2
+        assert tts_cache_module.get_tts_cache().get_stats()["memory_entries"] == 0
+
+    _run(scenario)
+
+
+if __name__ == "__main__":
+    test_same_voice_and_text_is_cached()
+    test_replaced_voice_is_resynthesized()
+    test_failed_synthesis_is_not_cached()
+    print("✅ 모든 테스트 완료!")
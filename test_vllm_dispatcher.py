@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+vLLM 요청 디스패처(VLLMDispatcher) 테스트 스크립트
+scripts/fake_runpod_worker.py의 가짜 RunPod 워커로 네트워크 없이 제출/폴링/취소 확인
+    python -m pytest test_vllm_dispatcher.py   또는   python test_vllm_dispatcher.py
+"""
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+# app 설정 로드 전에 테스트용 환경 변수 지정
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ.setdefault("RUNPOD_API_KEY", "test")
+
+from app.services.runpod_manager import RunPodManagerError
+from app.services.vllm_dispatcher import VLLMDispatcher
+from scripts.fake_runpod_worker import FakeRunPodWorker
+
+
+def _payload(prompt, adapter="adapter-a", **extra):
+    return {"input": {"prompt": prompt, "hf_repo": "org/model", "lora_adapter": adapter, **extra}}
+
+
+def test_idle_request_is_submitted_without_window():
+    """대기/진행 중인 요청이 없으면 시간 창을 기다리지 않고 바로 제출"""
+    worker = FakeRunPodWorker(queue_overhead=0.0, inference_time=0.02, api_latency=0.0)
+    dispatcher = VLLMDispatcher(window=1.0, poll_interval=0.01, max_poll_interval=0.05, manager=worker)
+
+    async def run():
+        started = time.monotonic()
+        result = await dispatcher.submit(_payload("hello"))
+        return result, time.monotonic() - started
+
+    result, elapsed = asyncio.run(run())
+    assert result == "echo: hello"
+    assert elapsed < 0.5
+    assert dispatcher.get_stats()["immediate_submits"] == 1
+
+
+def test_concurrent_requests_for_same_adapter_are_grouped():
+    """진행 중인 요청이 있으면 같은 어댑터 요청은 시간 창 동안 모아 한 번에 제출"""
+    worker = FakeRunPodWorker(queue_overhead=0.0, inference_time=0.05, api_latency=0.0)
+    dispatcher = VLLMDispatcher(window=0.05, poll_interval=0.01, max_poll_interval=0.05, manager=worker)
+
+    async def run():
+        return await asyncio.gather(
+            *(dispatcher.submit(_payload(f"m{i}")) for i in range(6)),
+            dispatcher.submit(_payload("other", adapter="adapter-b")),
+        )
+
+    results = asyncio.run(run())
+    assert results == [f"echo: m{i}" for i in range(6)] + ["echo: other"]
+    stats = dispatcher.get_stats()
+    # adapter-a: 첫 요청은 바로, 나머지 5건은 한 묶음 / adapter-b: 바로
+    assert stats["batches"] == 3
+    assert stats["max_batch_size"] == 5
+    assert stats["immediate_submits"] == 2
+    assert worker.calls["run"] == 7
+
+
+def test_status_polling_backs_off_for_long_jobs():
+    """오래 걸리는 작업은 경과 시간에 비례해 조회 간격을 늘려 /status 호출 수를 줄임"""
+    def status_calls(max_poll_interval):
+        worker = FakeRunPodWorker(queue_overhead=0.0, inference_time=1.0, api_latency=0.0)
+        dispatcher = VLLMDispatcher(window=0.0, poll_interval=0.02, max_poll_interval=max_poll_interval, manager=worker)
+        started = time.monotonic()
+        assert asyncio.run(dispatcher.submit(_payload("long"))) == "echo: long"
+        return worker.calls["status"], time.monotonic() - started
+
+    fixed, _ = status_calls(0.02)
+    backoff, elapsed = status_calls(1.0)
+    assert fixed >= 40
+    assert backoff <= 20
+    # 완료 → 전달 지연은 경과 시간의 25% 이내
+    assert elapsed < 1.0 * 1.25 + 0.1
+
+
+def test_new_job_is_polled_promptly_while_others_back_off():
+    """긴 작업이 최대 간격으로 대기 중이어도 새 작업은 최소 간격으로 조회"""
+    worker = FakeRunPodWorker(queue_overhead=0.0, api_latency=0.0)
+    dispatcher = VLLMDispatcher(window=0.0, poll_interval=0.02, max_poll_interval=1.0, manager=worker)
+
+    async def run():
+        long_job = asyncio.create_task(dispatcher.submit(_payload("long", fake_inference_time=2.0)))
+        await asyncio.sleep(0.6)
+        started = time.monotonic()
+        short = await dispatcher.submit(_payload("short", adapter="adapter-b", fake_inference_time=0.02))
+        elapsed = time.monotonic() - started
+        await long_job
+        return short, elapsed
+
+    short, elapsed = asyncio.run(run())
+    assert short == "echo: short"
+    assert elapsed < 0.3
+
+
+def test_failure_cancel_and_timeout():
+    """실패 상태는 예외로, 호출자 취소는 작업 취소로, 타임아웃은 예외 + 작업 취소로"""
+    worker = FakeRunPodWorker(queue_overhead=0.0, api_latency=0.0)
+    dispatcher = VLLMDispatcher(window=0.0, poll_interval=0.01, max_poll_interval=0.05, job_timeout=0.3, manager=worker)
+
+    async def run():
+        try:
+            await dispatcher.submit(_payload("bad", fake_fail=True, fake_inference_time=0.02))
+            raise AssertionError("실패한 작업은 예외가 나야 함")
+        except RunPodManagerError:
+            pass
+
+        task = asyncio.create_task(dispatcher.submit(_payload("cancel-me", adapter="c", fake_inference_time=5.0)))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        await asyncio.sleep(0.05)
+        cancelled_job = worker.job_ids_by_prompt["cancel-me"]
+        assert worker.jobs[cancelled_job]["status"] == "CANCELLED"
+
+        try:
+            await dispatcher.submit(_payload("slow", adapter="d", fake_inference_time=5.0))
+            raise AssertionError("타임아웃 작업은 예외가 나야 함")
+        except RunPodManagerError as e:
+            assert "타임아웃" in str(e)
+        await asyncio.sleep(0.01)
+
+    asyncio.run(run())
+    stats = dispatcher.get_stats()
+    assert stats["failed"] == 1 and stats["cancelled"] == 1 and stats["timed_out"] == 1
+    assert stats["in_flight_jobs"] == 0
+    assert worker.calls["cancel"] == 2
+
+
+if __name__ == "__main__":
+    test_idle_request_is_submitted_without_window()
+    test_concurrent_requests_for_same_adapter_are_grouped()
+    test_status_polling_backs_off_for_long_jobs()
+    test_new_job_is_polled_promptly_while_others_back_off()
+    test_failure_cancel_and_timeout()
+    print("✅ 모든 테스트 완료!")
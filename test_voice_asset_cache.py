@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+TTS 참조 음성 캐시(VoiceAssetCache) 테스트 스크립트
+moto로 S3를 로컬에서 흉내내어 ETag 기준 재검증, 덮어쓴 음성 감지, 업로드 시 무효화 확인
+    python -m pytest test_voice_asset_cache.py   또는   python test_voice_asset_cache.py
+"""
+import asyncio
+import base64
+import os
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+# app 설정 로드 전에 테스트용 환경 변수 지정
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ["AWS_ACCESS_KEY_ID"] = "testing"
+os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
+os.environ["AWS_REGION"] = "us-east-1"
+os.environ["S3_BUCKET_NAME"] = "aimex-test-bucket"
+os.environ.pop("S3_ENDPOINT_URL", None)
+
+from moto import mock_aws
+
+from app.services.object_storage import AsyncObjectStorage, create_s3_client
+from app.services.voice_asset_cache import VoiceAssetCache, VoiceRef
+
+BUCKET = "aimex-test-bucket"
+VOICE_KEY = "audio_base/inf-1/base.wav"
+
+
+class CountingStorage(AsyncObjectStorage):
+    """S3 요청 수 기록"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.heads = 0
+        self.downloads = 0
+
+    async def head_object(self, *args, **kwargs):
+        self.heads += 1
+        return await super().head_object(*args, **kwargs)
+
+    async def open_object(self, *args, **kwargs):
+        self.downloads += 1
+        return await super().open_object(*args, **kwargs)
+
+
+class FakeDBVoiceAssetCache(VoiceAssetCache):
+    """DB 대신 메모리의 voice_base 행으로 참조 음성 조회"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.rows = {}
+        self.lookups = 0
+
+    async def _lookup_voice(self, influencer_id):
+        self.lookups += 1
+        row = self.rows.get(influencer_id)
+        if row is None:
+            return None
+        voice_id, s3_key, version = row
+        return VoiceRef(voice_id=voice_id, s3_key=s3_key, version=f"{s3_key}@{version}")
+
+
+def _storage() -> CountingStorage:
+    client = create_s3_client()
+    client.create_bucket(Bucket=BUCKET)
+    return CountingStorage(client, BUCKET)
+
+
+def _b64(data: bytes) -> str:
+    return base64.b64encode(data).decode("utf-8")
+
+
+@mock_aws
+def test_revalidates_with_etag_and_detects_overwrite():
+    """재검증 주기가 지나면 조건부 HEAD로 확인하고, 같은 키에 덮어쓰면 ETag 불일치로 다시 다운로드"""
+    storage = _storage()
+
+    async def run():
+        await storage.put_object(VOICE_KEY, b"voice-v1", "audio/wav")
+        cache = VoiceAssetCache(storage=storage, revalidate_seconds=60)
+        assert await cache.get(VOICE_KEY) == _b64(b"voice-v1")
+        # 재검증 주기 이내에는 S3 요청 없음
+        assert await cache.get(VOICE_KEY) == _b64(b"voice-v1")
+        assert (storage.downloads, storage.heads) == (1, 0)
+
+        cache.revalidate_seconds = 0
+        assert await cache.get(VOICE_KEY) == _b64(b"voice-v1")
+        assert (storage.downloads, storage.heads) == (1, 1)
+
+        await storage.put_object(VOICE_KEY, b"voice-v2", "audio/wav")
+        assert await cache.get(VOICE_KEY) == _b64(b"voice-v2")
+        assert (storage.downloads, storage.heads) == (2, 2)
+        assert cache.get_stats()["invalidations"] == 1
+
+        await storage.delete_objects([VOICE_KEY])
+        assert await cache.get(VOICE_KEY) is None
+        assert cache.get_stats()["entries"] == 0
+
+    asyncio.run(run())
+
+
+@mock_aws
+def test_invalidate_on_upload_skips_revalidation_window():
+    """업로드 경로의 invalidate 호출 후에는 재검증 주기 이내라도 새 음성과 새 voice_base 행을 사용"""
+    storage = _storage()
+
+    async def run():
+        await storage.put_object(VOICE_KEY, b"voice-v1", "audio/wav")
+        cache = FakeDBVoiceAssetCache(storage=storage, revalidate_seconds=60)
+        cache.rows["inf-1"] = ("7", VOICE_KEY, "2026-01-01T00:00:00")
+        assert await cache.get_for_influencer("inf-1") == _b64(b"voice-v1")
+        first = await cache.resolve_voice("inf-1")
+
+        # 음성 업로드: 같은 키에 덮어쓰고 voice_base 행의 수정 시각 변경
+        await storage.put_object(VOICE_KEY, b"voice-v2", "audio/wav")
+        cache.rows["inf-1"] = ("7", VOICE_KEY, "2026-01-02T00:00:00")
+        # 무효화 전에는 재검증 주기 동안 이전 음성 사용
+        assert await cache.get_for_influencer("inf-1") == _b64(b"voice-v1")
+        assert (await cache.resolve_voice("inf-1")).version == first.version
+
+        cache.invalidate(VOICE_KEY, influencer_id="inf-1")
+        assert await cache.get_for_influencer("inf-1") == _b64(b"voice-v2")
+        assert (await cache.resolve_voice("inf-1")).version != first.version
+        assert cache.lookups == 2 and storage.downloads == 2 and storage.heads == 0
+
+    asyncio.run(run())
+
+
+@mock_aws
+def test_concurrent_requests_share_one_download():
+    """같은 키의 동시 요청은 한 번만 다운로드하고, 최대 크기를 넘으면 오래된 음성부터 제거"""
+    storage = _storage()
+
+    async def run():
+        await storage.put_object(VOICE_KEY, b"a" * 300, "audio/wav")
+        await storage.put_object("audio_base/inf-2/base.wav", b"b" * 300, "audio/wav")
+        cache = VoiceAssetCache(storage=storage, max_bytes=500, revalidate_seconds=60)
+
+        results = await asyncio.gather(*(cache.get(VOICE_KEY) for _ in range(5)))
+        assert len(set(results)) == 1 and storage.downloads == 1
+
+        await cache.get("audio_base/inf-2/base.wav")
+        stats = cache.get_stats()
+        assert stats["entries"] == 1 and stats["bytes"] <= 500
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    test_revalidates_with_etag_and_detects_overwrite()
+    test_invalidate_on_upload_skips_revalidation_window()
+    test_concurrent_requests_share_one_download()
+    print("✅ 모든 테스트 완료!")
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+ComfyUI 웜 Pod 풀(WarmPodPool) 테스트 스크립트
+가짜 RunPod Pod API와 scripts/fake_comfyui_server.py의 가짜 ComfyUI 서버로 할당/반환/종료/보충 확인
+    python -m pytest test_warm_pod_pool.py   또는   python test_warm_pod_pool.py
+"""
+import asyncio
+import itertools
+import os
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+# app 설정 로드 전에 테스트용 환경 변수 지정
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "test")
+
+from app.services.runpod_service import RunPodPodResponse
+from app.services.warm_pod_pool import WarmPodPool
+from scripts.fake_comfyui_server import FakeComfyUIServer
+
+
+class FakeRunPodPods:
+    """RunPodService의 Pod 관련 메서드 대체 (모든 Pod이 같은 가짜 ComfyUI 서버를 가리킴)"""
+
+    def __init__(self, endpoint_url: str, boot_time: float = 0.01):
+        self.endpoint_url = endpoint_url
+        self.boot_time = boot_time
+        self.credits = 100.0
+        self.pods = {}
+        self.terminated = []
+        self._ids = itertools.count(1)
+
+    async def create_pod(self, request_id: str) -> RunPodPodResponse:
+        pod = RunPodPodResponse(
+            pod_id=f"pod-{next(self._ids)}", status="RUNNING", endpoint_url=self.endpoint_url, cost_per_hour=0.5
+        )
+        self.pods[pod.pod_id] = pod
+        return pod
+
+    async def wait_for_ready(self, pod_id: str, max_wait_time: int = 600) -> bool:
+        await asyncio.sleep(self.boot_time)
+        return True
+
+    async def terminate_pod(self, pod_id: str) -> bool:
+        self.terminated.append(pod_id)
+        if pod_id in self.pods:
+            self.pods[pod_id].status = "TERMINATED"
+        return True
+
+    async def list_pods(self):
+        return dict(self.pods)
+
+    async def get_remaining_credits(self):
+        return {"remaining_credits": self.credits}
+
+
+def _pool(service, max_size=3, min_idle=2) -> WarmPodPool:
+    pool = WarmPodPool(runpod_service=service, max_size=max_size, min_idle=min_idle)
+    pool.profile = []
+    pool.max_reuse = 5
+    pool.idle_ttl = 60
+    pool.min_credits = 10
+    pool.credits_check_interval = 0
+    return pool
+
+
+async def _tick(pool: WarmPodPool):
+    """관리 작업 한 번 실행 후 준비 중인 Pod을 모두 기다림"""
+    await pool._tick()
+    if pool._booting:
+        await asyncio.gather(*pool._booting)
+
+
+def _run(scenario):
+    async def run():
+        server = FakeComfyUIServer()
+        url = await server.start()
+        try:
+            await scenario(server, FakeRunPodPods(url))
+        finally:
+            await server.stop()
+
+    asyncio.run(run())
+
+
+def test_replenish_and_lease():
+    """최소 유휴 수만큼 미리 준비하고, 할당으로 빈 자리는 다음 주기에 보충"""
+    async def scenario(server, service):
+        pool = _pool(service)
+        await _tick(pool)
+        assert pool.get_stats()["idle"] == 2 and pool.get_stats()["provisioned"] == 2
+
+        pod = pool.lease("alice")
+        assert pod is not None and pod.owner == "alice"
+        assert pool.get_stats()["idle"] == 1
+
+        await _tick(pool)
+        stats = pool.get_stats()
+        assert stats["idle"] == 2 and stats["provisioned"] == 3 and stats["hits"] == 1
+
+    _run(scenario)
+
+
+def test_returned_pod_is_only_leased_to_same_user():
+    """반환된 Pod은 큐/히스토리를 비우되 input/output 파일이 남으므로 같은 사용자에게만 재할당"""
+    async def scenario(server, service):
+        pool = _pool(service)
+        await _tick(pool)
+
+        alice_pod = pool.lease("alice")
+        assert await pool.release_pod(alice_pod.pod_id)
+        assert server.clear_requests == {"/queue": 1, "/history": 1}
+        assert pool.get_stats()["idle_reserved"] == 1
+
+        bob_pod = pool.lease("bob")
+        assert bob_pod is not None and bob_pod.pod_id != alice_pod.pod_id
+        # 남은 유휴 Pod은 alice 전용이므로 다른 사용자는 풀 미스
+        assert pool.lease("carol") is None
+
+        again = pool.lease("alice")
+        assert again.pod_id == alice_pod.pod_id and again.leases == 2
+
+        # 전용 Pod은 보충 목표에 포함되지 않으므로 새 Pod 준비
+        assert await pool.release_pod(again.pod_id)
+        await _tick(pool)
+        stats = pool.get_stats()
+        assert stats["idle"] == 3 and stats["idle_reserved"] == 1
+
+    _run(scenario)
+
+
+def test_unknown_pod_is_terminated_not_adopted():
+    """풀이 할당하지 않은 Pod은 반환 시 풀에 편입하지 않고 종료"""
+    async def scenario(server, service):
+        pool = _pool(service, min_idle=0)
+        assert await pool.release_pod("cold-pod")
+        assert service.terminated == ["cold-pod"]
+        assert pool.get_stats()["idle"] == 0 and server.clear_requests == {}
+
+    _run(scenario)
+
+
+def test_eviction():
+    """재사용 횟수 초과/초기화 실패/사용자가 돌아오지 않은 전용 Pod/종료된 Pod/잔액 부족 시 제거"""
+    async def scenario(server, service):
+        pool = _pool(service)
+        await _tick(pool)
+
+        # 재사용 횟수 초과
+        pool.max_reuse = 1
+        pod = pool.lease("alice")
+        assert await pool.release_pod(pod.pod_id)
+        assert pod.pod_id in service.terminated
+        pool.max_reuse = 5
+
+        # 초기화 실패
+        await _tick(pool)
+        pod = pool.lease("bob")
+        server.fail_clear = True
+        assert await pool.release_pod(pod.pod_id)
+        assert pod.pod_id in service.terminated
+        server.fail_clear = False
+
+        # 사용자가 돌아오지 않은 전용 Pod은 유휴 유지 시간 후 종료
+        await _tick(pool)
+        pod = pool.lease("carol")
+        assert await pool.release_pod(pod.pod_id)
+        assert pool.get_stats()["idle_reserved"] == 1
+        pod.idle_since -= pool.idle_ttl + 1
+        await _tick(pool)
+        assert pod.pod_id in service.terminated
+        assert pool.get_stats()["idle_reserved"] == 0
+
+        # RunPod에서 종료된 유휴 Pod은 목록 조회로 감지하여 제거
+        gone = pool._idle[0].pod_id
+        service.pods[gone].status = "EXITED"
+        pool._health_checked_at = 0
+        await pool._check_idle_health(1e9)
+        assert gone not in pool.owned_pod_ids()
+
+        # 잔액 부족이면 보충을 멈추고 유휴 Pod 종료
+        service.credits = 1.0
+        await _tick(pool)
+        stats = pool.get_stats()
+        assert stats["budget_blocked"] and stats["idle"] == 0 and stats["target_idle"] == 0
+        assert pool.lease("dave") is None
+
+    _run(scenario)
+
+
+if __name__ == "__main__":
+    test_replenish_and_lease()
+    test_returned_pod_is_only_leased_to_same_user()
+    test_unknown_pod_is_terminated_not_adopted()
+    test_eviction()
+    print("✅ 모든 테스트 완료!")
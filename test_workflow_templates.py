@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+ComfyUI 워크플로우 템플릿 레지스트리(WorkflowTemplateRegistry) 테스트 스크립트
+저장소의 workflows/*.json을 실제로 로드하여 바인딩 검증, 노드 누락 감지, 페이로드 생성 확인
+    python -m pytest test_workflow_templates.py   또는   python test_workflow_templates.py
+"""
+import json
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+# app 설정 로드 전에 테스트용 환경 변수 지정
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "test")
+
+from app.services.workflow_templates import (
+    FLUX_T2I,
+    IMAGE_MODIFY,
+    WORKFLOW_SPECS,
+    WORKFLOWS_DIR,
+    WorkflowTemplateError,
+    WorkflowTemplateRegistry,
+)
+
+
+def _copy_workflows() -> Path:
+    target = Path(tempfile.mkdtemp())
+    for spec in WORKFLOW_SPECS.values():
+        shutil.copy(WORKFLOWS_DIR / spec.filename, target / spec.filename)
+    return target
+
+
+def _edit(directory: Path, name: str, change):
+    path = directory / WORKFLOW_SPECS[name].filename
+    workflow = json.loads(path.read_text(encoding="utf-8"))
+    change(workflow)
+    path.write_text(json.dumps(workflow), encoding="utf-8")
+    # 같은 타임스탬프 단위 안의 수정도 변경으로 감지되도록 mtime을 앞으로 이동
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_repository_workflows_match_bindings():
+    """저장소의 워크플로우 파일이 모든 바인딩/필수 노드를 만족 (노드가 사라지면 여기서 실패)"""
+    registry = WorkflowTemplateRegistry()
+    registry.load_all()
+    templates = registry.get_stats()["templates"]
+    assert set(templates) == set(WORKFLOW_SPECS)
+    for name, spec in WORKFLOW_SPECS.items():
+        assert templates[name]["params"] == len(spec.bindings)
+
+
+def test_missing_or_changed_node_fails_load():
+    """바인딩된 노드가 사라지거나 종류가 바뀌면 로드 실패 메시지에 노드가 표시됨"""
+    directory = _copy_workflows()
+    try:
+        _edit(directory, FLUX_T2I, lambda workflow: workflow.pop("47"))
+        _edit(directory, IMAGE_MODIFY, lambda workflow: workflow["6"].update(class_type="KSamplerAdvanced"))
+        try:
+            WorkflowTemplateRegistry(workflows_dir=directory).load_all()
+            raise AssertionError("노드가 없는 워크플로우는 로드에 실패해야 함")
+        except WorkflowTemplateError as e:
+            message = str(e)
+        assert "노드 47 없음" in message
+        assert "노드 6가 KSampler이 아님" in message
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_reload_keeps_previous_version_on_failure():
+    """변경된 파일이 검증에 실패하면 이전 버전을 유지하고, 고쳐지면 다시 로드"""
+    directory = _copy_workflows()
+    try:
+        registry = WorkflowTemplateRegistry(workflows_dir=directory)
+        registry.load_all()
+        original = registry.get(FLUX_T2I)
+
+        removed = {}
+        _edit(directory, FLUX_T2I, lambda workflow: removed.update(node=workflow.pop("6")))
+        assert registry.reload_changed() == []
+        assert registry.get(FLUX_T2I) is original
+        assert registry.get_stats()["reload_failures"] == 1
+        # 같은 실패 버전은 다시 시도하지 않음
+        assert registry.reload_changed() == []
+        assert registry.get_stats()["reload_failures"] == 1
+
+        _edit(directory, FLUX_T2I, lambda workflow: workflow.update({"6": removed["node"]}))
+        assert registry.reload_changed() == [FLUX_T2I]
+        assert registry.get(FLUX_T2I) is not original
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_build_copies_only_changed_nodes():
+    """값을 넣은 노드만 복사하고 원본 템플릿은 그대로 유지"""
+    registry = WorkflowTemplateRegistry()
+    template = registry.get(IMAGE_MODIFY)
+    before = json.dumps(template.workflow, sort_keys=True)
+
+    payload = registry.build(IMAGE_MODIFY, edit_text="안경 추가", seed=42, lora_1_on=False, lora_1_strength=0.3)
+    assert payload["9"]["inputs"]["editText"] == "안경 추가"
+    assert payload["6"]["inputs"]["seed"] == 42
+    assert payload["22"]["inputs"]["lora_1"]["on"] is False
+    assert payload["22"]["inputs"]["lora_1"]["strength"] == 0.3
+    # 바뀐 노드는 복사, 나머지는 원본과 공유
+    assert payload["9"] is not template.workflow["9"]
+    assert payload["15"] is template.workflow["15"]
+    assert json.dumps(template.workflow, sort_keys=True) == before
+
+    try:
+        registry.build(IMAGE_MODIFY, unknown=1)
+        raise AssertionError("없는 파라미터는 예외가 나야 함")
+    except WorkflowTemplateError:
+        pass
+
+
+if __name__ == "__main__":
+    test_repository_workflows_match_bindings()
+    test_missing_or_changed_node_fails_load()
+    test_reload_keeps_previous_version_on_failure()
+    test_build_copies_only_changed_nodes()
+    print("✅ 모든 테스트 완료!")